@@ -15,6 +15,7 @@ Key concepts:
 
 from open_agent_kit.features.codebase_intelligence.activity.batches import (
     finalize_prompt_batch,
+    schedule_prompt_batch_processing,
 )
 from open_agent_kit.features.codebase_intelligence.activity.processor import (
     ActivityProcessor,
@@ -46,6 +47,7 @@ __all__ = [
     "process_prompt_batch_async",
     "process_session_async",
     "finalize_prompt_batch",
+    "schedule_prompt_batch_processing",
     # Prompts
     "PromptTemplate",
     "PromptTemplateConfig",
@@ -44,27 +44,7 @@ def finalize_prompt_batch(
 
     processing_scheduled = False
     if activity_processor:
-        processor = activity_processor
-        batch_id = prompt_batch_id
-
-        async def _process_batch() -> None:
-            logger.debug(f"[REALTIME] Starting async processing for batch {batch_id}")
-            try:
-                result = await process_prompt_batch_async(processor, batch_id)
-                if result.success:
-                    logger.info(
-                        f"[REALTIME] Prompt batch {batch_id} processed: "
-                        f"{result.observations_extracted} observations from "
-                        f"{result.activities_processed} activities "
-                        f"(type={result.classification})"
-                    )
-                else:
-                    logger.warning(f"[REALTIME] Prompt batch processing failed: {result.error}")
-            except (RuntimeError, OSError, ValueError) as e:
-                logger.warning(f"[REALTIME] Prompt batch processing error: {e}")
-
-        logger.debug(f"[REALTIME] Scheduling async task for batch {batch_id}")
-        asyncio.create_task(_process_batch())
+        schedule_prompt_batch_processing(activity_processor, prompt_batch_id)
         processing_scheduled = True
 
     result: dict[str, Any] = {
@@ -77,3 +57,36 @@ def finalize_prompt_batch(
         result["processing_scheduled"] = True
 
     return result
+
+
+def schedule_prompt_batch_processing(
+    activity_processor: ActivityProcessor,
+    prompt_batch_id: int,
+) -> None:
+    """Schedule background processing of a finalized prompt batch.
+
+    Must be called on the event loop. Callers that finalize a batch from a
+    worker thread pass ``activity_processor=None`` to ``finalize_prompt_batch``
+    and schedule processing with this once back on the loop.
+    """
+    processor = activity_processor
+    batch_id = prompt_batch_id
+
+    async def _process_batch() -> None:
+        logger.debug(f"[REALTIME] Starting async processing for batch {batch_id}")
+        try:
+            result = await process_prompt_batch_async(processor, batch_id)
+            if result.success:
+                logger.info(
+                    f"[REALTIME] Prompt batch {batch_id} processed: "
+                    f"{result.observations_extracted} observations from "
+                    f"{result.activities_processed} activities "
+                    f"(type={result.classification})"
+                )
+            else:
+                logger.warning(f"[REALTIME] Prompt batch processing failed: {result.error}")
+        except (RuntimeError, OSError, ValueError) as e:
+            logger.warning(f"[REALTIME] Prompt batch processing error: {e}")
+
+    logger.debug(f"[REALTIME] Scheduling async task for batch {batch_id}")
+    asyncio.create_task(_process_batch())
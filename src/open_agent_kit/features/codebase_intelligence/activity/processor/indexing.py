@@ -12,7 +12,10 @@ if TYPE_CHECKING:
         ActivityStore,
         PromptBatch,
     )
-    from open_agent_kit.features.codebase_intelligence.memory.store import VectorStore
+    from open_agent_kit.features.codebase_intelligence.memory.store import (
+        MemoryObservation,
+        VectorStore,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -244,18 +247,19 @@ def rebuild_chromadb_from_sqlite(
             f"({processed}/{stats['total']} done)"
         )
 
+        memories: list[MemoryObservation] = []
+        skipped_ids: list[str] = []
         for stored_obs in observations:
             # Session summaries belong in the session_summaries collection,
             # not the memory collection. They are handled by
             # backfill_session_summaries / reembed_session_summaries instead.
             if stored_obs.memory_type == "session_summary":
-                activity_store.mark_observation_embedded(stored_obs.id)
-                stats["skipped"] += 1
+                skipped_ids.append(stored_obs.id)
                 continue
 
-            try:
-                # Create MemoryObservation for ChromaDB
-                memory = MemoryObservation(
+            # Create MemoryObservation for ChromaDB
+            memories.append(
+                MemoryObservation(
                     id=stored_obs.id,
                     observation=stored_obs.observation,
                     memory_type=stored_obs.memory_type,
@@ -265,15 +269,23 @@ def rebuild_chromadb_from_sqlite(
                     status=stored_obs.status or OBSERVATION_STATUS_ACTIVE,
                     session_origin_type=stored_obs.session_origin_type,
                 )
+            )
 
-                # Embed and store
-                vector_store.add_memory(memory)
-                activity_store.mark_observation_embedded(stored_obs.id)
-                stats["embedded"] += 1
+        embedded_ids = _embed_memory_batch(vector_store, memories)
 
-            except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
-                logger.warning(f"Failed to embed observation {stored_obs.id}: {e}")
-                stats["failed"] += 1
+        # Mark the whole batch in one transaction
+        activity_store.mark_observations_embedded(skipped_ids + embedded_ids)
+        stats["skipped"] += len(skipped_ids)
+        stats["embedded"] += len(embedded_ids)
+        stats["failed"] += len(memories) - len(embedded_ids)
+
+        if not skipped_ids and not embedded_ids:
+            # Every row failed; fetching again would return the same rows
+            logger.warning(
+                f"Stopping ChromaDB rebuild: none of {len(observations)} observations "
+                "could be embedded"
+            )
+            break
 
         processed += len(observations)
 
@@ -301,6 +313,40 @@ def rebuild_chromadb_from_sqlite(
     return stats
 
 
+def _embed_memory_batch(
+    vector_store: "VectorStore",
+    memories: list["MemoryObservation"],
+) -> list[str]:
+    """Embed and store a batch of memories, isolating failures to single rows.
+
+    The batch is embedded and upserted in bulk. If that fails, each memory is
+    retried on its own so one bad observation doesn't fail its neighbours.
+
+    Args:
+        vector_store: ChromaDB vector store.
+        memories: Memories to store.
+
+    Returns:
+        IDs of the memories that were stored.
+    """
+    if not memories:
+        return []
+
+    try:
+        return vector_store.add_memories(memories)
+    except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+        logger.warning(f"Batch embedding of {len(memories)} observations failed, retrying: {e}")
+
+    embedded_ids: list[str] = []
+    for memory in memories:
+        try:
+            vector_store.add_memory(memory)
+            embedded_ids.append(memory.id)
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.warning(f"Failed to embed observation {memory.id}: {e}")
+    return embedded_ids
+
+
 def embed_pending_observations(
     activity_store: "ActivityStore",
     vector_store: "VectorStore",
@@ -8,6 +8,7 @@ Decomposes the large store.py into focused modules:
 - sessions.py: Session CRUD operations
 - batches.py: Prompt batch operations and plan embedding
 - activities.py: Activity CRUD and FTS5 search
+- writer.py: Write-behind queue for buffered activity inserts
 - observations.py: Memory observation storage
 - stats.py: Statistics and caching
 - backup.py: SQL export/import
@@ -10,6 +10,13 @@ import sqlite3
 from typing import TYPE_CHECKING, Any
 
 from open_agent_kit.features.codebase_intelligence.activity.store.models import Activity
+from open_agent_kit.features.codebase_intelligence.activity.store.pagination import (
+    decode_cursor,
+    keyset_condition,
+    next_cursor,
+    order_clause,
+    select_keys,
+)
 
 if TYPE_CHECKING:
     from open_agent_kit.features.codebase_intelligence.activity.store.core import ActivityStore
@@ -62,65 +69,6 @@ def add_activity(store: ActivityStore, activity: Activity) -> int:
         return cursor.lastrowid or 0
 
 
-def flush_activity_buffer(store: ActivityStore) -> list[int]:
-    """Flush any buffered activities to the database.
-
-    Args:
-        store: The ActivityStore instance.
-
-    Returns:
-        List of inserted activity IDs.
-    """
-    with store._buffer_lock:
-        if not store._activity_buffer:
-            return []
-        activities = store._activity_buffer[:]
-        store._activity_buffer.clear()
-
-    if activities:
-        count = len(activities)
-        ids = add_activities(store, activities)
-        logger.debug(f"Flushed {count} buffered activities (bulk insert)")
-        return ids
-    return []
-
-
-def add_activity_buffered(
-    store: ActivityStore, activity: Activity, force_flush: bool = False
-) -> int | None:
-    """Add an activity with automatic batching.
-
-    Activities are buffered and flushed when the buffer reaches _buffer_size.
-    This provides better performance for rapid tool execution while maintaining
-    low latency for debugging.
-
-    Args:
-        store: The ActivityStore instance.
-        activity: Activity to add.
-        force_flush: If True, flush buffer immediately after adding.
-
-    Returns:
-        Activity ID if flushed immediately, None if buffered.
-    """
-    with store._buffer_lock:
-        store._activity_buffer.append(activity)
-        should_flush = len(store._activity_buffer) >= store._buffer_size or force_flush
-
-        if should_flush:
-            activities = store._activity_buffer[:]
-            store._activity_buffer.clear()
-        else:
-            activities = None
-
-    if activities:
-        count = len(activities)
-        ids = add_activities(store, activities)
-        logger.debug(f"Bulk inserted {count} activities (buffer auto-flush)")
-        # Return the ID of the activity we just added (last in batch)
-        return ids[-1] if ids else None
-    return None
-
-
 def add_activities(store: ActivityStore, activities: list[Activity]) -> list[int]:
     """Add multiple activities in a single transaction (bulk insert).
 
@@ -230,12 +178,15 @@ def _bulk_insert_transaction(
     affected_sessions: set[str] = set()
 
     with store._transaction() as conn:
-        for activity in activities:
-            row = activity.to_row()
-            cursor = conn.execute(_INSERT_SQL, row)
+        conn.executemany(_INSERT_SQL, [activity.to_row() for activity in activities])
+        # AUTOINCREMENT ids are consecutive within one write transaction, so the
+        # batch's ids end at last_insert_rowid() (trigger inserts don't change it).
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        first_id = last_id - len(activities) + 1
+        for offset, activity in enumerate(activities):
             _track_activity(
                 activity,
-                cursor.lastrowid or 0,
+                first_id + offset,
                 ids,
                 session_updates,
                 batch_updates,
@@ -325,6 +276,57 @@ def get_session_activities(
     return [Activity.from_row(row) for row in cursor.fetchall()]
 
 
+# Chronological order; the id tiebreaker is the rowid, which
+# idx_activities_session_timestamp already carries.
+_ACTIVITY_SORT_EXPRS: tuple[str, ...] = ("timestamp_epoch", "id")
+
+
+def get_session_activities_page(
+    store: ActivityStore,
+    session_id: str,
+    limit: int,
+    cursor: str | None = None,
+    offset: int = 0,
+    tool_name: str | None = None,
+) -> tuple[list[Activity], str | None]:
+    """Get one page of a session's activities using keyset pagination.
+
+    Args:
+        store: The ActivityStore instance.
+        session_id: Session to query.
+        limit: Maximum activities to return.
+        cursor: next_cursor from the previous page. Takes precedence over offset.
+        offset: Number of activities to skip when no cursor is given (deprecated).
+        tool_name: Optional filter by tool name.
+
+    Returns:
+        Tuple of (activities oldest first, cursor for the next page or None).
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or from another query.
+    """
+    kind = "activities"
+    conn = store._get_connection()
+
+    query = f"SELECT *, {select_keys(_ACTIVITY_SORT_EXPRS)} FROM activities WHERE session_id = ?"
+    params: list[Any] = [session_id]
+
+    if tool_name:
+        query += " AND tool_name = ? COLLATE NOCASE"
+        params.append(tool_name)
+    if cursor:
+        query += f" AND {keyset_condition(_ACTIVITY_SORT_EXPRS, descending=False)}"
+        params.extend(decode_cursor(cursor, kind, len(_ACTIVITY_SORT_EXPRS)))
+        offset = 0
+
+    query += f" {order_clause(_ACTIVITY_SORT_EXPRS, descending=False)} LIMIT ? OFFSET ?"
+    params.extend([limit + 1, offset])
+
+    rows = conn.execute(query, params).fetchall()
+    cursor_out = next_cursor(kind, rows, limit, len(_ACTIVITY_SORT_EXPRS))
+    return [Activity.from_row(row) for row in rows], cursor_out
+
+
 def get_unprocessed_activities(
     store: ActivityStore,
     session_id: str | None = None,
@@ -10,6 +10,14 @@ import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+from open_agent_kit.features.codebase_intelligence.activity.store.pagination import (
+    decode_cursor,
+    keyset_condition,
+    next_cursor,
+    order_clause,
+    select_keys,
+)
+
 if TYPE_CHECKING:
     from open_agent_kit.features.codebase_intelligence.activity.store.core import ActivityStore
 
@@ -24,6 +32,7 @@ def create_run(
     status: str = "pending",
     project_config: dict[str, Any] | None = None,
     system_prompt_hash: str | None = None,
+    queue_wait_ms: int | None = None,
 ) -> None:
     """Create a new agent run record.
 
@@ -35,6 +44,7 @@ def create_run(
         status: Initial status (default: pending).
         project_config: Snapshot of project configuration.
         system_prompt_hash: Hash of the system prompt used.
+        queue_wait_ms: Time a scheduled run waited for a scheduler slot.
     """
     now = datetime.now()
     now_iso = now.isoformat()
@@ -49,8 +59,8 @@ def create_run(
             INSERT INTO agent_runs (
                 id, agent_name, task, status,
                 created_at, created_at_epoch,
-                project_config, system_prompt_hash, source_machine_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                project_config, system_prompt_hash, source_machine_id, queue_wait_ms
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 run_id,
@@ -62,6 +72,7 @@ def create_run(
                 config_json,
                 system_prompt_hash,
                 machine_id,
+                queue_wait_ms,
             ),
         )
 
@@ -197,6 +208,17 @@ def update_run(
     logger.debug(f"Updated agent run: {run_id}")
 
 
+# ORDER BY expressions per sort field, each ending with the id tiebreaker
+_RUN_SORT_EXPRS: dict[str, tuple[str, ...]] = {
+    "created_at": ("created_at_epoch", "id"),
+    "duration": (
+        "(COALESCE(completed_at_epoch, 0) - COALESCE(started_at_epoch, 0))",
+        "id",
+    ),
+    "cost": ("COALESCE(cost_usd, 0)", "id"),
+}
+
+
 def list_runs(
     store: ActivityStore,
     limit: int = 20,
@@ -224,6 +246,52 @@ def list_runs(
     Returns:
         Tuple of (runs list, total count).
     """
+    runs, total, _next_cursor = list_runs_page(
+        store,
+        limit=limit,
+        offset=offset,
+        agent_name=agent_name,
+        status=status,
+        created_after_epoch=created_after_epoch,
+        created_before_epoch=created_before_epoch,
+        sort_by=sort_by,
+        sort_order=sort_order,
+    )
+    return runs, total
+
+
+def list_runs_page(
+    store: ActivityStore,
+    limit: int = 20,
+    cursor: str | None = None,
+    offset: int = 0,
+    agent_name: str | None = None,
+    status: str | None = None,
+    created_after_epoch: int | None = None,
+    created_before_epoch: int | None = None,
+    sort_by: str = "created_at",
+    sort_order: str = "desc",
+) -> tuple[list[dict[str, Any]], int, str | None]:
+    """List one page of agent runs using keyset pagination.
+
+    Args:
+        store: ActivityStore instance.
+        limit: Maximum runs to return.
+        cursor: next_cursor from the previous page. Takes precedence over offset.
+        offset: Pagination offset when no cursor is given (deprecated).
+        agent_name: Filter by agent name.
+        status: Filter by status.
+        created_after_epoch: Filter by creation time (epoch) - inclusive.
+        created_before_epoch: Filter by creation time (epoch) - exclusive.
+        sort_by: Sort field (created_at, duration, cost).
+        sort_order: Sort order (asc, desc).
+
+    Returns:
+        Tuple of (runs list, total count, cursor for the next page or None).
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or from another sort order.
+    """
     conn = store._get_connection()
 
     # Build WHERE clause
@@ -248,32 +316,38 @@ def list_runs(
 
     where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
-    # Map sort_by to column
-    sort_column_map = {
-        "created_at": "created_at_epoch",
-        "duration": "(COALESCE(completed_at_epoch, 0) - COALESCE(started_at_epoch, 0))",
-        "cost": "COALESCE(cost_usd, 0)",
-    }
-    sort_column = sort_column_map.get(sort_by, "created_at_epoch")
-    order = "DESC" if sort_order.lower() == "desc" else "ASC"
+    sort_exprs = _RUN_SORT_EXPRS.get(sort_by, _RUN_SORT_EXPRS["created_at"])
+    descending = sort_order.lower() == "desc"
+    kind = f"runs:{sort_by}:{'desc' if descending else 'asc'}"
 
     # Get total count
     count_sql = f"SELECT COUNT(*) FROM agent_runs {where_clause}"  # noqa: S608
-    cursor = conn.execute(count_sql, params)
-    total = cursor.fetchone()[0]
-
-    # Get paginated results
+    total = conn.execute(count_sql, params).fetchone()[0]
+
+    # Get one page, continuing after the cursor row if given
+    if cursor:
+        conditions.append(keyset_condition(sort_exprs, descending))
+        params.extend(decode_cursor(cursor, kind, len(sort_exprs)))
+        where_clause = f"WHERE {' AND '.join(conditions)}"
+        offset = 0
     query_sql = f"""
-        SELECT * FROM agent_runs
+        SELECT *, {select_keys(sort_exprs)} FROM agent_runs
         {where_clause}
-        ORDER BY {sort_column} {order}
+        {order_clause(sort_exprs, descending)}
         LIMIT ? OFFSET ?
     """  # noqa: S608
-    cursor = conn.execute(query_sql, [*params, limit, offset])
-
-    runs = [_row_to_dict(row) for row in cursor.fetchall()]
-
-    return runs, total
+    rows = conn.execute(query_sql, [*params, limit + 1, offset]).fetchall()
+    cursor_out = next_cursor(kind, rows, limit, len(sort_exprs))
+
+    runs = []
+    for row in rows:
+        data = _row_to_dict(row)
+        # Sort key columns are only for the cursor
+        for i in range(len(sort_exprs)):
+            data.pop(f"_k{i}", None)
+        runs.append(data)
+
+    return runs, total, cursor_out
 
 
 def delete_run(store: ActivityStore, run_id: str) -> bool:
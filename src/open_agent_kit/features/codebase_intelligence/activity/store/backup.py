@@ -12,12 +12,20 @@ import logging
 import platform
 import re
 import sqlite3
+import time
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from open_agent_kit.features.codebase_intelligence.activity.store.schema import SCHEMA_VERSION
+from open_agent_kit.features.codebase_intelligence.constants import (
+    CI_BACKUP_HEADER_MAX_LINES,
+    CI_BACKUP_IMPORT_BATCH_SIZE,
+    CI_BACKUP_IMPORT_READ_CHUNK_CHARS,
+)
 
 if TYPE_CHECKING:
     from open_agent_kit.features.codebase_intelligence.activity.store.core import ActivityStore
@@ -547,6 +555,17 @@ class ImportResult:
     runs_deleted: int = 0
     gov_audit_deleted: int = 0
 
+    # Throughput (rows parsed from the backup and wall-clock import time)
+    rows_read: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Rows parsed per second of import time."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.rows_read / self.duration_seconds
+
     @property
     def total_imported(self) -> int:
         """Total records imported across all tables."""
@@ -1197,6 +1216,12 @@ def import_from_sql_with_dedup(
     - prompt_batches: id column removed (auto-generated by SQLite)
     - activities: id column removed, prompt_batch_id remapped to new IDs
 
+    The backup is streamed: rows are parsed in a single pass as the file is
+    read in chunks, and inserted with executemany in batches. The import
+    runs in one transaction: it is committed at the end, or rolled back if
+    reading or inserting fails.
+    Tables are processed in the order export_to_sql writes them.
+
     When ``replace_machine=True``, all existing records from the backup's
     source machine are deleted before importing.  This prevents memory
     amplification when observations are regenerated with different text.
@@ -1213,13 +1238,14 @@ def import_from_sql_with_dedup(
         ImportResult with detailed statistics.
     """
     logger.info(f"Importing from backup: {backup_path} (dry_run={dry_run})")
+    start_time = time.monotonic()
 
     result = ImportResult()
-    content = backup_path.read_text(encoding="utf-8")
-    lines = content.split("\n")
+    with backup_path.open("r", encoding="utf-8") as handle:
+        header_lines = [line.rstrip("\n") for line in islice(handle, CI_BACKUP_HEADER_MAX_LINES)]
 
     # Check backup schema version
-    backup_schema_version = _parse_backup_schema_version(lines)
+    backup_schema_version = _parse_backup_schema_version(header_lines)
     if backup_schema_version is not None and backup_schema_version != SCHEMA_VERSION:
         if backup_schema_version < SCHEMA_VERSION:
             logger.warning(
@@ -1271,56 +1297,17 @@ def import_from_sql_with_dedup(
         f"{len(existing_resolution_hashes)} resolution_events"
     )
 
-    # Parse INSERT statements - use proper SQL statement extraction for multi-line values
-    statements_by_table: dict[str, list[tuple[str, dict]]] = {
-        "sessions": [],
-        "prompt_batches": [],
-        "memory_observations": [],
-        "activities": [],
-        "agent_schedules": [],
-        "resolution_events": [],
-        "governance_audit_events": [],
-    }
-
-    # Extract complete SQL statements (handles multi-line INSERT with newlines in values)
-    sql_statements = _extract_sql_statements(content)
-    logger.debug(f"Extracted {len(sql_statements)} SQL statements from backup")
-
-    for stmt in sql_statements:
-        # Extract table name
-        table_match = re.match(r"INSERT INTO (\w+)", stmt)
-        if not table_match:
-            continue
-        table = table_match.group(1)
-
-        if table not in statements_by_table:
-            continue
-
-        # Parse column names and values
-        parsed = _parse_insert_statement(stmt)
-        if parsed:
-            statements_by_table[table].append((stmt, parsed))
-
-    # Process each table in order (sessions first due to foreign keys)
     conn = store._get_connection()
 
     # Get valid columns for each table (for schema compatibility filtering)
     table_columns: dict[str, set[str]] = {}
-    for table in statements_by_table:
+    for table in _IMPORT_TABLE_ORDER:
         table_columns[table] = _get_table_columns(conn, table)
     logger.debug(f"Schema columns loaded for tables: {list(table_columns.keys())}")
 
     # Track old prompt_batch_id -> (session_id, prompt_number) from backup file
     # This is needed to remap activities' prompt_batch_id foreign keys
     old_batch_id_to_key: dict[int, tuple[str, int]] = {}
-    for _stmt, row_dict in statements_by_table["prompt_batches"]:
-        old_id = row_dict.get("id")
-        session_id = row_dict.get("session_id")
-        prompt_number = row_dict.get("prompt_number")
-        if old_id is not None and session_id and prompt_number is not None:
-            old_batch_id_to_key[int(old_id)] = (str(session_id), int(prompt_number))
-
-    logger.debug(f"Tracked {len(old_batch_id_to_key)} old prompt_batch_id -> key mappings")
 
     # Initialize the batch ID mapping (built after prompt_batches import)
     old_to_new_batch_id: dict[int, int] = {}
@@ -1329,128 +1316,144 @@ def import_from_sql_with_dedup(
     imported_session_ids: set[str] = set()
 
     # Track columns removed during filtering (for summary logging)
-    all_removed_columns: dict[str, set[str]] = {t: set() for t in statements_by_table}
-
-    for table in [
-        "sessions",
-        "prompt_batches",
-        "memory_observations",
-        "activities",
-        "agent_schedules",
-        "resolution_events",
-        "governance_audit_events",
-    ]:
-        # After importing sessions, validate parent_session_id references
-        if table == "prompt_batches" and not dry_run and imported_session_ids:
-            _validate_parent_session_ids(conn, imported_session_ids)
-
-        # After importing prompt_batches, build the ID mapping and remap self-references
-        if table == "memory_observations" and not dry_run:
-            # Build mapping from (session_id, prompt_number) -> new_prompt_batch_id
-            new_key_to_batch_id = _build_prompt_batch_id_map(conn)
-            # Combine: old_batch_id -> key -> new_batch_id
-            for old_id, key in old_batch_id_to_key.items():
-                if key in new_key_to_batch_id:
-                    old_to_new_batch_id[old_id] = new_key_to_batch_id[key]
-            logger.debug(
-                f"Built prompt_batch_id remap: {len(old_to_new_batch_id)} mappings "
-                f"(from {len(old_batch_id_to_key)} old IDs)"
-            )
-
-            # Remap source_plan_batch_id self-references in prompt_batches
-            _remap_source_plan_batch_id(conn, old_to_new_batch_id)
-
-        # Governance audit events use delete-then-import (no hashing needed).
-        # Delete existing events from the backup's source machine before importing.
-        if table == "governance_audit_events" and source_machine_id and not dry_run:
-            deleted = conn.execute(
-                "DELETE FROM governance_audit_events WHERE source_machine_id = ?",
-                (source_machine_id,),
-            ).rowcount
-            if deleted > 0:
-                result.gov_audit_deleted = deleted
+    all_removed_columns: dict[str, set[str]] = {t: set() for t in _IMPORT_TABLE_ORDER}
+
+    batcher = _ImportBatcher(conn, result)
+    # Index in _IMPORT_TABLE_ORDER of the last table whose pre-import step ran
+    stage = -1
+
+    def advance_to(next_stage: int) -> None:
+        """Run the steps that must happen before each table, in order."""
+        nonlocal stage
+        batcher.flush()
+        while stage < next_stage:
+            stage += 1
+            if stage >= len(_IMPORT_TABLE_ORDER) or dry_run:
+                continue
+            table = _IMPORT_TABLE_ORDER[stage]
+
+            # After importing sessions, validate parent_session_id references
+            if table == "prompt_batches" and imported_session_ids:
+                _validate_parent_session_ids(conn, imported_session_ids)
+
+            # After importing prompt_batches, build the ID mapping and remap self-references
+            if table == "memory_observations":
+                # Build mapping from (session_id, prompt_number) -> new_prompt_batch_id
+                new_key_to_batch_id = _build_prompt_batch_id_map(conn)
+                # Combine: old_batch_id -> key -> new_batch_id
+                for old_id, key in old_batch_id_to_key.items():
+                    if key in new_key_to_batch_id:
+                        old_to_new_batch_id[old_id] = new_key_to_batch_id[key]
                 logger.debug(
-                    f"Cleared {deleted} governance audit events from machine {source_machine_id}"
+                    f"Built prompt_batch_id remap: {len(old_to_new_batch_id)} mappings "
+                    f"(from {len(old_batch_id_to_key)} old IDs)"
                 )
 
-        for stmt, row_dict in statements_by_table[table]:
-            try:
-                # Filter columns for schema compatibility (handles newer backups)
-                filtered_stmt, filtered_row_dict, removed_cols = _filter_columns_for_schema(
-                    stmt, row_dict, table_columns[table]
-                )
-                all_removed_columns[table].update(removed_cols)
-
-                should_skip, reason = _should_skip_record(
-                    table,
-                    filtered_row_dict,
-                    existing_session_ids,
-                    existing_batch_hashes,
-                    existing_obs_hashes,
-                    existing_activity_hashes,
-                    existing_schedule_names,
-                    current_machine_id,
-                    existing_resolution_hashes,
-                )
+                # Remap source_plan_batch_id self-references in prompt_batches
+                _remap_source_plan_batch_id(conn, old_to_new_batch_id)
+
+            # Governance audit events use delete-then-import (no hashing needed).
+            # Delete existing events from the backup's source machine before importing.
+            if table == "governance_audit_events" and source_machine_id:
+                deleted = conn.execute(
+                    "DELETE FROM governance_audit_events WHERE source_machine_id = ?",
+                    (source_machine_id,),
+                ).rowcount
+                if deleted > 0:
+                    result.gov_audit_deleted = deleted
+                    logger.debug(
+                        f"Cleared {deleted} governance audit events from machine "
+                        f"{source_machine_id}"
+                    )
 
-                if should_skip:
-                    _increment_skipped(result, table)
-                    logger.debug(f"Skipping {table} record: {reason}")
-                    continue
+    if not dry_run and not conn.in_transaction:
+        # One transaction for the whole import; batches only use savepoints
+        conn.execute("BEGIN")
+    try:
+        for table, row_dict in _iter_backup_rows(backup_path):
+            table_stage = _IMPORT_TABLE_INDEX.get(table)
+            if table_stage is None:
+                continue
+            result.rows_read += 1
+            if table_stage > stage:
+                advance_to(table_stage)
+
+            if table == "prompt_batches":
+                old_id = row_dict.get("id")
+                session_id = row_dict.get("session_id")
+                prompt_number = row_dict.get("prompt_number")
+                if old_id is not None and session_id and prompt_number is not None:
+                    old_batch_id_to_key[int(old_id)] = (str(session_id), int(prompt_number))
+
+            # Filter columns for schema compatibility (handles newer backups)
+            filtered_row_dict, removed_cols = _filter_columns_for_schema(
+                row_dict, table_columns[table]
+            )
+            all_removed_columns[table].update(removed_cols)
+
+            should_skip, reason = _should_skip_record(
+                table,
+                filtered_row_dict,
+                existing_session_ids,
+                existing_batch_hashes,
+                existing_obs_hashes,
+                existing_activity_hashes,
+                existing_schedule_names,
+                current_machine_id,
+                existing_resolution_hashes,
+            )
 
-                rows_affected = 1  # Default for dry_run
-                if not dry_run:
-                    # Modify statement for proper import
-                    modified_stmt = _prepare_statement_for_import(filtered_stmt, table)
-
-                    # For memory_observations and activities, remap prompt_batch_id to new ID
-                    if table in ("memory_observations", "activities"):
-                        modified_stmt = _remap_prompt_batch_id(
-                            modified_stmt, filtered_row_dict, old_to_new_batch_id
-                        )
-
-                    cursor = conn.execute(modified_stmt)
-                    rows_affected = cursor.rowcount
-
-                    # Track imported session IDs for parent validation
-                    if table == "sessions":
-                        session_id = filtered_row_dict.get("id")
-                        if session_id:
-                            imported_session_ids.add(str(session_id))
-
-                    # Update existing sets to avoid duplicates within same import
-                    _update_existing_sets(
-                        table,
-                        filtered_row_dict,
-                        existing_session_ids,
-                        existing_batch_hashes,
-                        existing_obs_hashes,
-                        existing_activity_hashes,
-                        existing_schedule_names,
-                        existing_resolution_hashes,
-                    )
+            if should_skip:
+                _increment_skipped(result, table)
+                logger.debug(f"Skipping {table} record: {reason}")
+                continue
 
-                # Only count as imported if a row was actually inserted
-                # (INSERT OR IGNORE returns rowcount=0 when ignored due to ID collision)
-                if rows_affected > 0:
-                    _increment_imported(result, table)
-                else:
-                    _increment_skipped(result, table)
-                    logger.debug(f"Skipped {table} record due to ID collision")
+            if dry_run:
+                _increment_imported(result, table)
+                continue
 
-            except sqlite3.Error as e:
-                result.errors += 1
-                error_msg = f"Error importing {table} record: {e}"
-                result.error_messages.append(error_msg)
-                logger.warning(error_msg)
+            # Modify row for proper import
+            verb, import_row = _prepare_row_for_import(table, filtered_row_dict)
+
+            # For memory_observations and activities, remap prompt_batch_id to new ID
+            if table in ("memory_observations", "activities"):
+                _remap_prompt_batch_id(import_row, old_to_new_batch_id)
+
+            # Imported and skipped counts are recorded when the batch is flushed
+            batcher.add(table, verb, import_row)
+
+            # Track imported session IDs for parent validation
+            if table == "sessions":
+                session_id = filtered_row_dict.get("id")
+                if session_id:
+                    imported_session_ids.add(str(session_id))
+
+            # Update existing sets to avoid duplicates within same import
+            _update_existing_sets(
+                table,
+                filtered_row_dict,
+                existing_session_ids,
+                existing_batch_hashes,
+                existing_obs_hashes,
+                existing_activity_hashes,
+                existing_schedule_names,
+                existing_resolution_hashes,
+            )
 
-    if not dry_run:
-        conn.commit()
+        # Run the remaining per-table steps (e.g. governance delete-then-import)
+        advance_to(len(_IMPORT_TABLE_ORDER))
 
-        # Backfill sessions.summary from imported session_summary observations.
-        # Old backups store summaries as memory_observations with memory_type='session_summary'.
-        # New schema stores them directly in sessions.summary. Migrate on import.
-        _backfill_session_summaries_from_observations(conn)
+        if not dry_run:
+            # Backfill sessions.summary from imported session_summary observations.
+            # Old backups store summaries as memory_observations with
+            # memory_type='session_summary'. New schema stores them directly in
+            # sessions.summary. Migrate on import.
+            _backfill_session_summaries_from_observations(conn)
+            conn.commit()
+    except Exception:
+        if not dry_run:
+            conn.rollback()
+        raise
 
     # Log summary of filtered columns (schema compatibility)
     for table, removed in all_removed_columns.items():
@@ -1460,170 +1463,223 @@ def import_from_sql_with_dedup(
                 f"from {table}: {sorted(removed)}"
             )
 
+    result.duration_seconds = time.monotonic() - start_time
     logger.info(
         f"Import complete: {result.total_imported} imported, "
-        f"{result.total_skipped} skipped (duplicates), {result.errors} errors"
+        f"{result.total_skipped} skipped (duplicates), {result.errors} errors "
+        f"({result.rows_read} rows in {result.duration_seconds:.1f}s, "
+        f"{result.rows_per_second:.0f} rows/s)"
     )
     return result
 
 
-def _extract_sql_statements(content: str) -> list[str]:
-    """Extract complete SQL INSERT statements from backup content.
+# Tables restored by import, in processing order (sessions first due to
+# foreign keys). export_to_sql writes tables in this order.
+_IMPORT_TABLE_ORDER: tuple[str, ...] = (
+    "sessions",
+    "prompt_batches",
+    "memory_observations",
+    "activities",
+    "agent_schedules",
+    "resolution_events",
+    "governance_audit_events",
+)
+_IMPORT_TABLE_INDEX: dict[str, int] = {table: i for i, table in enumerate(_IMPORT_TABLE_ORDER)}
+
+# Single-quoted SQL string with '' escapes. The body is possessive: a '' is
+# always an escape, never the end of one string and the start of another, so
+# an unterminated string at the end of a read chunk fails in linear time.
+_SQL_STRING = r"'[^']*+(?:''[^']*+)*+'"
+# Whitespace and -- comments between statements
+_SQL_GAP_RE = re.compile(r"(?:\s+|--[^\n]*\n)*")
+_SQL_INSERT_HEADER_RE = re.compile(r"INSERT INTO (\w+) \(([^)]+)\) VALUES \(\s*")
+# One value and the separator after it: a quoted string or a bare literal
+_SQL_VALUE_RE = re.compile(rf"(?:({_SQL_STRING})|([^\s,')]+))\s*([,)])\s*")
+# Any complete statement, quote-aware (used to skip ones that do not parse)
+_SQL_STATEMENT_RE = re.compile(rf"(?:[^';]|{_SQL_STRING})*+;")
+
+
+def _iter_backup_rows(
+    backup_path: Path,
+    chunk_chars: int = CI_BACKUP_IMPORT_READ_CHUNK_CHARS,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Stream parsed INSERT rows from a backup file.
 
-    Handles multi-line statements where values contain newlines.
-    A statement ends with ');' not inside a quoted string.
+    Reads the file in chunks and tokenizes each statement once, so memory
+    use is bounded by the chunk size and the longest statement rather than
+    the file size. Values may contain newlines, semicolons and escaped quotes.
 
     Args:
-        content: Full backup file content.
+        backup_path: Path to SQL backup file.
+        chunk_chars: Characters to read per chunk.
 
-    Returns:
-        List of complete INSERT statements.
+    Yields:
+        (table, row) per INSERT statement, with values converted to Python
+        types. Statements that do not parse are skipped.
     """
-    statements = []
-    current_stmt = ""
-    in_string = False
-    in_comment = False
-    i = 0
-
-    while i < len(content):
-        char = content[i]
-
-        # Handle SQL comments (-- to end of line)
-        if not in_string and not in_comment and char == "-":
-            if i + 1 < len(content) and content[i + 1] == "-":
-                in_comment = True
-                i += 2
+    with backup_path.open("r", encoding="utf-8") as handle:
+        buffer = ""
+        pos = 0
+        eof = False
+        while True:
+            pos = _SQL_GAP_RE.match(buffer, pos).end()  # type: ignore[union-attr]
+            parsed = _parse_insert_at(buffer, pos)
+            if parsed is not None:
+                pos, table, row = parsed
+                if row is not None:
+                    yield table, row
                 continue
 
-        # End of comment at newline
-        if in_comment:
-            if char == "\n":
-                in_comment = False
-            i += 1
-            continue
-
-        # Skip whitespace/newlines when not in a statement
-        if not current_stmt and char in " \t\n\r":
-            i += 1
-            continue
-
-        current_stmt += char
-
-        if char == "'" and not in_string:
-            in_string = True
-        elif char == "'" and in_string:
-            # Check for escaped quote ''
-            if i + 1 < len(content) and content[i + 1] == "'":
-                # Escaped quote - add it and skip next char
-                current_stmt += content[i + 1]
-                i += 1
-            else:
-                in_string = False
-        elif char == ";" and not in_string:
-            # Statement complete
-            stmt = current_stmt.strip()
-            if stmt.startswith("INSERT INTO"):
-                statements.append(stmt)
-            current_stmt = ""
+            # A "--" here is a comment cut off by the end of the buffer
+            in_comment = buffer.startswith("--", pos) or buffer[pos:] == "-"
+            statement = None if in_comment else _SQL_STATEMENT_RE.match(buffer, pos)
+            if statement is not None:
+                # Complete but not a parseable INSERT
+                logger.debug(f"Skipping unparseable backup statement at offset {pos}")
+                pos = statement.end()
+                continue
 
-        i += 1
+            if eof:
+                if buffer[pos:].strip():
+                    logger.warning(f"Ignoring incomplete statement at end of {backup_path}")
+                return
 
-    return statements
+            # Statement continues past the buffer: drop consumed text, read more
+            chunk = handle.read(chunk_chars)
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            if not chunk:
+                eof = True
+                # Terminate a trailing comment without a final newline
+                buffer += "\n"
 
 
-def _parse_insert_statement(stmt: str) -> dict | None:
-    """Parse INSERT statement to extract column names and values.
+def _parse_insert_at(buffer: str, pos: int) -> tuple[int, str, dict[str, Any] | None] | None:
+    """Parse one ``INSERT INTO t (cols) VALUES (...);`` statement at a position.
 
     Args:
-        stmt: SQL INSERT statement.
+        buffer: Text containing the statement.
+        pos: Offset where the statement starts.
 
     Returns:
-        Dictionary of column names to values, or None if parsing fails.
+        (end offset, table, row) or None if no complete INSERT starts at
+        ``pos``. The row is None if the value and column counts differ.
     """
-    # Pattern: INSERT INTO table (col1, col2, ...) VALUES (val1, val2, ...);
-    match = re.match(
-        r"INSERT INTO \w+ \(([^)]+)\) VALUES \((.+)\);?$",
-        stmt,
-        re.DOTALL,
-    )
-    if not match:
+    header = _SQL_INSERT_HEADER_RE.match(buffer, pos)
+    if header is None:
         return None
 
-    columns_str = match.group(1)
-    values_str = match.group(2)
-
-    columns = [c.strip() for c in columns_str.split(",")]
+    values: list[Any] = []
+    pos = header.end()
+    while True:
+        match = _SQL_VALUE_RE.match(buffer, pos)
+        if match is None:
+            return None
+        quoted, literal, separator = match.groups()
+        if quoted is not None:
+            values.append(quoted[1:-1].replace("''", "'"))
+        else:
+            values.append(_parse_sql_literal(literal))
+        pos = match.end()
+        if separator == ")":
+            break
 
-    # Parse values (handling quoted strings with commas)
-    values = _parse_sql_values(values_str)
-    if len(values) != len(columns):
+    if not buffer.startswith(";", pos):
         return None
 
-    return dict(zip(columns, values, strict=False))
+    columns = [c.strip() for c in header.group(2).split(",")]
+    row = dict(zip(columns, values, strict=True)) if len(values) == len(columns) else None
+    return pos + 1, header.group(1), row
 
 
-def _parse_sql_values(values_str: str) -> list:
-    """Parse SQL VALUES clause, handling quoted strings with commas.
+def _parse_sql_literal(token: str) -> int | float | str | None:
+    """Parse an unquoted SQL value (NULL or a number) to a Python value.
 
     Args:
-        values_str: The values portion of an INSERT statement.
+        token: Unquoted SQL value.
 
     Returns:
-        List of parsed values.
+        None for NULL, int or float for numbers, otherwise the token itself.
     """
-    values = []
-    current = ""
-    in_string = False
-    i = 0
-
-    while i < len(values_str):
-        char = values_str[i]
-
-        if char == "'" and not in_string:
-            in_string = True
-            current += char
-        elif char == "'" and in_string:
-            # Check for escaped quote
-            if i + 1 < len(values_str) and values_str[i + 1] == "'":
-                current += "''"
-                i += 1
-            else:
-                in_string = False
-                current += char
-        elif char == "," and not in_string:
-            values.append(_parse_sql_value(current.strip()))
-            current = ""
-        else:
-            current += char
-        i += 1
-
-    # Don't forget the last value
-    if current.strip():
-        values.append(_parse_sql_value(current.strip()))
-
-    return values
-
+    if token == "NULL":
+        return None
+    try:
+        return int(token)
+    except ValueError:
+        pass
+    try:
+        return float(token)
+    except ValueError:
+        return token
 
-def _parse_sql_value(val_str: str) -> str | int | float | bool | None:
-    """Parse a single SQL value string to Python type.
 
-    Args:
-        val_str: SQL value string.
+class _ImportBatcher:
+    """Inserts prepared rows with executemany, one savepoint per batch.
 
-    Returns:
-        Parsed Python value (str, int, float, None, or bool).
+    Rows are grouped while they share a table, insert verb and column list.
+    A batch that fails is rolled back to its savepoint and retried row by
+    row, so a bad record only costs itself. The caller owns the enclosing
+    transaction and commits once the whole import is done.
     """
-    if val_str == "NULL":
-        return None
-    if val_str.startswith("'") and val_str.endswith("'"):
-        # Unescape single quotes
-        return val_str[1:-1].replace("''", "'")
-    try:
-        if "." in val_str:
-            return float(val_str)
-        return int(val_str)
-    except ValueError:
-        return val_str
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        result: ImportResult,
+        batch_size: int = CI_BACKUP_IMPORT_BATCH_SIZE,
+    ):
+        self._conn = conn
+        self._result = result
+        self._batch_size = batch_size
+        self._table = ""
+        self._sql = ""
+        self._rows: list[tuple[Any, ...]] = []
+
+    def add(self, table: str, verb: str, row: dict[str, Any]) -> None:
+        """Queue a row, flushing the current batch if it cannot share it."""
+        placeholders = ", ".join("?" * len(row))
+        sql = f"{verb} INTO {table} ({', '.join(row)}) VALUES ({placeholders})"
+        if sql != self._sql:
+            self.flush()
+            self._table = table
+            self._sql = sql
+        self._rows.append(tuple(row.values()))
+        if len(self._rows) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Insert the queued rows."""
+        if not self._rows:
+            return
+        table, sql, rows = self._table, self._sql, self._rows
+        self._rows = []
+
+        conn = self._conn
+        errors = 0
+        conn.execute("SAVEPOINT backup_import")
+        try:
+            inserted = conn.executemany(sql, rows).rowcount
+        except sqlite3.Error:
+            conn.execute("ROLLBACK TO backup_import")
+            inserted = 0
+            for params in rows:
+                try:
+                    inserted += conn.execute(sql, params).rowcount
+                except sqlite3.Error as e:
+                    errors += 1
+                    error_msg = f"Error importing {table} record: {e}"
+                    self._result.errors += 1
+                    self._result.error_messages.append(error_msg)
+                    logger.warning(error_msg)
+        conn.execute("RELEASE backup_import")
+
+        # Only count as imported if a row was actually inserted
+        # (INSERT OR IGNORE inserts nothing when ignored due to ID collision)
+        _increment_imported(self._result, table, inserted)
+        ignored = len(rows) - errors - inserted
+        if ignored > 0:
+            _increment_skipped(self._result, table, ignored)
+            logger.debug(f"Skipped {ignored} {table} records due to ID collision")
 
 
 def _should_skip_record(
@@ -1777,8 +1833,8 @@ def _update_existing_sets(
             existing_resolution_hashes.add(content_hash)
 
 
-def _prepare_statement_for_import(stmt: str, table: str) -> str:
-    """Modify INSERT statement for proper import.
+def _prepare_row_for_import(table: str, row: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    """Adjust a row for proper import.
 
     For memory_observations, marks embedded=0 to trigger ChromaDB rebuild.
     For prompt_batches, marks plan_embedded=0 for re-indexing and removes id column.
@@ -1790,40 +1846,49 @@ def _prepare_statement_for_import(stmt: str, table: str) -> str:
     different machines that have overlapping id sequences.
 
     Args:
-        stmt: Original INSERT statement.
         table: Table name.
+        row: Row data filtered to the current schema.
 
     Returns:
-        Modified statement ready for execution.
+        Tuple of (insert verb, row to insert).
     """
+    row = dict(row)
     if table == "memory_observations":
         # Use INSERT OR IGNORE to handle rare UUID collisions gracefully
         # (if ID exists but content_hash is different, skip the import)
-        stmt = stmt.replace("INSERT INTO", "INSERT OR IGNORE INTO", 1)
-        return _replace_column_value(stmt, "embedded", "0")
+        _replace_column_value(row, "embedded", 0)
+        return "INSERT OR IGNORE", row
     elif table == "prompt_batches":
         # Remove id column to let SQLite auto-generate, and mark unembedded
-        stmt = _remove_column_from_insert(stmt, "id")
-        stmt = _replace_column_value(stmt, "plan_embedded", "0")
-        return stmt
+        row.pop("id", None)
+        _replace_column_value(row, "plan_embedded", 0)
+        return "INSERT", row
     elif table == "activities":
         # Remove id column to let SQLite auto-generate
-        return _remove_column_from_insert(stmt, "id")
+        row.pop("id", None)
+        return "INSERT", row
     elif table == "sessions":
         # Use INSERT OR IGNORE to handle potential session ID collisions
-        return stmt.replace("INSERT INTO", "INSERT OR IGNORE INTO", 1)
+        return "INSERT OR IGNORE", row
     elif table == "agent_schedules":
         # Use INSERT OR IGNORE for TEXT primary key (task_name)
         # Schedules are already filtered by machine in _should_skip_record
-        return stmt.replace("INSERT INTO", "INSERT OR IGNORE INTO", 1)
+        return "INSERT OR IGNORE", row
     elif table == "resolution_events":
         # Use INSERT OR IGNORE and mark as unapplied (needs replay)
-        stmt = stmt.replace("INSERT INTO", "INSERT OR IGNORE INTO", 1)
-        return _replace_column_value(stmt, "applied", "0")
+        _replace_column_value(row, "applied", 0)
+        return "INSERT OR IGNORE", row
     elif table == "governance_audit_events":
         # Remove auto-increment id to let SQLite generate new IDs
-        return _remove_column_from_insert(stmt, "id")
-    return stmt
+        row.pop("id", None)
+        return "INSERT", row
+    return "INSERT", row
+
+
+def _replace_column_value(row: dict[str, Any], column_name: str, new_value: Any) -> None:
+    """Replace a column's value in a row, if the row has that column."""
+    if column_name in row:
+        row[column_name] = new_value
 
 
 def _build_prompt_batch_id_map(conn: sqlite3.Connection) -> dict[tuple[str, int], int]:
@@ -1843,11 +1908,10 @@ def _build_prompt_batch_id_map(conn: sqlite3.Connection) -> dict[tuple[str, int]
 
 
 def _remap_prompt_batch_id(
-    stmt: str,
-    row_dict: dict,
+    row: dict[str, Any],
     old_to_new_batch_id: dict[int, int],
-) -> str:
-    """Remap prompt_batch_id to the correct new ID.
+) -> None:
+    """Remap prompt_batch_id to the correct new ID, in place.
 
     After prompt_batches are imported with auto-generated IDs, activities
     and memory_observations still reference the OLD prompt_batch_id from
@@ -1855,16 +1919,12 @@ def _remap_prompt_batch_id(
     the pre-computed mapping.
 
     Args:
-        stmt: The INSERT statement for the record.
-        row_dict: Parsed row data from the record.
+        row: Row data for the record; left unchanged if lookup fails.
         old_to_new_batch_id: Mapping from old prompt_batch_id to new id.
-
-    Returns:
-        Modified statement with corrected prompt_batch_id, or original if lookup fails.
     """
-    old_batch_id = row_dict.get("prompt_batch_id")
+    old_batch_id = row.get("prompt_batch_id")
     if old_batch_id is None:
-        return stmt
+        return
 
     old_batch_id_int = int(old_batch_id)
     new_batch_id = old_to_new_batch_id.get(old_batch_id_int)
@@ -1874,168 +1934,10 @@ def _remap_prompt_batch_id(
             f"No mapping found for old prompt_batch_id {old_batch_id}, "
             f"activity may reference wrong batch"
         )
-        return stmt
+        return
 
     logger.debug(f"Remapped activity prompt_batch_id: {old_batch_id} -> {new_batch_id}")
-    return _replace_column_value(stmt, "prompt_batch_id", str(new_batch_id))
-
-
-def _remove_column_from_insert(stmt: str, column_name: str) -> str:
-    """Remove a column and its value from an INSERT statement.
-
-    Used to strip auto-increment id columns so SQLite generates new IDs,
-    avoiding PRIMARY KEY conflicts when importing from different machines.
-
-    Args:
-        stmt: INSERT INTO table (cols) VALUES (vals); statement.
-        column_name: Name of the column to remove.
-
-    Returns:
-        Modified statement without the column.
-    """
-    # Parse column list
-    cols_match = re.search(r"\(([^)]+)\)\s*VALUES\s*\(", stmt, re.IGNORECASE)
-    if not cols_match:
-        return stmt
-
-    cols_str = cols_match.group(1)
-    columns = [c.strip() for c in cols_str.split(",")]
-
-    # Find target column index
-    try:
-        col_idx = columns.index(column_name)
-    except ValueError:
-        return stmt  # Column not in statement
-
-    # Find VALUES section
-    values_start = stmt.upper().find("VALUES")
-    if values_start == -1:
-        return stmt
-
-    # Find the opening paren after VALUES
-    paren_start = stmt.find("(", values_start)
-    if paren_start == -1:
-        return stmt
-
-    # Parse values as raw SQL strings (handling quoted strings with commas)
-    values_section = stmt[paren_start + 1 :]
-    values = _parse_sql_values_as_strings(values_section.rstrip(");"))
-
-    if col_idx >= len(values):
-        return stmt
-
-    # Remove the column and value
-    new_columns = columns[:col_idx] + columns[col_idx + 1 :]
-    new_values = values[:col_idx] + values[col_idx + 1 :]
-
-    # Get table name
-    table_match = re.match(r"INSERT INTO (\w+)", stmt)
-    if not table_match:
-        return stmt
-    table_name = table_match.group(1)
-
-    # Rebuild the statement
-    return f"INSERT INTO {table_name} ({', '.join(new_columns)}) VALUES ({', '.join(new_values)});"
-
-
-def _replace_column_value(stmt: str, column_name: str, new_value: str) -> str:
-    """Replace a column's value in an INSERT statement.
-
-    Parses the INSERT statement to find the column index in the column list,
-    then replaces the corresponding value in the VALUES section.
-
-    Args:
-        stmt: INSERT INTO table (cols) VALUES (vals); statement.
-        column_name: Name of the column to modify.
-        new_value: New value to set.
-
-    Returns:
-        Modified statement with the column's value replaced.
-    """
-    # Parse column list
-    cols_match = re.search(r"\(([^)]+)\)\s*VALUES\s*\(", stmt, re.IGNORECASE)
-    if not cols_match:
-        return stmt
-
-    cols_str = cols_match.group(1)
-    columns = [c.strip() for c in cols_str.split(",")]
-
-    # Find target column index
-    try:
-        col_idx = columns.index(column_name)
-    except ValueError:
-        return stmt  # Column not in statement
-
-    # Find VALUES section
-    values_start = stmt.upper().find("VALUES")
-    if values_start == -1:
-        return stmt
-
-    # Find the opening paren after VALUES
-    paren_start = stmt.find("(", values_start)
-    if paren_start == -1:
-        return stmt
-
-    # Parse values as raw SQL strings (handling quoted strings with commas)
-    values_section = stmt[paren_start + 1 :]
-    values = _parse_sql_values_as_strings(values_section.rstrip(");"))
-
-    if col_idx >= len(values):
-        return stmt
-
-    # Replace the value
-    values[col_idx] = new_value
-
-    # Rebuild the statement
-    prefix = stmt[: paren_start + 1]
-    return f"{prefix}{', '.join(values)});"
-
-
-def _parse_sql_values_as_strings(values_str: str) -> list[str]:
-    """Parse SQL VALUES section into list of raw SQL value strings.
-
-    Handles quoted strings with embedded commas and parentheses.
-    Returns original SQL representation (e.g., 'text', NULL, 123).
-
-    Args:
-        values_str: The content inside VALUES (...) without outer parens.
-
-    Returns:
-        List of SQL value strings.
-    """
-    values: list[str] = []
-    current = ""
-    in_string = False
-    depth = 0
-
-    for char in values_str:
-        if char == "'" and not in_string:
-            in_string = True
-            current += char
-        elif char == "'" and in_string:
-            # Check for escaped quote ('')
-            if current.endswith("'"):
-                current += char
-            else:
-                in_string = False
-                current += char
-        elif char == "(" and not in_string:
-            depth += 1
-            current += char
-        elif char == ")" and not in_string:
-            depth -= 1
-            current += char
-        elif char == "," and not in_string and depth == 0:
-            values.append(current.strip())
-            current = ""
-        else:
-            current += char
-
-    # Don't forget the last value
-    if current.strip():
-        values.append(current.strip())
-
-    return values
+    row["prompt_batch_id"] = new_batch_id
 
 
 _TABLE_TO_IMPORTED_ATTR: dict[str, str] = {
@@ -2059,18 +1961,18 @@ _TABLE_TO_SKIPPED_ATTR: dict[str, str] = {
 }
 
 
-def _increment_imported(result: ImportResult, table: str) -> None:
+def _increment_imported(result: ImportResult, table: str, count: int = 1) -> None:
     """Increment the appropriate imported counter."""
     attr = _TABLE_TO_IMPORTED_ATTR.get(table)
     if attr:
-        setattr(result, attr, getattr(result, attr) + 1)
+        setattr(result, attr, getattr(result, attr) + count)
 
 
-def _increment_skipped(result: ImportResult, table: str) -> None:
+def _increment_skipped(result: ImportResult, table: str, count: int = 1) -> None:
     """Increment the appropriate skipped counter."""
     attr = _TABLE_TO_SKIPPED_ATTR.get(table)
     if attr:
-        setattr(result, attr, getattr(result, attr) + 1)
+        setattr(result, attr, getattr(result, attr) + count)
 
 
 # =============================================================================
@@ -2093,69 +1995,27 @@ def _get_table_columns(conn: sqlite3.Connection, table: str) -> set[str]:
 
 
 def _filter_columns_for_schema(
-    stmt: str,
-    row_dict: dict,
+    row_dict: dict[str, Any],
     valid_columns: set[str],
-) -> tuple[str, dict, list[str]]:
-    """Filter INSERT statement to only include columns in current schema.
+) -> tuple[dict[str, Any], list[str]]:
+    """Filter a row to only include columns in current schema.
 
     This enables importing backups from newer schema versions by stripping
     columns that don't exist in the current schema.
 
     Args:
-        stmt: Original INSERT statement.
         row_dict: Parsed row data.
         valid_columns: Set of valid column names from current schema.
 
     Returns:
-        Tuple of (filtered_stmt, filtered_row_dict, removed_columns).
+        Tuple of (filtered_row_dict, removed_columns).
     """
-    # Parse the statement to get columns and values
-    cols_match = re.search(r"INSERT INTO (\w+) \(([^)]+)\) VALUES \(", stmt, re.IGNORECASE)
-    if not cols_match:
-        return stmt, row_dict, []
-
-    table_name = cols_match.group(1)
-    cols_str = cols_match.group(2)
-    columns = [c.strip() for c in cols_str.split(",")]
-
-    # Find columns to remove
-    removed_columns = [c for c in columns if c not in valid_columns]
+    removed_columns = [c for c in row_dict if c not in valid_columns]
     if not removed_columns:
-        return stmt, row_dict, []
-
-    # Parse values
-    values_start = stmt.upper().find("VALUES")
-    paren_start = stmt.find("(", values_start)
-    values_section = stmt[paren_start + 1 :].rstrip(");")
-    values = _parse_sql_values_as_strings(values_section)
-
-    if len(values) != len(columns):
-        logger.warning(f"Column/value count mismatch, skipping column filter for {table_name}")
-        return stmt, row_dict, []
-
-    # Build filtered columns and values
-    filtered_columns = []
-    filtered_values = []
-    filtered_row_dict = {}
-
-    for col, val in zip(columns, values, strict=False):
-        if col in valid_columns:
-            filtered_columns.append(col)
-            filtered_values.append(val)
-            if col in row_dict:
-                filtered_row_dict[col] = row_dict[col]
-
-    # Rebuild statement
-    filtered_stmt = (
-        f"INSERT INTO {table_name} ({', '.join(filtered_columns)}) "
-        f"VALUES ({', '.join(filtered_values)});"
-    )
+        return row_dict, []
 
-    logger.debug(
-        f"Filtered {len(removed_columns)} unknown columns from {table_name}: {removed_columns}"
-    )
-    return filtered_stmt, filtered_row_dict, removed_columns
+    filtered_row_dict = {c: v for c, v in row_dict.items() if c in valid_columns}
+    return filtered_row_dict, removed_columns
 
 
 def _remap_source_plan_batch_id(
@@ -2268,7 +2128,7 @@ def _backfill_session_summaries_from_observations(conn: sqlite3.Connection) -> i
     sessions.summary/summary_updated_at, then removes the migrated observations.
 
     Args:
-        conn: SQLite connection (already committed after import).
+        conn: SQLite connection inside the import transaction (not committed here).
 
     Returns:
         Number of sessions backfilled.
@@ -2293,7 +2153,6 @@ def _backfill_session_summaries_from_observations(conn: sqlite3.Connection) -> i
 
     if backfilled > 0:
         conn.execute("DELETE FROM memory_observations WHERE memory_type = 'session_summary'")
-        conn.commit()
         logger.info(
             f"Backfilled {backfilled} session summaries from legacy " "session_summary observations"
         )
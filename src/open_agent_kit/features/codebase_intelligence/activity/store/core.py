@@ -37,6 +37,7 @@ from open_agent_kit.features.codebase_intelligence.activity.store.schema import
     SCHEMA_SQL,
     SCHEMA_VERSION,
 )
+from open_agent_kit.features.codebase_intelligence.activity.store.writer import ActivityWriter
 
 logger = logging.getLogger(__name__)
 
@@ -64,10 +65,8 @@ class ActivityStore:
         self._stats_cache: dict[str, tuple[dict[str, Any], float]] = {}
         self._cache_ttl = 5.0  # 5 seconds TTL for near real-time debugging
         self._cache_lock = threading.Lock()
-        # Activity batching buffer for bulk inserts
-        self._activity_buffer: list[Activity] = []
-        self._buffer_lock = threading.Lock()
-        self._buffer_size = 10  # Flush when buffer reaches this size
+        # Write-behind queue for buffered activity inserts
+        self._activity_writer = ActivityWriter(self)
         self._ensure_schema()
 
     def _get_connection(self) -> sqlite3.Connection:
@@ -250,7 +249,12 @@ class ActivityStore:
         stats.invalidate_stats_cache(self, session_id)
 
     def close(self) -> None:
-        """Close database connections (read-write and read-only)."""
+        """Write queued activities, then close this thread's connections."""
+        self._activity_writer.stop()
+        self._close_connections()
+
+    def _close_connections(self) -> None:
+        """Close this thread's database connections (read-write and read-only)."""
         if hasattr(self._local, "conn") and self._local.conn:
             self._local.conn.close()
             self._local.conn = None
@@ -397,6 +401,18 @@ class ActivityStore:
         """Get recent sessions with pagination support."""
         return sessions.get_recent_sessions(self, limit, offset, status, agent, sort)
 
+    def get_sessions_page(
+        self,
+        limit: int = 10,
+        cursor: str | None = None,
+        offset: int = 0,
+        status: str | None = None,
+        agent: str | None = None,
+        sort: str = "last_activity",
+    ) -> tuple[list[Session], str | None]:
+        """Get one page of sessions using keyset pagination."""
+        return sessions.get_sessions_page(self, limit, cursor, offset, status, agent, sort)
+
     def get_sessions_needing_titles(self, limit: int = 10) -> list[Session]:
         """Get sessions that need titles generated."""
         return sessions.get_sessions_needing_titles(self, limit)
@@ -628,12 +644,33 @@ class ActivityStore:
         return activities.add_activity(self, activity)
 
     def flush_activity_buffer(self) -> list[int]:
-        """Flush any buffered activities to the database."""
-        return activities.flush_activity_buffer(self)
+        """Write all queued activities and wait for them to commit.
+
+        Returns:
+            IDs of the activities written.
+        """
+        return self._activity_writer.flush()
 
     def add_activity_buffered(self, activity: Activity, force_flush: bool = False) -> int | None:
-        """Add an activity with automatic batching."""
-        return activities.add_activity_buffered(self, activity, force_flush)
+        """Queue an activity for the background writer.
+
+        Args:
+            activity: Activity to add.
+            force_flush: If True, wait until the queue (including this
+                activity) is written.
+
+        Returns:
+            ID of the last activity written if flushed, None if queued.
+        """
+        self._activity_writer.submit(activity)
+        if force_flush:
+            ids = self._activity_writer.flush()
+            return ids[-1] if ids else None
+        return None
+
+    def get_activity_writer_stats(self) -> dict[str, Any]:
+        """Get activity write queue depth and write latency."""
+        return self._activity_writer.get_stats()
 
     def add_activities(self, activity_list: list[Activity]) -> list[int]:
         """Add multiple activities in a single transaction."""
@@ -645,6 +682,19 @@ class ActivityStore:
         """Get activities for a session."""
         return activities.get_session_activities(self, session_id, tool_name, limit)
 
+    def get_session_activities_page(
+        self,
+        session_id: str,
+        limit: int,
+        cursor: str | None = None,
+        offset: int = 0,
+        tool_name: str | None = None,
+    ) -> tuple[list[Activity], str | None]:
+        """Get one page of a session's activities using keyset pagination."""
+        return activities.get_session_activities_page(
+            self, session_id, limit, cursor, offset, tool_name
+        )
+
     def get_unprocessed_activities(
         self, session_id: str | None = None, limit: int = 100
     ) -> list[Activity]:
@@ -774,6 +824,36 @@ class ActivityStore:
             include_resolved=include_resolved,
         )
 
+    def list_observations_page(
+        self,
+        limit: int = 50,
+        cursor: str | None = None,
+        offset: int = 0,
+        memory_types: list[str] | None = None,
+        exclude_types: list[str] | None = None,
+        tag: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        include_archived: bool = False,
+        status: str | None = "active",
+        include_resolved: bool = False,
+    ) -> tuple[list[dict], int, str | None]:
+        """List one page of observations using keyset pagination."""
+        return observations.list_observations_page(
+            self,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            memory_types=memory_types,
+            exclude_types=exclude_types,
+            tag=tag,
+            start_date=start_date,
+            end_date=end_date,
+            include_archived=include_archived,
+            status=status,
+            include_resolved=include_resolved,
+        )
+
     def find_later_edit_session(
         self, file_path: str, after_epoch: float, exclude_session_id: str
     ) -> str | None:
@@ -1063,10 +1143,18 @@ class ActivityStore:
         status: str = "pending",
         project_config: dict[str, Any] | None = None,
         system_prompt_hash: str | None = None,
+        queue_wait_ms: int | None = None,
     ) -> None:
         """Create a new agent run record."""
         agent_runs.create_run(
-            self, run_id, agent_name, task, status, project_config, system_prompt_hash
+            self,
+            run_id,
+            agent_name,
+            task,
+            status,
+            project_config,
+            system_prompt_hash,
+            queue_wait_ms,
         )
 
     def get_agent_run(self, run_id: str) -> dict[str, Any] | None:
@@ -1133,6 +1221,32 @@ class ActivityStore:
             sort_order,
         )
 
+    def list_agent_runs_page(
+        self,
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+        agent_name: str | None = None,
+        status: str | None = None,
+        created_after_epoch: int | None = None,
+        created_before_epoch: int | None = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+    ) -> tuple[list[dict[str, Any]], int, str | None]:
+        """List one page of agent runs using keyset pagination."""
+        return agent_runs.list_runs_page(
+            self,
+            limit,
+            cursor,
+            offset,
+            agent_name,
+            status,
+            created_after_epoch,
+            created_before_epoch,
+            sort_by,
+            sort_order,
+        )
+
     def delete_agent_run(self, run_id: str) -> bool:
         """Delete an agent run."""
         return agent_runs.delete_run(self, run_id)
@@ -6,6 +6,11 @@ Contains all migration logic for upgrading database schema versions.
 import logging
 import sqlite3
 
+from open_agent_kit.features.codebase_intelligence.activity.store.schema import (
+    KEYSET_INDEX_STATEMENTS,
+    SESSION_ROLLUP_STATEMENTS,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,11 +35,18 @@ def apply_migrations(conn: sqlite3.Connection, from_version: int) -> None:
         _migrate_v6_to_v7(conn)
     if from_version < 8:
         _migrate_v7_to_v8(conn)
+    if from_version < 9:
+        _migrate_v8_to_v9(conn)
+    if from_version < 10:
+        _migrate_v9_to_v10(conn)
+    if from_version < 11:
+        _migrate_v10_to_v11(conn)
 
     # Always run idempotent column checks for the current version.
     # This catches columns added mid-development after a version was
     # first bumped (e.g. summary_embedded added to v6 after initial release).
     _ensure_v6_columns(conn)
+    _ensure_session_rollup_triggers(conn)
 
 
 def _migrate_v1_to_v2(conn: sqlite3.Connection) -> None:
@@ -308,6 +320,111 @@ def _migrate_v7_to_v8(conn: sqlite3.Connection) -> None:
     logger.info("Migration v7 -> v8 complete: origin_type column added to memory_observations")
 
 
+def _migrate_v8_to_v9(conn: sqlite3.Connection) -> None:
+    """Migrate schema v8 -> v9: add materialized per-session rollups.
+
+    Creates the session rollup tables and the triggers that maintain them,
+    then backfills them from the existing activities in one pass.
+    """
+    logger.info("Migrating activity store schema v8 -> v9 (session rollups)")
+
+    for statement in SESSION_ROLLUP_STATEMENTS:
+        conn.execute(statement)
+    backfill_session_rollups(conn)
+
+    logger.info("Migration v8 -> v9 complete: session rollups backfilled")
+
+
+def _migrate_v9_to_v10(conn: sqlite3.Connection) -> None:
+    """Migrate schema v9 -> v10: add composite indexes for keyset pagination."""
+    logger.info("Migrating activity store schema v9 -> v10 (keyset pagination indexes)")
+
+    for statement in KEYSET_INDEX_STATEMENTS:
+        conn.execute(statement)
+
+    logger.info("Migration v9 -> v10 complete: keyset pagination indexes created")
+
+
+def _migrate_v10_to_v11(conn: sqlite3.Connection) -> None:
+    """Migrate schema v10 -> v11: add queue_wait_ms to agent_runs.
+
+    Records how long a scheduled run waited for a free scheduler slot after
+    its due time. Existing runs keep NULL.
+
+    Idempotent: skips column if it already exists.
+    """
+    logger.info("Migrating activity store schema v10 -> v11 (agent run queue wait)")
+
+    existing_columns = {row[1] for row in conn.execute("PRAGMA table_info(agent_runs)").fetchall()}
+
+    if "queue_wait_ms" not in existing_columns:
+        conn.execute("ALTER TABLE agent_runs ADD COLUMN queue_wait_ms INTEGER")
+
+    logger.info("Migration v10 -> v11 complete: queue_wait_ms column added to agent_runs")
+
+
+def backfill_session_rollups(conn: sqlite3.Connection) -> None:
+    """Rebuild all session rollups from the activities table.
+
+    Idempotent: existing rollup rows are replaced.
+
+    Args:
+        conn: Database connection (within transaction).
+    """
+    conn.execute("DELETE FROM session_rollups")
+    conn.execute("DELETE FROM session_tool_rollups")
+    conn.execute("DELETE FROM session_file_rollups")
+    conn.execute("""
+        INSERT INTO session_rollups (
+            session_id, last_activity_epoch, activity_count,
+            read_count, edit_count, write_count, error_count, files_touched
+        )
+        SELECT
+            session_id,
+            MAX(timestamp_epoch),
+            COUNT(*),
+            SUM(CASE WHEN tool_name = 'Read' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN tool_name = 'Edit' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN tool_name = 'Write' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN success = FALSE THEN 1 ELSE 0 END),
+            COUNT(DISTINCT file_path)
+        FROM activities
+        GROUP BY session_id
+    """)
+    conn.execute("""
+        INSERT INTO session_tool_rollups (session_id, tool_name, count)
+        SELECT session_id, tool_name, COUNT(*)
+        FROM activities
+        GROUP BY session_id, tool_name
+    """)
+    conn.execute("""
+        INSERT INTO session_file_rollups (session_id, file_path, count)
+        SELECT session_id, file_path, COUNT(*)
+        FROM activities
+        WHERE file_path IS NOT NULL
+        GROUP BY session_id, file_path
+    """)
+
+
+def _ensure_session_rollup_triggers(conn: sqlite3.Connection) -> None:
+    """Ensure the rollup triggers exist even if v9 was reached without all of them.
+
+    Databases migrated before the activities UPDATE trigger was added may
+    have rollups that drifted on activity updates, so they are rebuilt once
+    when the trigger is created. Runs unconditionally (cheap sqlite_master check).
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'session_rollups_au'"
+    ).fetchone()
+    if exists:
+        return
+
+    for statement in SESSION_ROLLUP_STATEMENTS:
+        conn.execute(statement)
+    backfill_session_rollups(conn)
+    logger.info("Added missing session_rollups_au trigger and rebuilt session rollups")
+
+
 def _ensure_v6_columns(conn: sqlite3.Connection) -> None:
     """Ensure v6 columns exist even if the migration ran before they were added.
 
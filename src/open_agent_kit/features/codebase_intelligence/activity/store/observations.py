@@ -9,6 +9,13 @@ import logging
 from typing import TYPE_CHECKING
 
 from open_agent_kit.features.codebase_intelligence.activity.store.models import StoredObservation
+from open_agent_kit.features.codebase_intelligence.activity.store.pagination import (
+    decode_cursor,
+    keyset_condition,
+    next_cursor,
+    order_clause,
+    select_keys,
+)
 
 if TYPE_CHECKING:
     from open_agent_kit.features.codebase_intelligence.activity.store.core import ActivityStore
@@ -406,6 +413,10 @@ def get_active_observations(
     return [StoredObservation.from_row(row) for row in cursor.fetchall()]
 
 
+# Newest first; idx_memory_observations_created_id covers the keyset seek
+_OBSERVATION_SORT_EXPRS: tuple[str, ...] = ("created_at_epoch", "id")
+
+
 def list_observations(
     store: ActivityStore,
     limit: int = 50,
@@ -440,6 +451,60 @@ def list_observations(
     Returns:
         Tuple of (observations list as dicts, total count).
     """
+    memories, total, _next_cursor = list_observations_page(
+        store,
+        limit=limit,
+        offset=offset,
+        memory_types=memory_types,
+        exclude_types=exclude_types,
+        tag=tag,
+        start_date=start_date,
+        end_date=end_date,
+        include_archived=include_archived,
+        status=status,
+        include_resolved=include_resolved,
+    )
+    return memories, total
+
+
+def list_observations_page(
+    store: ActivityStore,
+    limit: int = 50,
+    cursor: str | None = None,
+    offset: int = 0,
+    memory_types: list[str] | None = None,
+    exclude_types: list[str] | None = None,
+    tag: str | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    include_archived: bool = False,
+    status: str | None = "active",
+    include_resolved: bool = False,
+) -> tuple[list[dict], int, str | None]:
+    """List one page of observations using keyset pagination.
+
+    Args:
+        store: The ActivityStore instance.
+        limit: Maximum observations to return.
+        cursor: next_cursor from the previous page. Takes precedence over offset.
+        offset: Pagination offset when no cursor is given (deprecated).
+        memory_types: Only include these memory types.
+        exclude_types: Exclude these memory types.
+        tag: Filter to observations containing this tag (substring match on CSV).
+        start_date: Filter by start date (ISO YYYY-MM-DD).
+        end_date: Filter by end date (ISO YYYY-MM-DD).
+        include_archived: If True, include archived observations.
+        status: Filter to this observation status. Default "active".
+        include_resolved: If True, include all statuses (overrides status filter).
+
+    Returns:
+        Tuple of (observations list as dicts, total count, cursor for the
+        next page or None on the last page).
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or from another query.
+    """
+    kind = "memories"
     conn = store._get_connection()
 
     conditions: list[str] = []
@@ -482,17 +547,22 @@ def list_observations(
 
     # Get total count
     count_sql = f"SELECT COUNT(*) FROM memory_observations{where_clause}"
-    cursor = conn.execute(count_sql, params)
-    result = cursor.fetchone()
+    result = conn.execute(count_sql, params).fetchone()
     total = int(result[0]) if result else 0
 
-    # Fetch paginated results
+    # Fetch one page, continuing after the cursor row if given
+    if cursor:
+        conditions.append(keyset_condition(_OBSERVATION_SORT_EXPRS, descending=True))
+        params.extend(decode_cursor(cursor, kind, len(_OBSERVATION_SORT_EXPRS)))
+        where_clause = " WHERE " + " AND ".join(conditions)
+        offset = 0
     query_sql = (
-        f"SELECT * FROM memory_observations{where_clause}"
-        f" ORDER BY created_at_epoch DESC LIMIT ? OFFSET ?"
+        f"SELECT *, {select_keys(_OBSERVATION_SORT_EXPRS)} FROM memory_observations"
+        f"{where_clause} {order_clause(_OBSERVATION_SORT_EXPRS, descending=True)}"
+        f" LIMIT ? OFFSET ?"
     )
-    cursor = conn.execute(query_sql, [*params, limit, offset])
-    rows = cursor.fetchall()
+    rows = conn.execute(query_sql, [*params, limit + 1, offset]).fetchall()
+    cursor_out = next_cursor(kind, rows, limit, len(_OBSERVATION_SORT_EXPRS))
 
     memories: list[dict] = []
     for row in rows:
@@ -515,7 +585,7 @@ def list_observations(
             }
         )
 
-    return memories, total
+    return memories, total, cursor_out
 
 
 def find_later_edit_session(
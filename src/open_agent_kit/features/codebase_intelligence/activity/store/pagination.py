@@ -0,0 +1,132 @@
+"""Keyset (cursor) pagination helpers for activity store list queries.
+
+A cursor records the sort key and id of the last row on a page as an opaque
+URL-safe string. The next page continues strictly after that row, so SQLite
+seeks with a composite sort index instead of scanning and discarding every
+row skipped by ``LIMIT ? OFFSET ?``.
+
+Every keyset query orders by a list of expressions ending with the row id
+(the tiebreaker), all in the same direction, and selects those expressions
+as ``_k0``, ``_k1``, ... so the next cursor can be read off the last row.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from typing import Any
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(kind: str, values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row on a page.
+
+    Args:
+        kind: Query and sort order the cursor belongs to (e.g. "sessions:created").
+        values: Values of the ORDER BY expressions, ending with the row id.
+
+    Returns:
+        Opaque URL-safe cursor string.
+    """
+    payload = json.dumps([kind, *values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, kind: str, key_count: int) -> list[Any]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page.
+        kind: Expected query and sort order.
+        key_count: Expected number of values (sort expressions plus the id).
+
+    Returns:
+        Sort values followed by the row id.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for a
+            different query or sort order.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Malformed cursor: {cursor!r}") from e
+
+    if (
+        not isinstance(payload, list)
+        or len(payload) != key_count + 1
+        or payload[0] != kind
+        or not all(isinstance(v, (int, float, str)) for v in payload[1:])
+    ):
+        raise InvalidCursorError(f"Cursor does not match this query: {cursor!r}")
+    return payload[1:]
+
+
+def select_keys(sort_exprs: Sequence[str]) -> str:
+    """Build the SELECT fragment exposing the sort key as ``_k0``, ``_k1``, ...
+
+    Args:
+        sort_exprs: ORDER BY expressions, ending with the id tiebreaker.
+
+    Returns:
+        SQL select-list fragment.
+    """
+    return ", ".join(f"{expr} AS _k{i}" for i, expr in enumerate(sort_exprs))
+
+
+def keyset_condition(sort_exprs: Sequence[str], descending: bool) -> str:
+    """Build the WHERE condition selecting rows after a cursor.
+
+    Uses a row-value comparison so SQLite can seek an index on the same
+    columns.
+
+    Args:
+        sort_exprs: ORDER BY expressions, ending with the id tiebreaker.
+        descending: True if the query sorts DESC.
+
+    Returns:
+        SQL condition with one ``?`` placeholder per expression.
+    """
+    columns = ", ".join(sort_exprs)
+    placeholders = ", ".join("?" * len(sort_exprs))
+    operator = "<" if descending else ">"
+    return f"({columns}) {operator} ({placeholders})"
+
+
+def order_clause(sort_exprs: Sequence[str], descending: bool) -> str:
+    """Build the ORDER BY clause matching keyset_condition.
+
+    Args:
+        sort_exprs: ORDER BY expressions, ending with the id tiebreaker.
+        descending: True to sort DESC.
+
+    Returns:
+        SQL ORDER BY clause.
+    """
+    direction = "DESC" if descending else "ASC"
+    return "ORDER BY " + ", ".join(f"{expr} {direction}" for expr in sort_exprs)
+
+
+def next_cursor(kind: str, rows: list[Any], limit: int, key_count: int) -> str | None:
+    """Trim a ``LIMIT limit + 1`` result to one page and build its next cursor.
+
+    Args:
+        kind: Query and sort order the cursor belongs to.
+        rows: Rows fetched with ``LIMIT limit + 1``; trimmed in place.
+        limit: Page size.
+        key_count: Number of sort expressions (selected as ``_k0``...).
+
+    Returns:
+        Cursor for the following page, or None if this is the last page.
+    """
+    if len(rows) <= limit:
+        return None
+    del rows[limit:]
+    last = rows[-1]
+    return encode_cursor(kind, [last[f"_k{i}"] for i in range(key_count)])
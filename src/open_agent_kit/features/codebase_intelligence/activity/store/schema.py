@@ -226,6 +226,7 @@ CREATE TABLE IF NOT EXISTS agent_runs (
     cost_usd REAL,
     input_tokens INTEGER,  -- Input tokens used (from SDK ResultMessage)
     output_tokens INTEGER,  -- Output tokens generated (from SDK ResultMessage)
+    queue_wait_ms INTEGER,  -- Scheduled runs: delay between due time and start
 
     -- Files modified (JSON arrays)
     files_created TEXT,  -- JSON array of file paths
@@ -387,3 +388,177 @@ CREATE INDEX IF NOT EXISTS idx_gov_audit_tool
 CREATE INDEX IF NOT EXISTS idx_gov_audit_rule
     ON governance_audit_events(rule_id);
 """
+
+# Per-session rollups read by the sessions list and session stats instead of
+# aggregating the activities table. Triggers keep them current as activities
+# are inserted, deleted or have a rolled-up column updated (an update is
+# applied as a delete of the old row plus an insert of the new one).
+# session_file_rollups reference-counts file paths so files_touched stays a
+# distinct count. No FK to sessions: rows go with the session trigger.
+SESSION_ROLLUP_STATEMENTS: tuple[str, ...] = (
+    """
+CREATE TABLE IF NOT EXISTS session_rollups (
+    session_id TEXT PRIMARY KEY,
+    last_activity_epoch INTEGER,
+    activity_count INTEGER NOT NULL DEFAULT 0,
+    read_count INTEGER NOT NULL DEFAULT 0,
+    edit_count INTEGER NOT NULL DEFAULT 0,
+    write_count INTEGER NOT NULL DEFAULT 0,
+    error_count INTEGER NOT NULL DEFAULT 0,
+    files_touched INTEGER NOT NULL DEFAULT 0
+)""",
+    """
+CREATE TABLE IF NOT EXISTS session_tool_rollups (
+    session_id TEXT NOT NULL,
+    tool_name TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (session_id, tool_name)
+) WITHOUT ROWID""",
+    """
+CREATE TABLE IF NOT EXISTS session_file_rollups (
+    session_id TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (session_id, file_path)
+) WITHOUT ROWID""",
+    # Recomputing last_activity_epoch after a delete is an index seek
+    """
+CREATE INDEX IF NOT EXISTS idx_activities_session_timestamp
+    ON activities(session_id, timestamp_epoch)""",
+    """
+CREATE TRIGGER IF NOT EXISTS session_rollups_ai AFTER INSERT ON activities BEGIN
+    INSERT INTO session_rollups (session_id) VALUES (new.session_id)
+        ON CONFLICT(session_id) DO NOTHING;
+    UPDATE session_rollups SET
+        last_activity_epoch = MAX(COALESCE(last_activity_epoch, new.timestamp_epoch), new.timestamp_epoch),
+        activity_count = activity_count + 1,
+        read_count = read_count + (CASE WHEN new.tool_name = 'Read' THEN 1 ELSE 0 END),
+        edit_count = edit_count + (CASE WHEN new.tool_name = 'Edit' THEN 1 ELSE 0 END),
+        write_count = write_count + (CASE WHEN new.tool_name = 'Write' THEN 1 ELSE 0 END),
+        error_count = error_count + (CASE WHEN new.success = FALSE THEN 1 ELSE 0 END),
+        files_touched = files_touched + (
+            CASE WHEN new.file_path IS NOT NULL AND NOT EXISTS (
+                SELECT 1 FROM session_file_rollups
+                WHERE session_id = new.session_id AND file_path = new.file_path
+            ) THEN 1 ELSE 0 END
+        )
+    WHERE session_id = new.session_id;
+    INSERT INTO session_file_rollups (session_id, file_path, count)
+        SELECT new.session_id, new.file_path, 1 WHERE new.file_path IS NOT NULL
+        ON CONFLICT(session_id, file_path) DO UPDATE SET count = count + 1;
+    INSERT INTO session_tool_rollups (session_id, tool_name, count)
+        VALUES (new.session_id, new.tool_name, 1)
+        ON CONFLICT(session_id, tool_name) DO UPDATE SET count = count + 1;
+END""",
+    """
+CREATE TRIGGER IF NOT EXISTS session_rollups_ad AFTER DELETE ON activities BEGIN
+    UPDATE session_file_rollups SET count = count - 1
+    WHERE session_id = old.session_id AND file_path = old.file_path;
+    UPDATE session_rollups SET
+        last_activity_epoch = CASE
+            WHEN old.timestamp_epoch >= last_activity_epoch THEN (
+                SELECT MAX(timestamp_epoch) FROM activities WHERE session_id = old.session_id
+            )
+            ELSE last_activity_epoch
+        END,
+        activity_count = activity_count - 1,
+        read_count = read_count - (CASE WHEN old.tool_name = 'Read' THEN 1 ELSE 0 END),
+        edit_count = edit_count - (CASE WHEN old.tool_name = 'Edit' THEN 1 ELSE 0 END),
+        write_count = write_count - (CASE WHEN old.tool_name = 'Write' THEN 1 ELSE 0 END),
+        error_count = error_count - (CASE WHEN old.success = FALSE THEN 1 ELSE 0 END),
+        files_touched = files_touched - (
+            CASE WHEN EXISTS (
+                SELECT 1 FROM session_file_rollups
+                WHERE session_id = old.session_id AND file_path = old.file_path AND count <= 0
+            ) THEN 1 ELSE 0 END
+        )
+    WHERE session_id = old.session_id;
+    DELETE FROM session_file_rollups
+    WHERE session_id = old.session_id AND file_path = old.file_path AND count <= 0;
+    UPDATE session_tool_rollups SET count = count - 1
+    WHERE session_id = old.session_id AND tool_name = old.tool_name;
+    DELETE FROM session_tool_rollups
+    WHERE session_id = old.session_id AND tool_name = old.tool_name AND count <= 0;
+END""",
+    """
+CREATE TRIGGER IF NOT EXISTS session_rollups_au
+AFTER UPDATE OF timestamp_epoch, success, tool_name, file_path, session_id ON activities BEGIN
+    UPDATE session_file_rollups SET count = count - 1
+    WHERE session_id = old.session_id AND file_path = old.file_path;
+    UPDATE session_rollups SET
+        last_activity_epoch = CASE
+            WHEN old.timestamp_epoch >= last_activity_epoch THEN (
+                SELECT MAX(timestamp_epoch) FROM activities WHERE session_id = old.session_id
+            )
+            ELSE last_activity_epoch
+        END,
+        activity_count = activity_count - 1,
+        read_count = read_count - (CASE WHEN old.tool_name = 'Read' THEN 1 ELSE 0 END),
+        edit_count = edit_count - (CASE WHEN old.tool_name = 'Edit' THEN 1 ELSE 0 END),
+        write_count = write_count - (CASE WHEN old.tool_name = 'Write' THEN 1 ELSE 0 END),
+        error_count = error_count - (CASE WHEN old.success = FALSE THEN 1 ELSE 0 END),
+        files_touched = files_touched - (
+            CASE WHEN EXISTS (
+                SELECT 1 FROM session_file_rollups
+                WHERE session_id = old.session_id AND file_path = old.file_path AND count <= 0
+            ) THEN 1 ELSE 0 END
+        )
+    WHERE session_id = old.session_id;
+    DELETE FROM session_file_rollups
+    WHERE session_id = old.session_id AND file_path = old.file_path AND count <= 0;
+    UPDATE session_tool_rollups SET count = count - 1
+    WHERE session_id = old.session_id AND tool_name = old.tool_name;
+    DELETE FROM session_tool_rollups
+    WHERE session_id = old.session_id AND tool_name = old.tool_name AND count <= 0;
+    INSERT INTO session_rollups (session_id) VALUES (new.session_id)
+        ON CONFLICT(session_id) DO NOTHING;
+    UPDATE session_rollups SET
+        last_activity_epoch = MAX(COALESCE(last_activity_epoch, new.timestamp_epoch), new.timestamp_epoch),
+        activity_count = activity_count + 1,
+        read_count = read_count + (CASE WHEN new.tool_name = 'Read' THEN 1 ELSE 0 END),
+        edit_count = edit_count + (CASE WHEN new.tool_name = 'Edit' THEN 1 ELSE 0 END),
+        write_count = write_count + (CASE WHEN new.tool_name = 'Write' THEN 1 ELSE 0 END),
+        error_count = error_count + (CASE WHEN new.success = FALSE THEN 1 ELSE 0 END),
+        files_touched = files_touched + (
+            CASE WHEN new.file_path IS NOT NULL AND NOT EXISTS (
+                SELECT 1 FROM session_file_rollups
+                WHERE session_id = new.session_id AND file_path = new.file_path
+            ) THEN 1 ELSE 0 END
+        )
+    WHERE session_id = new.session_id;
+    INSERT INTO session_file_rollups (session_id, file_path, count)
+        SELECT new.session_id, new.file_path, 1 WHERE new.file_path IS NOT NULL
+        ON CONFLICT(session_id, file_path) DO UPDATE SET count = count + 1;
+    INSERT INTO session_tool_rollups (session_id, tool_name, count)
+        VALUES (new.session_id, new.tool_name, 1)
+        ON CONFLICT(session_id, tool_name) DO UPDATE SET count = count + 1;
+END""",
+    """
+CREATE TRIGGER IF NOT EXISTS session_rollups_session_ad AFTER DELETE ON sessions BEGIN
+    DELETE FROM session_rollups WHERE session_id = old.id;
+    DELETE FROM session_tool_rollups WHERE session_id = old.id;
+    DELETE FROM session_file_rollups WHERE session_id = old.id;
+END""",
+)
+
+SCHEMA_SQL += "".join(f"{statement};\n" for statement in SESSION_ROLLUP_STATEMENTS)
+
+# Composite (sort key, id) indexes for keyset pagination of the list APIs.
+# The id tiebreaker lets "after this row" queries seek instead of scanning.
+# Activities use idx_activities_session_timestamp, which carries the rowid.
+KEYSET_INDEX_STATEMENTS: tuple[str, ...] = (
+    """
+CREATE INDEX IF NOT EXISTS idx_sessions_created_id
+    ON sessions(created_at_epoch, id)""",
+    """
+CREATE INDEX IF NOT EXISTS idx_memory_observations_created_id
+    ON memory_observations(created_at_epoch, id)""",
+    """
+CREATE INDEX IF NOT EXISTS idx_agent_runs_created_id
+    ON agent_runs(created_at_epoch, id)""",
+    """
+CREATE INDEX IF NOT EXISTS idx_agent_runs_agent_created_id
+    ON agent_runs(agent_name, created_at_epoch, id)""",
+)
+
+SCHEMA_SQL += "".join(f"{statement};\n" for statement in KEYSET_INDEX_STATEMENTS)
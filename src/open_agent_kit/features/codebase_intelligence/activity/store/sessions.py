@@ -12,6 +12,13 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, cast
 
 from open_agent_kit.features.codebase_intelligence.activity.store.models import Session
+from open_agent_kit.features.codebase_intelligence.activity.store.pagination import (
+    decode_cursor,
+    keyset_condition,
+    next_cursor,
+    order_clause,
+    select_keys,
+)
 from open_agent_kit.features.codebase_intelligence.constants import (
     AGENT_CLAUDE,
     AGENT_UNKNOWN,
@@ -418,6 +425,22 @@ def count_sessions(
     return row[0] if row else 0
 
 
+# ORDER BY expressions per sort mode, each ending with the id tiebreaker.
+# All expressions in a mode sort in the same direction (DESC).
+_SESSION_SORT_EXPRS: dict[str, tuple[str, ...]] = {
+    # Most recent activity, falling back to session start time, so resumed
+    # sessions appear at the top
+    "last_activity": ("COALESCE(r.last_activity_epoch, s.created_at_epoch)", "s.id"),
+    # Active sessions first, then by creation time
+    "status": (
+        f"(COALESCE(s.status, '') = '{SESSION_STATUS_ACTIVE}')",
+        "s.created_at_epoch",
+        "s.id",
+    ),
+    "created": ("s.created_at_epoch", "s.id"),
+}
+
+
 def get_recent_sessions(
     store: ActivityStore,
     limit: int = 10,
@@ -440,6 +463,44 @@ def get_recent_sessions(
     Returns:
         List of recent Session objects.
     """
+    sessions, _next_cursor = get_sessions_page(
+        store, limit=limit, offset=offset, status=status, agent=agent, sort=sort
+    )
+    return sessions
+
+
+def get_sessions_page(
+    store: ActivityStore,
+    limit: int = 10,
+    cursor: str | None = None,
+    offset: int = 0,
+    status: str | None = None,
+    agent: str | None = None,
+    sort: str = "last_activity",
+) -> tuple[list[Session], str | None]:
+    """Get one page of sessions using keyset pagination.
+
+    Args:
+        store: The ActivityStore instance.
+        limit: Maximum sessions to return.
+        cursor: next_cursor from the previous page. Takes precedence over offset.
+        offset: Number of sessions to skip when no cursor is given (deprecated).
+        status: Optional status filter (e.g., 'active', 'completed').
+        agent: Optional agent filter. Matches exact and model-agent labels
+            containing the agent (e.g., ``gpt-5.3-codex`` matches ``codex``).
+        sort: Sort order - 'last_activity' (default), 'created', or 'status'.
+
+    Returns:
+        Tuple of (sessions, cursor for the next page or None on the last page).
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or from another sort order.
+    """
+    if sort not in _SESSION_SORT_EXPRS:
+        sort = "created"
+    sort_exprs = _SESSION_SORT_EXPRS[sort]
+    kind = f"sessions:{sort}"
+
     conn = store._get_connection()
     params: list[Any] = []
     conditions: list[str] = []
@@ -450,34 +511,22 @@ def get_recent_sessions(
         normalized_agent = agent.strip().lower()
         conditions.append("(LOWER(s.agent) = ? OR LOWER(s.agent) LIKE ?)")
         params.extend([normalized_agent, f"%{normalized_agent}%"])
+    if cursor:
+        conditions.append(keyset_condition(sort_exprs, descending=True))
+        params.extend(decode_cursor(cursor, kind, len(sort_exprs)))
+        offset = 0
 
+    query = f"SELECT s.*, {select_keys(sort_exprs)} FROM sessions s"
     if sort == "last_activity":
-        # Sort by most recent activity, falling back to session start time
-        # This ensures resumed sessions appear at the top
-        query = """
-            SELECT s.*, COALESCE(MAX(a.timestamp_epoch), s.created_at_epoch) as sort_key
-            FROM sessions s
-            LEFT JOIN activities a ON s.id = a.session_id
-        """
-        if conditions:
-            query += f" WHERE {' AND '.join(conditions)}"
-        query += " GROUP BY s.id ORDER BY sort_key DESC LIMIT ? OFFSET ?"
-    elif sort == "status":
-        # Active sessions first, then by creation time
-        query = "SELECT * FROM sessions s"
-        if conditions:
-            query += f" WHERE {' AND '.join(conditions)}"
-        query += f" ORDER BY CASE WHEN status = '{SESSION_STATUS_ACTIVE}' THEN 0 ELSE 1 END, created_at_epoch DESC LIMIT ? OFFSET ?"
-    else:
-        # Default: sort by created_at_epoch (session start time)
-        query = "SELECT * FROM sessions s"
-        if conditions:
-            query += f" WHERE {' AND '.join(conditions)}"
-        query += " ORDER BY created_at_epoch DESC LIMIT ? OFFSET ?"
+        query += " LEFT JOIN session_rollups r ON s.id = r.session_id"
+    if conditions:
+        query += f" WHERE {' AND '.join(conditions)}"
+    query += f" {order_clause(sort_exprs, descending=True)} LIMIT ? OFFSET ?"
 
-    params.extend([limit, offset])
-    cursor = conn.execute(query, params)
-    return [Session.from_row(row) for row in cursor.fetchall()]
+    params.extend([limit + 1, offset])
+    rows = conn.execute(query, params).fetchall()
+    cursor_out = next_cursor(kind, rows, limit, len(sort_exprs))
+    return [Session.from_row(row) for row in rows], cursor_out
 
 
 def get_sessions_needing_titles(store: ActivityStore, limit: int = 10) -> list[Session]:
@@ -655,20 +704,22 @@ def recover_stale_sessions(
     conn = store._get_connection()
     cursor = conn.execute(
         f"""
-        SELECT s.id, MAX(a.timestamp_epoch) as last_activity, s.created_at_epoch,
-               COUNT(a.id) as activity_count,
-               (SELECT MAX(pb.created_at_epoch) FROM prompt_batches pb WHERE pb.session_id = s.id) as last_batch_epoch,
-               (SELECT COUNT(*) FROM prompt_batches pb WHERE pb.session_id = s.id AND pb.status = 'active') as active_batches
-        FROM sessions s
-        LEFT JOIN activities a ON s.id = a.session_id
-        WHERE s.status = '{SESSION_STATUS_ACTIVE}'
-          AND s.source_machine_id = ?
-        GROUP BY s.id
-        HAVING
+        SELECT id, last_activity, created_at_epoch, activity_count
+        FROM (
+            SELECT s.id, r.last_activity_epoch as last_activity, s.created_at_epoch,
+                   COALESCE(r.activity_count, 0) as activity_count,
+                   (SELECT MAX(pb.created_at_epoch) FROM prompt_batches pb WHERE pb.session_id = s.id) as last_batch_epoch,
+                   (SELECT COUNT(*) FROM prompt_batches pb WHERE pb.session_id = s.id AND pb.status = 'active') as active_batches
+            FROM sessions s
+            LEFT JOIN session_rollups r ON s.id = r.session_id
+            WHERE s.status = '{SESSION_STATUS_ACTIVE}'
+              AND s.source_machine_id = ?
+        )
+        WHERE
             -- Skip sessions with active prompt batches (currently being worked on)
             active_batches = 0
             -- Check staleness: use the most recent of activity, batch creation, or session creation
-            AND COALESCE(last_activity, last_batch_epoch, s.created_at_epoch) < ?
+            AND COALESCE(last_activity, last_batch_epoch, created_at_epoch) < ?
         """,
         (store.machine_id, cutoff_epoch),
     )
@@ -90,61 +90,7 @@ def get_session_stats(store: ActivityStore, session_id: str) -> dict[str, Any]:
         logger.debug(f"Session stats cache hit: {session_id}")
         return cached
 
-    conn = store._get_connection()
-
-    # Tool counts by name
-    cursor = conn.execute(
-        """
-        SELECT tool_name, COUNT(*) as count
-        FROM activities
-        WHERE session_id = ?
-        GROUP BY tool_name
-        ORDER BY count DESC
-        """,
-        (session_id,),
-    )
-    tool_counts = {row["tool_name"]: row["count"] for row in cursor.fetchall()}
-
-    # File operation counts
-    cursor = conn.execute(
-        """
-        SELECT
-            COUNT(DISTINCT file_path) as files_touched,
-            SUM(CASE WHEN tool_name = 'Read' THEN 1 ELSE 0 END) as reads,
-            SUM(CASE WHEN tool_name = 'Edit' THEN 1 ELSE 0 END) as edits,
-            SUM(CASE WHEN tool_name = 'Write' THEN 1 ELSE 0 END) as writes,
-            SUM(CASE WHEN success = FALSE THEN 1 ELSE 0 END) as errors
-        FROM activities
-        WHERE session_id = ?
-        """,
-        (session_id,),
-    )
-    row = cursor.fetchone()
-
-    # Get total activity count
-    cursor = conn.execute(
-        "SELECT COUNT(*) as count FROM activities WHERE session_id = ?",
-        (session_id,),
-    )
-    activity_count = cursor.fetchone()["count"]
-
-    # Get prompt batch count
-    cursor = conn.execute(
-        "SELECT COUNT(*) as count FROM prompt_batches WHERE session_id = ?",
-        (session_id,),
-    )
-    prompt_batch_count = cursor.fetchone()["count"]
-
-    stats = {
-        "tool_counts": tool_counts,
-        "activity_count": activity_count,
-        "prompt_batch_count": prompt_batch_count,
-        "files_touched": row["files_touched"] or 0,
-        "reads": row["reads"] or 0,
-        "edits": row["edits"] or 0,
-        "writes": row["writes"] or 0,
-        "errors": row["errors"] or 0,
-    }
+    stats = get_bulk_session_stats(store, [session_id])[session_id]
 
     # Cache the result
     set_cached_stats(store, cache_key, stats)
@@ -155,10 +101,11 @@ def get_session_stats(store: ActivityStore, session_id: str) -> dict[str, Any]:
 def get_bulk_session_stats(
     store: ActivityStore, session_ids: list[str]
 ) -> dict[str, dict[str, Any]]:
-    """Get statistics for multiple sessions in a single query.
+    """Get statistics for multiple sessions from the materialized rollups.
 
-    This method eliminates the N+1 query pattern by fetching stats for
-    all sessions in a single aggregated query.
+    Reads session_rollups and session_tool_rollups instead of aggregating
+    the activities table, and fetches every session at once to avoid an
+    N+1 query pattern.
 
     Args:
         store: The ActivityStore instance.
@@ -179,85 +126,57 @@ def get_bulk_session_stats(
         return {}
 
     conn = store._get_connection()
-
-    # Build placeholders for IN clause
     placeholders = ",".join("?" * len(session_ids))
 
-    # Single aggregated query for all sessions
-    cursor = conn.execute(
-        f"""
-        SELECT
-            a.session_id,
-            COUNT(DISTINCT a.id) as activity_count,
-            COUNT(DISTINCT a.file_path) as files_touched,
-            SUM(CASE WHEN a.tool_name = 'Read' THEN 1 ELSE 0 END) as reads,
-            SUM(CASE WHEN a.tool_name = 'Edit' THEN 1 ELSE 0 END) as edits,
-            SUM(CASE WHEN a.tool_name = 'Write' THEN 1 ELSE 0 END) as writes,
-            SUM(CASE WHEN a.success = FALSE THEN 1 ELSE 0 END) as errors,
-            COUNT(DISTINCT pb.id) as prompt_batch_count
-        FROM activities a
-        LEFT JOIN prompt_batches pb ON a.session_id = pb.session_id
-        WHERE a.session_id IN ({placeholders})
-        GROUP BY a.session_id
-        """,
-        session_ids,
-    )
+    # Counters are materialized in session_rollups (kept current by triggers)
+    rollups = {
+        row["session_id"]: row
+        for row in conn.execute(
+            f"SELECT * FROM session_rollups WHERE session_id IN ({placeholders})",
+            session_ids,
+        ).fetchall()
+    }
 
-    # Bulk query for tool counts across all sessions (eliminates N+1)
-    tool_cursor = conn.execute(
+    tool_counts_map: dict[str, dict[str, int]] = {}
+    for tool_row in conn.execute(
         f"""
-        SELECT session_id, tool_name, COUNT(*) as count
-        FROM activities
+        SELECT session_id, tool_name, count
+        FROM session_tool_rollups
         WHERE session_id IN ({placeholders})
-        GROUP BY session_id, tool_name
+        ORDER BY count DESC
         """,
         session_ids,
-    )
-    # Build tool_counts map: session_id -> {tool_name: count}
-    tool_counts_map: dict[str, dict[str, int]] = {}
-    for tool_row in tool_cursor.fetchall():
-        sid = tool_row["session_id"]
-        if sid not in tool_counts_map:
-            tool_counts_map[sid] = {}
-        tool_counts_map[sid][tool_row["tool_name"]] = tool_row["count"]
+    ).fetchall():
+        session_tools = tool_counts_map.setdefault(tool_row["session_id"], {})
+        session_tools[tool_row["tool_name"]] = tool_row["count"]
+
+    prompt_batch_counts = {
+        row["session_id"]: row["count"]
+        for row in conn.execute(
+            f"""
+            SELECT session_id, COUNT(*) as count
+            FROM prompt_batches
+            WHERE session_id IN ({placeholders})
+            GROUP BY session_id
+            """,
+            session_ids,
+        ).fetchall()
+    }
 
-    # Build result dict with aggregated stats
     stats_map: dict[str, dict[str, Any]] = {}
-    for row in cursor.fetchall():
-        session_id = row["session_id"]
-
+    for session_id in session_ids:
+        rollup = rollups.get(session_id)
         stats_map[session_id] = {
             "tool_counts": tool_counts_map.get(session_id, {}),
-            "activity_count": row["activity_count"] or 0,
-            "prompt_batch_count": row["prompt_batch_count"] or 0,
-            "files_touched": row["files_touched"] or 0,
-            "reads": row["reads"] or 0,
-            "edits": row["edits"] or 0,
-            "writes": row["writes"] or 0,
-            "errors": row["errors"] or 0,
+            "activity_count": rollup["activity_count"] if rollup else 0,
+            "prompt_batch_count": prompt_batch_counts.get(session_id, 0),
+            "files_touched": rollup["files_touched"] if rollup else 0,
+            "reads": rollup["read_count"] if rollup else 0,
+            "edits": rollup["edit_count"] if rollup else 0,
+            "writes": rollup["write_count"] if rollup else 0,
+            "errors": rollup["error_count"] if rollup else 0,
         }
 
-    # Fill in missing sessions (sessions with no activities)
-    for session_id in session_ids:
-        if session_id not in stats_map:
-            # Still need prompt_batch_count even if no activities
-            cursor = conn.execute(
-                "SELECT COUNT(*) as count FROM prompt_batches WHERE session_id = ?",
-                (session_id,),
-            )
-            prompt_batch_count = cursor.fetchone()["count"]
-
-            stats_map[session_id] = {
-                "tool_counts": {},
-                "activity_count": 0,
-                "prompt_batch_count": prompt_batch_count or 0,
-                "files_touched": 0,
-                "reads": 0,
-                "edits": 0,
-                "writes": 0,
-                "errors": 0,
-            }
-
     return stats_map
 
 
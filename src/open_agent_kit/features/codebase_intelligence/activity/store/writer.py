@@ -0,0 +1,245 @@
+"""Write-behind queue for activity inserts.
+
+Hooks record an activity for nearly every tool call. Inserting each one on the
+hook's own thread means every concurrent hook competes for SQLite's write lock
+and pays for the ``activities_ai`` FTS trigger inline.
+
+``ActivityWriter`` takes those inserts off the caller's thread. Activities go
+onto a bounded queue and a single writer thread inserts them with one
+``executemany`` transaction, either when ``batch_size`` rows are pending or when
+the oldest pending row has waited ``flush_interval_ms``.
+
+``flush()`` blocks until everything queued before it is committed. Callers that
+read activities back right away, such as stop, session end and notify, flush
+first.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from open_agent_kit.features.codebase_intelligence.activity.store.activities import (
+    add_activities,
+)
+from open_agent_kit.features.codebase_intelligence.constants import (
+    ACTIVITY_WRITE_BATCH_SIZE,
+    ACTIVITY_WRITE_ENQUEUE_TIMEOUT_SECONDS,
+    ACTIVITY_WRITE_FLUSH_INTERVAL_MS,
+    ACTIVITY_WRITE_FLUSH_TIMEOUT_SECONDS,
+    ACTIVITY_WRITE_QUEUE_MAX,
+    ACTIVITY_WRITER_THREAD_NAME,
+)
+
+if TYPE_CHECKING:
+    from open_agent_kit.features.codebase_intelligence.activity.store.core import ActivityStore
+    from open_agent_kit.features.codebase_intelligence.activity.store.models import Activity
+
+logger = logging.getLogger(__name__)
+
+
+class _FlushRequest:
+    """Queue marker: commit everything ahead of it, then wake the caller."""
+
+    __slots__ = ("done", "ids")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.ids: list[int] = []
+
+
+class _Stop:
+    """Queue marker: commit everything ahead of it, then exit."""
+
+
+class ActivityWriter:
+    """Single writer thread draining a bounded queue of activities.
+
+    The thread starts on the first submitted activity and can be restarted
+    after ``stop()``, so short-lived stores (backups, sync) that never buffer
+    activities never start one.
+    """
+
+    def __init__(
+        self,
+        store: ActivityStore,
+        batch_size: int = ACTIVITY_WRITE_BATCH_SIZE,
+        flush_interval_ms: int = ACTIVITY_WRITE_FLUSH_INTERVAL_MS,
+        max_queue: int = ACTIVITY_WRITE_QUEUE_MAX,
+    ):
+        """Initialize the writer.
+
+        Args:
+            store: Store whose connection the writer thread inserts through.
+            batch_size: Pending rows that trigger an immediate write.
+            flush_interval_ms: Longest time a row waits before being written.
+            max_queue: Queue capacity; callers wait for space when it is full.
+        """
+        self._store = store
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self._queue: queue.Queue[Activity | _FlushRequest | _Stop] = queue.Queue(maxsize=max_queue)
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._depth = 0  # queued or held by the writer, not yet written
+        self._writes = 0
+        self._rows_written = 0
+        self._rows_dropped = 0
+        self._inline_writes = 0
+        self._total_write_ms = 0.0
+        self._max_write_ms = 0.0
+        self._last_write_ms = 0.0
+
+    def submit(self, activity: Activity) -> None:
+        """Queue an activity for the writer thread.
+
+        If the queue stays full for longer than the enqueue timeout, the
+        activity is written on the caller's thread instead of being dropped.
+        """
+        self._ensure_running()
+        with self._stats_lock:
+            self._depth += 1
+        try:
+            self._queue.put(activity, timeout=ACTIVITY_WRITE_ENQUEUE_TIMEOUT_SECONDS)
+        except queue.Full:
+            logger.warning("Activity write queue full, writing inline")
+            with self._stats_lock:
+                self._depth -= 1
+                self._inline_writes += 1
+            self._write([activity])
+
+    def flush(self, timeout: float = ACTIVITY_WRITE_FLUSH_TIMEOUT_SECONDS) -> list[int]:
+        """Commit every activity queued so far.
+
+        Args:
+            timeout: Seconds to wait for the writer thread.
+
+        Returns:
+            IDs of the activities written by this flush.
+        """
+        with self._thread_lock:
+            running = self._thread is not None and self._thread.is_alive()
+        if not running:
+            return self._drain_inline()
+
+        request = _FlushRequest()
+        self._queue.put(request)
+        if not request.done.wait(timeout):
+            logger.warning(f"Activity writer did not flush within {timeout}s")
+            return []
+        return request.ids
+
+    def stop(self, timeout: float = ACTIVITY_WRITE_FLUSH_TIMEOUT_SECONDS) -> None:
+        """Write everything queued and stop the writer thread."""
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._queue.put(_Stop())
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning(f"Activity writer did not stop within {timeout}s")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Queue depth and write latency for the status API."""
+        with self._stats_lock:
+            writes = self._writes or 1
+            return {
+                "queue_depth": self._depth,
+                "writes": self._writes,
+                "rows_written": self._rows_written,
+                "rows_dropped": self._rows_dropped,
+                "inline_writes": self._inline_writes,
+                "avg_write_ms": round(self._total_write_ms / writes, 2),
+                "max_write_ms": round(self._max_write_ms, 2),
+                "last_write_ms": round(self._last_write_ms, 2),
+            }
+
+    def _ensure_running(self) -> None:
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name=ACTIVITY_WRITER_THREAD_NAME, daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        pending: list[Activity] = []
+        deadline = 0.0
+        interval = self.flush_interval_ms / 1000
+        try:
+            while True:
+                timeout = max(0.0, deadline - time.monotonic()) if pending else None
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    self._write_pending(pending)
+                    continue
+
+                if isinstance(item, _Stop):
+                    self._write_pending(pending)
+                    return
+                if isinstance(item, _FlushRequest):
+                    item.ids = self._write_pending(pending)
+                    item.done.set()
+                    continue
+
+                if not pending:
+                    deadline = time.monotonic() + interval
+                pending.append(item)
+                if len(pending) >= self.batch_size:
+                    self._write_pending(pending)
+        finally:
+            # The writer's thread-local connection would otherwise leak
+            self._store._close_connections()
+
+    def _write_pending(self, pending: list[Activity]) -> list[int]:
+        batch = pending[:]
+        pending.clear()
+        with self._stats_lock:
+            self._depth -= len(batch)
+        return self._write(batch)
+
+    def _drain_inline(self) -> list[int]:
+        """Write whatever is queued on the caller's thread (no writer running)."""
+        batch: list[Activity] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, _FlushRequest):
+                item.done.set()
+            elif not isinstance(item, _Stop):
+                batch.append(item)
+        with self._stats_lock:
+            self._depth -= len(batch)
+        return self._write(batch)
+
+    def _write(self, batch: list[Activity]) -> list[int]:
+        if not batch:
+            return []
+        started = time.perf_counter()
+        try:
+            ids = add_activities(self._store, batch)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to write {len(batch)} queued activities: {e}")
+            with self._stats_lock:
+                self._rows_dropped += len(batch)
+            return []
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            self._writes += 1
+            self._rows_written += len(ids)
+            self._rows_dropped += len(batch) - len(ids)
+            self._total_write_ms += elapsed_ms
+            self._max_write_ms = max(self._max_write_ms, elapsed_ms)
+            self._last_write_ms = elapsed_ms
+        logger.debug(f"Wrote {len(ids)} queued activities in {elapsed_ms:.1f}ms")
+        return ids
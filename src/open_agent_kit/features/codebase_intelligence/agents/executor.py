@@ -521,6 +521,7 @@ class AgentExecutor:
         agent: AgentDefinition,
         task: str,
         agent_task: AgentTask | None = None,
+        queue_wait_ms: int | None = None,
     ) -> AgentRun:
         """Create a new run record.
 
@@ -530,6 +531,7 @@ class AgentExecutor:
             agent: Agent definition (template).
             task: Task description.
             agent_task: Optional task being run.
+            queue_wait_ms: Time a scheduled run waited for a scheduler slot.
 
         Returns:
             New AgentRun instance.
@@ -545,6 +547,7 @@ class AgentExecutor:
             task=task,
             status=AgentRunStatus.PENDING,
             created_at=datetime.now(),
+            queue_wait_ms=queue_wait_ms,
         )
 
         # Persist to SQLite if available
@@ -578,6 +581,7 @@ class AgentExecutor:
                 status=run.status.value,
                 project_config=project_config,
                 system_prompt_hash=system_prompt_hash,
+                queue_wait_ms=queue_wait_ms,
             )
 
         # Cache in memory
@@ -638,6 +642,7 @@ class AgentExecutor:
             cost_usd=data.get("cost_usd"),
             input_tokens=data.get("input_tokens"),
             output_tokens=data.get("output_tokens"),
+            queue_wait_ms=data.get("queue_wait_ms"),
             files_created=data.get("files_created") or [],
             files_modified=data.get("files_modified") or [],
             files_deleted=data.get("files_deleted") or [],
@@ -715,6 +720,76 @@ class AgentExecutor:
 
             return runs, total
 
+    def list_runs_page(
+        self,
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+        agent_name: str | None = None,
+        status: AgentRunStatus | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+    ) -> tuple[list[AgentRun], int, str | None]:
+        """List one page of runs using keyset pagination.
+
+        Same filters as list_runs. The in-memory fallback only supports
+        offset pagination and never returns a next cursor.
+
+        Args:
+            limit: Maximum runs to return.
+            cursor: next_cursor from the previous page. Takes precedence over offset.
+            offset: Pagination offset when no cursor is given (deprecated).
+            agent_name: Filter by agent name.
+            status: Filter by status.
+            created_after: Filter by creation time (inclusive).
+            created_before: Filter by creation time (exclusive).
+            sort_by: Sort field (created_at, duration, cost).
+            sort_order: Sort order (asc, desc).
+
+        Returns:
+            Tuple of (runs list, total count, cursor for the next page or None).
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid, or given without an
+                activity store.
+        """
+        if self._activity_store:
+            status_str = status.value if status else None
+            created_after_epoch = int(created_after.timestamp()) if created_after else None
+            created_before_epoch = int(created_before.timestamp()) if created_before else None
+            data_list, total, next_cursor = self._activity_store.list_agent_runs_page(
+                limit=limit,
+                cursor=cursor,
+                offset=offset,
+                agent_name=agent_name,
+                status=status_str,
+                created_after_epoch=created_after_epoch,
+                created_before_epoch=created_before_epoch,
+                sort_by=sort_by,
+                sort_order=sort_order,
+            )
+            return [self._dict_to_run(d) for d in data_list], total, next_cursor
+
+        if cursor:
+            from open_agent_kit.features.codebase_intelligence.activity.store.pagination import (
+                InvalidCursorError,
+            )
+
+            raise InvalidCursorError("Cursor pagination requires the activity store")
+        runs, total = self.list_runs(
+            limit=limit,
+            offset=offset,
+            agent_name=agent_name,
+            status=status,
+            created_after=created_after,
+            created_before=created_before,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
+        return runs, total, None
+
     async def execute(
         self,
         agent: AgentDefinition,
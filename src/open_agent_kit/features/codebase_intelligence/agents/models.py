@@ -425,6 +425,9 @@ class AgentRun(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     started_at: datetime | None = Field(default=None)
     completed_at: datetime | None = Field(default=None)
+    queue_wait_ms: int | None = Field(
+        default=None, description="Scheduled runs: wait between due time and start"
+    )
 
     # Results
     result: str | None = Field(default=None, description="Final result/summary from agent")
@@ -564,6 +567,7 @@ class AgentRunListResponse(BaseModel):
     total: int = 0
     limit: int = 20
     offset: int = 0
+    next_cursor: str | None = None  # Pass as cursor to fetch the next page
 
 
 class AgentRunDetailResponse(BaseModel):
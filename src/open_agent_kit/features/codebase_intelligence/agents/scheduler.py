@@ -3,16 +3,18 @@
 This module provides the AgentScheduler class that manages scheduled agent runs:
 - Reads schedule definitions from database (cron, description, trigger_type)
 - Computes next run times from cron expressions
-- Checks for and executes due schedules
-- Background scheduling loop
+- Keeps an in-memory queue of next run times and sleeps until the earliest
+- Runs due schedules concurrently, up to a configurable limit, with at most
+  one run per agent task at a time
 
 IMPORTANT: Schedule definitions now live in the database only. YAML schedule
 support is deprecated. Use the API/UI to create and manage schedules.
 """
 
 import asyncio
+import heapq
 import logging
-import threading
+import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -43,8 +45,11 @@ class AgentScheduler:
     The scheduler:
     - Reads schedule definitions from ActivityStore (SQLite) - database is source of truth
     - Computes next run times using croniter
-    - Periodically checks for and runs due schedules
-    - Tracks run history via AgentExecutor
+    - Keeps a heap of (next run epoch, task name) rebuilt from the schedule
+      table, and sleeps until the earliest entry is due
+    - Runs due schedules concurrently up to scheduler_max_concurrent_runs,
+      never running the same task twice at once
+    - Tracks run history via AgentExecutor, including queue wait per run
 
     YAML schedule support is deprecated. Schedules are managed via API/UI.
 
@@ -81,8 +86,21 @@ class AgentScheduler:
 
         # Background loop control
         self._running = False
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._loop_task: asyncio.Task[None] | None = None
-        self._stop_event = threading.Event()
+        self._wake_event = asyncio.Event()
+
+        # Next-run queue: heap of (wake_epoch, task_name, schedule)
+        self._queue: list[tuple[float, str, dict[str, Any]]] = []
+        self._queue_dirty = True
+        self._next_resync = 0.0
+        # task_name -> (due epoch attempted, epoch to retry at) for due
+        # schedules whose run did not advance next_run_at (skipped or failed)
+        self._attempted: dict[str, tuple[int, float]] = {}
+
+        # Tasks holding a run slot, and their asyncio tasks
+        self._active_tasks: set[str] = set()
+        self._in_flight: set[asyncio.Task[dict[str, Any]]] = set()
 
     @property
     def _agent_config(self) -> "AgentConfig":
@@ -100,9 +118,14 @@ class AgentScheduler:
 
     @property
     def scheduler_interval_seconds(self) -> int:
-        """Get the scheduler check interval from config."""
+        """Get the max interval between schedule queue reloads from config."""
         return self._agent_config.scheduler_interval_seconds
 
+    @property
+    def max_concurrent_runs(self) -> int:
+        """Get the max number of scheduled runs executing at once from config."""
+        return self._agent_config.scheduler_max_concurrent_runs
+
     def compute_next_run(self, cron_expr: str, after: datetime | None = None) -> datetime:
         """Compute the next run time for a cron expression.
 
@@ -164,6 +187,9 @@ class AgentScheduler:
                 removed += 1
                 logger.info(f"Removed orphaned schedule for '{task_name}' (task not found)")
 
+        if removed:
+            self.notify_schedules_changed()
+
         result = {
             "created": 0,  # No longer auto-create from YAML
             "updated": 0,
@@ -184,6 +210,89 @@ class AgentScheduler:
         """
         return self._activity_store.get_due_schedules()
 
+    def notify_schedules_changed(self) -> None:
+        """Rebuild the next-run queue and wake the scheduler loop.
+
+        Call after creating, updating or deleting a schedule so the loop does
+        not sleep past a new or earlier due time. Safe to call from any thread.
+        """
+        self._queue_dirty = True
+        loop = self._loop
+        if self._running and loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._wake_event.set)
+
+    def _rebuild_queue(self) -> None:
+        """Rebuild the next-run heap from the schedule table.
+
+        A due schedule that was already attempted at the same due time (the
+        run was skipped or failed before next_run_at advanced) is re-queued
+        for its retry time instead of immediately, so it cannot spin.
+        """
+        now = time.time()
+        queue: list[tuple[float, str, dict[str, Any]]] = []
+        attempted: dict[str, tuple[int, float]] = {}
+        for schedule in self._activity_store.list_schedules(enabled_only=True):
+            due_epoch = schedule.get("next_run_at_epoch")
+            if schedule.get("trigger_type") != SCHEDULE_TRIGGER_CRON or due_epoch is None:
+                continue
+            task_name = schedule["task_name"]
+            wake_epoch = float(due_epoch)
+            previous = self._attempted.get(task_name)
+            if previous is not None and previous[0] == due_epoch:
+                attempted[task_name] = previous
+                wake_epoch = max(wake_epoch, previous[1])
+            queue.append((wake_epoch, task_name, schedule))
+
+        heapq.heapify(queue)
+        self._queue = queue
+        self._attempted = attempted
+        self._queue_dirty = False
+        self._next_resync = now + self.scheduler_interval_seconds
+
+    def _seconds_until_wake(self) -> float:
+        """Compute how long the loop may sleep.
+
+        Returns:
+            Seconds until the earliest queued schedule is due (if a run slot
+            is free) or the next queue reload, whichever comes first.
+        """
+        now = time.time()
+        timeout = max(0.0, self._next_resync - now)
+        if self._queue and len(self._active_tasks) < self.max_concurrent_runs:
+            timeout = min(timeout, max(0.0, self._queue[0][0] - now))
+        return timeout
+
+    def _dispatch_due(self) -> list[asyncio.Task[dict[str, Any]]]:
+        """Start runs for due queue entries while run slots are free.
+
+        Entries whose task already holds a slot are dropped; the running
+        task's completion rebuilds the queue from its updated next_run_at.
+
+        Returns:
+            Tasks started by this call.
+        """
+        now = time.time()
+        started: list[asyncio.Task[dict[str, Any]]] = []
+        while (
+            self._queue
+            and self._queue[0][0] <= now
+            and len(self._active_tasks) < self.max_concurrent_runs
+        ):
+            _, task_name, schedule = heapq.heappop(self._queue)
+            if task_name in self._active_tasks:
+                continue
+
+            due_epoch = schedule["next_run_at_epoch"]
+            self._attempted[task_name] = (due_epoch, now + self.scheduler_interval_seconds)
+            queue_wait_ms = max(0, int((now - due_epoch) * 1000))
+
+            self._active_tasks.add(task_name)
+            task = asyncio.create_task(self._run_with_slot(schedule, queue_wait_ms))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+            started.append(task)
+        return started
+
     def _is_task_running(self, task_name: str) -> bool:
         """Check if an agent task already has an active run.
 
@@ -202,7 +311,11 @@ class AgentScheduler:
         )
         return len(runs) > 0
 
-    async def run_scheduled_agent(self, schedule: dict[str, Any]) -> dict[str, Any]:
+    async def run_scheduled_agent(
+        self,
+        schedule: dict[str, Any],
+        queue_wait_ms: int | None = None,
+    ) -> dict[str, Any]:
         """Run a scheduled agent and update schedule state.
 
         Prevents concurrent execution of the same agent task. If a task
@@ -210,6 +323,50 @@ class AgentScheduler:
 
         Args:
             schedule: Schedule record from database.
+            queue_wait_ms: Time the run waited for a slot after its due time
+                (None for manual runs).
+
+        Returns:
+            Result dict with run_id, status, and any error.
+        """
+        task_name = schedule["task_name"]
+        if task_name in self._active_tasks:
+            logger.warning(f"Skipping scheduled run for '{task_name}' - already running")
+            return {"task_name": task_name, "skipped": True, "reason": "already_running"}
+
+        self._active_tasks.add(task_name)
+        return await self._run_with_slot(schedule, queue_wait_ms)
+
+    async def _run_with_slot(
+        self,
+        schedule: dict[str, Any],
+        queue_wait_ms: int | None,
+    ) -> dict[str, Any]:
+        """Run a schedule whose task already holds a run slot, then free it.
+
+        Args:
+            schedule: Schedule record from database.
+            queue_wait_ms: Time the run waited for a slot after its due time.
+
+        Returns:
+            Result dict from _execute_schedule.
+        """
+        try:
+            return await self._execute_schedule(schedule, queue_wait_ms)
+        finally:
+            self._active_tasks.discard(schedule["task_name"])
+            self.notify_schedules_changed()
+
+    async def _execute_schedule(
+        self,
+        schedule: dict[str, Any],
+        queue_wait_ms: int | None,
+    ) -> dict[str, Any]:
+        """Execute the agent for a schedule and advance its next run time.
+
+        Args:
+            schedule: Schedule record from database.
+            queue_wait_ms: Time the run waited for a slot after its due time.
 
         Returns:
             Result dict with run_id, status, and any error.
@@ -217,7 +374,7 @@ class AgentScheduler:
         task_name = schedule["task_name"]
         result: dict[str, Any] = {"task_name": task_name}
 
-        # Check for concurrent execution - skip if already running
+        # A manual run of the same task may be active outside the scheduler
         if self._is_task_running(task_name):
             result["skipped"] = True
             result["reason"] = "already_running"
@@ -237,7 +394,7 @@ class AgentScheduler:
             logger.error(result["error"])
             return result
 
-        logger.info(f"Running scheduled agent: {task_name}")
+        logger.info(f"Running scheduled agent: {task_name} (queue_wait_ms={queue_wait_ms})")
 
         try:
             # Compose task prompt with optional assignment (same pattern as manual run)
@@ -246,15 +403,20 @@ class AgentScheduler:
             if additional_prompt:
                 task_prompt = f"## Assignment\n{additional_prompt}\n\n---\n\n{task.default_task}"
 
-            # Execute the agent
+            # Create the run up front so the queue wait is recorded with it
+            run = self._agent_executor.create_run(
+                template, task_prompt, task, queue_wait_ms=queue_wait_ms
+            )
             run = await self._agent_executor.execute(
                 agent=template,
                 task=task_prompt,
+                run=run,
                 agent_task=task,
             )
 
             result["run_id"] = run.id
             result["status"] = run.status.value
+            result["queue_wait_ms"] = queue_wait_ms
 
             # Update schedule with run info
             now = datetime.now()
@@ -291,50 +453,54 @@ class AgentScheduler:
         return result
 
     async def check_and_run(self) -> list[dict[str, Any]]:
-        """Check for due schedules and run them.
+        """Run every schedule that is due now and wait for them to finish.
 
-        This is the main entry point for the scheduling loop.
+        Due schedules run concurrently, up to max_concurrent_runs at a time.
+        The background loop dispatches without waiting; this is the one-shot
+        equivalent.
 
         Returns:
             List of result dicts from run_scheduled_agent.
         """
-        due_schedules = self.get_due_schedules()
-        if not due_schedules:
+        self._rebuild_queue()
+        pending = set(self._dispatch_due())
+        if not pending:
             return []
 
-        logger.info(f"Found {len(due_schedules)} due schedule(s)")
+        logger.info(f"Running due schedule(s), up to {self.max_concurrent_runs} at a time")
 
-        results = []
-        for schedule in due_schedules:
-            result = await self.run_scheduled_agent(schedule)
-            results.append(result)
+        results: list[dict[str, Any]] = []
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            results.extend(task.result() for task in done)
+            pending |= set(self._dispatch_due())
 
         return results
 
-    async def _run_loop(self, interval_seconds: int) -> None:
-        """Background loop that checks and runs due schedules.
+    async def _run_loop(self) -> None:
+        """Background loop that dispatches due schedules.
 
-        Args:
-            interval_seconds: Seconds between checks.
+        Sleeps until the earliest queued schedule is due, a run finishes,
+        schedules change, or the periodic queue reload is due.
         """
-        logger.info(f"Scheduler loop started (interval={interval_seconds}s)")
+        logger.info(
+            f"Scheduler loop started (max_concurrent_runs={self.max_concurrent_runs}, "
+            f"resync={self.scheduler_interval_seconds}s)"
+        )
 
         while self._running:
+            self._wake_event.clear()
             try:
-                await self.check_and_run()
+                if self._queue_dirty or time.time() >= self._next_resync:
+                    self._rebuild_queue()
+                self._dispatch_due()
             except (OSError, RuntimeError) as e:
                 logger.error(f"Error in scheduler loop: {e}")
 
-            # Wait for next check or stop signal
             try:
-                await asyncio.wait_for(
-                    asyncio.to_thread(self._stop_event.wait, interval_seconds),
-                    timeout=interval_seconds,
-                )
-                # Stop event was set
-                break
+                await asyncio.wait_for(self._wake_event.wait(), timeout=self._seconds_until_wake())
             except TimeoutError:
-                # Normal timeout, continue loop
+                # Next schedule due or queue reload due
                 pass
 
         logger.info("Scheduler loop stopped")
@@ -342,43 +508,49 @@ class AgentScheduler:
     def start(self) -> None:
         """Start the background scheduling loop.
 
-        Uses scheduler_interval_seconds from AgentConfig.
+        Uses scheduler_interval_seconds and scheduler_max_concurrent_runs
+        from AgentConfig.
         """
         if self._running:
             logger.warning("Scheduler already running")
             return
 
         self._running = True
-        self._stop_event.clear()
+        self._queue_dirty = True
+        self._wake_event = asyncio.Event()
 
         # Start the loop in the current event loop
         try:
-            loop = asyncio.get_running_loop()
-            self._loop_task = loop.create_task(self._run_loop(self.scheduler_interval_seconds))
+            self._loop = asyncio.get_running_loop()
+            self._loop_task = self._loop.create_task(self._run_loop())
         except RuntimeError:
             # No running loop - caller will need to run it manually
             logger.warning("No running event loop - scheduler loop not started automatically")
 
-        logger.info(f"Scheduler started (interval={self.scheduler_interval_seconds}s)")
+        logger.info(
+            f"Scheduler started (max_concurrent_runs={self.max_concurrent_runs}, "
+            f"resync={self.scheduler_interval_seconds}s)"
+        )
 
     def stop(self) -> None:
         """Stop the background scheduling loop with timeout.
 
-        Waits up to SCHEDULER_STOP_TIMEOUT_SECONDS for clean shutdown.
+        Cancels in-flight scheduled runs and waits up to
+        SCHEDULER_STOP_TIMEOUT_SECONDS for clean shutdown.
         """
         if not self._running:
             return
 
         self._running = False
-        self._stop_event.set()
+
+        for task in list(self._in_flight):
+            task.cancel()
 
         if self._loop_task and not self._loop_task.done():
             self._loop_task.cancel()
             # Wait for task to complete with timeout
             try:
                 # Use a synchronous wait with timeout since stop() is sync
-                import time
-
                 deadline = time.monotonic() + SCHEDULER_STOP_TIMEOUT_SECONDS
                 while not self._loop_task.done() and time.monotonic() < deadline:
                     time.sleep(0.1)
@@ -392,6 +564,7 @@ class AgentScheduler:
             finally:
                 self._loop_task = None
 
+        self._loop = None
         logger.info("Scheduler stopped")
 
     def get_schedule_status(self, task_name: str) -> dict[str, Any] | None:
@@ -472,6 +645,9 @@ class AgentScheduler:
 
         return {
             "running": self._running,
+            "max_concurrent_runs": self.max_concurrent_runs,
+            "active_runs": sorted(self._active_tasks),
+            "queued_schedules": len(self._queue),
             "total_schedules": len(statuses),
             "enabled_schedules": sum(1 for s in statuses if s.get("enabled", False)),
             "schedules": statuses,
@@ -51,6 +51,7 @@ from open_agent_kit.features.codebase_intelligence.constants import (
     CI_CONFIG_KEY_EXCLUDE_PATTERNS,
     CI_CONFIG_KEY_GOVERNANCE,
     CI_CONFIG_KEY_INDEX_ON_STARTUP,
+    CI_CONFIG_KEY_INDEX_WORKERS,
     CI_CONFIG_KEY_LOG_LEVEL,
     CI_CONFIG_KEY_LOG_ROTATION,
     CI_CONFIG_KEY_SESSION_QUALITY,
@@ -70,13 +71,19 @@ from open_agent_kit.features.codebase_intelligence.constants import (
     DEFAULT_BACKGROUND_PROCESSING_INTERVAL_SECONDS,
     DEFAULT_BACKGROUND_PROCESSING_WORKERS,
     DEFAULT_BASE_URL,
+    DEFAULT_EMBEDDING_CACHE_MAX_MB,
+    DEFAULT_EMBEDDING_CONCURRENCY,
+    DEFAULT_EMBEDDING_MAX_BATCH_SIZE,
+    DEFAULT_EMBEDDING_MAX_BATCH_TOKENS,
     DEFAULT_EXECUTOR_CACHE_SIZE,
+    DEFAULT_INDEX_WORKERS,
     DEFAULT_LOG_BACKUP_COUNT,
     DEFAULT_LOG_MAX_SIZE_MB,
     DEFAULT_LOG_ROTATION_ENABLED,
     DEFAULT_MODEL,
     DEFAULT_PROVIDER,
     DEFAULT_SCHEDULER_INTERVAL_SECONDS,
+    DEFAULT_SCHEDULER_MAX_CONCURRENT_RUNS,
     DEFAULT_SUMMARIZATION_BASE_URL,
     DEFAULT_SUMMARIZATION_MODEL,
     DEFAULT_SUMMARIZATION_PROVIDER,
@@ -95,16 +102,22 @@ from open_agent_kit.features.codebase_intelligence.constants import (
     MAX_AGENT_TIMEOUT_SECONDS,
     MAX_BACKGROUND_PROCESSING_INTERVAL_SECONDS,
     MAX_BACKGROUND_PROCESSING_WORKERS,
+    MAX_EMBEDDING_CACHE_MAX_MB,
+    MAX_EMBEDDING_CONCURRENCY,
     MAX_EXECUTOR_CACHE_SIZE,
+    MAX_INDEX_WORKERS,
     MAX_LOG_BACKUP_COUNT,
     MAX_LOG_MAX_SIZE_MB,
     MAX_SCHEDULER_INTERVAL_SECONDS,
+    MAX_SCHEDULER_MAX_CONCURRENT_RUNS,
     MIN_AGENT_TIMEOUT_SECONDS,
     MIN_BACKGROUND_PROCESSING_INTERVAL_SECONDS,
     MIN_BACKGROUND_PROCESSING_WORKERS,
     MIN_EXECUTOR_CACHE_SIZE,
+    MIN_INDEX_WORKERS,
     MIN_LOG_MAX_SIZE_MB,
     MIN_SCHEDULER_INTERVAL_SECONDS,
+    MIN_SCHEDULER_MAX_CONCURRENT_RUNS,
     MIN_SESSION_ACTIVITIES,
     SESSION_INACTIVE_TIMEOUT_SECONDS,
     VALID_LOG_LEVELS,
@@ -297,6 +310,10 @@ class EmbeddingConfig:
         fallback_enabled: Reserved for future use (currently ignored).
         context_tokens: Max input tokens (auto-detect from known models).
         max_chunk_chars: Max chars per chunk (auto-detect from model).
+        cache_max_mb: Size of the persistent embedding cache (0 disables it).
+        max_batch_size: Max texts sent per embedding request.
+        max_batch_tokens: Estimated token budget per embedding request.
+        concurrency: Embedding requests in flight at once while indexing.
     """
 
     provider: str = DEFAULT_PROVIDER
@@ -307,6 +324,10 @@ class EmbeddingConfig:
     fallback_enabled: bool = False
     context_tokens: int | None = None
     max_chunk_chars: int | None = None
+    cache_max_mb: int = DEFAULT_EMBEDDING_CACHE_MAX_MB
+    max_batch_size: int = DEFAULT_EMBEDDING_MAX_BATCH_SIZE
+    max_batch_tokens: int = DEFAULT_EMBEDDING_MAX_BATCH_TOKENS
+    concurrency: int = DEFAULT_EMBEDDING_CONCURRENCY
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
@@ -354,6 +375,38 @@ class EmbeddingConfig:
                 expected="positive integer",
             )
 
+        if not 0 <= self.cache_max_mb <= MAX_EMBEDDING_CACHE_MAX_MB:
+            raise ValidationError(
+                f"cache_max_mb must be between 0 and {MAX_EMBEDDING_CACHE_MAX_MB}",
+                field="cache_max_mb",
+                value=self.cache_max_mb,
+                expected=f"0-{MAX_EMBEDDING_CACHE_MAX_MB}",
+            )
+
+        if self.max_batch_size <= 0:
+            raise ValidationError(
+                "max_batch_size must be positive",
+                field="max_batch_size",
+                value=self.max_batch_size,
+                expected="positive integer",
+            )
+
+        if self.max_batch_tokens <= 0:
+            raise ValidationError(
+                "max_batch_tokens must be positive",
+                field="max_batch_tokens",
+                value=self.max_batch_tokens,
+                expected="positive integer",
+            )
+
+        if not 1 <= self.concurrency <= MAX_EMBEDDING_CONCURRENCY:
+            raise ValidationError(
+                f"concurrency must be between 1 and {MAX_EMBEDDING_CONCURRENCY}",
+                field="concurrency",
+                value=self.concurrency,
+                expected=f"1-{MAX_EMBEDDING_CONCURRENCY}",
+            )
+
         # Warn about hardcoded API keys (but don't fail)
         if self.api_key and not self.api_key.startswith("${"):
             logger.warning(
@@ -404,6 +457,10 @@ class EmbeddingConfig:
             fallback_enabled=data.get("fallback_enabled", False),
             context_tokens=data.get("context_tokens"),
             max_chunk_chars=data.get("max_chunk_chars"),
+            cache_max_mb=data.get("cache_max_mb", DEFAULT_EMBEDDING_CACHE_MAX_MB),
+            max_batch_size=data.get("max_batch_size", DEFAULT_EMBEDDING_MAX_BATCH_SIZE),
+            max_batch_tokens=data.get("max_batch_tokens", DEFAULT_EMBEDDING_MAX_BATCH_TOKENS),
+            concurrency=data.get("concurrency", DEFAULT_EMBEDDING_CONCURRENCY),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -417,6 +474,10 @@ class EmbeddingConfig:
             "fallback_enabled": self.fallback_enabled,
             "context_tokens": self.context_tokens,
             "max_chunk_chars": self.max_chunk_chars,
+            "cache_max_mb": self.cache_max_mb,
+            "max_batch_size": self.max_batch_size,
+            "max_batch_tokens": self.max_batch_tokens,
+            "concurrency": self.concurrency,
         }
 
     def get_context_tokens(self) -> int:
@@ -578,7 +639,9 @@ class AgentConfig:
         enabled: Whether to enable the agent subsystem.
         max_turns: Default maximum turns for agent execution.
         timeout_seconds: Default timeout for agent execution.
-        scheduler_interval_seconds: Interval between scheduler checks for due schedules.
+        scheduler_interval_seconds: Max interval between scheduler reloads of the
+            schedule table (due schedules wake the scheduler directly).
+        scheduler_max_concurrent_runs: Max scheduled agent runs executing at once.
         executor_cache_size: Max runs to keep in executor's in-memory cache.
         background_processing_interval_seconds: Interval for activity processor background tasks.
         background_processing_workers: Number of parallel threads for batch processing.
@@ -602,6 +665,7 @@ class AgentConfig:
     max_turns: int = DEFAULT_AGENT_MAX_TURNS
     timeout_seconds: int = DEFAULT_AGENT_TIMEOUT_SECONDS
     scheduler_interval_seconds: int = DEFAULT_SCHEDULER_INTERVAL_SECONDS
+    scheduler_max_concurrent_runs: int = DEFAULT_SCHEDULER_MAX_CONCURRENT_RUNS
     executor_cache_size: int = DEFAULT_EXECUTOR_CACHE_SIZE
     background_processing_interval_seconds: int = DEFAULT_BACKGROUND_PROCESSING_INTERVAL_SECONDS
     background_processing_workers: int = DEFAULT_BACKGROUND_PROCESSING_WORKERS
@@ -663,6 +727,23 @@ class AgentConfig:
                 value=self.scheduler_interval_seconds,
                 expected=f"<= {MAX_SCHEDULER_INTERVAL_SECONDS}",
             )
+        # Validate scheduler concurrency
+        if self.scheduler_max_concurrent_runs < MIN_SCHEDULER_MAX_CONCURRENT_RUNS:
+            raise ValidationError(
+                f"scheduler_max_concurrent_runs must be at least "
+                f"{MIN_SCHEDULER_MAX_CONCURRENT_RUNS}",
+                field="scheduler_max_concurrent_runs",
+                value=self.scheduler_max_concurrent_runs,
+                expected=f">= {MIN_SCHEDULER_MAX_CONCURRENT_RUNS}",
+            )
+        if self.scheduler_max_concurrent_runs > MAX_SCHEDULER_MAX_CONCURRENT_RUNS:
+            raise ValidationError(
+                f"scheduler_max_concurrent_runs must be at most "
+                f"{MAX_SCHEDULER_MAX_CONCURRENT_RUNS}",
+                field="scheduler_max_concurrent_runs",
+                value=self.scheduler_max_concurrent_runs,
+                expected=f"<= {MAX_SCHEDULER_MAX_CONCURRENT_RUNS}",
+            )
         # Validate executor cache size
         if self.executor_cache_size < MIN_EXECUTOR_CACHE_SIZE:
             raise ValidationError(
@@ -739,6 +820,9 @@ class AgentConfig:
             scheduler_interval_seconds=data.get(
                 "scheduler_interval_seconds", DEFAULT_SCHEDULER_INTERVAL_SECONDS
             ),
+            scheduler_max_concurrent_runs=data.get(
+                "scheduler_max_concurrent_runs", DEFAULT_SCHEDULER_MAX_CONCURRENT_RUNS
+            ),
             executor_cache_size=data.get("executor_cache_size", DEFAULT_EXECUTOR_CACHE_SIZE),
             background_processing_interval_seconds=data.get(
                 "background_processing_interval_seconds",
@@ -760,6 +844,7 @@ class AgentConfig:
             "max_turns": self.max_turns,
             "timeout_seconds": self.timeout_seconds,
             "scheduler_interval_seconds": self.scheduler_interval_seconds,
+            "scheduler_max_concurrent_runs": self.scheduler_max_concurrent_runs,
             "executor_cache_size": self.executor_cache_size,
             "background_processing_interval_seconds": self.background_processing_interval_seconds,
             "background_processing_workers": self.background_processing_workers,
@@ -1466,6 +1551,7 @@ class CIConfig:
         governance: Agent governance (observability and enforcement) configuration.
         index_on_startup: Whether to build index when daemon starts.
         watch_files: Whether to watch files for changes.
+        index_workers: Worker processes used to chunk files during large index builds.
         exclude_patterns: Glob patterns to exclude from indexing.
         cli_command: CLI executable used for CI-managed integrations.
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR).
@@ -1483,6 +1569,7 @@ class CIConfig:
     governance: GovernanceConfig = field(default_factory=GovernanceConfig)
     index_on_startup: bool = True
     watch_files: bool = True
+    index_workers: int = DEFAULT_INDEX_WORKERS
     exclude_patterns: list[str] = field(default_factory=lambda: DEFAULT_EXCLUDE_PATTERNS.copy())
     cli_command: str = CI_CLI_COMMAND_DEFAULT
     log_level: str = LOG_LEVEL_INFO
@@ -1507,6 +1594,14 @@ class CIConfig:
                 expected=f"one of {VALID_LOG_LEVELS}",
             )
 
+        if not MIN_INDEX_WORKERS <= self.index_workers <= MAX_INDEX_WORKERS:
+            raise ValidationError(
+                f"Invalid index workers: {self.index_workers}",
+                field=CI_CONFIG_KEY_INDEX_WORKERS,
+                value=self.index_workers,
+                expected=f"integer between {MIN_INDEX_WORKERS} and {MAX_INDEX_WORKERS}",
+            )
+
         if not self.cli_command:
             raise ValidationError(
                 "CLI command cannot be empty",
@@ -1558,6 +1653,7 @@ class CIConfig:
             governance=GovernanceConfig.from_dict(governance_data),
             index_on_startup=data.get(CI_CONFIG_KEY_INDEX_ON_STARTUP, True),
             watch_files=data.get(CI_CONFIG_KEY_WATCH_FILES, True),
+            index_workers=data.get(CI_CONFIG_KEY_INDEX_WORKERS, DEFAULT_INDEX_WORKERS),
             exclude_patterns=data.get(
                 CI_CONFIG_KEY_EXCLUDE_PATTERNS, DEFAULT_EXCLUDE_PATTERNS.copy()
             ),
@@ -1580,6 +1676,7 @@ class CIConfig:
             CI_CONFIG_KEY_GOVERNANCE: self.governance.to_dict(),
             CI_CONFIG_KEY_INDEX_ON_STARTUP: self.index_on_startup,
             CI_CONFIG_KEY_WATCH_FILES: self.watch_files,
+            CI_CONFIG_KEY_INDEX_WORKERS: self.index_workers,
             CI_CONFIG_KEY_EXCLUDE_PATTERNS: self.exclude_patterns,
             CI_CONFIG_KEY_CLI_COMMAND: self.cli_command,
             CI_CONFIG_KEY_LOG_LEVEL: self.log_level,
@@ -1649,6 +1746,7 @@ USER_CLASSIFIED_PATHS: frozenset[str] = frozenset(
         f"{CI_CONFIG_KEY_AGENTS}.provider_model",  # Agent LLM backend varies per machine
         CI_CONFIG_KEY_TUNNEL,  # Tunnel provider/paths are machine-local
         CI_CONFIG_KEY_CLOUD_RELAY,  # Cloud relay config is machine-local (token, worker URL)
+        CI_CONFIG_KEY_INDEX_WORKERS,  # Core count varies per machine
         CI_CONFIG_KEY_LOG_LEVEL,  # Personal debugging preference
         CI_CONFIG_KEY_LOG_ROTATION,  # Machine-local log management
         f"{BACKUP_CONFIG_KEY}.auto_enabled",  # Personal preference for auto-backup
@@ -1959,6 +2057,7 @@ def get_config_origins(project_root: Path) -> dict[str, str]:
         CI_CONFIG_KEY_GOVERNANCE,
         CI_CONFIG_KEY_INDEX_ON_STARTUP,
         CI_CONFIG_KEY_WATCH_FILES,
+        CI_CONFIG_KEY_INDEX_WORKERS,
         CI_CONFIG_KEY_EXCLUDE_PATTERNS,
         CI_CONFIG_KEY_CLI_COMMAND,
         CI_CONFIG_KEY_LOG_LEVEL,
@@ -140,6 +140,9 @@ CI_LOG_FILE: Final[str] = "daemon.log"
 CI_HOOKS_LOG_FILE: Final[str] = "hooks.log"
 CI_PID_FILE: Final[str] = "daemon.pid"
 CI_PORT_FILE: Final[str] = "daemon.port"
+CI_SOCKET_FILE: Final[str] = "daemon.sock"
+CI_INDEX_MANIFEST_FILE: Final[str] = "index_manifest.json"
+CI_EMBEDDING_CACHE_FILE: Final[str] = "embedding_cache.db"
 
 # Team-shared port configuration (git-tracked, in oak/)
 # Priority: 1) .oak/ci/daemon.port (local override), 2) oak/daemon.port (team-shared)
@@ -183,6 +186,14 @@ PAGINATION_ACTIVITIES_MAX: Final[int] = 200
 PAGINATION_SEARCH_MAX: Final[int] = 200
 PAGINATION_STATS_SESSION_LIMIT: Final[int] = 100
 PAGINATION_STATS_DETAIL_LIMIT: Final[int] = 20
+# Offset pagination is kept for existing clients; new clients pass the opaque
+# next_cursor from the previous page instead (keyset pagination).
+PAGINATION_CURSOR_DESCRIPTION: Final[str] = (
+    "Opaque cursor from the previous page's next_cursor (takes precedence over offset)"
+)
+PAGINATION_OFFSET_DEPRECATED_DESCRIPTION: Final[str] = (
+    "Deprecated: pass cursor instead. Deep offsets get slower as history grows"
+)
 
 # =============================================================================
 # Session & Batch Status Values
@@ -199,6 +210,7 @@ ERROR_MSG_ACTIVITY_STORE_NOT_INITIALIZED: Final[str] = "Activity store not initi
 ERROR_MSG_PROJECT_ROOT_NOT_SET: Final[str] = "Project root not set"
 ERROR_MSG_SESSION_NOT_FOUND: Final[str] = "Session not found"
 ERROR_MSG_INVALID_JSON: Final[str] = "Invalid JSON"
+ERROR_MSG_INVALID_CURSOR: Final[str] = "Invalid pagination cursor"
 ERROR_MSG_LOCALHOST_ONLY: Final[str] = "Only localhost URLs are allowed for security reasons"
 
 # =============================================================================
@@ -269,6 +281,48 @@ MEMORY_EMBED_LINE_SEPARATOR: Final[str] = "\n"
 DEFAULT_EMBEDDING_BATCH_SIZE: Final[int] = 100
 DEFAULT_INDEXING_BATCH_SIZE: Final[int] = 50
 
+# Parallel chunking: worker processes for index builds (1 = chunk in the
+# daemon process). Builds with fewer files than the minimum stay in-process,
+# since starting workers costs more than it saves.
+DEFAULT_INDEX_WORKERS: Final[int] = 1
+MIN_INDEX_WORKERS: Final[int] = 1
+MAX_INDEX_WORKERS: Final[int] = 64
+PARALLEL_INDEX_MIN_FILES: Final[int] = 200
+# Files per task sent to a chunking worker
+PARALLEL_CHUNK_SHARD_SIZE: Final[int] = 16
+# Syntax trees kept per chunker so edited files can be reparsed incrementally
+AST_TREE_CACHE_SIZE: Final[int] = 128
+
+# Ollama /api/embed request splitting: max inputs per request and an estimated
+# token budget per request (estimated with CHARS_PER_TOKEN_ESTIMATE)
+DEFAULT_EMBEDDING_MAX_BATCH_SIZE: Final[int] = 64
+DEFAULT_EMBEDDING_MAX_BATCH_TOKENS: Final[int] = 32768
+
+# Embedding batches in flight at once while indexing (1 = sequential)
+DEFAULT_EMBEDDING_CONCURRENCY: Final[int] = 4
+MAX_EMBEDDING_CONCURRENCY: Final[int] = 16
+
+# In-process cache of search query embeddings (hooks and MCP tools repeat queries)
+QUERY_EMBEDDING_CACHE_SIZE: Final[int] = 256
+QUERY_EMBEDDING_CACHE_TTL_SECONDS: Final[float] = 600.0
+
+# Max IDs per ChromaDB delete call (stays well under SQLite's variable limit)
+VECTOR_DELETE_BATCH_SIZE: Final[int] = 1000
+
+# Activity write-behind queue: a writer thread inserts queued activities in one
+# transaction once this many are pending or the oldest has waited this long.
+ACTIVITY_WRITE_BATCH_SIZE: Final[int] = 100
+ACTIVITY_WRITE_FLUSH_INTERVAL_MS: Final[int] = 250
+ACTIVITY_WRITE_QUEUE_MAX: Final[int] = 10000
+# Callers wait this long for queue space before writing inline instead
+ACTIVITY_WRITE_ENQUEUE_TIMEOUT_SECONDS: Final[float] = 1.0
+ACTIVITY_WRITE_FLUSH_TIMEOUT_SECONDS: Final[float] = 30.0
+ACTIVITY_WRITER_THREAD_NAME: Final[str] = "oak-activity-writer"
+
+# Persistent embedding cache size (0 disables the cache)
+DEFAULT_EMBEDDING_CACHE_MAX_MB: Final[int] = 512
+MAX_EMBEDDING_CACHE_MAX_MB: Final[int] = 16384
+
 # Timeout for indexing operations (1 hour default - large codebases need time)
 DEFAULT_INDEXING_TIMEOUT_SECONDS: Final[float] = 3600.0
 
@@ -374,6 +428,9 @@ CI_HISTORY_BACKUP_FILE_PATTERN: Final[str] = "*.sql"
 CI_HISTORY_BACKUP_FILE_PREFIX: Final[str] = ""  # No prefix - directory provides context
 CI_HISTORY_BACKUP_FILE_SUFFIX: Final[str] = ".sql"
 CI_BACKUP_HEADER_MAX_LINES: Final[int] = 10
+# Backup import: characters read per chunk and rows per executemany transaction
+CI_BACKUP_IMPORT_READ_CHUNK_CHARS: Final[int] = 1024 * 1024
+CI_BACKUP_IMPORT_BATCH_SIZE: Final[int] = 500
 CI_BACKUP_PATH_INVALID_ERROR: Final[str] = "Backup path must be within {backup_dir}"
 
 # Environment variable for backup directory override
@@ -515,6 +572,18 @@ HOOK_DROP_LOG_TAG: Final[str] = "[DROP]"
 HOOK_TOOL_TRUNCATE_LENGTH: Final[int] = 500
 HOOK_READ_TRUNCATE_LENGTH: Final[int] = 200
 
+# Hook worker pool: blocking store/search stages of hook routes run here so a
+# slow SQLite write or embedding call never stalls the daemon's event loop.
+HOOK_WORKER_POOL_SIZE: Final[int] = 4
+HOOK_WORKER_THREAD_PREFIX: Final[str] = "oak-hook"
+# Stages that run longer than this are logged at WARNING
+HOOK_STAGE_SLOW_MS: Final[float] = 1000.0
+
+# Event loop lag monitor: sample how late a scheduled wake-up fires
+EVENT_LOOP_LAG_SAMPLE_INTERVAL_SECONDS: Final[float] = 0.5
+EVENT_LOOP_LAG_WINDOW_SAMPLES: Final[int] = 240  # ~2 minutes of samples
+EVENT_LOOP_LAG_WARN_MS: Final[float] = 250.0
+
 # Hook types
 HOOK_TYPE_JSON: Final[str] = "json"
 HOOK_TYPE_PLUGIN: Final[str] = "plugin"
@@ -528,6 +597,9 @@ HOOK_TYPE_OTEL: Final[str] = "otel"
 OTLP_LOGS_ENDPOINT: Final[str] = "/v1/logs"
 OTLP_CONTENT_TYPE_PROTOBUF: Final[str] = "application/x-protobuf"
 OTLP_CONTENT_TYPE_JSON: Final[str] = "application/json"
+OTLP_CONTENT_ENCODING_GZIP: Final[str] = "gzip"
+# Largest decompressed export the receiver accepts (guards against gzip bombs)
+OTLP_MAX_BODY_BYTES: Final[int] = 16 * 1024 * 1024
 
 # HTTP constants
 HTTP_HEADER_CONTENT_TYPE: Final[str] = "Content-Type"
@@ -718,7 +790,7 @@ TUNNEL_URL_PARSE_TIMEOUT_SECONDS: Final[float] = 15.0
 TUNNEL_SHUTDOWN_TIMEOUT_SECONDS: Final[float] = 5.0
 
 # Activity store schema version
-CI_ACTIVITY_SCHEMA_VERSION: Final[int] = 8
+CI_ACTIVITY_SCHEMA_VERSION: Final[int] = 11
 
 # Observation Lifecycle
 OBSERVATION_STATUS_ACTIVE: Final[str] = "active"
@@ -829,6 +901,7 @@ CI_CONFIG_KEY_AGENTS: Final[str] = "agents"
 CI_CONFIG_KEY_SESSION_QUALITY: Final[str] = "session_quality"
 CI_CONFIG_KEY_INDEX_ON_STARTUP: Final[str] = "index_on_startup"
 CI_CONFIG_KEY_WATCH_FILES: Final[str] = "watch_files"
+CI_CONFIG_KEY_INDEX_WORKERS: Final[str] = "index_workers"
 CI_CONFIG_KEY_EXCLUDE_PATTERNS: Final[str] = "exclude_patterns"
 CI_CONFIG_KEY_LOG_LEVEL: Final[str] = "log_level"
 CI_CONFIG_KEY_LOG_ROTATION: Final[str] = "log_rotation"
@@ -888,6 +961,18 @@ GOVERNANCE_SHELL_TOOLS: Final[frozenset[str]] = frozenset({"Bash"})
 GOVERNANCE_NETWORK_TOOLS: Final[frozenset[str]] = frozenset({"WebFetch", "WebSearch"})
 GOVERNANCE_AGENT_TOOLS: Final[frozenset[str]] = frozenset({"Task", "SendMessage"})
 
+# Distinct tool names whose candidate rule lists the governance engine caches
+GOVERNANCE_TOOL_RULES_CACHE_SIZE: Final[int] = 1024
+
+# Governance audit write buffer: events wait in a bounded ring buffer and are
+# inserted in one transaction once this many are pending or on the interval.
+# When the buffer is full the oldest event is dropped (and counted).
+GOVERNANCE_AUDIT_BUFFER_MAX: Final[int] = 5000
+GOVERNANCE_AUDIT_FLUSH_BATCH_SIZE: Final[int] = 200
+GOVERNANCE_AUDIT_FLUSH_INTERVAL_MS: Final[int] = 1000
+GOVERNANCE_AUDIT_WRITER_THREAD_NAME: Final[str] = "oak-governance-audit-writer"
+GOVERNANCE_AUDIT_STOP_TIMEOUT_SECONDS: Final[float] = 10.0
+
 # Governance audit retention
 GOVERNANCE_RETENTION_DAYS_DEFAULT: Final[int] = 30
 GOVERNANCE_RETENTION_DAYS_MIN: Final[int] = 1
@@ -1068,6 +1153,15 @@ CI_DEVTOOLS_CONFIRM_HEADER: Final[str] = "x-devtools-confirm"
 # File permissions for token file (owner read/write only)
 CI_TOKEN_FILE_PERMISSIONS: Final[int] = 0o600
 
+# Unix domain socket the daemon listens on alongside TCP (POSIX only).
+# Local clients prefer it: no TCP handshake and owner-only file permissions.
+CI_SOCKET_FILE_PERMISSIONS: Final[int] = 0o600
+# AF_UNIX paths are limited to 104 bytes on macOS and 108 on Linux; deeper
+# project paths skip the socket and use TCP only.
+CI_SOCKET_PATH_MAX_LENGTH: Final[int] = 100
+# How long startup waits for the socket listener before continuing on TCP only.
+CI_SOCKET_STARTUP_TIMEOUT_SECONDS: Final[float] = 5.0
+
 # Error messages for auth middleware
 CI_AUTH_ERROR_MISSING: Final[str] = "Missing Authorization header"
 CI_AUTH_ERROR_INVALID_SCHEME: Final[str] = "Invalid authentication scheme. Use: Bearer <token>"
@@ -1232,6 +1326,10 @@ INJECTION_MAX_LINES_PER_CHUNK: Final[int] = 50
 INJECTION_MAX_MEMORIES: Final[int] = 10
 INJECTION_MAX_SESSION_SUMMARIES: Final[int] = 3
 
+# Post-tool-use file memory cache (normalized path -> formatted context).
+# Entries are dropped when the memory collection changes.
+FILE_CONTEXT_CACHE_SIZE: Final[int] = 512
+
 # Summary generation limits
 SUMMARY_MAX_PLAN_CONTEXT_LENGTH: Final[int] = 1500
 
@@ -1253,11 +1351,18 @@ INJECTION_SESSION_START_REMINDER_BLOCK: Final[str] = MEMORY_EMBED_LINE_SEPARATOR
 # Agent Scheduler/Executor Configuration
 # =============================================================================
 
-# Scheduler interval: how often the scheduler checks for due schedules
-DEFAULT_SCHEDULER_INTERVAL_SECONDS: Final[int] = 60
+# Scheduler interval: max time between reloads of the schedule queue from the
+# database. Due schedules wake the scheduler directly, so this only bounds how
+# long a schedule edited outside the daemon API (e.g. a backup restore) goes unseen.
+DEFAULT_SCHEDULER_INTERVAL_SECONDS: Final[int] = 300
 MIN_SCHEDULER_INTERVAL_SECONDS: Final[int] = 10
 MAX_SCHEDULER_INTERVAL_SECONDS: Final[int] = 3600
 
+# Scheduler concurrency: how many scheduled agent runs may execute at once
+DEFAULT_SCHEDULER_MAX_CONCURRENT_RUNS: Final[int] = 2
+MIN_SCHEDULER_MAX_CONCURRENT_RUNS: Final[int] = 1
+MAX_SCHEDULER_MAX_CONCURRENT_RUNS: Final[int] = 8
+
 # Executor cache size: max runs to keep in memory
 DEFAULT_EXECUTOR_CACHE_SIZE: Final[int] = 100
 MIN_EXECUTOR_CACHE_SIZE: Final[int] = 10
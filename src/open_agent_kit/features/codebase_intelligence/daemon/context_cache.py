@@ -0,0 +1,112 @@
+"""Per-file memory context cache for post-tool-use injection.
+
+Every Read/Edit/Write hook searches the memory collection for notes about
+the touched file. Agents touch the same handful of files over and over, and
+between two touches of a file the memory collection usually has not changed,
+so the search returns the same memories each time.
+
+``FileContextCache`` keeps the formatted result per normalized file path,
+tagged with ``VectorStore.memory_generation`` at the time of the search. A
+lookup only hits when the generation still matches, so any memory added,
+resolved, archived or deleted since invalidates every entry at once.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from open_agent_kit.features.codebase_intelligence.constants import FILE_CONTEXT_CACHE_SIZE
+
+
+@dataclass(frozen=True)
+class FileContextEntry:
+    """Cached post-tool-use search result for one file.
+
+    Attributes:
+        generation: Memory collection generation the search ran against.
+        context: Formatted context to inject, or None if nothing matched.
+        search_ms: Time the original search took, credited on each hit.
+    """
+
+    generation: int
+    context: str | None
+    search_ms: float
+
+
+class FileContextCache:
+    """Thread-safe LRU of file memory context keyed by normalized path.
+
+    "No confident memories" is cached too (``context`` is None): most files
+    have no memories, and those are exactly the lookups worth skipping.
+    """
+
+    def __init__(self, max_entries: int = FILE_CONTEXT_CACHE_SIZE):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached files.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, FileContextEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._saved_ms = 0.0
+
+    def get(self, path: str, generation: int) -> FileContextEntry | None:
+        """Get the cached entry for a file, or None if missing or stale.
+
+        Args:
+            path: Normalized file path.
+            generation: Current memory collection generation.
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry.generation != generation:
+                if entry is not None:
+                    del self._entries[path]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(path)
+            self._hits += 1
+            self._saved_ms += entry.search_ms
+            return entry
+
+    def put(self, path: str, generation: int, context: str | None, search_ms: float) -> None:
+        """Store a search result, evicting the least recently used file if full.
+
+        Args:
+            path: Normalized file path.
+            generation: Memory collection generation read before the search.
+            context: Formatted context, or None if nothing matched.
+            search_ms: Time the search took.
+        """
+        with self._lock:
+            self._entries[path] = FileContextEntry(generation, context, search_ms)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters, entry count and the search
+            time saved by hits.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "saved_ms": round(self._saved_ms, 2),
+            }
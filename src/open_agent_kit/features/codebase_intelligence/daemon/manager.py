@@ -25,6 +25,8 @@ from open_agent_kit.features.codebase_intelligence.constants import (
     CI_PORT_FILE,
     CI_SHARED_PORT_DIR,
     CI_SHARED_PORT_FILE,
+    CI_SOCKET_FILE,
+    CI_SOCKET_PATH_MAX_LENGTH,
     CI_TOKEN_FILE,
     CI_TOKEN_FILE_PERMISSIONS,
 )
@@ -254,6 +256,24 @@ def get_project_port(project_root: Path, ci_data_dir: Path | None = None) -> int
         return derive_port_from_path(project_root)
 
 
+def get_socket_path(ci_data_dir: Path) -> Path | None:
+    """Get the daemon's Unix domain socket path.
+
+    Args:
+        ci_data_dir: CI data directory (.oak/ci).
+
+    Returns:
+        Socket path, or None where the daemon does not listen on a socket
+        (Windows, or a path too long for AF_UNIX). Clients then use TCP.
+    """
+    if os.name == "nt" or not hasattr(socket, "AF_UNIX"):
+        return None
+    socket_path = ci_data_dir / CI_SOCKET_FILE
+    if len(os.fsencode(socket_path)) > CI_SOCKET_PATH_MAX_LENGTH:
+        return None
+    return socket_path
+
+
 class DaemonManager:
     """Manage the Codebase Intelligence daemon lifecycle.
 
@@ -279,6 +299,7 @@ class DaemonManager:
         self.ci_data_dir = ci_data_dir or (project_root / OAK_DIR / CI_DATA_DIR)
         self.pid_file = self.ci_data_dir / CI_PID_FILE
         self.token_file = self.ci_data_dir / CI_TOKEN_FILE
+        self.socket_file = get_socket_path(self.ci_data_dir)
         self.log_file = self.ci_data_dir / CI_LOG_FILE
         self.lock_file = self.ci_data_dir / LOCK_FILE
         self.base_url = f"http://localhost:{port}"
@@ -746,18 +767,22 @@ class DaemonManager:
         return None
 
     def _cleanup_files(self) -> None:
-        """Clean up PID and token files on daemon stop.
+        """Clean up PID, token and socket files on daemon stop.
+
+        The daemon removes its own socket on a graceful shutdown; a daemon that
+        was force-killed leaves it behind.
 
         Note: Port file is intentionally preserved. The port is deterministic
         (derived from project path) and keeping the file provides visibility
         for debugging and avoids unnecessary recalculation.
         """
         self._remove_pid()
-        if self.token_file.exists():
-            try:
-                self.token_file.unlink()
-            except OSError:
-                pass
+        for path in (self.token_file, self.socket_file):
+            if path is not None and path.exists():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
 
     def restart(self) -> bool:
         """Restart the daemon.
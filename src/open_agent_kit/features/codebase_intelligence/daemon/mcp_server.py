@@ -7,6 +7,7 @@ The MCP server automatically starts the CI daemon if it's not running,
 providing seamless integration with AI agents like Claude Code.
 """
 
+import atexit
 import json
 import logging
 import sys
@@ -32,6 +33,7 @@ from open_agent_kit.features.codebase_intelligence.constants import (  # noqa: E
 from open_agent_kit.features.codebase_intelligence.daemon.manager import (  # noqa: E402
     DaemonManager,
     get_project_port,
+    get_socket_path,
 )
 from open_agent_kit.features.codebase_intelligence.exceptions import (  # noqa: E402
     DaemonConnectionError,
@@ -53,6 +55,22 @@ def create_mcp_server(project_root: Path) -> FastMCP:
     ci_data_dir = project_root / OAK_DIR / CI_DATA_DIR
     port = get_project_port(project_root, ci_data_dir)
     base_url = f"http://localhost:{port}"
+    socket_path = get_socket_path(ci_data_dir)
+
+    # One keep-alive client per transport for the server's lifetime, so tool
+    # calls reuse pooled connections. The Unix socket client is preferred;
+    # TCP is the fallback while the socket is missing or refuses connections.
+    tcp_client = httpx.Client(base_url=base_url, timeout=30.0)
+    uds_client: httpx.Client | None = None
+    if socket_path is not None:
+        uds_client = httpx.Client(
+            base_url="http://localhost",
+            timeout=30.0,
+            transport=httpx.HTTPTransport(uds=str(socket_path)),
+        )
+    for client in (tcp_client, uds_client):
+        if client is not None:
+            atexit.register(client.close)
 
     # Auth token — read fresh from disk on every request to survive daemon restarts.
     # The file is 64 bytes with 0600 perms; the read overhead is negligible.
@@ -134,28 +152,34 @@ def create_mcp_server(project_root: Path) -> FastMCP:
         Raises:
             Exception: If daemon cannot be started or request fails.
         """
-        url = f"{base_url}{endpoint}"
+        resolved_method = method
+        if resolved_method is None:
+            resolved_method = "POST" if data is not None else "GET"
+        resolved_method = resolved_method.upper()
+        if resolved_method not in ("PUT", "POST"):
+            resolved_method = "GET"
 
         def _make_request() -> dict[str, Any]:
             token = _read_auth_token()
             req_headers: dict[str, str] = {}
             if token:
                 req_headers["Authorization"] = f"{CI_AUTH_SCHEME_BEARER} {token}"
-            with httpx.Client(timeout=30.0) as client:
-                # Determine HTTP method
-                resolved_method = method
-                if resolved_method is None:
-                    resolved_method = "POST" if data is not None else "GET"
-                resolved_method = resolved_method.upper()
-
-                if resolved_method == "PUT":
-                    response = client.put(url, json=data, headers=req_headers)
-                elif resolved_method == "POST":
-                    response = client.post(url, json=data, headers=req_headers)
-                else:
-                    response = client.get(url, headers=req_headers)
-                response.raise_for_status()
-                return cast(dict[str, Any], response.json())
+            json_body = data if resolved_method != "GET" else None
+
+            response: httpx.Response | None = None
+            if uds_client is not None and socket_path is not None and socket_path.exists():
+                try:
+                    response = uds_client.request(
+                        resolved_method, endpoint, json=json_body, headers=req_headers
+                    )
+                except httpx.ConnectError:
+                    pass  # Stale socket file; the request was not sent
+            if response is None:
+                response = tcp_client.request(
+                    resolved_method, endpoint, json=json_body, headers=req_headers
+                )
+            response.raise_for_status()
+            return cast(dict[str, Any], response.json())
 
         # --- Happy path (daemon is up, token is current) ---
         try:
@@ -223,6 +223,7 @@ class MemoriesListResponse(BaseModel):
     total: int = 0
     limit: int = 50
     offset: int = 0
+    next_cursor: str | None = None  # Pass as cursor to fetch the next page
 
 
 class ObservationStatus(str, Enum):
@@ -307,6 +308,9 @@ class IndexResponse(BaseModel):
     status: str
     chunks_indexed: int = 0
     files_processed: int = 0
+    files_reused: int = 0
+    files_reembedded: int = 0
+    files_removed: int = 0
     duration_seconds: float = 0.0
 
 
@@ -477,6 +481,7 @@ class ActivityListResponse(BaseModel):
     total: int = 0
     limit: int = 50
     offset: int = 0
+    next_cursor: str | None = None  # Pass as cursor to fetch the next page
 
 
 class SessionListResponse(BaseModel):
@@ -486,6 +491,7 @@ class SessionListResponse(BaseModel):
     total: int = 0
     limit: int = 20
     offset: int = 0
+    next_cursor: str | None = None  # Pass as cursor to fetch the next page
 
 
 class PromptBatchListResponse(BaseModel):
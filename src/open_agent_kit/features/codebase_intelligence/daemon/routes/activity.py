@@ -20,14 +20,20 @@ from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, HTTPException, Query
 
+from open_agent_kit.features.codebase_intelligence.activity.store.pagination import (
+    InvalidCursorError,
+)
 from open_agent_kit.features.codebase_intelligence.constants import (
     DEFAULT_BACKGROUND_PROCESSING_INTERVAL_SECONDS,
     ERROR_MSG_ACTIVITY_STORE_NOT_INITIALIZED,
+    ERROR_MSG_INVALID_CURSOR,
     ERROR_MSG_SESSION_NOT_FOUND,
     PAGINATION_ACTIVITIES_MAX,
+    PAGINATION_CURSOR_DESCRIPTION,
     PAGINATION_DEFAULT_LIMIT,
     PAGINATION_DEFAULT_OFFSET,
     PAGINATION_MIN_LIMIT,
+    PAGINATION_OFFSET_DEPRECATED_DESCRIPTION,
     PAGINATION_SEARCH_MAX,
     PAGINATION_SESSIONS_MAX,
     PAGINATION_STATS_DETAIL_LIMIT,
@@ -476,7 +482,13 @@ async def list_sessions(
     limit: int = Query(
         default=PAGINATION_DEFAULT_LIMIT, ge=PAGINATION_MIN_LIMIT, le=PAGINATION_SESSIONS_MAX
     ),
-    offset: int = Query(default=PAGINATION_DEFAULT_OFFSET, ge=0),
+    offset: int = Query(
+        default=PAGINATION_DEFAULT_OFFSET,
+        ge=0,
+        deprecated=True,
+        description=PAGINATION_OFFSET_DEPRECATED_DESCRIPTION,
+    ),
+    cursor: str | None = Query(default=None, description=PAGINATION_CURSOR_DESCRIPTION),
     status: str | None = Query(default=None, description="Filter by status (active, completed)"),
     agent: str | None = Query(default=None, description="Filter by agent (claude, codex, etc.)"),
     sort: str = Query(
@@ -487,6 +499,7 @@ async def list_sessions(
     """List recent sessions with optional status filter.
 
     Returns sessions ordered by the specified sort order (default: last_activity).
+    Pass the returned next_cursor as ``cursor`` to fetch the following page.
     """
     state = get_state()
 
@@ -494,14 +507,17 @@ async def list_sessions(
         raise HTTPException(status_code=503, detail=ERROR_MSG_ACTIVITY_STORE_NOT_INITIALIZED)
 
     logger.debug(
-        f"Listing sessions: limit={limit}, offset={offset}, status={status}, "
-        f"agent={agent}, sort={sort}"
+        f"Listing sessions: limit={limit}, offset={offset}, cursor={cursor}, "
+        f"status={status}, agent={agent}, sort={sort}"
     )
 
     # Get sessions from activity store with SQL-level pagination and status filter
-    sessions = state.activity_store.get_recent_sessions(
-        limit=limit, offset=offset, status=status, agent=agent, sort=sort
-    )
+    try:
+        sessions, next_cursor = state.activity_store.get_sessions_page(
+            limit=limit, cursor=cursor, offset=offset, status=status, agent=agent, sort=sort
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=ERROR_MSG_INVALID_CURSOR) from e
 
     # Get stats in bulk (1 query instead of N queries) - eliminates N+1 pattern
     session_ids = [s.id for s in sessions]
@@ -542,6 +558,7 @@ async def list_sessions(
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
@@ -627,10 +644,19 @@ async def list_session_activities(
     limit: int = Query(
         default=PAGINATION_DEFAULT_LIMIT * 2, ge=PAGINATION_MIN_LIMIT, le=PAGINATION_ACTIVITIES_MAX
     ),
-    offset: int = Query(default=PAGINATION_DEFAULT_OFFSET, ge=0),
+    offset: int = Query(
+        default=PAGINATION_DEFAULT_OFFSET,
+        ge=0,
+        deprecated=True,
+        description=PAGINATION_OFFSET_DEPRECATED_DESCRIPTION,
+    ),
+    cursor: str | None = Query(default=None, description=PAGINATION_CURSOR_DESCRIPTION),
     tool_name: str | None = Query(default=None, description="Filter by tool name"),
 ) -> ActivityListResponse:
-    """List activities for a specific session."""
+    """List activities for a specific session, oldest first.
+
+    Pass the returned next_cursor as ``cursor`` to fetch the following page.
+    """
     state = get_state()
 
     if not state.activity_store:
@@ -638,18 +664,19 @@ async def list_session_activities(
 
     logger.debug(
         f"Listing activities for session {session_id}: "
-        f"limit={limit}, offset={offset}, tool={tool_name}"
-    )
-
-    # Get activities
-    activities = state.activity_store.get_session_activities(
-        session_id=session_id,
-        tool_name=tool_name,
-        limit=limit + offset,
+        f"limit={limit}, offset={offset}, cursor={cursor}, tool={tool_name}"
     )
 
-    # Apply offset
-    activities = activities[offset : offset + limit]
+    try:
+        activities, next_cursor = state.activity_store.get_session_activities_page(
+            session_id=session_id,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            tool_name=tool_name,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=ERROR_MSG_INVALID_CURSOR) from e
 
     items = [_activity_to_item(a) for a in activities]
 
@@ -658,6 +685,7 @@ async def list_session_activities(
         total=len(items) + offset,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
@@ -19,6 +19,9 @@ from typing import TYPE_CHECKING
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
 from pydantic import BaseModel, Field
 
+from open_agent_kit.features.codebase_intelligence.activity.store.pagination import (
+    InvalidCursorError,
+)
 from open_agent_kit.features.codebase_intelligence.agents.models import (
     AgentDetailResponse,
     AgentListItem,
@@ -35,6 +38,9 @@ from open_agent_kit.features.codebase_intelligence.agents.models import (
 from open_agent_kit.features.codebase_intelligence.constants import (
     AGENT_PROJECT_CONFIG_DIR,
     DEFAULT_BASE_URL,
+    ERROR_MSG_INVALID_CURSOR,
+    PAGINATION_CURSOR_DESCRIPTION,
+    PAGINATION_OFFSET_DEPRECATED_DESCRIPTION,
 )
 from open_agent_kit.features.codebase_intelligence.daemon.state import get_state
 
@@ -156,7 +162,10 @@ async def list_agents() -> AgentListResponse:
 @router.get("/runs", response_model=AgentRunListResponse)
 async def list_runs(
     limit: int = Query(default=20, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
+    offset: int = Query(
+        default=0, ge=0, deprecated=True, description=PAGINATION_OFFSET_DEPRECATED_DESCRIPTION
+    ),
+    cursor: str | None = Query(default=None, description=PAGINATION_CURSOR_DESCRIPTION),
     agent_name: str | None = Query(default=None, description="Filter by agent name"),
     status: str | None = Query(default=None, description="Filter by status"),
     created_after: datetime | None = Query(
@@ -174,7 +183,8 @@ async def list_runs(
 
     Args:
         limit: Maximum runs to return.
-        offset: Pagination offset.
+        offset: Pagination offset (deprecated, use cursor).
+        cursor: next_cursor from the previous page.
         agent_name: Filter by agent name.
         status: Filter by run status.
         created_after: Filter runs created after this time.
@@ -213,22 +223,27 @@ async def list_runs(
                 detail=f"Invalid status: {status}. Valid values: {[s.value for s in AgentRunStatus]}",
             ) from e
 
-    runs, total = executor.list_runs(
-        limit=limit,
-        offset=offset,
-        agent_name=agent_name,
-        status=status_filter,
-        created_after=created_after,
-        created_before=created_before,
-        sort_by=sort_by,
-        sort_order=sort_order,
-    )
+    try:
+        runs, total, next_cursor = executor.list_runs_page(
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            agent_name=agent_name,
+            status=status_filter,
+            created_after=created_after,
+            created_before=created_before,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=ERROR_MSG_INVALID_CURSOR) from e
 
     return AgentRunListResponse(
         runs=runs,
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
@@ -654,6 +669,8 @@ async def update_schedule(
 
     # Update the schedule
     state.activity_store.update_schedule(task_name=task_name, enabled=enabled)
+    if state.agent_scheduler:
+        state.agent_scheduler.notify_schedules_changed()
 
     # Get updated state
     updated = state.activity_store.get_schedule(task_name)
@@ -23,6 +23,7 @@ from open_agent_kit.features.codebase_intelligence.constants import (
     BACKUP_CONFIG_KEY,
     CI_CONFIG_KEY_EMBEDDING,
     CI_CONFIG_KEY_INDEX_ON_STARTUP,
+    CI_CONFIG_KEY_INDEX_WORKERS,
     CI_CONFIG_KEY_LOG_LEVEL,
     CI_CONFIG_KEY_LOG_ROTATION,
     CI_CONFIG_KEY_SESSION_QUALITY,
@@ -334,6 +335,7 @@ async def get_config() -> dict:
         },
         CI_CONFIG_KEY_INDEX_ON_STARTUP: config.index_on_startup,
         CI_CONFIG_KEY_WATCH_FILES: config.watch_files,
+        CI_CONFIG_KEY_INDEX_WORKERS: config.index_workers,
         CI_CONFIG_KEY_TUNNEL: {
             CI_CONFIG_TUNNEL_KEY_PROVIDER: config.tunnel.provider,
             CI_CONFIG_TUNNEL_KEY_AUTO_START: config.tunnel.auto_start,
@@ -1136,6 +1138,7 @@ async def restart_daemon() -> dict:
     # and reinitializes ChromaDB collections when embedding dimensions change
     if state.vector_store:
         state.vector_store.update_embedding_provider(state.embedding_chain)
+        state.vector_store.embedding_concurrency = ci_config.embedding.concurrency
 
     # Update indexer configuration
     if state.indexer:
@@ -80,6 +80,9 @@ async def get_audit_events(
     if not state.activity_store:
         return {"events": [], "total": 0}
 
+    # Buffered audit events become visible once written
+    state.flush_governance_audit()
+
     conn = state.activity_store._get_connection()
 
     # Build query with filters
@@ -135,6 +138,9 @@ async def get_audit_summary(
     if not state.activity_store:
         return {"total": 0, "by_action": {}, "by_tool": {}, "by_rule": {}}
 
+    # Buffered audit events become visible once written
+    state.flush_governance_audit()
+
     since_epoch = int(time.time()) - (days * 86400)
     conn = state.activity_store._get_connection()
 
@@ -35,6 +35,7 @@ from open_agent_kit.features.codebase_intelligence.constants import (
 )
 from open_agent_kit.features.codebase_intelligence.daemon.models import HealthResponse
 from open_agent_kit.features.codebase_intelligence.daemon.state import get_state
+from open_agent_kit.features.codebase_intelligence.daemon.workers import get_hook_pool
 
 logger = logging.getLogger(__name__)
 
@@ -176,6 +177,19 @@ async def get_status() -> dict:
             "config_version_outdated": state.config_version_outdated,
             "pending_migrations": state.pending_migration_count,
         },
+        "runtime": {
+            "event_loop_lag": (
+                state.loop_lag_monitor.snapshot() if state.loop_lag_monitor else None
+            ),
+            "hook_stages": get_hook_pool().stats(),
+            "file_context_cache": state.file_context_cache.get_stats(),
+            "activity_writer": (
+                state.activity_store.get_activity_writer_stats() if state.activity_store else None
+            ),
+            "governance_audit_writer": (
+                state.governance_audit_writer.get_stats() if state.governance_audit_writer else None
+            ),
+        },
     }
 
 
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, Request
 
@@ -42,6 +42,12 @@ from open_agent_kit.features.codebase_intelligence.daemon.routes.hooks_common im
     hooks_logger,
 )
 from open_agent_kit.features.codebase_intelligence.daemon.state import get_state
+from open_agent_kit.features.codebase_intelligence.daemon.workers import get_hook_pool
+
+if TYPE_CHECKING:
+    from open_agent_kit.features.codebase_intelligence.activity.store import ActivityStore
+    from open_agent_kit.features.codebase_intelligence.activity.store.models import PromptBatch
+    from open_agent_kit.features.codebase_intelligence.daemon.state import DaemonState
 
 logger = logging.getLogger(__name__)
 
@@ -92,31 +98,18 @@ async def hook_stop(request: Request) -> dict:
     if not state.activity_store:
         return result
 
-    # Persist transcript_path early — before any dedup or batch logic.
-    # In a dual-fire scenario (e.g. Claude cloud hooks fire first without
-    # transcript_path, then Cursor/VS Code local hooks fire with it), the
-    # second fire may not find an active batch.  Storing the path here
-    # ensures it is always captured for future recovery.
-    if transcript_path:
-        try:
-            state.activity_store.update_session_transcript_path(session_id, transcript_path)
-        except HOOK_STORE_EXCEPTIONS as e:
-            logger.debug(f"[STOP] Failed to store transcript_path: {e}")
-
-    # Flush any buffered activities before ending the batch
-    try:
-        flushed_ids = state.activity_store.flush_activity_buffer()
-        if flushed_ids:
-            logger.debug(f"Flushed {len(flushed_ids)} buffered activities before batch end")
-    except HOOK_STORE_EXCEPTIONS as e:
-        logger.debug(f"Failed to flush activity buffer: {e}")
+    # Transcript parsing and batch finalization block on SQLite and file I/O,
+    # so they run on the hook worker pool instead of the event loop.
+    pool = get_hook_pool()
+    active_batch = await pool.run(
+        "stop.prepare", _prepare_stop, state.activity_store, session_id, transcript_path
+    )
 
     state.record_hook_activity()
 
     # End current prompt batch and queue for processing (get batch from SQLite)
-    active_batch = state.activity_store.get_active_prompt_batch(session_id)
     prompt_batch_id = active_batch.id if active_batch else None
-    if prompt_batch_id:
+    if active_batch and prompt_batch_id:
         dedupe_key = build_dedupe_key(
             HOOK_EVENT_STOP,
             session_id,
@@ -131,32 +124,28 @@ async def hook_stop(request: Request) -> dict:
             result["prompt_batch_id"] = prompt_batch_id
             return result
         try:
-            response_summary = _extract_response_summary(transcript_path, body)
-
-            # Heuristic plan detection: check if response matches plan patterns
-            # This is the 4th detection mechanism, only runs if no deterministic
-            # mechanism already promoted the batch to plan.
-            if response_summary and active_batch and active_batch.source_type != PROMPT_SOURCE_PLAN:
-                _try_promote_to_plan(
-                    state, prompt_batch_id, response_summary, transcript_path, body, agent
+            result.update(
+                await pool.run(
+                    "stop.finalize",
+                    _finalize_stop,
+                    state,
+                    state.activity_store,
+                    prompt_batch_id,
+                    active_batch.source_type,
+                    transcript_path,
+                    body,
+                    agent,
                 )
-
-            from open_agent_kit.features.codebase_intelligence.activity import (
-                finalize_prompt_batch,
             )
+            # Processing runs on the loop, so it is scheduled here rather than
+            # by finalize_prompt_batch on the worker thread.
+            if state.activity_processor:
+                from open_agent_kit.features.codebase_intelligence.activity import (
+                    schedule_prompt_batch_processing,
+                )
 
-            finalize_result = finalize_prompt_batch(
-                activity_store=state.activity_store,
-                activity_processor=state.activity_processor,
-                prompt_batch_id=prompt_batch_id,
-                response_summary=response_summary,
-            )
-            result.update(finalize_result)
-            logger.info(
-                "[STOP] Ended prompt batch %s (has_summary=%s)",
-                prompt_batch_id,
-                response_summary is not None,
-            )
+                schedule_prompt_batch_processing(state.activity_processor, prompt_batch_id)
+                result["processing_scheduled"] = True
 
             # Note: batch status is tracked in SQLite, no in-memory cleanup needed
 
@@ -164,48 +153,133 @@ async def hook_stop(request: Request) -> dict:
             logger.warning(f"Failed to end prompt batch: {e}")
 
     elif transcript_path or body.get("response_summary"):
-        # -----------------------------------------------------------
-        # Dual-fire late arrival: the first stop (e.g. --agent claude)
-        # already finalized the active batch, so no active batch exists.
-        # The second stop (e.g. --agent cursor) carries the transcript.
-        # Find the just-completed batch and backfill its response.
-        # -----------------------------------------------------------
+        result.update(
+            await pool.run(
+                "stop.late-capture",
+                _capture_late_response,
+                state,
+                state.activity_store,
+                session_id,
+                transcript_path,
+                body,
+                agent,
+            )
+        )
+
+    return result
+
+
+def _prepare_stop(
+    store: ActivityStore, session_id: str, transcript_path: str
+) -> PromptBatch | None:
+    """Persist the transcript path, flush buffered activities, get the active batch."""
+    # Persist transcript_path early — before any dedup or batch logic.
+    # In a dual-fire scenario (e.g. Claude cloud hooks fire first without
+    # transcript_path, then Cursor/VS Code local hooks fire with it), the
+    # second fire may not find an active batch.  Storing the path here
+    # ensures it is always captured for future recovery.
+    if transcript_path:
         try:
-            response_summary = _extract_response_summary(transcript_path, body)
-            if response_summary:
-                recent_batch = state.activity_store.get_latest_prompt_batch(session_id)
-                if recent_batch and recent_batch.id:
-                    # Only backfill if the batch has no response yet
-                    if not recent_batch.response_summary:
-                        state.activity_store.update_prompt_batch_response(
-                            recent_batch.id, response_summary
-                        )
-                        logger.info(
-                            "[STOP] Late transcript capture: updated batch %s with response (%d chars)",
-                            recent_batch.id,
-                            len(response_summary),
-                        )
-                        result["prompt_batch_id"] = recent_batch.id
-                        result["late_capture"] = True
-
-                        # Also run plan detection on the backfilled response
-                        if recent_batch.source_type != PROMPT_SOURCE_PLAN:
-                            _try_promote_to_plan(
-                                state,
-                                recent_batch.id,
-                                response_summary,
-                                transcript_path,
-                                body,
-                                agent,
-                            )
-                    else:
-                        logger.debug(
-                            "[STOP] Batch %s already has response, skipping late capture",
-                            recent_batch.id,
-                        )
+            store.update_session_transcript_path(session_id, transcript_path)
         except HOOK_STORE_EXCEPTIONS as e:
-            logger.warning(f"[STOP] Failed to capture late transcript: {e}")
+            logger.debug(f"[STOP] Failed to store transcript_path: {e}")
+
+    # Flush any buffered activities before ending the batch
+    try:
+        flushed_ids = store.flush_activity_buffer()
+        if flushed_ids:
+            logger.debug(f"Flushed {len(flushed_ids)} buffered activities before batch end")
+    except HOOK_STORE_EXCEPTIONS as e:
+        logger.debug(f"Failed to flush activity buffer: {e}")
+
+    return store.get_active_prompt_batch(session_id)
+
+
+def _finalize_stop(
+    state: DaemonState,
+    store: ActivityStore,
+    prompt_batch_id: int,
+    source_type: str,
+    transcript_path: str,
+    body: dict,
+    agent: str,
+) -> dict[str, Any]:
+    """End the active prompt batch with its response summary (blocking)."""
+    from open_agent_kit.features.codebase_intelligence.activity import (
+        finalize_prompt_batch,
+    )
+
+    response_summary = _extract_response_summary(transcript_path, body)
+
+    # Heuristic plan detection: check if response matches plan patterns
+    # This is the 4th detection mechanism, only runs if no deterministic
+    # mechanism already promoted the batch to plan.
+    if response_summary and source_type != PROMPT_SOURCE_PLAN:
+        _try_promote_to_plan(state, prompt_batch_id, response_summary, transcript_path, body, agent)
+
+    finalize_result = finalize_prompt_batch(
+        activity_store=store,
+        activity_processor=None,
+        prompt_batch_id=prompt_batch_id,
+        response_summary=response_summary,
+    )
+    logger.info(
+        "[STOP] Ended prompt batch %s (has_summary=%s)",
+        prompt_batch_id,
+        response_summary is not None,
+    )
+    return finalize_result
+
+
+def _capture_late_response(
+    state: DaemonState,
+    store: ActivityStore,
+    session_id: str,
+    transcript_path: str,
+    body: dict,
+    agent: str,
+) -> dict[str, Any]:
+    """Backfill the response of a batch already finalized by an earlier stop (blocking).
+
+    Dual-fire late arrival: the first stop (e.g. --agent claude) already
+    finalized the active batch, so no active batch exists. The second stop
+    (e.g. --agent cursor) carries the transcript. Find the just-completed
+    batch and backfill its response.
+    """
+    result: dict[str, Any] = {}
+    try:
+        response_summary = _extract_response_summary(transcript_path, body)
+        if response_summary:
+            recent_batch = store.get_latest_prompt_batch(session_id)
+            if recent_batch and recent_batch.id:
+                # Only backfill if the batch has no response yet
+                if not recent_batch.response_summary:
+                    store.update_prompt_batch_response(recent_batch.id, response_summary)
+                    logger.info(
+                        "[STOP] Late transcript capture: updated batch %s with response (%d chars)",
+                        recent_batch.id,
+                        len(response_summary),
+                    )
+                    result["prompt_batch_id"] = recent_batch.id
+                    result["late_capture"] = True
 
+                    # Also run plan detection on the backfilled response
+                    if recent_batch.source_type != PROMPT_SOURCE_PLAN:
+                        _try_promote_to_plan(
+                            state,
+                            recent_batch.id,
+                            response_summary,
+                            transcript_path,
+                            body,
+                            agent,
+                        )
+                else:
+                    logger.debug(
+                        "[STOP] Batch %s already has response, skipping late capture",
+                        recent_batch.id,
+                    )
+    except HOOK_STORE_EXCEPTIONS as e:
+        logger.warning(f"[STOP] Failed to capture late transcript: {e}")
     return result
 
 
@@ -302,6 +376,33 @@ def _try_promote_to_plan(
         logger.debug(f"[STOP] Failed to promote batch to plan: {e}")
 
 
+def _store_lifecycle_activity(
+    state: DaemonState,
+    store: ActivityStore,
+    session_id: str,
+    tool_name: str,
+    **fields: Any,
+) -> int | None:
+    """Buffer a lifecycle event as an activity in the active batch (blocking).
+
+    Returns:
+        The active prompt batch ID the activity was attached to, if any.
+    """
+    from open_agent_kit.features.codebase_intelligence.activity import Activity
+
+    prompt_batch_id = get_active_batch_id(store, session_id)
+    activity = Activity(
+        session_id=session_id,
+        prompt_batch_id=prompt_batch_id,
+        tool_name=tool_name,
+        success=True,
+        **fields,
+    )
+    store.add_activity_buffered(activity)
+    state.record_hook_activity()
+    return prompt_batch_id
+
+
 # =============================================================================
 # Subagent handlers
 # =============================================================================
@@ -361,51 +462,30 @@ async def hook_subagent_start(request: Request) -> dict:
     #      have had a PreToolUse just moments before SubagentStart fires
     #   3. Fall back to most recently started session of the same agent if no
     #      activity data matches
+    pool = get_hook_pool()
     if state.activity_store and state.project_root and session_id:
-        agent_name = body.get(HOOK_FIELD_AGENT, AGENT_UNKNOWN)
-        existing = state.activity_store.get_session(session_id)
-        if not existing:
-            try:
-                from open_agent_kit.features.codebase_intelligence.activity.store import sessions
-
-                parent_id = sessions.find_active_parent_for_subagent(
-                    state.activity_store,
-                    subagent_session_id=session_id,
-                    agent=agent_name,
-                )
-
-                sessions.create_session(
-                    state.activity_store,
-                    session_id=session_id,
-                    agent=agent_name,
-                    project_root=str(state.project_root),
-                    parent_session_id=parent_id,
-                    parent_session_reason="subagent",
-                )
-                logger.info(
-                    f"[SUBAGENT-START] Created session {session_id[:8]} "
-                    f"with parent={parent_id[:8] if parent_id else 'none'}"
-                )
-            except HOOK_STORE_EXCEPTIONS as e:
-                logger.debug(f"Failed to pre-create subagent session: {e}")
+        await pool.run(
+            "subagent-start.session",
+            _ensure_subagent_session,
+            state.activity_store,
+            session_id,
+            body.get(HOOK_FIELD_AGENT, AGENT_UNKNOWN),
+            str(state.project_root),
+        )
 
     # Store as activity to track subagent spawn
     if state.activity_store and session_id:
         try:
-            from open_agent_kit.features.codebase_intelligence.activity import Activity
-
-            prompt_batch_id = get_active_batch_id(state.activity_store, session_id)
-
-            activity = Activity(
-                session_id=session_id,
-                prompt_batch_id=prompt_batch_id,
-                tool_name="SubagentStart",
+            prompt_batch_id = await pool.run(
+                "subagent-start.store",
+                _store_lifecycle_activity,
+                state,
+                state.activity_store,
+                session_id,
+                "SubagentStart",
                 tool_input={"agent_id": agent_id, "agent_type": agent_type},
                 tool_output_summary=f"Started subagent: {agent_type}",
-                success=True,
             )
-            state.activity_store.add_activity_buffered(activity)
-            state.record_hook_activity()
             logger.debug(f"Stored subagent-start: {agent_type} (batch={prompt_batch_id})")
 
         except HOOK_STORE_EXCEPTIONS as e:
@@ -461,15 +541,15 @@ async def hook_subagent_stop(request: Request) -> dict:
 
     # Store as activity to track subagent completion
     if state.activity_store and session_id:
+        pool = get_hook_pool()
         try:
-            from open_agent_kit.features.codebase_intelligence.activity import Activity
-
-            prompt_batch_id = get_active_batch_id(state.activity_store, session_id)
-
-            activity = Activity(
-                session_id=session_id,
-                prompt_batch_id=prompt_batch_id,
-                tool_name="SubagentStop",
+            prompt_batch_id = await pool.run(
+                "subagent-stop.store",
+                _store_lifecycle_activity,
+                state,
+                state.activity_store,
+                session_id,
+                "SubagentStop",
                 tool_input={
                     "agent_id": agent_id,
                     "agent_type": agent_type,
@@ -478,25 +558,19 @@ async def hook_subagent_stop(request: Request) -> dict:
                 },
                 tool_output_summary=f"Completed subagent: {agent_type}",
                 file_path=agent_transcript_path if agent_transcript_path else None,
-                success=True,
             )
-            state.activity_store.add_activity_buffered(activity)
-            state.record_hook_activity()
             logger.debug(f"Stored subagent-stop: {agent_type} (batch={prompt_batch_id})")
 
             # Capture subagent response summary from transcript
             if agent_transcript_path and prompt_batch_id:
-                from open_agent_kit.features.codebase_intelligence.transcript import (
-                    parse_transcript_response,
+                await pool.run(
+                    "subagent-stop.transcript",
+                    _capture_subagent_response,
+                    state.activity_store,
+                    prompt_batch_id,
+                    agent_transcript_path,
                 )
 
-                response_summary = parse_transcript_response(agent_transcript_path)
-                if response_summary:
-                    state.activity_store.update_prompt_batch_response(
-                        prompt_batch_id, response_summary
-                    )
-                    logger.debug(f"Captured subagent response for batch {prompt_batch_id}")
-
         except HOOK_STORE_EXCEPTIONS as e:
             logger.debug(f"Failed to store subagent-stop: {e}")
 
@@ -508,6 +582,52 @@ async def hook_subagent_stop(request: Request) -> dict:
     }
 
 
+def _ensure_subagent_session(
+    store: ActivityStore, session_id: str, agent_name: str, project_root: str
+) -> None:
+    """Pre-create a subagent's own session linked to its parent (blocking)."""
+    existing = store.get_session(session_id)
+    if existing:
+        return
+    try:
+        from open_agent_kit.features.codebase_intelligence.activity.store import sessions
+
+        parent_id = sessions.find_active_parent_for_subagent(
+            store,
+            subagent_session_id=session_id,
+            agent=agent_name,
+        )
+
+        sessions.create_session(
+            store,
+            session_id=session_id,
+            agent=agent_name,
+            project_root=project_root,
+            parent_session_id=parent_id,
+            parent_session_reason="subagent",
+        )
+        logger.info(
+            f"[SUBAGENT-START] Created session {session_id[:8]} "
+            f"with parent={parent_id[:8] if parent_id else 'none'}"
+        )
+    except HOOK_STORE_EXCEPTIONS as e:
+        logger.debug(f"Failed to pre-create subagent session: {e}")
+
+
+def _capture_subagent_response(
+    store: ActivityStore, prompt_batch_id: int, agent_transcript_path: str
+) -> None:
+    """Store a subagent's response summary from its transcript (blocking)."""
+    from open_agent_kit.features.codebase_intelligence.transcript import (
+        parse_transcript_response,
+    )
+
+    response_summary = parse_transcript_response(agent_transcript_path)
+    if response_summary:
+        store.update_prompt_batch_response(prompt_batch_id, response_summary)
+        logger.debug(f"Captured subagent response for batch {prompt_batch_id}")
+
+
 # =============================================================================
 # Agent thought handler
 # =============================================================================
@@ -563,23 +683,19 @@ async def hook_agent_thought(request: Request) -> dict:
     # Store as activity for analysis
     if state.activity_store and session_id:
         try:
-            from open_agent_kit.features.codebase_intelligence.activity import Activity
-
-            prompt_batch_id = get_active_batch_id(state.activity_store, session_id)
-
             # Truncate thought text if too long (keep first 2000 chars for summary)
             summary = thought_text[:2000] if len(thought_text) > 2000 else thought_text
 
-            activity = Activity(
-                session_id=session_id,
-                prompt_batch_id=prompt_batch_id,
-                tool_name="AgentThought",
+            prompt_batch_id = await get_hook_pool().run(
+                "agent-thought.store",
+                _store_lifecycle_activity,
+                state,
+                state.activity_store,
+                session_id,
+                "AgentThought",
                 tool_input={"duration_ms": duration_ms},
                 tool_output_summary=summary,
-                success=True,
             )
-            state.activity_store.add_activity_buffered(activity)
-            state.record_hook_activity()
             logger.debug(
                 f"Stored agent-thought: {len(thought_text)} chars (batch={prompt_batch_id})"
             )
@@ -645,14 +761,13 @@ async def hook_pre_compact(request: Request) -> dict:
     # Store as activity for debugging context pressure
     if state.activity_store and session_id:
         try:
-            from open_agent_kit.features.codebase_intelligence.activity import Activity
-
-            prompt_batch_id = get_active_batch_id(state.activity_store, session_id)
-
-            activity = Activity(
-                session_id=session_id,
-                prompt_batch_id=prompt_batch_id,
-                tool_name="ContextCompact",
+            prompt_batch_id = await get_hook_pool().run(
+                "pre-compact.store",
+                _store_lifecycle_activity,
+                state,
+                state.activity_store,
+                session_id,
+                "ContextCompact",
                 tool_input={
                     "trigger": trigger,
                     "context_usage_percent": context_usage_percent,
@@ -666,10 +781,7 @@ async def hook_pre_compact(request: Request) -> dict:
                     f"Context compaction ({trigger}): {context_usage_percent}% used, "
                     f"{messages_to_compact}/{message_count} messages"
                 ),
-                success=True,
             )
-            state.activity_store.add_activity_buffered(activity)
-            state.record_hook_activity()
             logger.debug(
                 f"Stored pre-compact: {context_usage_percent}% usage (batch={prompt_batch_id})"
             )
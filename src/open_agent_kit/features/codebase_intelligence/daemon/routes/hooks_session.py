@@ -9,7 +9,7 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, Request
 
@@ -34,6 +34,11 @@ from open_agent_kit.features.codebase_intelligence.daemon.routes.injection impor
     format_hook_output,
 )
 from open_agent_kit.features.codebase_intelligence.daemon.state import get_state
+from open_agent_kit.features.codebase_intelligence.daemon.workers import get_hook_pool
+
+if TYPE_CHECKING:
+    from open_agent_kit.features.codebase_intelligence.activity.store import ActivityStore
+    from open_agent_kit.features.codebase_intelligence.daemon.state import DaemonState
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +87,10 @@ async def hook_session_start(request: Request) -> dict:
     # Detailed logging to daemon.log (debug mode only)
     logger.debug(f"[SESSION-START] Raw request body: {body}")
 
+    # Session bookkeeping and context building block on SQLite and ChromaDB,
+    # so they run on the hook worker pool instead of the event loop.
+    pool = get_hook_pool()
+
     # Create or resume session in activity store (SQLite) - idempotent
     # Parent linking: prefer explicit parent_session_id from body, fall back to heuristic
     parent_session_id = body.get("parent_session_id") or None
@@ -95,83 +104,17 @@ async def hook_session_start(request: Request) -> dict:
         )
 
     if state.activity_store and state.project_root:
-        # When source="clear" and no explicit parent, find one heuristically:
-        # 1. Session that just ended (within SESSION_LINK_IMMEDIATE_GAP_SECONDS) - normal flow
-        # 2. Active session (race condition - SessionEnd not processed yet)
-        # 3. Most recent completed session within SESSION_LINK_FALLBACK_MAX_HOURS (stale/next-day)
-        if source == "clear" and not parent_session_id:
-            try:
-                from open_agent_kit.features.codebase_intelligence.activity.store.sessions import (
-                    find_linkable_parent_session,
-                )
-
-                link_result = find_linkable_parent_session(
-                    store=state.activity_store,
-                    agent=agent,
-                    project_root=str(state.project_root),
-                    exclude_session_id=session_id,
-                    new_session_started_at=datetime.now(),
-                    # Use defaults from constants (SESSION_LINK_IMMEDIATE_GAP_SECONDS,
-                    # SESSION_LINK_FALLBACK_MAX_HOURS)
-                )
-                if link_result:
-                    parent_session_id, parent_session_reason = link_result
-                    hooks_logger.info(
-                        f"[SESSION-LINK] session={session_id} parent={parent_session_id[:8]}... "
-                        f"reason={parent_session_reason} (heuristic)"
-                    )
-            except HOOK_STORE_EXCEPTIONS as e:
-                logger.debug(f"Failed to find parent session for linking: {e}")
-
-        try:
-            _, created = state.activity_store.get_or_create_session(
-                session_id=session_id,
-                agent=agent,
-                project_root=str(state.project_root),
-            )
-            if created:
-                logger.debug(f"Created activity session: {session_id}")
-                # If we found a parent session and the session was just created,
-                # update the parent link
-                if parent_session_id:
-                    try:
-                        from open_agent_kit.features.codebase_intelligence.activity.store.sessions import (
-                            update_session_parent,
-                        )
-
-                        update_session_parent(
-                            store=state.activity_store,
-                            session_id=session_id,
-                            parent_session_id=parent_session_id,
-                            reason=parent_session_reason or "clear",
-                        )
-                    except HOOK_STORE_EXCEPTIONS as e:
-                        logger.debug(f"Failed to update session parent: {e}")
-
-                # For continuation sources, create a batch immediately
-                # Agents may start executing tools before UserPromptSubmit fires
-                # Use manifest configuration to determine which sources trigger this
-                continuation_sources = get_continuation_sources(agent)
-
-                if source in continuation_sources:
-                    try:
-                        batch_label = get_continuation_label(source)
-                        batch = state.activity_store.create_prompt_batch(
-                            session_id=session_id,
-                            user_prompt=batch_label,
-                            source_type="system",
-                        )
-                        if batch:
-                            hooks_logger.info(
-                                f"[BATCH-CREATE-CONTINUATION] batch={batch.id} "
-                                f"session={session_id} source={source} agent={agent}"
-                            )
-                    except HOOK_STORE_EXCEPTIONS as e:
-                        logger.warning(f"Failed to create continuation batch: {e}")
-            else:
-                logger.debug(f"Resumed activity session: {session_id}")
-        except HOOK_STORE_EXCEPTIONS as e:
-            logger.warning(f"Failed to create/resume activity session: {e}")
+        await pool.run(
+            "session-start.store",
+            _start_session,
+            state,
+            state.activity_store,
+            session_id,
+            agent,
+            source,
+            parent_session_id,
+            parent_session_reason,
+        )
 
     # Build context response with injected_context for Claude
     context: dict[str, Any] = {
@@ -183,8 +126,12 @@ async def hook_session_start(request: Request) -> dict:
     inject_full_context = source in ("startup", "clear")
 
     # Build the context string that will be injected into Claude
-    injected = build_session_context(
-        state, include_memories=inject_full_context, session_id=session_id
+    injected = await pool.run(
+        "session-start.context",
+        build_session_context,
+        state,
+        include_memories=inject_full_context,
+        session_id=session_id,
     )
     if injected:
         context["injected_context"] = injected
@@ -200,7 +147,7 @@ async def hook_session_start(request: Request) -> dict:
         context["project_root"] = str(state.project_root)
 
     if state.vector_store:
-        stats = state.vector_store.get_stats()
+        stats = await pool.run("session-start.index-stats", state.vector_store.get_stats)
         context["index"] = {
             "code_chunks": stats.get("code_chunks", 0),
             "memory_observations": stats.get("memory_observations", 0),
@@ -215,6 +162,95 @@ async def hook_session_start(request: Request) -> dict:
     return response
 
 
+def _start_session(
+    state: DaemonState,
+    store: ActivityStore,
+    session_id: str,
+    agent: str,
+    source: str,
+    parent_session_id: str | None,
+    parent_session_reason: str | None,
+) -> None:
+    """Create or resume the session and link its parent (blocking)."""
+    # When source="clear" and no explicit parent, find one heuristically:
+    # 1. Session that just ended (within SESSION_LINK_IMMEDIATE_GAP_SECONDS) - normal flow
+    # 2. Active session (race condition - SessionEnd not processed yet)
+    # 3. Most recent completed session within SESSION_LINK_FALLBACK_MAX_HOURS (stale/next-day)
+    if source == "clear" and not parent_session_id:
+        try:
+            from open_agent_kit.features.codebase_intelligence.activity.store.sessions import (
+                find_linkable_parent_session,
+            )
+
+            link_result = find_linkable_parent_session(
+                store=store,
+                agent=agent,
+                project_root=str(state.project_root),
+                exclude_session_id=session_id,
+                new_session_started_at=datetime.now(),
+                # Use defaults from constants (SESSION_LINK_IMMEDIATE_GAP_SECONDS,
+                # SESSION_LINK_FALLBACK_MAX_HOURS)
+            )
+            if link_result:
+                parent_session_id, parent_session_reason = link_result
+                hooks_logger.info(
+                    f"[SESSION-LINK] session={session_id} parent={parent_session_id[:8]}... "
+                    f"reason={parent_session_reason} (heuristic)"
+                )
+        except HOOK_STORE_EXCEPTIONS as e:
+            logger.debug(f"Failed to find parent session for linking: {e}")
+
+    try:
+        _, created = store.get_or_create_session(
+            session_id=session_id,
+            agent=agent,
+            project_root=str(state.project_root),
+        )
+        if created:
+            logger.debug(f"Created activity session: {session_id}")
+            # If we found a parent session and the session was just created,
+            # update the parent link
+            if parent_session_id:
+                try:
+                    from open_agent_kit.features.codebase_intelligence.activity.store.sessions import (
+                        update_session_parent,
+                    )
+
+                    update_session_parent(
+                        store=store,
+                        session_id=session_id,
+                        parent_session_id=parent_session_id,
+                        reason=parent_session_reason or "clear",
+                    )
+                except HOOK_STORE_EXCEPTIONS as e:
+                    logger.debug(f"Failed to update session parent: {e}")
+
+            # For continuation sources, create a batch immediately
+            # Agents may start executing tools before UserPromptSubmit fires
+            # Use manifest configuration to determine which sources trigger this
+            continuation_sources = get_continuation_sources(agent)
+
+            if source in continuation_sources:
+                try:
+                    batch_label = get_continuation_label(source)
+                    batch = store.create_prompt_batch(
+                        session_id=session_id,
+                        user_prompt=batch_label,
+                        source_type="system",
+                    )
+                    if batch:
+                        hooks_logger.info(
+                            f"[BATCH-CREATE-CONTINUATION] batch={batch.id} "
+                            f"session={session_id} source={source} agent={agent}"
+                        )
+                except HOOK_STORE_EXCEPTIONS as e:
+                    logger.warning(f"Failed to create continuation batch: {e}")
+        else:
+            logger.debug(f"Resumed activity session: {session_id}")
+    except HOOK_STORE_EXCEPTIONS as e:
+        logger.warning(f"Failed to create/resume activity session: {e}")
+
+
 @router.post(f"{OAK_CI_PREFIX}/session-end")
 async def hook_session_end(request: Request) -> dict:
     """Handle session end - finalize session and any remaining prompt batches.
@@ -243,10 +279,16 @@ async def hook_session_end(request: Request) -> dict:
     # Detailed logging to daemon.log (debug mode only)
     logger.debug(f"[SESSION-END] Raw request body: {body}")
 
+    # Flushing and ending the session block on SQLite, so they run on the
+    # hook worker pool instead of the event loop.
+    pool = get_hook_pool()
+
     # Flush any buffered activities before ending the session
     if state.activity_store:
         try:
-            flushed_ids = state.activity_store.flush_activity_buffer()
+            flushed_ids = await pool.run(
+                "session-end.flush", state.activity_store.flush_activity_buffer
+            )
             if flushed_ids:
                 logger.debug(f"Flushed {len(flushed_ids)} buffered activities on session end")
         except HOOK_STORE_EXCEPTIONS as e:
@@ -264,109 +306,125 @@ async def hook_session_end(request: Request) -> dict:
     if not state.activity_store:
         return result
 
+    duration_minutes, prompt_batch_id, stats = await pool.run(
+        "session-end.store", _end_session, state.activity_store, session_id, agent
+    )
+
+    # Queue the final prompt batch for processing
+    if prompt_batch_id and state.activity_processor:
+        from open_agent_kit.features.codebase_intelligence.activity import (
+            process_prompt_batch_async,
+        )
+
+        # Capture processor reference to avoid type narrowing issues
+        processor = state.activity_processor
+        batch_id = prompt_batch_id
+
+        async def _process_final_batch() -> None:
+            logger.debug(f"[REALTIME] Starting async processing for final batch {batch_id}")
+            try:
+                proc_result = await process_prompt_batch_async(processor, batch_id)
+                if proc_result.success:
+                    logger.info(
+                        f"[REALTIME] Final prompt batch {batch_id} processed: "
+                        f"{proc_result.observations_extracted} observations"
+                    )
+                else:
+                    logger.warning(f"[REALTIME] Final batch {batch_id} failed: {proc_result.error}")
+            except (RuntimeError, OSError, ValueError) as e:
+                logger.warning(f"[REALTIME] Final batch processing error: {e}")
+
+        logger.debug(f"[REALTIME] Scheduling async task for final batch {batch_id}")
+        asyncio.create_task(_process_final_batch())
+
+    if stats is not None:
+        result["activity_stats"] = stats
+
+        # Generate session summary and title in background
+        if state.activity_processor:
+            processor = state.activity_processor
+            sid = session_id
+
+            async def _generate_session_summary_and_title() -> None:
+                try:
+                    loop = asyncio.get_event_loop()
+                    summary, title = await loop.run_in_executor(
+                        None,
+                        processor.process_session_summary_with_title,
+                        sid,
+                        True,  # regenerate_title from summary for better accuracy
+                    )
+                    if summary:
+                        logger.info(f"Session summary generated: {summary[:80]}...")
+                    if title:
+                        logger.info(f"Session title generated: {title}")
+                except (RuntimeError, OSError, ValueError) as e:
+                    logger.warning(f"Session summary/title generation error: {e}")
+
+            asyncio.create_task(_generate_session_summary_and_title())
+
+    # Session stats come from activity_stats (SQLite) - no in-memory tracking
+    result["duration_minutes"] = round(duration_minutes, 1)
+
+    return result
+
+
+def _end_session(
+    store: ActivityStore, session_id: str, agent: str
+) -> tuple[float, int | None, dict[str, Any] | None]:
+    """End the final prompt batch and the session (blocking).
+
+    Returns:
+        Tuple of (session duration in minutes, ID of the prompt batch that was
+        ended, session stats). The batch ID is None if there was no batch to
+        end; stats are None if ending the session failed.
+    """
     # Calculate session duration from SQLite session record
     duration_minutes = 0.0
-    db_session = state.activity_store.get_session(session_id)
+    db_session = store.get_session(session_id)
     if db_session and db_session.started_at:
         duration_minutes = (datetime.now() - db_session.started_at).total_seconds() / 60
 
     # End any remaining prompt batch (query SQLite for active batch)
-    active_batch = state.activity_store.get_active_prompt_batch(session_id)
+    ended_batch_id = None
+    active_batch = store.get_active_prompt_batch(session_id)
     prompt_batch_id = active_batch.id if active_batch else None
     if prompt_batch_id:
         try:
-            state.activity_store.end_prompt_batch(prompt_batch_id)
+            store.end_prompt_batch(prompt_batch_id)
+            ended_batch_id = prompt_batch_id
             logger.debug(f"Ended final prompt batch: {prompt_batch_id}")
-
-            # Queue for processing
-            if state.activity_processor:
-                from open_agent_kit.features.codebase_intelligence.activity import (
-                    process_prompt_batch_async,
-                )
-
-                # Capture processor reference to avoid type narrowing issues
-                processor = state.activity_processor
-                batch_id = prompt_batch_id
-
-                async def _process_final_batch() -> None:
-                    logger.debug(f"[REALTIME] Starting async processing for final batch {batch_id}")
-                    try:
-                        proc_result = await process_prompt_batch_async(processor, batch_id)
-                        if proc_result.success:
-                            logger.info(
-                                f"[REALTIME] Final prompt batch {batch_id} processed: "
-                                f"{proc_result.observations_extracted} observations"
-                            )
-                        else:
-                            logger.warning(
-                                f"[REALTIME] Final batch {batch_id} failed: {proc_result.error}"
-                            )
-                    except (RuntimeError, OSError, ValueError) as e:
-                        logger.warning(f"[REALTIME] Final batch processing error: {e}")
-
-                logger.debug(f"[REALTIME] Scheduling async task for final batch {batch_id}")
-                asyncio.create_task(_process_final_batch())
-
         except HOOK_STORE_EXCEPTIONS as e:
             logger.debug(f"Failed to end final prompt batch: {e}")
 
     # Ensure transcript_path is stored (fallback if Stop hook didn't provide it)
-    if state.activity_store and session_id:
-        try:
-            db_session = state.activity_store.get_session(session_id)
-            if db_session and not getattr(db_session, "transcript_path", None):
-                from open_agent_kit.features.codebase_intelligence.transcript_resolver import (
-                    resolve_transcript_path,
-                )
-
-                resolved = resolve_transcript_path(session_id, agent, db_session.project_root)
-                if resolved and resolved.exists():
-                    state.activity_store.update_session_transcript_path(session_id, str(resolved))
-                    logger.debug(f"[SESSION-END] Resolved transcript_path fallback: {resolved}")
-        except HOOK_STORE_EXCEPTIONS as e:
-            logger.debug(f"[SESSION-END] Transcript resolution fallback failed: {e}")
-
-    # End session in activity store
-    if state.activity_store and session_id:
-        try:
-            state.activity_store.end_session(session_id)
-            logger.debug(f"Ended activity session: {session_id}")
-
-            # Get session stats from activity store
-            stats = state.activity_store.get_session_stats(session_id)
-            result["activity_stats"] = stats
-            logger.info(
-                f"Session {session_id} ended with {stats.get('files_touched', 0)} files, "
-                f"{sum(stats.get('tool_counts', {}).values())} tool calls"
+    try:
+        db_session = store.get_session(session_id)
+        if db_session and not getattr(db_session, "transcript_path", None):
+            from open_agent_kit.features.codebase_intelligence.transcript_resolver import (
+                resolve_transcript_path,
             )
 
-            # Generate session summary and title in background
-            if state.activity_processor:
-                processor = state.activity_processor
-                sid = session_id
-
-                async def _generate_session_summary_and_title() -> None:
-                    try:
-                        loop = asyncio.get_event_loop()
-                        summary, title = await loop.run_in_executor(
-                            None,
-                            processor.process_session_summary_with_title,
-                            sid,
-                            True,  # regenerate_title from summary for better accuracy
-                        )
-                        if summary:
-                            logger.info(f"Session summary generated: {summary[:80]}...")
-                        if title:
-                            logger.info(f"Session title generated: {title}")
-                    except (RuntimeError, OSError, ValueError) as e:
-                        logger.warning(f"Session summary/title generation error: {e}")
-
-                asyncio.create_task(_generate_session_summary_and_title())
+            resolved = resolve_transcript_path(session_id, agent, db_session.project_root)
+            if resolved and resolved.exists():
+                store.update_session_transcript_path(session_id, str(resolved))
+                logger.debug(f"[SESSION-END] Resolved transcript_path fallback: {resolved}")
+    except HOOK_STORE_EXCEPTIONS as e:
+        logger.debug(f"[SESSION-END] Transcript resolution fallback failed: {e}")
 
-        except HOOK_STORE_EXCEPTIONS as e:
-            logger.warning(f"Failed to end activity session: {e}")
-
-    # Session stats come from activity_stats (SQLite) - no in-memory tracking
-    result["duration_minutes"] = round(duration_minutes, 1)
+    # End session in activity store
+    stats = None
+    try:
+        store.end_session(session_id)
+        logger.debug(f"Ended activity session: {session_id}")
+
+        # Get session stats from activity store
+        stats = store.get_session_stats(session_id)
+        logger.info(
+            f"Session {session_id} ended with {stats.get('files_touched', 0)} files, "
+            f"{sum(stats.get('tool_counts', {}).values())} tool calls"
+        )
+    except HOOK_STORE_EXCEPTIONS as e:
+        logger.warning(f"Failed to end activity session: {e}")
 
-    return result
+    return duration_minutes, ended_batch_id, stats
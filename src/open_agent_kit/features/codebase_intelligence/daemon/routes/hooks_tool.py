@@ -9,9 +9,10 @@ from __future__ import annotations
 import base64
 import json
 import logging
+import time
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, Request
 
@@ -49,9 +50,19 @@ from open_agent_kit.features.codebase_intelligence.daemon.routes.injection impor
     format_hook_output,
 )
 from open_agent_kit.features.codebase_intelligence.daemon.state import get_state
+from open_agent_kit.features.codebase_intelligence.daemon.workers import get_hook_pool
 from open_agent_kit.features.codebase_intelligence.plan_detector import detect_plan
 from open_agent_kit.features.codebase_intelligence.retrieval.engine import RetrievalEngine
 
+if TYPE_CHECKING:
+    from open_agent_kit.features.codebase_intelligence.activity.store import ActivityStore
+    from open_agent_kit.features.codebase_intelligence.activity.store.models import PromptBatch
+    from open_agent_kit.features.codebase_intelligence.daemon.state import DaemonState
+    from open_agent_kit.features.codebase_intelligence.governance.audit import (
+        GovernanceAuditWriter,
+    )
+    from open_agent_kit.features.codebase_intelligence.governance.engine import GovernanceDecision
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["hooks"])
@@ -125,27 +136,20 @@ async def hook_pre_tool_use(request: Request) -> dict:
         governance_decision = engine.evaluate(tool_name, tool_input)
         eval_ms = int((_time.monotonic() - t0) * 1000)
 
-        # Record audit event (fire-and-forget)
-        if state.activity_store:
-            try:
-                from open_agent_kit.features.codebase_intelligence.governance.audit import (
-                    GovernanceAuditWriter,
-                )
-
-                writer = GovernanceAuditWriter(state.activity_store)
-                input_summary = json.dumps(tool_input, default=str)[:500]
-                writer.record(
-                    session_id=session_id,
-                    agent=agent,
-                    tool_name=tool_name,
-                    tool_use_id=tool_use_id,
-                    decision=governance_decision,
-                    enforcement_mode=engine._config.enforcement_mode,
-                    evaluation_ms=eval_ms,
-                    tool_input_summary=input_summary,
-                )
-            except HOOK_STORE_EXCEPTIONS as e:
-                logger.debug("Failed to record governance audit: %s", e)
+        # Record audit event (buffered; written in batches by the audit writer)
+        audit_writer = state.governance_audit_writer
+        if audit_writer is not None:
+            _record_governance_audit(
+                audit_writer,
+                session_id=session_id,
+                agent=agent,
+                tool_name=tool_name,
+                tool_use_id=tool_use_id,
+                decision=governance_decision,
+                enforcement_mode=engine._config.enforcement_mode,
+                evaluation_ms=eval_ms,
+                tool_input=tool_input,
+            )
 
         # Merge deny fields into hook_output (governance module owns the format)
         from open_agent_kit.features.codebase_intelligence.governance.output import (
@@ -162,6 +166,35 @@ async def hook_pre_tool_use(request: Request) -> dict:
     return result
 
 
+def _record_governance_audit(
+    writer: GovernanceAuditWriter,
+    *,
+    session_id: str,
+    agent: str,
+    tool_name: str,
+    tool_use_id: str,
+    decision: GovernanceDecision,
+    enforcement_mode: str,
+    evaluation_ms: int,
+    tool_input: Any,
+) -> None:
+    """Buffer a governance audit event (failures are logged)."""
+    try:
+        input_summary = json.dumps(tool_input, default=str)[:500]
+        writer.record(
+            session_id=session_id,
+            agent=agent,
+            tool_name=tool_name,
+            tool_use_id=tool_use_id,
+            decision=decision,
+            enforcement_mode=enforcement_mode,
+            evaluation_ms=evaluation_ms,
+            tool_input_summary=input_summary,
+        )
+    except HOOK_STORE_EXCEPTIONS as e:
+        logger.debug("Failed to record governance audit: %s", e)
+
+
 @router.post(f"{OAK_CI_PREFIX}/post-tool-use")
 async def hook_post_tool_use(request: Request) -> dict:
     """Handle post-tool-use - auto-capture observations from tool output."""
@@ -264,420 +297,491 @@ async def hook_post_tool_use(request: Request) -> dict:
             preview = tool_output[:300].replace("\n", "\\n")
             logger.debug(f"  Tool output preview: {preview}...")
 
+    # SQLite writes and the memory search (embedding server round trip) block,
+    # so they run on the hook worker pool instead of the event loop.
+    pool = get_hook_pool()
+    cached_active_batch = None
+    if state.activity_store and session_id:
+        cached_active_batch = await pool.run(
+            "post-tool-use.store",
+            _store_tool_activity,
+            state,
+            state.activity_store,
+            session_id,
+            tool_name,
+            tool_input,
+            tool_output,
+        )
+
+    # NOTE: Observation extraction is now handled by the background ActivityProcessor
+    # which uses LLM-based classification via schema.yaml instead of pattern matching.
+    # Activities are stored above; the processor extracts observations when batches complete.
+
+    # Inject relevant context for file operations
+    injected_context = None
+    if tool_name in ("Read", "Edit", "Write") and state.retrieval_engine:
+        file_path = tool_input.get("file_path", "")
+        if file_path and state.activity_store:
+            injected_context = await pool.run(
+                "post-tool-use.search",
+                _search_file_memories,
+                state,
+                state.retrieval_engine,
+                session_id,
+                tool_name,
+                file_path,
+                tool_output,
+                cached_active_batch,
+            )
+
+    result: dict[str, Any] = {
+        "status": "ok",
+        # Observations are extracted by background ActivityProcessor, not in this hook
+        "observations_captured": 0,
+    }
+    if injected_context:
+        result["injected_context"] = injected_context
+
+    hook_event_name = body.get("hook_event_name", "PostToolUse")
+    result["hook_output"] = format_hook_output(result, agent, hook_event_name)
+    return result
+
+
+def _store_tool_activity(
+    state: DaemonState,
+    store: ActivityStore,
+    session_id: str,
+    tool_name: str,
+    tool_input: Any,
+    tool_output: str,
+) -> PromptBatch | None:
+    """Store a post-tool-use activity and tag plan batches (blocking).
+
+    Returns:
+        The session's active prompt batch, reused for context injection.
+    """
     # Cache active batch once -- reused for both activity storage and context injection.
     # The batch won't change during a single request, so this eliminates a redundant
     # SQLite query on the hottest code path (W4.2).
-    cached_active_batch = None
-    if state.activity_store and session_id:
-        cached_active_batch = state.activity_store.get_active_prompt_batch(session_id)
+    cached_active_batch = store.get_active_prompt_batch(session_id)
 
     # Store activity in SQLite for background processing (liberal capture)
-    if state.activity_store and session_id:
-        try:
-            from open_agent_kit.features.codebase_intelligence.activity import Activity
-
-            # Build a sanitized version of tool_input (remove large content)
-            sanitized_input = None
-            if isinstance(tool_input, dict):
-                sanitized_input = {}
-                for k, v in tool_input.items():
-                    if k in ("content", "new_source", "old_string", "new_string"):
-                        # For file content, just note the length
-                        sanitized_input[k] = f"<{len(str(v))} chars>"
-                    elif isinstance(v, str) and len(v) > 500:
-                        sanitized_input[k] = v[:500] + "..."
-                    else:
-                        sanitized_input[k] = v
-
-            # Build output summary (first 500 chars, excluding large content)
-            output_summary = ""
-            if tool_output:
-                # For file reads, just note the length
-                if tool_name == "Read" and len(tool_output) > 200:
-                    output_summary = f"Read {len(tool_output)} chars"
+    try:
+        from open_agent_kit.features.codebase_intelligence.activity import Activity
+
+        # Build a sanitized version of tool_input (remove large content)
+        sanitized_input = None
+        if isinstance(tool_input, dict):
+            sanitized_input = {}
+            for k, v in tool_input.items():
+                if k in ("content", "new_source", "old_string", "new_string"):
+                    # For file content, just note the length
+                    sanitized_input[k] = f"<{len(str(v))} chars>"
+                elif isinstance(v, str) and len(v) > 500:
+                    sanitized_input[k] = v[:500] + "..."
                 else:
-                    output_summary = tool_output[:500]
-
-            # Detect errors
-            is_error = False
-            error_msg = None
-            output_data = parse_tool_output(tool_output)
-            if output_data:
-                if output_data.get("stderr"):
-                    is_error = True
-                    error_msg = output_data.get("stderr", "")[:500]
-
-            # Use cached batch lookup (already queried above)
-            prompt_batch_id = cached_active_batch.id if cached_active_batch else None
-            if prompt_batch_id is None:
-                # No active batch - check if there's a recently completed batch we should use
-                # This handles cases where stuck batch recovery completed a batch that's
-                # still receiving tool activity
-                # Use constants for universal behavior (same across all agents)
-                try:
-                    recent_batches = state.activity_store.get_session_prompt_batches(
-                        session_id, limit=1
-                    )
-                    if recent_batches and BATCH_REACTIVATION_TIMEOUT_SECONDS > 0:
-                        last_batch = recent_batches[0]
-                        # If the last batch was completed very recently,
-                        # reactivate it instead of creating a synthetic batch.
-                        # This handles stuck batch recovery marking batches complete
-                        # while the agent is still actively working.
-                        if last_batch.ended_at and last_batch.id is not None:
-                            try:
-                                # ended_at is already a datetime from PromptBatch.from_row
-                                ended = last_batch.ended_at
-                                if ended.tzinfo is None:
-                                    ended = ended.replace(tzinfo=UTC)
-                                now = datetime.now(UTC)
-                                seconds_since_end = (now - ended).total_seconds()
-
-                                if seconds_since_end < BATCH_REACTIVATION_TIMEOUT_SECONDS:
-                                    # Reactivate the batch - it was prematurely completed
-                                    state.activity_store.reactivate_prompt_batch(last_batch.id)
-                                    prompt_batch_id = last_batch.id
-                                    logger.info(
-                                        f"Reactivated batch {last_batch.id} for session "
-                                        f"{session_id} (ended {seconds_since_end:.1f}s ago, "
-                                        f"still receiving tool activity)"
-                                    )
-                                    hooks_logger.info(
-                                        f"[BATCH-REACTIVATE] batch={last_batch.id} "
-                                        f"session={session_id} seconds_since_end={seconds_since_end:.1f}"
-                                    )
-                            except (ValueError, TypeError) as e:
-                                logger.debug(
-                                    f"Failed to parse ended_at for batch reactivation: {e}"
-                                )
+                    sanitized_input[k] = v
 
-                    # If we still don't have a batch, create a synthetic one
-                    # This is for edge cases where no recent batch exists
-                    if prompt_batch_id is None:
-                        session = state.activity_store.get_session(session_id)
-                        if session:
-                            batch = state.activity_store.create_prompt_batch(
-                                session_id=session_id,
-                                user_prompt=BATCH_LABEL_SESSION_CONTINUATION,
-                                source_type="system",
-                            )
-                            if batch:
-                                prompt_batch_id = batch.id
+        # Build output summary (first 500 chars, excluding large content)
+        output_summary = ""
+        if tool_output:
+            # For file reads, just note the length
+            if tool_name == "Read" and len(tool_output) > 200:
+                output_summary = f"Read {len(tool_output)} chars"
+            else:
+                output_summary = tool_output[:500]
+
+        # Detect errors
+        is_error = False
+        error_msg = None
+        output_data = parse_tool_output(tool_output)
+        if output_data:
+            if output_data.get("stderr"):
+                is_error = True
+                error_msg = output_data.get("stderr", "")[:500]
+
+        # Use cached batch lookup (already queried above)
+        prompt_batch_id = cached_active_batch.id if cached_active_batch else None
+        if prompt_batch_id is None:
+            # No active batch - check if there's a recently completed batch we should use
+            # This handles cases where stuck batch recovery completed a batch that's
+            # still receiving tool activity
+            # Use constants for universal behavior (same across all agents)
+            try:
+                recent_batches = store.get_session_prompt_batches(session_id, limit=1)
+                if recent_batches and BATCH_REACTIVATION_TIMEOUT_SECONDS > 0:
+                    last_batch = recent_batches[0]
+                    # If the last batch was completed very recently,
+                    # reactivate it instead of creating a synthetic batch.
+                    # This handles stuck batch recovery marking batches complete
+                    # while the agent is still actively working.
+                    if last_batch.ended_at and last_batch.id is not None:
+                        try:
+                            # ended_at is already a datetime from PromptBatch.from_row
+                            ended = last_batch.ended_at
+                            if ended.tzinfo is None:
+                                ended = ended.replace(tzinfo=UTC)
+                            now = datetime.now(UTC)
+                            seconds_since_end = (now - ended).total_seconds()
+
+                            if seconds_since_end < BATCH_REACTIVATION_TIMEOUT_SECONDS:
+                                # Reactivate the batch - it was prematurely completed
+                                store.reactivate_prompt_batch(last_batch.id)
+                                prompt_batch_id = last_batch.id
                                 logger.info(
-                                    f"Created synthetic batch {batch.id} for session "
-                                    f"{session_id} (no active batch found during tool use)"
+                                    f"Reactivated batch {last_batch.id} for session "
+                                    f"{session_id} (ended {seconds_since_end:.1f}s ago, "
+                                    f"still receiving tool activity)"
                                 )
                                 hooks_logger.info(
-                                    f"[BATCH-CREATE-SYNTHETIC] batch={batch.id} "
-                                    f"session={session_id} trigger=post-tool-use"
+                                    f"[BATCH-REACTIVATE] batch={last_batch.id} "
+                                    f"session={session_id} seconds_since_end={seconds_since_end:.1f}"
                                 )
-                except HOOK_STORE_EXCEPTIONS as e:
-                    logger.warning(f"Failed to handle missing batch: {e}")
-
-            activity = Activity(
-                session_id=session_id,
-                prompt_batch_id=prompt_batch_id,
-                tool_name=tool_name,
-                tool_input=sanitized_input,
-                tool_output_summary=output_summary,
-                file_path=tool_input.get("file_path") if isinstance(tool_input, dict) else None,
-                success=not is_error,
-                error_message=error_msg,
-            )
-            # Use buffered insert for better performance (auto-flushes at batch size)
-            state.activity_store.add_activity_buffered(activity)
-            state.record_hook_activity()
-            logger.debug(f"Stored activity: {tool_name} (batch={prompt_batch_id})")
-
-            # Lifecycle logging to dedicated hooks.log
-            hooks_logger.info(f"[TOOL-USE] {tool_name} session={session_id} success={not is_error}")
-
-            # Detect plan mode: if Write to a plan directory, mark batch as plan
-            # and capture plan content for self-contained CI storage
-            if tool_name == "Write" and prompt_batch_id:
-                file_path = tool_input.get("file_path", "") if isinstance(tool_input, dict) else ""
-                if file_path:
-                    detection = detect_plan(file_path)
-                    if detection.is_plan:
-                        # Read plan content from the file that was just written.
-                        # This is more reliable than tool_input because:
-                        # 1. tool_input in stored activities is sanitized (<N chars>)
-                        # 2. The file is the source of truth
-                        plan_content = ""
-                        plan_path = Path(file_path)
-                        if not plan_path.is_absolute() and state.project_root:
-                            plan_path = state.project_root / plan_path
-
-                        try:
-                            if plan_path.exists():
-                                plan_content = plan_path.read_text(encoding="utf-8")
-                            else:
-                                # Fallback to tool_input if file doesn't exist yet
-                                plan_content = (
-                                    tool_input.get("content", "")
-                                    if isinstance(tool_input, dict)
-                                    else ""
-                                )
-                        except (OSError, ValueError) as e:
-                            logger.warning(f"Failed to read plan file {plan_path}: {e}")
-                            # Fallback to tool_input
+                        except (ValueError, TypeError) as e:
+                            logger.debug(f"Failed to parse ended_at for batch reactivation: {e}")
+
+                # If we still don't have a batch, create a synthetic one
+                # This is for edge cases where no recent batch exists
+                if prompt_batch_id is None:
+                    session = store.get_session(session_id)
+                    if session:
+                        batch = store.create_prompt_batch(
+                            session_id=session_id,
+                            user_prompt=BATCH_LABEL_SESSION_CONTINUATION,
+                            source_type="system",
+                        )
+                        if batch:
+                            prompt_batch_id = batch.id
+                            logger.info(
+                                f"Created synthetic batch {batch.id} for session "
+                                f"{session_id} (no active batch found during tool use)"
+                            )
+                            hooks_logger.info(
+                                f"[BATCH-CREATE-SYNTHETIC] batch={batch.id} "
+                                f"session={session_id} trigger=post-tool-use"
+                            )
+            except HOOK_STORE_EXCEPTIONS as e:
+                logger.warning(f"Failed to handle missing batch: {e}")
+
+        activity = Activity(
+            session_id=session_id,
+            prompt_batch_id=prompt_batch_id,
+            tool_name=tool_name,
+            tool_input=sanitized_input,
+            tool_output_summary=output_summary,
+            file_path=tool_input.get("file_path") if isinstance(tool_input, dict) else None,
+            success=not is_error,
+            error_message=error_msg,
+        )
+        # Use buffered insert for better performance (auto-flushes at batch size)
+        store.add_activity_buffered(activity)
+        state.record_hook_activity()
+        logger.debug(f"Stored activity: {tool_name} (batch={prompt_batch_id})")
+
+        # Lifecycle logging to dedicated hooks.log
+        hooks_logger.info(f"[TOOL-USE] {tool_name} session={session_id} success={not is_error}")
+
+        # Detect plan mode: if Write to a plan directory, mark batch as plan
+        # and capture plan content for self-contained CI storage
+        if tool_name == "Write" and prompt_batch_id:
+            file_path = tool_input.get("file_path", "") if isinstance(tool_input, dict) else ""
+            if file_path:
+                detection = detect_plan(file_path)
+                if detection.is_plan:
+                    # Read plan content from the file that was just written.
+                    # This is more reliable than tool_input because:
+                    # 1. tool_input in stored activities is sanitized (<N chars>)
+                    # 2. The file is the source of truth
+                    plan_content = ""
+                    plan_path = Path(file_path)
+                    if not plan_path.is_absolute() and state.project_root:
+                        plan_path = state.project_root / plan_path
+
+                    try:
+                        if plan_path.exists():
+                            plan_content = plan_path.read_text(encoding="utf-8")
+                        else:
+                            # Fallback to tool_input if file doesn't exist yet
                             plan_content = (
                                 tool_input.get("content", "")
                                 if isinstance(tool_input, dict)
                                 else ""
                             )
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"Failed to read plan file {plan_path}: {e}")
+                        # Fallback to tool_input
+                        plan_content = (
+                            tool_input.get("content", "") if isinstance(tool_input, dict) else ""
+                        )
+
+                    # Consolidate plan iterations: if this session already has
+                    # a plan batch for the same file, update that batch's content
+                    # instead of tagging a new one. This prevents duplicate plan
+                    # entries when Claude iterates on a plan (same file, multiple
+                    # writes). The activity/prompt batches for iteration turns
+                    # still exist — they just aren't tagged as plans.
+                    existing_plan = (
+                        store.get_session_plan_batch(session_id, plan_file_path=file_path)
+                        if session_id
+                        else None
+                    )
 
-                        # Consolidate plan iterations: if this session already has
-                        # a plan batch for the same file, update that batch's content
-                        # instead of tagging a new one. This prevents duplicate plan
-                        # entries when Claude iterates on a plan (same file, multiple
-                        # writes). The activity/prompt batches for iteration turns
-                        # still exist — they just aren't tagged as plans.
+                    if existing_plan and existing_plan.id:
+                        # Update existing plan batch with latest content
+                        target_batch_id = existing_plan.id
+                        store.update_prompt_batch_source_type(
+                            target_batch_id,
+                            PROMPT_SOURCE_PLAN,
+                            plan_file_path=file_path,
+                            plan_content=plan_content,
+                        )
+                        # Re-embed with updated content
+                        store.mark_plan_unembedded(target_batch_id)
+                        location = "global" if detection.is_global else "project"
+                        content_len = len(plan_content) if plan_content else 0
+                        logger.info(
+                            f"Updated existing plan batch {target_batch_id} "
+                            f"(iteration of {file_path}, {content_len} chars)"
+                        )
+                    else:
+                        # First plan write in this session for this file
+                        target_batch_id = prompt_batch_id
+                        store.update_prompt_batch_source_type(
+                            target_batch_id,
+                            PROMPT_SOURCE_PLAN,
+                            plan_file_path=file_path,
+                            plan_content=plan_content,
+                        )
+                        location = "global" if detection.is_global else "project"
+                        content_len = len(plan_content) if plan_content else 0
+                        logger.info(
+                            f"Detected {location} plan mode for {detection.agent_type}, "
+                            f"batch {target_batch_id} marked as plan with file {file_path} "
+                            f"({content_len} chars stored)"
+                        )
+
+        # Detect ExitPlanMode: re-read plan file and update stored content
+        # Plans iterate during development - the final approved version (when user
+        # exits plan mode) may differ from the initial write. Re-reading ensures
+        # we capture the final content.
+        if is_exit_plan_tool(tool_name) and session_id:
+            try:
+                plan_batch = store.get_session_plan_batch(session_id)
+
+                if plan_batch and plan_batch.plan_file_path and plan_batch.id:
+                    plan_path = Path(plan_batch.plan_file_path)
+                    if not plan_path.is_absolute() and state.project_root:
+                        plan_path = state.project_root / plan_path
+
+                    if plan_path.exists():
+                        final_content = plan_path.read_text(encoding="utf-8")
+                        store.update_prompt_batch_source_type(
+                            plan_batch.id,
+                            PROMPT_SOURCE_PLAN,
+                            plan_file_path=plan_batch.plan_file_path,
+                            plan_content=final_content,
+                        )
+                        store.mark_plan_unembedded(plan_batch.id)
+                        hooks_logger.info(
+                            f"[EXIT-PLAN-MODE] Updated plan {plan_batch.id} "
+                            f"({len(final_content)} chars)"
+                        )
+                        logger.info(
+                            f"ExitPlanMode detected: re-read plan {plan_batch.plan_file_path} "
+                            f"and updated batch {plan_batch.id} ({len(final_content)} chars)"
+                        )
+                    else:
+                        logger.warning(
+                            f"[EXIT-PLAN-MODE] Plan file not found: {plan_batch.plan_file_path}"
+                        )
+                else:
+                    logger.debug(
+                        "[EXIT-PLAN-MODE] No plan batch in session "
+                        "(plan may have been cancelled or not created)"
+                    )
+            except HOOK_STORE_EXCEPTIONS as e:
+                logger.warning(f"[EXIT-PLAN-MODE] Failed to update plan content: {e}")
+
+        # Detect plan file reads/edits — agents like Cursor create plan files
+        # internally (IDE) and use Read/Edit to refine them. This mirrors the
+        # Write handler's consolidation pattern: tag the batch with plan metadata
+        # and read content from disk (source of truth).
+        if tool_name in ("Read", "Edit") and prompt_batch_id:
+            file_path = tool_input.get("file_path", "") if isinstance(tool_input, dict) else ""
+            if file_path:
+                detection = detect_plan(file_path)
+                if detection.is_plan:
+                    # Read plan content from disk (source of truth)
+                    plan_content = ""
+                    plan_path = Path(file_path)
+                    if not plan_path.is_absolute() and state.project_root:
+                        plan_path = state.project_root / plan_path
+
+                    try:
+                        if plan_path.exists():
+                            plan_content = plan_path.read_text(encoding="utf-8")
+                        else:
+                            logger.debug(f"Plan file not on disk for {tool_name}: {file_path}")
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"Failed to read plan file {plan_path}: {e}")
+
+                    # Only tag the batch if we got content from disk
+                    if plan_content:
+                        # Consolidate: if session already has a plan batch for
+                        # this file, update that batch instead of tagging a new one.
                         existing_plan = (
-                            state.activity_store.get_session_plan_batch(
-                                session_id, plan_file_path=file_path
-                            )
+                            store.get_session_plan_batch(session_id, plan_file_path=file_path)
                             if session_id
                             else None
                         )
 
                         if existing_plan and existing_plan.id:
-                            # Update existing plan batch with latest content
                             target_batch_id = existing_plan.id
-                            state.activity_store.update_prompt_batch_source_type(
+                            store.update_prompt_batch_source_type(
                                 target_batch_id,
                                 PROMPT_SOURCE_PLAN,
                                 plan_file_path=file_path,
                                 plan_content=plan_content,
                             )
-                            # Re-embed with updated content
-                            state.activity_store.mark_plan_unembedded(target_batch_id)
-                            location = "global" if detection.is_global else "project"
-                            content_len = len(plan_content) if plan_content else 0
+                            store.mark_plan_unembedded(target_batch_id)
                             logger.info(
                                 f"Updated existing plan batch {target_batch_id} "
-                                f"(iteration of {file_path}, {content_len} chars)"
+                                f"via {tool_name} of {file_path} "
+                                f"({len(plan_content)} chars)"
                             )
                         else:
-                            # First plan write in this session for this file
                             target_batch_id = prompt_batch_id
-                            state.activity_store.update_prompt_batch_source_type(
+                            store.update_prompt_batch_source_type(
                                 target_batch_id,
                                 PROMPT_SOURCE_PLAN,
                                 plan_file_path=file_path,
                                 plan_content=plan_content,
                             )
                             location = "global" if detection.is_global else "project"
-                            content_len = len(plan_content) if plan_content else 0
                             logger.info(
-                                f"Detected {location} plan mode for {detection.agent_type}, "
-                                f"batch {target_batch_id} marked as plan with file {file_path} "
-                                f"({content_len} chars stored)"
+                                f"Detected {location} plan via {tool_name} for "
+                                f"{detection.agent_type}, batch {target_batch_id} "
+                                f"marked as plan with file {file_path} "
+                                f"({len(plan_content)} chars stored)"
                             )
 
-            # Detect ExitPlanMode: re-read plan file and update stored content
-            # Plans iterate during development - the final approved version (when user
-            # exits plan mode) may differ from the initial write. Re-reading ensures
-            # we capture the final content.
-            if is_exit_plan_tool(tool_name) and session_id:
-                try:
-                    plan_batch = state.activity_store.get_session_plan_batch(session_id)
-
-                    if plan_batch and plan_batch.plan_file_path and plan_batch.id:
-                        plan_path = Path(plan_batch.plan_file_path)
-                        if not plan_path.is_absolute() and state.project_root:
-                            plan_path = state.project_root / plan_path
-
-                        if plan_path.exists():
-                            final_content = plan_path.read_text(encoding="utf-8")
-                            state.activity_store.update_prompt_batch_source_type(
-                                plan_batch.id,
-                                PROMPT_SOURCE_PLAN,
-                                plan_file_path=plan_batch.plan_file_path,
-                                plan_content=final_content,
-                            )
-                            state.activity_store.mark_plan_unembedded(plan_batch.id)
-                            hooks_logger.info(
-                                f"[EXIT-PLAN-MODE] Updated plan {plan_batch.id} "
-                                f"({len(final_content)} chars)"
-                            )
-                            logger.info(
-                                f"ExitPlanMode detected: re-read plan {plan_batch.plan_file_path} "
-                                f"and updated batch {plan_batch.id} ({len(final_content)} chars)"
-                            )
-                        else:
-                            logger.warning(
-                                f"[EXIT-PLAN-MODE] Plan file not found: {plan_batch.plan_file_path}"
-                            )
-                    else:
-                        logger.debug(
-                            "[EXIT-PLAN-MODE] No plan batch in session "
-                            "(plan may have been cancelled or not created)"
-                        )
-                except HOOK_STORE_EXCEPTIONS as e:
-                    logger.warning(f"[EXIT-PLAN-MODE] Failed to update plan content: {e}")
-
-            # Detect plan file reads/edits — agents like Cursor create plan files
-            # internally (IDE) and use Read/Edit to refine them. This mirrors the
-            # Write handler's consolidation pattern: tag the batch with plan metadata
-            # and read content from disk (source of truth).
-            if tool_name in ("Read", "Edit") and prompt_batch_id:
-                file_path = tool_input.get("file_path", "") if isinstance(tool_input, dict) else ""
-                if file_path:
-                    detection = detect_plan(file_path)
-                    if detection.is_plan:
-                        # Read plan content from disk (source of truth)
-                        plan_content = ""
-                        plan_path = Path(file_path)
-                        if not plan_path.is_absolute() and state.project_root:
-                            plan_path = state.project_root / plan_path
+                    hooks_logger.info(
+                        f"[PLAN-{tool_name.upper()}] {detection.agent_type} plan "
+                        f"{'captured' if plan_content else 'detected'}: {file_path} "
+                        f"session={session_id}"
+                    )
 
-                        try:
-                            if plan_path.exists():
-                                plan_content = plan_path.read_text(encoding="utf-8")
-                            else:
-                                logger.debug(f"Plan file not on disk for {tool_name}: {file_path}")
-                        except (OSError, ValueError) as e:
-                            logger.warning(f"Failed to read plan file {plan_path}: {e}")
-
-                        # Only tag the batch if we got content from disk
-                        if plan_content:
-                            # Consolidate: if session already has a plan batch for
-                            # this file, update that batch instead of tagging a new one.
-                            existing_plan = (
-                                state.activity_store.get_session_plan_batch(
-                                    session_id, plan_file_path=file_path
-                                )
-                                if session_id
-                                else None
-                            )
+    except HOOK_STORE_EXCEPTIONS as e:
+        logger.debug(f"Failed to store activity: {e}")
 
-                            if existing_plan and existing_plan.id:
-                                target_batch_id = existing_plan.id
-                                state.activity_store.update_prompt_batch_source_type(
-                                    target_batch_id,
-                                    PROMPT_SOURCE_PLAN,
-                                    plan_file_path=file_path,
-                                    plan_content=plan_content,
-                                )
-                                state.activity_store.mark_plan_unembedded(target_batch_id)
-                                logger.info(
-                                    f"Updated existing plan batch {target_batch_id} "
-                                    f"via {tool_name} of {file_path} "
-                                    f"({len(plan_content)} chars)"
-                                )
-                            else:
-                                target_batch_id = prompt_batch_id
-                                state.activity_store.update_prompt_batch_source_type(
-                                    target_batch_id,
-                                    PROMPT_SOURCE_PLAN,
-                                    plan_file_path=file_path,
-                                    plan_content=plan_content,
-                                )
-                                location = "global" if detection.is_global else "project"
-                                logger.info(
-                                    f"Detected {location} plan via {tool_name} for "
-                                    f"{detection.agent_type}, batch {target_batch_id} "
-                                    f"marked as plan with file {file_path} "
-                                    f"({len(plan_content)} chars stored)"
-                                )
+    return cached_active_batch
 
-                        hooks_logger.info(
-                            f"[PLAN-{tool_name.upper()}] {detection.agent_type} plan "
-                            f"{'captured' if plan_content else 'detected'}: {file_path} "
-                            f"session={session_id}"
-                        )
 
-        except HOOK_STORE_EXCEPTIONS as e:
-            logger.debug(f"Failed to store activity: {e}")
+def _search_file_memories(
+    state: DaemonState,
+    engine: RetrievalEngine,
+    session_id: str,
+    tool_name: str,
+    file_path: str,
+    tool_output: str,
+    cached_active_batch: PromptBatch | None,
+) -> str | None:
+    """Search memories about a file for post-tool-use injection (blocking).
 
-    # NOTE: Observation extraction is now handled by the background ActivityProcessor
-    # which uses LLM-based classification via schema.yaml instead of pattern matching.
-    # Activities are stored above; the processor extracts observations when batches complete.
+    Results are cached per file until the memory collection changes, so
+    repeated touches of the same file skip the embedding and vector search.
 
-    # Inject relevant context for file operations
+    Returns:
+        Formatted context to inject, or None if nothing confident matched.
+    """
     injected_context = None
-    if tool_name in ("Read", "Edit", "Write") and state.retrieval_engine:
-        file_path = tool_input.get("file_path", "")
-        if file_path and state.activity_store:
-            try:
-                normalized_path = normalize_file_path(file_path, state.project_root)
-
-                # Get user prompt for richer context from cached active batch
-                user_prompt = None
-                if cached_active_batch:
-                    user_prompt = cached_active_batch.user_prompt
-
-                    # Build rich query (not just file path) for better semantic matching
-                    search_query = build_rich_search_query(
-                        normalized_path=normalized_path,
-                        tool_output=tool_output if tool_name != "Read" else None,
-                        user_prompt=user_prompt,
+    try:
+        normalized_path = normalize_file_path(file_path, state.project_root)
+
+        # Get user prompt for richer context from cached active batch
+        user_prompt = None
+        if cached_active_batch:
+            # Read the generation before searching: a memory written mid-search
+            # bumps it, so the entry stored below is already stale.
+            generation = engine.store.memory_generation
+            cached = state.file_context_cache.get(normalized_path, generation)
+            if cached is not None:
+                logger.debug(f"[SEARCH:file-context:cached] file={normalized_path}")
+                if cached.context:
+                    hooks_logger.info(
+                        "[CONTEXT-INJECT] file_memories=cached "
+                        f"file={normalized_path} session={session_id} hook=post-tool-use"
                     )
+                return cached.context
 
-                    # Debug logging for file context search (trace mode)
-                    logger.debug(
-                        f"[SEARCH:file-context] query={search_query[:150]} file={normalized_path}"
-                    )
+            search_start = time.perf_counter()
+            user_prompt = cached_active_batch.user_prompt
 
-                    # Search for memories about this file, filter by combined score
-                    # For file operations, include medium+ combined score
-                    search_res = state.retrieval_engine.search(
-                        query=search_query,
-                        search_type="memory",
-                        limit=8,  # Fetch more, filter by combined score
-                    )
-                    # Filter by combined score (confidence + importance)
-                    confident_memories = RetrievalEngine.filter_by_combined_score(
-                        search_res.memory, min_combined="medium"
-                    )
+            # Build rich query (not just file path) for better semantic matching
+            search_query = build_rich_search_query(
+                normalized_path=normalized_path,
+                tool_output=tool_output if tool_name != "Read" else None,
+                user_prompt=user_prompt,
+            )
+
+            # Debug logging for file context search (trace mode)
+            logger.debug(f"[SEARCH:file-context] query={search_query[:150]} file={normalized_path}")
+
+            # Search for memories about this file, filter by combined score
+            # For file operations, include medium+ combined score
+            search_res = engine.search(
+                query=search_query,
+                search_type="memory",
+                limit=8,  # Fetch more, filter by combined score
+            )
+            # Filter by combined score (confidence + importance)
+            confident_memories = RetrievalEngine.filter_by_combined_score(
+                search_res.memory, min_combined="medium"
+            )
+
+            # Debug logging for file context results (trace mode)
+            logger.debug(
+                f"[SEARCH:file-context:results] found={len(search_res.memory)} "
+                f"kept_combined={len(confident_memories)}"
+            )
+
+            if confident_memories:
+                mem_lines = []
+                for mem in confident_memories[:3]:  # Cap at 3
+                    mem_type = mem.get("memory_type", "note")
+                    obs = mem.get("observation", "")
+                    if mem_type == "gotcha":
+                        mem_lines.append(f"\u26a0\ufe0f GOTCHA: {obs}")
+                    else:
+                        mem_lines.append(f"[{mem_type}] {obs}")
 
-                    # Debug logging for file context results (trace mode)
+                if mem_lines:
+                    injected_context = f"**Memories about {normalized_path}:**\n" + "\n".join(
+                        mem_lines
+                    )
+                    num_file_memories = len(confident_memories[:3])
                     logger.debug(
-                        f"[SEARCH:file-context:results] found={len(search_res.memory)} "
-                        f"kept_combined={len(confident_memories)}"
+                        f"Injecting {num_file_memories} confident memories "
+                        f"for {normalized_path}"
                     )
+                    # Summary to hooks.log for easy visibility
+                    hooks_logger.info(
+                        f"[CONTEXT-INJECT] file_memories={num_file_memories} "
+                        f"file={normalized_path} session={session_id} hook=post-tool-use"
+                    )
+                    logger.debug(f"[INJECT:post-tool-use] Content:\n{injected_context}")
 
-                    if confident_memories:
-                        mem_lines = []
-                        for mem in confident_memories[:3]:  # Cap at 3
-                            mem_type = mem.get("memory_type", "note")
-                            obs = mem.get("observation", "")
-                            if mem_type == "gotcha":
-                                mem_lines.append(f"\u26a0\ufe0f GOTCHA: {obs}")
-                            else:
-                                mem_lines.append(f"[{mem_type}] {obs}")
-
-                        if mem_lines:
-                            injected_context = (
-                                f"**Memories about {normalized_path}:**\n" + "\n".join(mem_lines)
-                            )
-                            num_file_memories = len(confident_memories[:3])
-                            logger.debug(
-                                f"Injecting {num_file_memories} confident memories "
-                                f"for {normalized_path}"
-                            )
-                            # Summary to hooks.log for easy visibility
-                            hooks_logger.info(
-                                f"[CONTEXT-INJECT] file_memories={num_file_memories} "
-                                f"file={normalized_path} session={session_id} hook=post-tool-use"
-                            )
-                            logger.debug(f"[INJECT:post-tool-use] Content:\n{injected_context}")
-
-            except (OSError, ValueError, RuntimeError, AttributeError) as e:
-                logger.debug(f"Failed to search memories for file context: {e}")
+            state.file_context_cache.put(
+                normalized_path,
+                generation,
+                injected_context,
+                (time.perf_counter() - search_start) * 1000,
+            )
 
-    result: dict[str, Any] = {
-        "status": "ok",
-        # Observations are extracted by background ActivityProcessor, not in this hook
-        "observations_captured": 0,
-    }
-    if injected_context:
-        result["injected_context"] = injected_context
+    except (OSError, ValueError, RuntimeError, AttributeError) as e:
+        logger.debug(f"Failed to search memories for file context: {e}")
 
-    hook_event_name = body.get("hook_event_name", "PostToolUse")
-    result["hook_output"] = format_hook_output(result, agent, hook_event_name)
-    return result
+    return injected_context
 
 
 @router.post(f"{OAK_CI_PREFIX}/post-tool-use-failure")
@@ -738,29 +842,48 @@ async def hook_post_tool_use_failure(request: Request) -> dict:
 
     # Store activity in SQLite with success=False
     if state.activity_store and session_id:
-        try:
-            from open_agent_kit.features.codebase_intelligence.activity import Activity
+        await get_hook_pool().run(
+            "post-tool-use-failure.store",
+            _store_failed_tool_activity,
+            state,
+            state.activity_store,
+            session_id,
+            tool_name,
+            tool_input,
+            error_message,
+        )
 
-            # Get current prompt batch ID from SQLite
-            prompt_batch_id = get_active_batch_id(state.activity_store, session_id)
+    return {"status": "ok", "tool_name": tool_name, "recorded": True}
 
-            activity = Activity(
-                session_id=session_id,
-                prompt_batch_id=prompt_batch_id,
-                tool_name=tool_name,
-                tool_input=tool_input if isinstance(tool_input, dict) else None,
-                tool_output_summary=(
-                    error_message[:500] if error_message else "Tool execution failed"
-                ),
-                file_path=tool_input.get("file_path") if isinstance(tool_input, dict) else None,
-                success=False,
-                error_message=error_message[:500] if error_message else None,
-            )
-            state.activity_store.add_activity_buffered(activity)
-            state.record_hook_activity()
-            logger.debug(f"Stored failed activity: {tool_name} (batch={prompt_batch_id})")
 
-        except HOOK_STORE_EXCEPTIONS as e:
-            logger.debug(f"Failed to store failed activity: {e}")
+def _store_failed_tool_activity(
+    state: DaemonState,
+    store: ActivityStore,
+    session_id: str,
+    tool_name: str,
+    tool_input: Any,
+    error_message: str,
+) -> None:
+    """Store a failed tool activity (blocking, failures are logged)."""
+    try:
+        from open_agent_kit.features.codebase_intelligence.activity import Activity
+
+        # Get current prompt batch ID from SQLite
+        prompt_batch_id = get_active_batch_id(store, session_id)
+
+        activity = Activity(
+            session_id=session_id,
+            prompt_batch_id=prompt_batch_id,
+            tool_name=tool_name,
+            tool_input=tool_input if isinstance(tool_input, dict) else None,
+            tool_output_summary=(error_message[:500] if error_message else "Tool execution failed"),
+            file_path=tool_input.get("file_path") if isinstance(tool_input, dict) else None,
+            success=False,
+            error_message=error_message[:500] if error_message else None,
+        )
+        store.add_activity_buffered(activity)
+        state.record_hook_activity()
+        logger.debug(f"Stored failed activity: {tool_name} (batch={prompt_batch_id})")
 
-    return {"status": "ok", "tool_name": tool_name, "recorded": True}
+    except HOOK_STORE_EXCEPTIONS as e:
+        logger.debug(f"Failed to store failed activity: {e}")
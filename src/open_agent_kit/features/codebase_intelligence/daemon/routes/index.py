@@ -88,6 +88,9 @@ async def build_index(request: IndexRequest) -> IndexResponse:
             status="completed",
             chunks_indexed=result.chunks_indexed,
             files_processed=result.files_processed,
+            files_reused=result.files_reused,
+            files_reembedded=result.files_reembedded,
+            files_removed=result.files_removed,
             duration_seconds=result.duration_seconds,
         )
 
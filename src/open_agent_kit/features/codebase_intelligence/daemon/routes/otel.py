@@ -5,7 +5,7 @@ and translates them into OAK CI activities. This enables agents like Codex that
 emit OTel events (instead of using traditional hooks) to integrate with CI.
 
 The receiver:
-- Accepts JSON-encoded OTLP log records at /v1/logs
+- Accepts OTLP log exports at /v1/logs as JSON or binary protobuf, optionally gzipped
 - Extracts event name and attributes from each log record
 - Maps events to hook actions using agent manifest configuration
 - Dispatches to existing hook handlers for consistent activity storage
@@ -23,10 +23,14 @@ Reference: OpenTelemetry Protocol (OTLP) Specification
 https://opentelemetry.io/docs/specs/otlp/
 """
 
+from __future__ import annotations
+
 import json
 import logging
+import sqlite3
+import zlib
 from functools import lru_cache
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, Request, Response
 
@@ -45,10 +49,22 @@ from open_agent_kit.features.codebase_intelligence.constants import (
     OTEL_ATTR_TOOL_NAME,
     OTEL_ATTR_TOOL_OUTPUT,
     OTEL_ATTR_TOOL_SUCCESS,
+    OTLP_CONTENT_ENCODING_GZIP,
     OTLP_CONTENT_TYPE_JSON,
+    OTLP_CONTENT_TYPE_PROTOBUF,
     OTLP_LOGS_ENDPOINT,
+    OTLP_MAX_BODY_BYTES,
+)
+from open_agent_kit.features.codebase_intelligence.daemon.routes.otel_proto import (
+    decode_export_logs_request,
+    encode_export_logs_response,
 )
 from open_agent_kit.features.codebase_intelligence.daemon.state import get_state
+from open_agent_kit.features.codebase_intelligence.daemon.workers import get_hook_pool
+
+if TYPE_CHECKING:
+    from open_agent_kit.features.codebase_intelligence.activity import Activity
+    from open_agent_kit.features.codebase_intelligence.activity.store import ActivityStore
 
 logger = logging.getLogger(__name__)
 
@@ -301,7 +317,88 @@ def _extract_session_id(
     return None
 
 
-async def _handle_session_start(
+class _ExportBatch:
+    """Per-export state for processing one OTLP request as a batch.
+
+    An export usually carries many records for the same session, so session
+    creation and active-batch lookups are resolved once per session instead
+    of once per record, and tool results are collected and inserted in a
+    single transaction by ``flush()``.
+    """
+
+    def __init__(self, store: ActivityStore | None, project_root: str | None) -> None:
+        self.store = store
+        self.project_root = project_root
+        self._ensured_sessions: set[str] = set()
+        self._active_batches: dict[str, int | None] = {}
+        self._activities: list[Activity] = []
+
+    def ensure_session(
+        self,
+        session_id: str,
+        agent: str,
+        attributes: dict[str, Any],
+        resource_attributes: dict[str, Any],
+    ) -> None:
+        """Ensure a session exists, creating it if needed.
+
+        Many OTEL agents don't emit explicit session_start events, so we
+        auto-create sessions on first event.
+        """
+        if not self.store or not self.project_root or session_id in self._ensured_sessions:
+            return
+
+        try:
+            # get_or_create_session is idempotent - it will return existing session
+            # or create a new one if it doesn't exist
+            model = attributes.get(OTEL_ATTR_MODEL) or resource_attributes.get(OTEL_ATTR_MODEL)
+            _, created = self.store.get_or_create_session(
+                session_id=session_id,
+                agent=agent,
+                project_root=self.project_root,
+            )
+            self._ensured_sessions.add(session_id)
+            if created:
+                otel_logger.info(
+                    f"[OTEL:SESSION-AUTO] session={session_id} agent={agent} model={model}"
+                )
+                logger.debug(f"Auto-created session from OTEL: {session_id}")
+        except (OSError, ValueError, RuntimeError) as e:
+            logger.debug(f"Failed to ensure session exists: {e}")
+
+    def active_batch_id(self, session_id: str) -> int | None:
+        """Get the session's active prompt batch ID, looked up once per export."""
+        if session_id not in self._active_batches and self.store:
+            active_batch = self.store.get_active_prompt_batch(session_id)
+            self._active_batches[session_id] = active_batch.id if active_batch else None
+        return self._active_batches.get(session_id)
+
+    def set_active_batch_id(self, session_id: str, batch_id: int | None) -> None:
+        """Record a batch created or ended while processing this export."""
+        self._active_batches[session_id] = batch_id
+
+    def add_activity(self, activity: Activity) -> None:
+        """Queue an activity for the end-of-export insert."""
+        self._activities.append(activity)
+
+    def flush(self) -> int:
+        """Insert queued activities in one transaction.
+
+        Returns:
+            Number of activities inserted.
+        """
+        if not self._activities or not self.store:
+            return 0
+        activities, self._activities = self._activities, []
+        try:
+            return len(self.store.add_activities(activities))
+        except (OSError, ValueError, RuntimeError, sqlite3.Error) as e:
+            logger.warning(f"Failed to store {len(activities)} activities from OTEL: {e}")
+            return 0
+
+
+def _handle_session_start(
+    batch: _ExportBatch,
     session_id: str,
     agent: str,
     attributes: dict[str, Any],
@@ -309,7 +406,11 @@ async def _handle_session_start(
 ) -> dict[str, Any]:
     """Handle session-start event from OTEL.
 
+    The session itself is created by ``_ExportBatch.ensure_session`` before
+    any handler runs.
+
     Args:
+        batch: Export being processed.
         session_id: Session identifier.
         agent: Agent name.
         attributes: Log record attributes.
@@ -318,30 +419,15 @@ async def _handle_session_start(
     Returns:
         Response dict.
     """
-    state = get_state()
     model = attributes.get(OTEL_ATTR_MODEL) or resource_attributes.get(OTEL_ATTR_MODEL)
 
     otel_logger.info(f"[OTEL:SESSION-START] session={session_id} agent={agent} model={model}")
 
-    # Create or resume session in activity store
-    if state.activity_store and state.project_root:
-        try:
-            _, created = state.activity_store.get_or_create_session(
-                session_id=session_id,
-                agent=agent,
-                project_root=str(state.project_root),
-            )
-            if created:
-                logger.debug(f"Created activity session from OTEL: {session_id}")
-            else:
-                logger.debug(f"Resumed activity session from OTEL: {session_id}")
-        except (OSError, ValueError, RuntimeError) as e:
-            logger.warning(f"Failed to create/resume activity session from OTEL: {e}")
-
     return {"status": "ok", "session_id": session_id, "event": "session-start"}
 
 
-async def _handle_prompt_submit(
+def _handle_prompt_submit(
+    batch: _ExportBatch,
     session_id: str,
     agent: str,
     attributes: dict[str, Any],
@@ -353,6 +439,7 @@ async def _handle_prompt_submit(
     - tool_decision events (fallback): has tool_name - signals start of new turn
 
     Args:
+        batch: Export being processed.
         session_id: Session identifier.
         agent: Agent name.
         attributes: Log record attributes.
@@ -360,8 +447,6 @@ async def _handle_prompt_submit(
     Returns:
         Response dict.
     """
-    state = get_state()
-
     # Check for user_prompt event attributes
     prompt = attributes.get(OTEL_ATTR_PROMPT, "")
     prompt_length = attributes.get(OTEL_ATTR_PROMPT_LENGTH, 0)
@@ -385,39 +470,43 @@ async def _handle_prompt_submit(
         f"tool={tool_name or 'N/A'} prompt_len={prompt_length}"
     )
 
-    if not state.activity_store:
+    if not batch.store:
         return {"status": "ok", "event": "prompt-submit"}
 
     prompt_batch_id = None
     try:
         # Check for active batch - if tool_decision, reuse existing batch
         # (multiple tools can be called in one turn)
-        active_batch = state.activity_store.get_active_prompt_batch(session_id)
+        active_batch_id = batch.active_batch_id(session_id)
 
-        if tool_name and active_batch and active_batch.id:
+        if tool_name and active_batch_id:
             # tool_decision with active batch - reuse it
-            prompt_batch_id = active_batch.id
-            logger.debug(f"Reusing active prompt batch for tool_decision: {prompt_batch_id}")
+            logger.debug(f"Reusing active prompt batch for tool_decision: {active_batch_id}")
             return {
                 "status": "ok",
                 "event": "prompt-submit",
-                "prompt_batch_id": prompt_batch_id,
+                "prompt_batch_id": active_batch_id,
                 "reused": True,
             }
 
+        # Tool results collected so far belong to the batch about to end
+        batch.flush()
+
         # End previous batch if exists and this is a new prompt
-        if active_batch and active_batch.id and not tool_name:
-            state.activity_store.end_prompt_batch(active_batch.id)
-            logger.debug(f"Ended previous prompt batch from OTEL: {active_batch.id}")
+        if active_batch_id and not tool_name:
+            batch.store.end_prompt_batch(active_batch_id)
+            batch.set_active_batch_id(session_id, None)
+            logger.debug(f"Ended previous prompt batch from OTEL: {active_batch_id}")
 
         # Create new prompt batch
-        batch = state.activity_store.create_prompt_batch(
+        new_batch = batch.store.create_prompt_batch(
             session_id=session_id,
             user_prompt=prompt_text,
             source_type="user",
             agent=agent,
         )
-        prompt_batch_id = batch.id
+        prompt_batch_id = new_batch.id
+        batch.set_active_batch_id(session_id, prompt_batch_id)
         logger.debug(f"Created prompt batch from OTEL: {prompt_batch_id}")
 
     except (OSError, ValueError, RuntimeError) as e:
@@ -426,21 +515,24 @@ async def _handle_prompt_submit(
     return {"status": "ok", "event": "prompt-submit", "prompt_batch_id": prompt_batch_id}
 
 
-async def _handle_tool_result(
+def _handle_tool_result(
+    batch: _ExportBatch,
     session_id: str,
     attributes: dict[str, Any],
 ) -> dict[str, Any]:
     """Handle Codex tool_result event as post-tool-use.
 
+    The activity is queued on the export batch and inserted with the rest of
+    the export's tool results.
+
     Args:
+        batch: Export being processed.
         session_id: Session identifier.
         attributes: Log record attributes.
 
     Returns:
         Response dict.
     """
-    state = get_state()
-
     tool_name = attributes.get(OTEL_ATTR_TOOL_NAME, "unknown")
     call_id = attributes.get(OTEL_ATTR_TOOL_CALL_ID, "")
     duration_ms = attributes.get(OTEL_ATTR_TOOL_DURATION_MS, 0)
@@ -463,17 +555,14 @@ async def _handle_tool_result(
         f"duration_ms={duration_ms}"
     )
 
-    if not state.activity_store:
+    if not batch.store:
         return {"status": "ok", "event": "post-tool-use"}
 
     try:
         from open_agent_kit.features.codebase_intelligence.activity import Activity
 
         # Get current prompt batch ID
-        prompt_batch_id = None
-        active_batch = state.activity_store.get_active_prompt_batch(session_id)
-        if active_batch:
-            prompt_batch_id = active_batch.id
+        prompt_batch_id = batch.active_batch_id(session_id)
 
         # Extract file_path if present in arguments
         file_path = None
@@ -490,9 +579,9 @@ async def _handle_tool_result(
             success=success,
             error_message=None if success else output[:500],
         )
-        state.activity_store.add_activity_buffered(activity)
+        batch.add_activity(activity)
         logger.debug(
-            f"Stored activity from OTEL: {tool_name} (batch={prompt_batch_id}, "
+            f"Queued activity from OTEL: {tool_name} (batch={prompt_batch_id}, "
             f"call_id={call_id})"
         )
 
@@ -502,46 +591,8 @@ async def _handle_tool_result(
     return {"status": "ok", "event": "post-tool-use", "tool_name": tool_name}
 
 
-async def _ensure_session_exists(
-    session_id: str,
-    agent: str,
-    attributes: dict[str, Any],
-    resource_attributes: dict[str, Any],
-) -> None:
-    """Ensure a session exists, creating it if needed.
-
-    Many OTEL agents don't emit explicit session_start events, so we auto-create
-    sessions on first event.
-
-    Args:
-        session_id: Session identifier.
-        agent: Agent name.
-        attributes: Log record attributes.
-        resource_attributes: Resource-level attributes.
-    """
-    state = get_state()
-    if not state.activity_store or not state.project_root:
-        return
-
-    try:
-        # get_or_create_session is idempotent - it will return existing session
-        # or create a new one if it doesn't exist
-        model = attributes.get(OTEL_ATTR_MODEL) or resource_attributes.get(OTEL_ATTR_MODEL)
-        _, created = state.activity_store.get_or_create_session(
-            session_id=session_id,
-            agent=agent,
-            project_root=str(state.project_root),
-        )
-        if created:
-            otel_logger.info(
-                f"[OTEL:SESSION-AUTO] session={session_id} agent={agent} model={model}"
-            )
-            logger.debug(f"Auto-created session from OTEL: {session_id}")
-    except (OSError, ValueError, RuntimeError) as e:
-        logger.debug(f"Failed to ensure session exists: {e}")
-
-
-async def _process_log_record(
+def _process_log_record(
+    batch: _ExportBatch,
     log_record: dict[str, Any],
     resource_attributes: dict[str, Any],
 ) -> dict[str, Any] | None:
@@ -551,6 +602,7 @@ async def _process_log_record(
     attribute, and agent detection.
 
     Args:
+        batch: Export being processed.
         log_record: The log record from the OTLP payload.
         resource_attributes: Resource-level attributes.
 
@@ -561,8 +613,8 @@ async def _process_log_record(
     attributes = _attributes_to_dict(log_record.get("attributes", []))
 
     # Get event name - most agents put it in attributes as 'event.name'
-    # Fall back to body.stringValue for other OTel implementations
-    event_name = attributes.get("event.name", "")
+    # Fall back to the LogRecord event_name field, then body.stringValue
+    event_name = attributes.get("event.name", "") or log_record.get("eventName", "")
     if not event_name:
         body = log_record.get("body", {})
         event_name = body.get("stringValue", "") if isinstance(body, dict) else ""
@@ -599,25 +651,121 @@ async def _process_log_record(
         return None
 
     # Ensure session exists (many agents don't emit explicit session_start)
-    await _ensure_session_exists(session_id, agent, attributes, resource_attributes)
+    batch.ensure_session(session_id, agent, attributes, resource_attributes)
 
     # Dispatch to appropriate handler
     if hook_action == HOOK_EVENT_SESSION_START or hook_action == "session-start":
-        return await _handle_session_start(session_id, agent, attributes, resource_attributes)
+        return _handle_session_start(batch, session_id, agent, attributes, resource_attributes)
     elif hook_action == HOOK_EVENT_PROMPT_SUBMIT or hook_action == "prompt-submit":
-        return await _handle_prompt_submit(session_id, agent, attributes)
+        return _handle_prompt_submit(batch, session_id, agent, attributes)
     elif hook_action == HOOK_EVENT_POST_TOOL_USE or hook_action == "post-tool-use":
-        return await _handle_tool_result(session_id, attributes)
+        return _handle_tool_result(batch, session_id, attributes)
     else:
         logger.debug(f"Unhandled hook action: {hook_action}")
         return None
 
 
+def _process_export(body: dict[str, Any]) -> tuple[int, int]:
+    """Process every log record in a decoded OTLP export (blocking).
+
+    Args:
+        body: Export in the OTLP/JSON shape.
+
+    Returns:
+        Tuple of (processed, rejected) record counts.
+    """
+    state = get_state()
+    batch = _ExportBatch(
+        state.activity_store, str(state.project_root) if state.project_root else None
+    )
+    processed = 0
+    rejected = 0
+
+    for resource_log in body.get("resourceLogs", []):
+        # Extract resource-level attributes
+        resource = resource_log.get("resource", {})
+        resource_attributes = _attributes_to_dict(resource.get("attributes", []))
+
+        # Process scope logs
+        for scope_log in resource_log.get("scopeLogs", []):
+            for log_record in scope_log.get("logRecords", []):
+                try:
+                    if _process_log_record(batch, log_record, resource_attributes):
+                        processed += 1
+                    else:
+                        rejected += 1
+                except (OSError, ValueError, KeyError, RuntimeError) as e:
+                    logger.warning(f"Error processing OTEL log record: {e}")
+                    rejected += 1
+
+    batch.flush()
+    return processed, rejected
+
+
+class _PayloadTooLargeError(ValueError):
+    """Decompressed OTLP body exceeds OTLP_MAX_BODY_BYTES."""
+
+
+def _gunzip(data: bytes) -> bytes:
+    """Decompress a gzip body, refusing to inflate past OTLP_MAX_BODY_BYTES."""
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    out = decompressor.decompress(data, OTLP_MAX_BODY_BYTES + 1)
+    if len(out) > OTLP_MAX_BODY_BYTES:
+        raise _PayloadTooLargeError(f"decompressed body exceeds {OTLP_MAX_BODY_BYTES} bytes")
+    if not decompressor.eof:
+        raise ValueError("truncated gzip body")
+    return out
+
+
+def _decode_body(raw: bytes, is_protobuf: bool, gzipped: bool) -> dict[str, Any]:
+    """Decompress and decode an OTLP request body (blocking).
+
+    Returns:
+        Export in the OTLP/JSON shape.
+    """
+    if gzipped:
+        raw = _gunzip(raw)
+    if is_protobuf:
+        return decode_export_logs_request(raw)
+    body = json.loads(raw)
+    if not isinstance(body, dict):
+        raise ValueError("OTLP JSON body must be an object")
+    return body
+
+
+def _otlp_response(is_protobuf: bool, rejected: int, status_code: int = 200) -> Response:
+    """Build an OTLP export response in the request's encoding."""
+    if is_protobuf:
+        return Response(
+            content=encode_export_logs_response(rejected),
+            status_code=status_code,
+            media_type=OTLP_CONTENT_TYPE_PROTOBUF,
+        )
+    response_body: dict[str, Any] = {}
+    if rejected > 0:
+        response_body["partialSuccess"] = {"rejectedLogRecords": rejected}
+    return Response(
+        content=json.dumps(response_body),
+        status_code=status_code,
+        media_type=OTLP_CONTENT_TYPE_JSON,
+    )
+
+
+def _error_response(status_code: int, message: str) -> Response:
+    return Response(
+        content=json.dumps({"error": message}),
+        status_code=status_code,
+        media_type=OTLP_CONTENT_TYPE_JSON,
+    )
+
+
 @router.post(OTLP_LOGS_ENDPOINT)
 async def otlp_logs_receiver(request: Request) -> Response:
     """OTLP HTTP logs receiver endpoint.
 
-    Accepts JSON-encoded OTLP log records and translates them to CI activities.
+    Accepts OTLP log exports encoded as JSON or binary protobuf
+    (``application/x-protobuf``), optionally gzip-compressed, and translates
+    them to CI activities. Responses use the request's encoding.
 
     The OTLP JSON format is:
     {
@@ -636,66 +784,45 @@ async def otlp_logs_receiver(request: Request) -> Response:
     }
     """
     content_type = request.headers.get("content-type", "")
-
-    # Only accept JSON for now
-    if OTLP_CONTENT_TYPE_JSON not in content_type and "json" not in content_type:
+    is_protobuf = OTLP_CONTENT_TYPE_PROTOBUF in content_type or "protobuf" in content_type
+    if (
+        not is_protobuf
+        and OTLP_CONTENT_TYPE_JSON not in content_type
+        and "json" not in content_type
+    ):
         logger.warning(f"Unsupported OTLP content type: {content_type}")
-        return Response(
-            content=json.dumps({"error": "Only JSON encoding is supported"}),
-            status_code=415,
-            media_type="application/json",
-        )
+        return _error_response(415, "Only JSON and protobuf encodings are supported")
 
+    content_encoding = request.headers.get("content-encoding", "").strip().lower()
+    if content_encoding not in ("", "identity", OTLP_CONTENT_ENCODING_GZIP):
+        logger.warning(f"Unsupported OTLP content encoding: {content_encoding}")
+        return _error_response(415, "Only gzip compression is supported")
+
+    pool = get_hook_pool()
+    raw = await request.body()
     try:
-        body = await request.json()
-    except (ValueError, json.JSONDecodeError) as e:
-        logger.warning(f"Failed to parse OTLP JSON: {e}")
-        return Response(
-            content=json.dumps({"partialSuccess": {"rejectedLogRecords": 1}}),
-            status_code=200,  # OTLP uses 200 even for partial failures
-            media_type="application/json",
+        body = await pool.run(
+            "otel.decode",
+            _decode_body,
+            raw,
+            is_protobuf,
+            content_encoding == OTLP_CONTENT_ENCODING_GZIP,
         )
+    except _PayloadTooLargeError as e:
+        logger.warning(f"Rejected OTLP export: {e}")
+        return _error_response(413, "Payload too large")
+    except (ValueError, OSError, EOFError, zlib.error) as e:
+        # json.JSONDecodeError and OtlpDecodeError are ValueErrors
+        logger.warning(f"Failed to decode OTLP export: {e}")
+        # OTLP uses 200 even for partial failures
+        return _otlp_response(is_protobuf, rejected=1)
 
-    # Process resource logs
-    resource_logs = body.get("resourceLogs", [])
-    processed = 0
-    rejected = 0
-
-    for resource_log in resource_logs:
-        # Extract resource-level attributes
-        resource = resource_log.get("resource", {})
-        resource_attributes = _attributes_to_dict(resource.get("attributes", []))
-
-        # Process scope logs
-        scope_logs = resource_log.get("scopeLogs", [])
-        for scope_log in scope_logs:
-            log_records = scope_log.get("logRecords", [])
-            for log_record in log_records:
-                try:
-                    result = await _process_log_record(
-                        log_record,
-                        resource_attributes,
-                    )
-                    if result:
-                        processed += 1
-                    else:
-                        rejected += 1
-                except (OSError, ValueError, KeyError, RuntimeError) as e:
-                    logger.warning(f"Error processing OTEL log record: {e}")
-                    rejected += 1
+    processed, rejected = await pool.run("otel.export", _process_export, body)
 
     logger.debug(f"OTLP processed: {processed} accepted, {rejected} rejected")
 
     # Return OTLP partial success response
-    response_body: dict[str, Any] = {}
-    if rejected > 0:
-        response_body["partialSuccess"] = {"rejectedLogRecords": rejected}
-
-    return Response(
-        content=json.dumps(response_body),
-        status_code=200,
-        media_type="application/json",
-    )
+    return _otlp_response(is_protobuf, rejected)
 
 
 @router.post("/")
@@ -707,19 +834,23 @@ async def otlp_root_receiver(request: Request) -> Response:
     """
     # Check if this looks like an OTLP request
     content_type = request.headers.get("content-type", "")
+    if "protobuf" in content_type:
+        # Binary payloads can't be sniffed; the content type is specific enough
+        return await otlp_logs_receiver(request)
     if "json" in content_type or OTLP_CONTENT_TYPE_JSON in content_type:
         try:
             body = await request.body()
+            if (
+                request.headers.get("content-encoding", "").strip().lower()
+                == OTLP_CONTENT_ENCODING_GZIP
+            ):
+                body = _gunzip(body)
             body_str = body.decode("utf-8")
             if "resourceLogs" in body_str or "logRecords" in body_str:
                 # Reconstruct request and delegate
                 return await otlp_logs_receiver(request)
-        except (OSError, ValueError, UnicodeDecodeError):
+        except (OSError, ValueError, UnicodeDecodeError, EOFError, zlib.error):
             pass
 
     # Not an OTLP request, return 404
-    return Response(
-        content=json.dumps({"error": "Not Found"}),
-        status_code=404,
-        media_type="application/json",
-    )
+    return _error_response(404, "Not Found")
@@ -0,0 +1,238 @@
+"""Minimal OTLP logs protobuf codec.
+
+Decodes an ``ExportLogsServiceRequest`` into the same dict shape the OTLP/JSON
+encoding produces (``resourceLogs`` -> ``scopeLogs`` -> ``logRecords``, with
+``{"key": ..., "value": {"stringValue": ...}}`` attributes), so the receiver
+handles both encodings with one code path. Only the fields the receiver reads
+are decoded; everything else is skipped by wire type, which keeps this
+compatible with newer versions of the proto.
+
+Field numbers follow ``opentelemetry/proto/collector/logs/v1/logs_service.proto``,
+``logs/v1/logs.proto``, ``common/v1/common.proto`` and
+``resource/v1/resource.proto``. Vendored instead of depending on
+``opentelemetry-proto`` to keep protobuf out of the daemon's dependencies.
+"""
+
+import base64
+import struct
+from collections.abc import Iterator
+from typing import Any
+
+_WIRE_VARINT = 0
+_WIRE_FIXED64 = 1
+_WIRE_LEN = 2
+_WIRE_FIXED32 = 5
+
+_DOUBLE = struct.Struct("<d")
+_UINT64 = struct.Struct("<Q")
+
+
+class OtlpDecodeError(ValueError):
+    """Raised when a protobuf payload is malformed."""
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise OtlpDecodeError("truncated varint")
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 64:
+            raise OtlpDecodeError("varint too long")
+
+
+def _iter_fields(data: bytes) -> Iterator[tuple[int, int, Any]]:
+    """Yield ``(field_number, wire_type, value)`` for each field in a message.
+
+    Length-delimited values are yielded as ``bytes``; fixed-width values as
+    raw ``bytes``; varints as ``int``.
+    """
+    pos = 0
+    end = len(data)
+    while pos < end:
+        key, pos = _read_varint(data, pos)
+        field, wire_type = key >> 3, key & 0x07
+        if wire_type == _WIRE_VARINT:
+            value, pos = _read_varint(data, pos)
+            yield field, wire_type, value
+        elif wire_type == _WIRE_LEN:
+            length, pos = _read_varint(data, pos)
+            if pos + length > end:
+                raise OtlpDecodeError("truncated length-delimited field")
+            yield field, wire_type, data[pos : pos + length]
+            pos += length
+        elif wire_type == _WIRE_FIXED64:
+            if pos + 8 > end:
+                raise OtlpDecodeError("truncated fixed64 field")
+            yield field, wire_type, data[pos : pos + 8]
+            pos += 8
+        elif wire_type == _WIRE_FIXED32:
+            if pos + 4 > end:
+                raise OtlpDecodeError("truncated fixed32 field")
+            yield field, wire_type, data[pos : pos + 4]
+            pos += 4
+        else:
+            raise OtlpDecodeError(f"unsupported wire type {wire_type}")
+
+
+def _decode_str(value: bytes) -> str:
+    try:
+        return value.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise OtlpDecodeError(f"invalid UTF-8 in string field: {e}") from e
+
+
+def _decode_any_value(data: bytes) -> dict[str, Any]:
+    """AnyValue: 1 string, 2 bool, 3 int64, 4 double, 5 array, 6 kvlist, 7 bytes."""
+    for field, wire_type, value in _iter_fields(data):
+        if field == 1 and wire_type == _WIRE_LEN:
+            return {"stringValue": _decode_str(value)}
+        if field == 2 and wire_type == _WIRE_VARINT:
+            return {"boolValue": bool(value)}
+        if field == 3 and wire_type == _WIRE_VARINT:
+            # int64 is two's complement in a 64-bit varint
+            return {"intValue": value - (1 << 64) if value >= 1 << 63 else value}
+        if field == 4 and wire_type == _WIRE_FIXED64:
+            return {"doubleValue": _DOUBLE.unpack(value)[0]}
+        if field == 5 and wire_type == _WIRE_LEN:
+            values = [
+                _decode_any_value(v) for f, w, v in _iter_fields(value) if f == 1 and w == _WIRE_LEN
+            ]
+            return {"arrayValue": {"values": values}}
+        if field == 6 and wire_type == _WIRE_LEN:
+            return {"kvlistValue": {"values": _decode_key_values(value)}}
+        if field == 7 and wire_type == _WIRE_LEN:
+            return {"bytesValue": base64.b64encode(value).decode("ascii")}
+    return {}
+
+
+def _decode_key_value(data: bytes) -> dict[str, Any]:
+    """KeyValue: 1 key, 2 value."""
+    key = ""
+    value: dict[str, Any] = {}
+    for field, wire_type, raw in _iter_fields(data):
+        if field == 1 and wire_type == _WIRE_LEN:
+            key = _decode_str(raw)
+        elif field == 2 and wire_type == _WIRE_LEN:
+            value = _decode_any_value(raw)
+    return {"key": key, "value": value}
+
+
+def _decode_key_values(data: bytes) -> list[dict[str, Any]]:
+    """Repeated KeyValue at field 1 (KeyValueList, Resource, InstrumentationScope)."""
+    return [_decode_key_value(v) for f, w, v in _iter_fields(data) if f == 1 and w == _WIRE_LEN]
+
+
+def _decode_log_record(data: bytes) -> dict[str, Any]:
+    """LogRecord: 1/11 timestamps, 2-3 severity, 5 body, 6 attributes, 12 event name."""
+    record: dict[str, Any] = {}
+    attributes: list[dict[str, Any]] = []
+    for field, wire_type, value in _iter_fields(data):
+        if field == 1 and wire_type == _WIRE_FIXED64:
+            record["timeUnixNano"] = str(_UINT64.unpack(value)[0])
+        elif field == 11 and wire_type == _WIRE_FIXED64:
+            record["observedTimeUnixNano"] = str(_UINT64.unpack(value)[0])
+        elif field == 2 and wire_type == _WIRE_VARINT:
+            record["severityNumber"] = value
+        elif field == 3 and wire_type == _WIRE_LEN:
+            record["severityText"] = _decode_str(value)
+        elif field == 5 and wire_type == _WIRE_LEN:
+            record["body"] = _decode_any_value(value)
+        elif field == 6 and wire_type == _WIRE_LEN:
+            attributes.append(_decode_key_value(value))
+        elif field == 12 and wire_type == _WIRE_LEN:
+            record["eventName"] = _decode_str(value)
+    record["attributes"] = attributes
+    return record
+
+
+def _decode_scope_logs(data: bytes) -> dict[str, Any]:
+    """ScopeLogs: 1 scope, 2 log records."""
+    scope_logs: dict[str, Any] = {}
+    records: list[dict[str, Any]] = []
+    for field, wire_type, value in _iter_fields(data):
+        if field == 1 and wire_type == _WIRE_LEN:
+            scope: dict[str, Any] = {}
+            for f, w, v in _iter_fields(value):
+                if f == 1 and w == _WIRE_LEN:
+                    scope["name"] = _decode_str(v)
+                elif f == 2 and w == _WIRE_LEN:
+                    scope["version"] = _decode_str(v)
+            scope_logs["scope"] = scope
+        elif field == 2 and wire_type == _WIRE_LEN:
+            records.append(_decode_log_record(value))
+    scope_logs["logRecords"] = records
+    return scope_logs
+
+
+def _decode_resource_logs(data: bytes) -> dict[str, Any]:
+    """ResourceLogs: 1 resource, 2 scope logs."""
+    resource_logs: dict[str, Any] = {"resource": {"attributes": []}}
+    scopes: list[dict[str, Any]] = []
+    for field, wire_type, value in _iter_fields(data):
+        if field == 1 and wire_type == _WIRE_LEN:
+            resource_logs["resource"] = {"attributes": _decode_key_values(value)}
+        elif field == 2 and wire_type == _WIRE_LEN:
+            scopes.append(_decode_scope_logs(value))
+    resource_logs["scopeLogs"] = scopes
+    return resource_logs
+
+
+def decode_export_logs_request(data: bytes) -> dict[str, Any]:
+    """Decode a protobuf ``ExportLogsServiceRequest``.
+
+    Args:
+        data: Serialized request body (already decompressed).
+
+    Returns:
+        Dict in the OTLP/JSON shape: ``{"resourceLogs": [...]}``.
+
+    Raises:
+        OtlpDecodeError: If the payload is not valid protobuf.
+    """
+    return {
+        "resourceLogs": [
+            _decode_resource_logs(value)
+            for field, wire_type, value in _iter_fields(data)
+            if field == 1 and wire_type == _WIRE_LEN
+        ]
+    }
+
+
+def _encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def encode_export_logs_response(rejected: int, error_message: str = "") -> bytes:
+    """Encode an ``ExportLogsServiceResponse``.
+
+    Args:
+        rejected: Number of rejected log records (0 for full success).
+        error_message: Optional message for a partial success.
+
+    Returns:
+        Serialized response; empty bytes when everything was accepted.
+    """
+    if not rejected and not error_message:
+        return b""
+    partial = b""
+    if rejected:
+        partial += b"\x08" + _encode_varint(rejected)
+    if error_message:
+        message = error_message.encode("utf-8")
+        partial += b"\x12" + _encode_varint(len(message)) + message
+    return b"\x0a" + _encode_varint(len(partial)) + partial
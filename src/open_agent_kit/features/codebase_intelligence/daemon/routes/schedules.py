@@ -274,6 +274,7 @@ async def create_schedule(request: ScheduleCreateRequest) -> ScheduleStatusRespo
         next_run_at=next_run_at,
         additional_prompt=request.additional_prompt,
     )
+    scheduler.notify_schedules_changed()
 
     logger.info(f"Created schedule for '{request.task_name}': cron={request.cron_expression}")
 
@@ -361,6 +362,7 @@ async def update_schedule(task_name: str, request: ScheduleUpdateRequest) -> Sch
 
     if update_kwargs:
         state.activity_store.update_schedule(task_name, **update_kwargs)
+        scheduler.notify_schedules_changed()
         logger.info(f"Updated schedule '{task_name}': {update_kwargs}")
 
     # Return updated status
@@ -408,6 +410,7 @@ async def delete_schedule(task_name: str) -> ScheduleDeleteResponse:
     deleted = state.activity_store.delete_schedule(task_name)
 
     if deleted:
+        scheduler.notify_schedules_changed()
         logger.info(f"Deleted schedule for '{task_name}'")
         return ScheduleDeleteResponse(
             task_name=task_name,
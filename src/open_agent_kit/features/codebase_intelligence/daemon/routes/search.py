@@ -14,8 +14,14 @@ from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, HTTPException, Query
 
+from open_agent_kit.features.codebase_intelligence.activity.store.pagination import (
+    InvalidCursorError,
+)
 from open_agent_kit.features.codebase_intelligence.constants import (
+    ERROR_MSG_INVALID_CURSOR,
     OBSERVATION_STATUS_RESOLVED,
+    PAGINATION_CURSOR_DESCRIPTION,
+    PAGINATION_OFFSET_DEPRECATED_DESCRIPTION,
 )
 from open_agent_kit.features.codebase_intelligence.daemon.models import (
     BulkAction,
@@ -302,7 +308,10 @@ async def unarchive_memory(memory_id: str) -> dict:
 @router.get("/api/memories", response_model=MemoriesListResponse)
 async def list_memories(
     limit: int = Query(default=50, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
+    offset: int = Query(
+        default=0, ge=0, deprecated=True, description=PAGINATION_OFFSET_DEPRECATED_DESCRIPTION
+    ),
+    cursor: str | None = Query(default=None, description=PAGINATION_CURSOR_DESCRIPTION),
     memory_type: str | None = Query(default=None, description="Filter by memory type"),
     tag: str | None = Query(default=None, description="Filter by tag"),
     start_date: str | None = Query(default=None, description="Filter by start date (YYYY-MM-DD)"),
@@ -316,7 +325,8 @@ async def list_memories(
     """List stored memories with pagination and filtering.
 
     This endpoint provides browsing access to all stored memories,
-    complementing the semantic search functionality.
+    complementing the semantic search functionality. Pass the returned
+    next_cursor as ``cursor`` to fetch the following page.
     """
     engine, _state = _get_retrieval_engine()
 
@@ -324,17 +334,21 @@ async def list_memories(
     memory_types = [memory_type] if memory_type else None
 
     # Use engine for listing
-    memories, total = engine.list_memories(
-        limit=limit,
-        offset=offset,
-        memory_types=memory_types,
-        tag=tag,
-        start_date=start_date,
-        end_date=end_date,
-        include_archived=include_archived,
-        status=status,
-        include_resolved=include_resolved,
-    )
+    try:
+        memories, total, next_cursor = engine.list_memories_page(
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            memory_types=memory_types,
+            tag=tag,
+            start_date=start_date,
+            end_date=end_date,
+            include_archived=include_archived,
+            status=status,
+            include_resolved=include_resolved,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=ERROR_MSG_INVALID_CURSOR) from e
 
     # Map to response model
     items = [
@@ -358,6 +372,7 @@ async def list_memories(
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
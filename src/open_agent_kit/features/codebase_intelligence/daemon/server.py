@@ -37,7 +37,9 @@ from open_agent_kit.features.codebase_intelligence.constants import (
     CI_CORS_ORIGIN_TEMPLATE,
     CI_CORS_SCHEME_HTTP,
     CI_DATA_DIR,
+    CI_EMBEDDING_CACHE_FILE,
     CI_HOOKS_LOG_FILE,
+    CI_INDEX_MANIFEST_FILE,
     CI_LOG_FILE,
     CI_RESTART_SHUTDOWN_DELAY_SECONDS,
     CI_RESTART_SUBPROCESS_DELAY_SECONDS,
@@ -259,16 +261,23 @@ async def _background_index() -> None:
         return
 
     # Check if index already has data
+    full_rebuild = True
     stats = state.vector_store.get_stats()
     if stats.get("code_chunks", 0) > 0:
-        logger.info(f"Index already has {stats['code_chunks']} chunks, skipping initial index")
-        state.index_status.set_ready()
-        state.index_status.file_count = state.vector_store.count_unique_files()
-        # Still start file watcher for incremental updates
-        await _start_file_watcher()
-        return
+        manifest_path = state.indexer.config.manifest_path
+        if manifest_path is None or not manifest_path.exists():
+            logger.info(f"Index already has {stats['code_chunks']} chunks, skipping initial index")
+            state.index_status.set_ready()
+            state.index_status.file_count = state.vector_store.count_unique_files()
+            # Still start file watcher for incremental updates
+            await _start_file_watcher()
+            return
 
-    logger.info("Starting background indexing...")
+        # Manifest makes catching up on changes made while the daemon was down cheap
+        logger.info(f"Index already has {stats['code_chunks']} chunks, running incremental update")
+        full_rebuild = False
+    else:
+        logger.info("Starting background indexing...")
 
     # Set indexing status BEFORE running in executor to eliminate race condition
     # where UI polls between task scheduling and executor start
@@ -281,7 +290,7 @@ async def _background_index() -> None:
         result = await asyncio.wait_for(
             loop.run_in_executor(
                 None,
-                lambda: state.run_index_build(full_rebuild=True, _status_preset=True),
+                lambda: state.run_index_build(full_rebuild=full_rebuild, _status_preset=True),
             ),
             timeout=DEFAULT_INDEXING_TIMEOUT_SECONDS,
         )
@@ -837,11 +846,21 @@ def _init_vector_store_and_indexer(
 
     ci_data_dir = project_root / OAK_DIR / CI_DATA_DIR / CI_CHROMA_DIR
 
+    from open_agent_kit.features.codebase_intelligence.embeddings.cache import EmbeddingCache
     from open_agent_kit.features.codebase_intelligence.memory.store import VectorStore
 
+    embedding_cache = None
+    if ci_config.embedding.cache_max_mb > 0:
+        embedding_cache = EmbeddingCache(
+            db_path=project_root / OAK_DIR / CI_DATA_DIR / CI_EMBEDDING_CACHE_FILE,
+            max_size_mb=ci_config.embedding.cache_max_mb,
+        )
+
     state.vector_store = VectorStore(
         persist_directory=ci_data_dir,
         embedding_provider=state.embedding_chain,
+        embedding_cache=embedding_cache,
+        embedding_concurrency=ci_config.embedding.concurrency,
     )
     logger.info(f"Vector store initialized at {ci_data_dir}")
 
@@ -862,7 +881,11 @@ def _init_vector_store_and_indexer(
     if user_patterns:
         logger.debug(f"User exclude patterns: {user_patterns}")
 
-    indexer_config = IndexerConfig(ignore_patterns=combined_patterns)
+    indexer_config = IndexerConfig(
+        ignore_patterns=combined_patterns,
+        manifest_path=project_root / OAK_DIR / CI_DATA_DIR / CI_INDEX_MANIFEST_FILE,
+        workers=ci_config.index_workers,
+    )
 
     state.indexer = CodebaseIndexer(
         project_root=project_root,
@@ -881,6 +904,28 @@ def _init_vector_store_and_indexer(
         )
 
 
+async def _init_unix_socket(state: "DaemonState", app: FastAPI, project_root: Path) -> None:
+    """Serve the API on the daemon's Unix socket as well as TCP.
+
+    Non-critical: where the platform or path length rules out a socket, or
+    binding fails, local clients keep using TCP.
+    """
+    from open_agent_kit.features.codebase_intelligence.daemon.manager import get_socket_path
+
+    socket_path = get_socket_path(project_root / OAK_DIR / CI_DATA_DIR)
+    if socket_path is None:
+        return
+
+    from open_agent_kit.features.codebase_intelligence.daemon.unix_socket import (
+        UnixSocketListener,
+    )
+
+    listener = UnixSocketListener(app, socket_path)
+    if await listener.start():
+        state.unix_socket_listener = listener
+        logger.info(f"Listening on Unix socket {socket_path}")
+
+
 async def _init_activity(state: "DaemonState", project_root: Path) -> None:
     """Initialize the activity store and processor.
 
@@ -990,6 +1035,11 @@ async def _shutdown(state: "DaemonState") -> None:
     """Graceful shutdown sequence for all subsystems."""
     logger.info("Initiating graceful shutdown...")
 
+    # 0. Stop the Unix socket listener; local clients fall back to TCP
+    if state.unix_socket_listener:
+        await state.unix_socket_listener.stop()
+        state.unix_socket_listener = None
+
     # 1. Cancel background tasks and wait for them with timeout
     for task in state.background_tasks:
         if not task.done():
@@ -1005,6 +1055,24 @@ async def _shutdown(state: "DaemonState") -> None:
             except (RuntimeError, OSError) as e:
                 logger.warning(f"Error cancelling task {task.get_name()}: {e}")
     state.background_tasks.clear()
+    state.loop_lag_monitor = None
+
+    # 1b. Stop taking new hook stages; running ones finish on their threads
+    from open_agent_kit.features.codebase_intelligence.daemon.workers import get_hook_pool
+
+    get_hook_pool().shutdown()
+
+    # 1c. Write governance audit events and activities still queued for the
+    # background writers
+    try:
+        state.stop_governance_audit()
+    except (RuntimeError, OSError) as e:
+        logger.warning(f"Error flushing governance audit events: {e}")
+    if state.activity_store:
+        try:
+            state.activity_store.close()
+        except (RuntimeError, OSError) as e:
+            logger.warning(f"Error flushing queued activities: {e}")
 
     # 2. Activity processor uses daemon timers that auto-terminate on shutdown
     # No explicit stop needed - daemon threads exit with the process
@@ -1135,9 +1203,19 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     version_check_task = asyncio.create_task(_periodic_version_check(), name="version_check")
     state.background_tasks.append(version_check_task)
 
+    # Sample event-loop lag so blocking work on the loop shows up in /api/status
+    from open_agent_kit.features.codebase_intelligence.daemon.workers import EventLoopLagMonitor
+
+    state.loop_lag_monitor = EventLoopLagMonitor()
+    lag_task = asyncio.create_task(state.loop_lag_monitor.run(), name="event_loop_lag")
+    state.background_tasks.append(lag_task)
+
     # Run one immediate governance audit prune (ongoing pruning is power-aware via ActivityProcessor)
     _run_governance_prune(state)
 
+    # Last, so the socket (like TCP) only accepts requests once startup is done
+    await _init_unix_socket(state, app, project_root)
+
     yield
 
     await _shutdown(state)
@@ -23,6 +23,7 @@ from open_agent_kit.features.codebase_intelligence.constants import (
     POWER_STATE_ACTIVE,
     POWER_STATE_DEEP_SLEEP,
 )
+from open_agent_kit.features.codebase_intelligence.daemon.context_cache import FileContextCache
 
 if TYPE_CHECKING:
     from open_agent_kit.features.codebase_intelligence.activity.processor import (
@@ -34,7 +35,14 @@ if TYPE_CHECKING:
     from open_agent_kit.features.codebase_intelligence.agents.scheduler import AgentScheduler
     from open_agent_kit.features.codebase_intelligence.cloud_relay.base import RelayClient
     from open_agent_kit.features.codebase_intelligence.config import CIConfig
+    from open_agent_kit.features.codebase_intelligence.daemon.unix_socket import (
+        UnixSocketListener,
+    )
+    from open_agent_kit.features.codebase_intelligence.daemon.workers import EventLoopLagMonitor
     from open_agent_kit.features.codebase_intelligence.embeddings import EmbeddingProviderChain
+    from open_agent_kit.features.codebase_intelligence.governance.audit import (
+        GovernanceAuditWriter,
+    )
     from open_agent_kit.features.codebase_intelligence.governance.engine import GovernanceEngine
     from open_agent_kit.features.codebase_intelligence.indexing.indexer import (
         CodebaseIndexer,
@@ -175,9 +183,15 @@ class DaemonState:
     # Cached governance engine instance (recreated when config changes)
     _governance_engine: "GovernanceEngine | None" = field(default=None, init=False, repr=False)
     _governance_config_id: int = field(default=0, init=False, repr=False)
+    # Buffered governance audit writer (recreated when the activity store changes)
+    _governance_audit_writer: "GovernanceAuditWriter | None" = field(
+        default=None, init=False, repr=False
+    )
     # Hook deduplication cache (key -> None, insertion ordered)
     hook_event_cache: "OrderedDict[str, None]" = field(default_factory=OrderedDict)
     _hook_event_lock: RLock = field(default_factory=RLock, init=False, repr=False)
+    # Post-tool-use file memory context (invalidated by memory generation)
+    file_context_cache: FileContextCache = field(default_factory=FileContextCache)
     # Agent subsystem
     agent_registry: "AgentRegistry | None" = None
     agent_executor: "AgentExecutor | None" = None
@@ -188,6 +202,10 @@ class DaemonState:
     auth_token: str | None = None
     # Tunnel sharing
     tunnel_provider: "TunnelProvider | None" = None
+    # Unix domain socket listener for local clients (hooks, MCP proxy)
+    unix_socket_listener: "UnixSocketListener | None" = None
+    # Event-loop lag sampling (exposed via /api/status)
+    loop_lag_monitor: "EventLoopLagMonitor | None" = None
     # Cloud MCP Relay
     cloud_relay_client: "RelayClient | None" = None
     cf_account_name: str | None = None
@@ -295,6 +313,40 @@ class DaemonState:
         self._governance_config_id = config_id
         return self._governance_engine
 
+    @property
+    def governance_audit_writer(self) -> "GovernanceAuditWriter | None":
+        """Get the buffered governance audit writer for the activity store.
+
+        Returns:
+            GovernanceAuditWriter instance, or None if there is no activity store.
+        """
+        store = self.activity_store
+        writer = self._governance_audit_writer
+        if writer is not None and writer.store is store:
+            return writer
+        if writer is not None:
+            writer.stop()
+            self._governance_audit_writer = None
+        if store is None:
+            return None
+
+        from open_agent_kit.features.codebase_intelligence.governance.audit import (
+            GovernanceAuditWriter,
+        )
+
+        self._governance_audit_writer = GovernanceAuditWriter(store)
+        return self._governance_audit_writer
+
+    def flush_governance_audit(self) -> None:
+        """Write buffered governance audit events (before reading them back)."""
+        if self._governance_audit_writer is not None:
+            self._governance_audit_writer.flush()
+
+    def stop_governance_audit(self) -> None:
+        """Write buffered governance audit events and stop the writer thread."""
+        if self._governance_audit_writer is not None:
+            self._governance_audit_writer.stop()
+
     @property
     def ci_config(self) -> "CIConfig | None":
         """Get CI configuration, lazy-loading from disk if needed.
@@ -476,7 +528,7 @@ class DaemonState:
             )
 
             # Update status with results
-            self.index_status.file_count = stats.files_processed
+            self.index_status.file_count = stats.files_processed + stats.files_reused
             self.index_status.ast_stats = {
                 "ast_success": stats.ast_success,
                 "ast_fallback": stats.ast_fallback,
@@ -547,13 +599,18 @@ class DaemonState:
         self._retrieval_engine = None
         self._governance_engine = None
         self._governance_config_id = 0
+        self.stop_governance_audit()
+        self._governance_audit_writer = None
         self.hook_event_cache = OrderedDict()
+        self.file_context_cache = FileContextCache()
         self.agent_registry = None
         self.agent_executor = None
         self.agent_scheduler = None
         self.last_auto_backup = None
         self.auth_token = None
         self.tunnel_provider = None
+        self.unix_socket_listener = None
+        self.loop_lag_monitor = None
         self.cloud_relay_client = None
         self.cf_account_name = None
         self._dynamic_cors_origins = set()
@@ -0,0 +1,122 @@
+"""Unix domain socket listener for the CI daemon.
+
+The TCP port serves the web UI, tunnels and remote clients. Local clients
+(agent hooks, the MCP proxy) call the daemon many times per session, so the
+daemon also listens on ``.oak/ci/daemon.sock`` to spare them the TCP connect
+and teardown on each call. The socket is served by a second uvicorn server
+bound to the same FastAPI app: routes, middleware and auth are identical on
+both transports.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+from collections.abc import Iterator
+from pathlib import Path
+
+import uvicorn
+from fastapi import FastAPI
+
+from open_agent_kit.features.codebase_intelligence.constants import (
+    CI_SOCKET_FILE_PERMISSIONS,
+    CI_SOCKET_STARTUP_TIMEOUT_SECONDS,
+    SHUTDOWN_TASK_TIMEOUT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Poll interval while waiting for the socket server to report started.
+_STARTUP_POLL_SECONDS = 0.01
+
+
+class _SocketServer(uvicorn.Server):
+    """uvicorn server that leaves signal handling to the main TCP server.
+
+    Both servers run in the same event loop. If this one installed its own
+    SIGINT/SIGTERM handlers it would swallow the signal that should stop
+    the whole daemon; instead the daemon lifespan stops it on shutdown.
+    """
+
+    def install_signal_handlers(self) -> None:
+        """Skip signal handlers (uvicorn < 0.29)."""
+
+    @contextlib.contextmanager
+    def capture_signals(self) -> Iterator[None]:
+        """Skip signal capture (uvicorn >= 0.29)."""
+        yield
+
+
+class UnixSocketListener:
+    """Serve the daemon app on a Unix domain socket alongside TCP."""
+
+    def __init__(self, app: FastAPI, path: Path) -> None:
+        """Initialize the listener.
+
+        Args:
+            app: The daemon's FastAPI application.
+            path: Socket file path (see ``manager.get_socket_path``).
+        """
+        self.path = path
+        # log_config=None keeps uvicorn from re-running dictConfig, which
+        # would drop the daemon's file handler on ``uvicorn.error``.
+        config = uvicorn.Config(
+            app,
+            lifespan="off",
+            log_config=None,
+            access_log=False,
+        )
+        self._server = _SocketServer(config)
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> bool:
+        """Bind the socket and start serving.
+
+        The socket is bound here rather than by uvicorn so it can be made
+        owner-only before the server accepts any connection.
+
+        Returns:
+            True once the socket accepts connections, False if binding or
+            startup failed (clients keep using TCP).
+        """
+        # A daemon that was killed leaves its socket file behind.
+        with contextlib.suppress(FileNotFoundError):
+            self.path.unlink()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(str(self.path))
+            os.chmod(self.path, CI_SOCKET_FILE_PERMISSIONS)
+        except OSError as e:
+            sock.close()
+            logger.warning(f"Could not bind Unix socket {self.path}: {e}")
+            return False
+
+        self._task = asyncio.create_task(
+            self._server.serve(sockets=[sock]), name="unix_socket_server"
+        )
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + CI_SOCKET_STARTUP_TIMEOUT_SECONDS
+        while not self._server.started:
+            if self._task.done() or loop.time() >= deadline:
+                logger.warning(f"Unix socket server did not start on {self.path}")
+                await self.stop()
+                return False
+            await asyncio.sleep(_STARTUP_POLL_SECONDS)
+        return True
+
+    async def stop(self) -> None:
+        """Stop serving and remove the socket file."""
+        task, self._task = self._task, None
+        if task is not None:
+            self._server.should_exit = True
+            try:
+                await asyncio.wait_for(task, timeout=SHUTDOWN_TASK_TIMEOUT_SECONDS)
+            except TimeoutError:
+                # wait_for has already cancelled the task.
+                logger.warning("Unix socket server did not stop in time; cancelled")
+            except (OSError, RuntimeError) as e:
+                logger.warning(f"Error stopping Unix socket server: {e}")
+        with contextlib.suppress(OSError):
+            self.path.unlink()
@@ -0,0 +1,258 @@
+"""Off-loop execution and event-loop health for the CI daemon.
+
+Hook routes are ``async`` but most of their work is blocking: SQLite reads
+and writes through ``ActivityStore``, and ``RetrievalEngine.search``, which
+calls the embedding server over HTTP. Run inline, one slow embed stalls every
+concurrent hook, the dashboard and MCP requests sharing the event loop.
+
+``HookWorkerPool`` runs those blocking stages on a small bounded thread pool
+and keeps per-stage timings. ``EventLoopLagMonitor`` measures how late the
+loop wakes up from a timed sleep, which is the symptom of anything still
+blocking it.
+"""
+
+import asyncio
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from open_agent_kit.features.codebase_intelligence.constants import (
+    EVENT_LOOP_LAG_SAMPLE_INTERVAL_SECONDS,
+    EVENT_LOOP_LAG_WARN_MS,
+    EVENT_LOOP_LAG_WINDOW_SAMPLES,
+    HOOK_STAGE_SLOW_MS,
+    HOOK_WORKER_POOL_SIZE,
+    HOOK_WORKER_THREAD_PREFIX,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class StageStats:
+    """Running timings for one named hook stage.
+
+    ``wait`` is time spent queued for a worker; ``run`` is time in the
+    stage function itself. A growing wait with a flat run time means the
+    pool is saturated rather than the work getting slower.
+    """
+
+    count: int = 0
+    errors: int = 0
+    slow: int = 0
+    total_wait_ms: float = 0.0
+    total_run_ms: float = 0.0
+    max_run_ms: float = 0.0
+    last_run_ms: float = 0.0
+
+    def record(self, wait_ms: float, run_ms: float, failed: bool) -> None:
+        """Add one completed call to the totals."""
+        self.count += 1
+        self.errors += int(failed)
+        self.slow += int(run_ms >= HOOK_STAGE_SLOW_MS)
+        self.total_wait_ms += wait_ms
+        self.total_run_ms += run_ms
+        self.max_run_ms = max(self.max_run_ms, run_ms)
+        self.last_run_ms = run_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize for the status API."""
+        count = self.count or 1
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "slow": self.slow,
+            "avg_wait_ms": round(self.total_wait_ms / count, 2),
+            "avg_run_ms": round(self.total_run_ms / count, 2),
+            "max_run_ms": round(self.max_run_ms, 2),
+            "last_run_ms": round(self.last_run_ms, 2),
+        }
+
+
+class HookWorkerPool:
+    """Bounded thread pool for the blocking stages of hook handlers.
+
+    The pool is small on purpose: hook work is mostly SQLite writes that
+    serialize on the database lock anyway, so more threads would only queue
+    inside SQLite instead of here, where the wait is measured.
+    """
+
+    def __init__(self, max_workers: int = HOOK_WORKER_POOL_SIZE) -> None:
+        """Initialize the pool. Threads start on first use.
+
+        Args:
+            max_workers: Maximum number of concurrent stage calls.
+        """
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._stats: dict[str, StageStats] = {}
+        self._in_flight = 0
+        self._closed = False
+
+    def _get_executor(self) -> ThreadPoolExecutor | None:
+        with self._lock:
+            if self._closed:
+                return None
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=HOOK_WORKER_THREAD_PREFIX,
+                )
+            return self._executor
+
+    async def run(self, stage: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking function on the pool and record its timing.
+
+        Args:
+            stage: Stage name used for stats and logs (e.g. ``post-tool-use.store``).
+            func: Blocking callable.
+            *args: Positional arguments for ``func``.
+            **kwargs: Keyword arguments for ``func``.
+
+        Returns:
+            Whatever ``func`` returns. Exceptions propagate to the caller.
+
+        After ``shutdown`` the call runs inline on the caller's thread, so
+        late requests during daemon shutdown still complete without starting
+        new worker threads.
+        """
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+        started = 0.0
+
+        def _call() -> T:
+            nonlocal started
+            started = time.perf_counter()
+            return func(*args, **kwargs)
+
+        failed = False
+        with self._lock:
+            self._in_flight += 1
+        try:
+            executor = self._get_executor()
+            if executor is None:
+                return _call()
+            return await loop.run_in_executor(executor, _call)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self._in_flight -= 1
+            # started stays 0 if the call was cancelled before a worker picked it up.
+            if started:
+                self._record(
+                    stage, (started - submitted) * 1000, (finished - started) * 1000, failed
+                )
+
+    def _record(self, stage: str, wait_ms: float, run_ms: float, failed: bool) -> None:
+        with self._lock:
+            self._stats.setdefault(stage, StageStats()).record(wait_ms, run_ms, failed)
+        if run_ms >= HOOK_STAGE_SLOW_MS:
+            logger.warning(f"[HOOK-STAGE] {stage} took {run_ms:.0f}ms (queued {wait_ms:.0f}ms)")
+        else:
+            logger.debug(f"[HOOK-STAGE] {stage} took {run_ms:.1f}ms (queued {wait_ms:.1f}ms)")
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of pool occupancy and per-stage timings."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "in_flight": self._in_flight,
+                "stages": {name: s.to_dict() for name, s in sorted(self._stats.items())},
+            }
+
+    def shutdown(self) -> None:
+        """Stop running work on pool threads.
+
+        Calls already running finish on their threads; the interpreter joins
+        them at exit, so in-flight writes are not lost. Later calls to ``run``
+        execute inline instead of starting a new executor.
+        """
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+_hook_pool: HookWorkerPool | None = None
+_hook_pool_lock = threading.Lock()
+
+
+def get_hook_pool() -> HookWorkerPool:
+    """Get the process-wide hook worker pool.
+
+    The pool lives at module level rather than on ``DaemonState`` so that
+    resetting daemon state (tests, restarts) does not orphan idle threads.
+    A pool that was shut down is replaced, so a daemon restarted in the same
+    process gets worker threads again.
+    """
+    global _hook_pool
+    with _hook_pool_lock:
+        if _hook_pool is None or _hook_pool._closed:
+            _hook_pool = HookWorkerPool()
+        return _hook_pool
+
+
+class EventLoopLagMonitor:
+    """Measure event-loop responsiveness by timing short sleeps.
+
+    Each sample sleeps for a fixed interval and records how much later than
+    requested the loop woke up. On a healthy loop the lag is well under a
+    millisecond; anything blocking the loop shows up here directly.
+    """
+
+    def __init__(
+        self,
+        interval: float = EVENT_LOOP_LAG_SAMPLE_INTERVAL_SECONDS,
+        window: int = EVENT_LOOP_LAG_WINDOW_SAMPLES,
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            interval: Seconds between samples.
+            window: Number of recent samples kept for percentiles.
+        """
+        self.interval = interval
+        self._samples: deque[float] = deque(maxlen=window)
+        self._max_ms = 0.0
+
+    def record(self, lag_ms: float) -> None:
+        """Add one lag sample."""
+        self._samples.append(lag_ms)
+        self._max_ms = max(self._max_ms, lag_ms)
+        if lag_ms >= EVENT_LOOP_LAG_WARN_MS:
+            logger.warning(f"Event loop blocked for {lag_ms:.0f}ms")
+
+    async def run(self) -> None:
+        """Sample until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, (loop.time() - expected) * 1000))
+
+    def snapshot(self) -> dict[str, Any]:
+        """Summarize recent lag for the status API."""
+        samples = list(self._samples)
+        if not samples:
+            return {"samples": 0}
+        ordered = sorted(samples)
+        return {
+            "samples": len(samples),
+            "last_ms": round(samples[-1], 2),
+            "p50_ms": round(statistics.median(ordered), 2),
+            "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 2),
+            "max_ms": round(self._max_ms, 2),
+        }
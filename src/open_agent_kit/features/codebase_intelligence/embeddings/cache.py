@@ -0,0 +1,349 @@
+"""Embedding caches.
+
+``EmbeddingCache`` stores embedding vectors on disk keyed by (provider,
+dimensions, SHA-256 of the embedded text). Provider names already carry the
+model (e.g. ``ollama:nomic-embed-text``), so switching models or dimensions
+never serves stale vectors. Full rebuilds, branch switches and reverted files
+then only pay for text that has never been embedded before. The cache is
+bounded by size and evicts least-recently-used entries.
+
+``QueryEmbeddingCache`` is a small in-process LRU with a TTL for search query
+embeddings, which hooks and MCP tools tend to repeat within seconds.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from open_agent_kit.features.codebase_intelligence.constants import (
+    QUERY_EMBEDDING_CACHE_SIZE,
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Max host parameters per IN (...) lookup, well under SQLite's limit
+_LOOKUP_BATCH_SIZE = 500
+
+# Evict down to this fraction of max size so eviction doesn't run on every insert
+_EVICTION_TARGET_RATIO = 0.9
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    provider TEXT NOT NULL,
+    dimensions INTEGER NOT NULL,
+    text_hash TEXT NOT NULL,
+    embedding BLOB NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (provider, dimensions, text_hash)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used ON embedding_cache(last_used);
+"""
+
+
+def hash_text(text: str) -> str:
+    """Compute the cache key hash for a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed, size-bounded LRU cache of embedding vectors.
+
+    Thread-safe: each thread uses its own connection, and size accounting
+    is guarded by a lock. Vectors are stored as float32, the same precision
+    ChromaDB keeps them at.
+    """
+
+    def __init__(self, db_path: Path, max_size_mb: int):
+        """Initialize the cache.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            max_size_mb: Maximum size of stored vectors in megabytes.
+        """
+        self.db_path = db_path
+        self.max_bytes = max_size_mb * 1024 * 1024
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._get_connection()
+        conn.executescript(_SCHEMA_SQL)
+        conn.commit()
+        row = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(embedding)), 0) FROM embedding_cache"
+        ).fetchone()
+        self._entries = int(row[0])
+        self._size_bytes = int(row[1])
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if getattr(self._local, "conn", None) is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        result: sqlite3.Connection = self._local.conn
+        return result
+
+    def get_many(
+        self, provider: str, dimensions: int, texts: list[str]
+    ) -> list[list[float] | None]:
+        """Look up embeddings for texts.
+
+        Args:
+            provider: Provider name (includes the model).
+            dimensions: Embedding dimensions.
+            texts: Texts to look up.
+
+        Returns:
+            One entry per text: the cached vector, or None on a miss.
+        """
+        hashes = [hash_text(text) for text in texts]
+        found: dict[str, list[float]] = {}
+
+        try:
+            conn = self._get_connection()
+            unique_hashes = list(dict.fromkeys(hashes))
+            for start in range(0, len(unique_hashes), _LOOKUP_BATCH_SIZE):
+                batch = unique_hashes[start : start + _LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    "SELECT text_hash, embedding FROM embedding_cache "
+                    f"WHERE provider = ? AND dimensions = ? AND text_hash IN ({placeholders})",
+                    (provider, dimensions, *batch),
+                ).fetchall()
+                for text_hash, blob in rows:
+                    found[text_hash] = array("f", blob).tolist()
+
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE embedding_cache SET last_used = ? "
+                    "WHERE provider = ? AND dimensions = ? AND text_hash = ?",
+                    [(now, provider, dimensions, text_hash) for text_hash in found],
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+
+        results = [found.get(text_hash) for text_hash in hashes]
+        hits = sum(1 for vector in results if vector is not None)
+        with self._lock:
+            self._hits += hits
+            self._misses += len(results) - hits
+        return results
+
+    def put_many(
+        self,
+        provider: str,
+        dimensions: int,
+        texts: list[str],
+        embeddings: list[list[float]],
+    ) -> None:
+        """Store embeddings for texts, evicting old entries if over budget.
+
+        Args:
+            provider: Provider name (includes the model).
+            dimensions: Embedding dimensions.
+            texts: Texts that were embedded.
+            embeddings: Vectors, aligned with texts.
+        """
+        if not texts or len(texts) != len(embeddings):
+            return
+
+        now = time.time()
+        rows = {
+            hash_text(text): array("f", vector).tobytes()
+            for text, vector in zip(texts, embeddings, strict=True)
+        }
+
+        try:
+            conn = self._get_connection()
+            with self._lock:
+                # Account for rows being replaced so the size stays accurate
+                replaced = self._existing_sizes(conn, provider, dimensions, list(rows))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embedding_cache "
+                    "(provider, dimensions, text_hash, embedding, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (provider, dimensions, text_hash, blob, now)
+                        for text_hash, blob in rows.items()
+                    ],
+                )
+                conn.commit()
+                self._entries += len(rows) - len(replaced)
+                self._size_bytes += sum(len(blob) for blob in rows.values()) - sum(
+                    replaced.values()
+                )
+                if self._size_bytes > self.max_bytes:
+                    self._evict(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    @staticmethod
+    def _existing_sizes(
+        conn: sqlite3.Connection, provider: str, dimensions: int, hashes: list[str]
+    ) -> dict[str, int]:
+        sizes: dict[str, int] = {}
+        for start in range(0, len(hashes), _LOOKUP_BATCH_SIZE):
+            batch = hashes[start : start + _LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                "SELECT text_hash, LENGTH(embedding) FROM embedding_cache "
+                f"WHERE provider = ? AND dimensions = ? AND text_hash IN ({placeholders})",
+                (provider, dimensions, *batch),
+            ).fetchall()
+            sizes.update({text_hash: int(size) for text_hash, size in rows})
+        return sizes
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least-recently-used entries until under the target size.
+
+        Caller must hold ``self._lock``.
+        """
+        target = int(self.max_bytes * _EVICTION_TARGET_RATIO)
+        evicted = 0
+        while self._size_bytes > target:
+            rows = conn.execute(
+                "SELECT provider, dimensions, text_hash, LENGTH(embedding) "
+                "FROM embedding_cache ORDER BY last_used LIMIT ?",
+                (_LOOKUP_BATCH_SIZE,),
+            ).fetchall()
+            if not rows:
+                self._size_bytes = 0
+                self._entries = 0
+                break
+
+            victims = []
+            for provider, dimensions, text_hash, size in rows:
+                victims.append((provider, dimensions, text_hash))
+                self._size_bytes -= int(size)
+                if self._size_bytes <= target:
+                    break
+
+            conn.executemany(
+                "DELETE FROM embedding_cache "
+                "WHERE provider = ? AND dimensions = ? AND text_hash = ?",
+                victims,
+            )
+            conn.commit()
+            self._entries -= len(victims)
+            evicted += len(victims)
+
+        self._evictions += evicted
+        logger.debug(f"Evicted {evicted} embeddings from cache")
+
+    def clear(self) -> None:
+        """Delete all cached embeddings."""
+        conn = self._get_connection()
+        with self._lock:
+            conn.execute("DELETE FROM embedding_cache")
+            conn.commit()
+            self._entries = 0
+            self._size_bytes = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and size information.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "entries": self._entries,
+                "size_bytes": self._size_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class QueryEmbeddingCache:
+    """Thread-safe in-memory LRU cache of query embeddings with a TTL.
+
+    Entries are keyed by provider name (which includes the model),
+    dimensions and the exact query text.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = QUERY_EMBEDDING_CACHE_SIZE,
+        ttl_seconds: float = QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached queries.
+            ttl_seconds: How long an entry stays valid after it was stored.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, int, str], tuple[float, list[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, provider: str, dimensions: int, query: str) -> list[float] | None:
+        """Get a cached query embedding, or None if missing or expired."""
+        key = (provider, dimensions, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, provider: str, dimensions: int, query: str, embedding: list[float]) -> None:
+        """Store a query embedding, evicting the least recently used entry if full."""
+        key = (provider, dimensions, query)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached query embeddings."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and the number of entries.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
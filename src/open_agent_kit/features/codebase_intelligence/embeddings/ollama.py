@@ -1,10 +1,20 @@
-"""Ollama embedding provider."""
+"""Ollama embedding provider.
+
+Uses the batched ``/api/embed`` endpoint (Ollama 0.3.0+), which embeds a list
+of inputs per request. Servers that predate it are detected on first use and
+served through the legacy one-text-per-request ``/api/embeddings`` endpoint.
+"""
 
 import logging
 
 import httpx
 
-from open_agent_kit.features.codebase_intelligence.constants import DEFAULT_BASE_URL
+from open_agent_kit.features.codebase_intelligence.constants import (
+    CHARS_PER_TOKEN_ESTIMATE,
+    DEFAULT_BASE_URL,
+    DEFAULT_EMBEDDING_MAX_BATCH_SIZE,
+    DEFAULT_EMBEDDING_MAX_BATCH_TOKENS,
+)
 from open_agent_kit.features.codebase_intelligence.embeddings.base import (
     EmbeddingError,
     EmbeddingProvider,
@@ -36,6 +46,8 @@ class OllamaProvider(EmbeddingProvider):
         timeout: float = 30.0,
         max_chars: int | None = None,
         dimensions: int | None = None,
+        max_batch_size: int = DEFAULT_EMBEDDING_MAX_BATCH_SIZE,
+        max_batch_tokens: int = DEFAULT_EMBEDDING_MAX_BATCH_TOKENS,
     ):
         """Initialize Ollama provider.
 
@@ -45,6 +57,8 @@ class OllamaProvider(EmbeddingProvider):
             timeout: Request timeout in seconds.
             max_chars: Maximum characters per text chunk.
             dimensions: Embedding dimensions (auto-detected on first embed if not set).
+            max_batch_size: Maximum texts per /api/embed request.
+            max_batch_tokens: Estimated token budget per /api/embed request.
         """
         self._model = model
         self._base_url = base_url.rstrip("/")
@@ -54,6 +68,10 @@ class OllamaProvider(EmbeddingProvider):
         self._client = httpx.Client(timeout=timeout)
         self._available: bool | None = None
         self._resolved_model: str | None = None  # Actual model name from Ollama
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_batch_chars = max(1, max_batch_tokens) * CHARS_PER_TOKEN_ESTIMATE
+        # Set once the server turns out to predate /api/embed
+        self._legacy_endpoint = False
 
     @property
     def name(self) -> str:
@@ -176,39 +194,18 @@ class OllamaProvider(EmbeddingProvider):
                 provider=self.name,
             )
 
-        embeddings = []
+        embeddings: list[list[float]] = []
         # Use resolved model name if available (handles namespaced models like manutic/nomic-embed-code)
         model_name = self._resolved_model or self._model
         try:
-            for text in truncated_texts:
-                response = self._client.post(
-                    f"{self._base_url}/api/embeddings",
-                    json={"model": model_name, "prompt": text},
-                )
-
-                if response.status_code != 200:
-                    error_text = response.text
-                    # Check for known Ollama model issues
-                    if "-Inf" in error_text or "Inf" in error_text:
-                        raise EmbeddingError(
-                            f"Model '{model_name}' produced invalid values (infinity). "
-                            "This model may be unstable for embeddings. "
-                            "Try using 'nomic-embed-text' instead.",
-                            provider=self.name,
-                        )
-                    raise EmbeddingError(
-                        f"Ollama returned status {response.status_code}: {error_text}",
-                        provider=self.name,
-                    )
-
-                data = response.json()
-                embedding = data.get("embedding")
-                if not embedding:
-                    raise EmbeddingError(
-                        f"No embedding in Ollama response: {data}",
-                        provider=self.name,
-                    )
-                embeddings.append(embedding)
+            for batch in self._split_batches(truncated_texts):
+                if not self._legacy_endpoint:
+                    batch_embeddings = self._embed_batch(model_name, batch)
+                    if batch_embeddings is not None:
+                        embeddings.extend(batch_embeddings)
+                        continue
+                for text in batch:
+                    embeddings.append(self._embed_single(model_name, text))
 
         except httpx.RequestError as e:
             raise EmbeddingError(
@@ -224,6 +221,106 @@ class OllamaProvider(EmbeddingProvider):
             dimensions=self._dimensions,
         )
 
+    def _split_batches(self, texts: list[str]) -> list[list[str]]:
+        """Split texts into batches bounded by count and estimated tokens.
+
+        A single text larger than the token budget gets a batch of its own.
+        """
+        batches: list[list[str]] = []
+        current: list[str] = []
+        current_chars = 0
+        for text in texts:
+            if current and (
+                len(current) >= self._max_batch_size
+                or current_chars + len(text) > self._max_batch_chars
+            ):
+                batches.append(current)
+                current = []
+                current_chars = 0
+            current.append(text)
+            current_chars += len(text)
+        if current:
+            batches.append(current)
+        return batches
+
+    def _embed_batch(self, model_name: str, texts: list[str]) -> list[list[float]] | None:
+        """Embed a batch of texts with one /api/embed request.
+
+        Returns:
+            One embedding per text, or None if the server predates /api/embed
+            (the caller then falls back to the legacy endpoint).
+
+        Raises:
+            EmbeddingError: If the request fails.
+        """
+        response = self._client.post(
+            f"{self._base_url}/api/embed",
+            json={"model": model_name, "input": texts},
+        )
+
+        # Old servers answer unknown routes with a plain 404 (or 405). A 404
+        # from a current server carries a JSON error about the model instead.
+        if response.status_code in (404, 405) and "model" not in response.text:
+            logger.info(
+                f"Ollama at {self._base_url} does not support /api/embed, "
+                "falling back to /api/embeddings"
+            )
+            self._legacy_endpoint = True
+            return None
+
+        if response.status_code != 200:
+            self._raise_for_error(model_name, response)
+
+        data = response.json()
+        embeddings = data.get("embeddings")
+        if not embeddings or len(embeddings) != len(texts) or not all(embeddings):
+            raise EmbeddingError(
+                f"Ollama returned {len(embeddings or [])} embeddings for {len(texts)} inputs",
+                provider=self.name,
+            )
+        result: list[list[float]] = embeddings
+        return result
+
+    def _embed_single(self, model_name: str, text: str) -> list[float]:
+        """Embed one text with the legacy /api/embeddings endpoint.
+
+        Raises:
+            EmbeddingError: If the request fails.
+        """
+        response = self._client.post(
+            f"{self._base_url}/api/embeddings",
+            json={"model": model_name, "prompt": text},
+        )
+
+        if response.status_code != 200:
+            self._raise_for_error(model_name, response)
+
+        data = response.json()
+        embedding = data.get("embedding")
+        if not embedding:
+            raise EmbeddingError(
+                f"No embedding in Ollama response: {data}",
+                provider=self.name,
+            )
+        result: list[float] = embedding
+        return result
+
+    def _raise_for_error(self, model_name: str, response: httpx.Response) -> None:
+        """Raise an EmbeddingError describing a failed Ollama response."""
+        error_text = response.text
+        # Check for known Ollama model issues
+        if "-Inf" in error_text or "Inf" in error_text:
+            raise EmbeddingError(
+                f"Model '{model_name}' produced invalid values (infinity). "
+                "This model may be unstable for embeddings. "
+                "Try using 'nomic-embed-text' instead.",
+                provider=self.name,
+            )
+        raise EmbeddingError(
+            f"Ollama returned status {response.status_code}: {error_text}",
+            provider=self.name,
+        )
+
     def ensure_model(self) -> bool:
         """Ensure the model is pulled and available.
 
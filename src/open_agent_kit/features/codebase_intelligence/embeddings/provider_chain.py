@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from typing import TYPE_CHECKING
 
 from open_agent_kit.features.codebase_intelligence.constants import DEFAULT_BASE_URL
@@ -41,6 +42,8 @@ def create_provider_from_config(config: EmbeddingConfig) -> EmbeddingProvider:
             base_url=config.base_url,
             max_chars=config.get_max_chunk_chars(),
             dimensions=config.dimensions,
+            max_batch_size=config.max_batch_size,
+            max_batch_tokens=config.max_batch_tokens,
         )
     elif provider_type == "openai":
         from open_agent_kit.features.codebase_intelligence.embeddings.openai_compat import (
@@ -101,6 +104,8 @@ class EmbeddingProviderChain(EmbeddingProvider):
         self._tried_providers: set[str] = set()
         # Track usage statistics per provider
         self._usage_stats: dict[str, dict[str, int]] = {}
+        # Indexing embeds batches from several threads at once
+        self._stats_lock = threading.Lock()
 
     @property
     def name(self) -> str:
@@ -109,6 +114,19 @@ class EmbeddingProviderChain(EmbeddingProvider):
             return self._active_provider.name
         return "chain:none"
 
+    @property
+    def resolved_name(self) -> str:
+        """Name of the provider that will serve the next embedding.
+
+        The active provider once one has succeeded, otherwise the primary
+        (configured) provider, matching how ``dimensions`` resolves.
+        """
+        if self._active_provider:
+            return self._active_provider.name
+        if self._providers:
+            return self._providers[0].name
+        return self.name
+
     @property
     def dimensions(self) -> int:
         """Dimensions of the primary (configured) provider.
@@ -167,12 +185,13 @@ class EmbeddingProviderChain(EmbeddingProvider):
 
     def _track_usage(self, provider_name: str, success: bool) -> None:
         """Track usage statistics for a provider."""
-        if provider_name not in self._usage_stats:
-            self._usage_stats[provider_name] = {"success": 0, "failure": 0}
-        if success:
-            self._usage_stats[provider_name]["success"] += 1
-        else:
-            self._usage_stats[provider_name]["failure"] += 1
+        with self._stats_lock:
+            if provider_name not in self._usage_stats:
+                self._usage_stats[provider_name] = {"success": 0, "failure": 0}
+            if success:
+                self._usage_stats[provider_name]["success"] += 1
+            else:
+                self._usage_stats[provider_name]["failure"] += 1
 
     def embed(self, texts: list[str]) -> EmbeddingResult:
         """Generate embeddings using providers in order.
@@ -3,15 +3,31 @@
 Records every governance evaluation (allow, deny, warn, observe) to the
 governance_audit_events table for compliance reporting and debugging.
 Includes retention pruning to prevent unbounded table growth.
+
+Evaluations happen on every pre-tool-use hook, so ``GovernanceAuditWriter``
+does not write them inline. Events go into a bounded ring buffer and a
+writer thread inserts them in one transaction when ``batch_size`` events are
+pending, every ``flush_interval_ms``, and on ``stop()``. Audit queries call
+``flush()`` first so buffered events are visible to them.
 """
 
 from __future__ import annotations
 
 import logging
 import sqlite3
+import threading
 import time
+from collections import deque
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from open_agent_kit.features.codebase_intelligence.constants import (
+    GOVERNANCE_AUDIT_BUFFER_MAX,
+    GOVERNANCE_AUDIT_FLUSH_BATCH_SIZE,
+    GOVERNANCE_AUDIT_FLUSH_INTERVAL_MS,
+    GOVERNANCE_AUDIT_STOP_TIMEOUT_SECONDS,
+    GOVERNANCE_AUDIT_WRITER_THREAD_NAME,
+)
 
 if TYPE_CHECKING:
     from open_agent_kit.features.codebase_intelligence.activity.store import ActivityStore
@@ -21,6 +37,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_INSERT_SQL = """
+    INSERT INTO governance_audit_events (
+        session_id, agent, tool_name, tool_use_id,
+        tool_category, rule_id, rule_description,
+        action, reason, matched_pattern,
+        tool_input_summary, enforcement_mode,
+        created_at, created_at_epoch,
+        evaluation_ms, source_machine_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 def prune_old_events(activity_store: ActivityStore, retention_days: int) -> int:
     """Delete governance audit events older than retention_days.
@@ -54,10 +81,50 @@ def prune_old_events(activity_store: ActivityStore, retention_days: int) -> int:
 
 
 class GovernanceAuditWriter:
-    """Writes governance evaluation results to the audit events table."""
+    """Buffers governance evaluation results and writes them in batches.
+
+    The writer thread starts on the first recorded event and can be
+    restarted after ``stop()``.
+    """
+
+    def __init__(
+        self,
+        activity_store: ActivityStore,
+        batch_size: int = GOVERNANCE_AUDIT_FLUSH_BATCH_SIZE,
+        flush_interval_ms: int = GOVERNANCE_AUDIT_FLUSH_INTERVAL_MS,
+        max_buffer: int = GOVERNANCE_AUDIT_BUFFER_MAX,
+    ) -> None:
+        """Initialize the writer.
 
-    def __init__(self, activity_store: ActivityStore) -> None:
+        Args:
+            activity_store: Store whose connection events are inserted through.
+            batch_size: Buffered events that trigger an immediate write.
+            flush_interval_ms: Longest time an event waits before being written.
+            max_buffer: Ring buffer capacity; the oldest event is dropped when full.
+        """
         self._store = activity_store
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self._buffer: deque[tuple[Any, ...]] = deque(maxlen=max_buffer)
+        self._buffer_lock = threading.Lock()
+        # Serializes writes so flush() returns only once earlier events committed
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._flushes = 0
+        self._events_written = 0
+        self._events_dropped = 0
+        self._total_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._last_flush_ms = 0.0
+
+    @property
+    def store(self) -> ActivityStore:
+        """The activity store events are written to."""
+        return self._store
 
     def record(
         self,
@@ -70,7 +137,7 @@ class GovernanceAuditWriter:
         evaluation_ms: int | None = None,
         tool_input_summary: str | None = None,
     ) -> None:
-        """Record a governance evaluation to the audit events table.
+        """Buffer a governance evaluation for the audit events table.
 
         Args:
             session_id: Current session ID.
@@ -89,38 +156,139 @@ class GovernanceAuditWriter:
         # Get machine_id from activity store if available
         source_machine_id = getattr(self._store, "machine_id", None)
 
-        try:
-            conn = self._store._get_connection()
-            conn.execute(
-                """
-                INSERT INTO governance_audit_events (
-                    session_id, agent, tool_name, tool_use_id,
-                    tool_category, rule_id, rule_description,
-                    action, reason, matched_pattern,
-                    tool_input_summary, enforcement_mode,
-                    created_at, created_at_epoch,
-                    evaluation_ms, source_machine_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    session_id,
-                    agent,
-                    tool_name,
-                    tool_use_id,
-                    decision.tool_category,
-                    decision.rule_id or None,
-                    decision.rule_description or None,
-                    decision.action,
-                    decision.reason or None,
-                    decision.matched_pattern or None,
-                    tool_input_summary,
-                    enforcement_mode,
-                    created_at,
-                    created_at_epoch,
-                    evaluation_ms,
-                    source_machine_id,
-                ),
+        row = (
+            session_id,
+            agent,
+            tool_name,
+            tool_use_id,
+            decision.tool_category,
+            decision.rule_id or None,
+            decision.rule_description or None,
+            decision.action,
+            decision.reason or None,
+            decision.matched_pattern or None,
+            tool_input_summary,
+            enforcement_mode,
+            created_at,
+            created_at_epoch,
+            evaluation_ms,
+            source_machine_id,
+        )
+
+        self._ensure_running()
+        with self._buffer_lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                # deque(maxlen) evicts the oldest event on append
+                with self._stats_lock:
+                    self._events_dropped += 1
+            self._buffer.append(row)
+            pending = len(self._buffer)
+        if pending >= self.batch_size:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Write every buffered event on the caller's thread.
+
+        Returns:
+            Number of events written.
+        """
+        with self._write_lock:
+            with self._buffer_lock:
+                batch = list(self._buffer)
+                self._buffer.clear()
+            return self._write(batch)
+
+    def stop(self, timeout: float = GOVERNANCE_AUDIT_STOP_TIMEOUT_SECONDS) -> None:
+        """Write everything buffered and stop the writer thread."""
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._stopping = True
+                self._wake.set()
+                thread.join(timeout)
+                if thread.is_alive():
+                    logger.warning(f"Governance audit writer did not stop within {timeout}s")
+                self._stopping = False
+        self.flush()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Buffer depth, dropped events and flush latency for the status API."""
+        with self._buffer_lock:
+            buffered = len(self._buffer)
+        with self._stats_lock:
+            flushes = self._flushes or 1
+            return {
+                "buffered": buffered,
+                "flushes": self._flushes,
+                "events_written": self._events_written,
+                "events_dropped": self._events_dropped,
+                "avg_flush_ms": round(self._total_flush_ms / flushes, 2),
+                "max_flush_ms": round(self._max_flush_ms, 2),
+                "last_flush_ms": round(self._last_flush_ms, 2),
+            }
+
+    def _ensure_running(self) -> None:
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name=GOVERNANCE_AUDIT_WRITER_THREAD_NAME, daemon=True
             )
-            conn.commit()
+            self._thread.start()
+
+    def _run(self) -> None:
+        interval = self.flush_interval_ms / 1000
+        try:
+            while not self._stopping:
+                self._wake.wait(interval)
+                self._wake.clear()
+                self.flush()
+        finally:
+            # The writer's thread-local connection would otherwise leak
+            self._store._close_connections()
+
+    def _write(self, batch: list[tuple[Any, ...]]) -> int:
+        if not batch:
+            return 0
+        started = time.perf_counter()
+        try:
+            try:
+                with self._store._transaction() as conn:
+                    conn.executemany(_INSERT_SQL, batch)
+                written = len(batch)
+            except sqlite3.IntegrityError:
+                # FK violation (e.g. unknown session) — insert one by one, skipping bad rows
+                written = self._write_individually(batch)
         except sqlite3.Error as e:
-            logger.warning("Failed to record governance audit event: %s", e)
+            logger.warning("Failed to record %d governance audit events: %s", len(batch), e)
+            with self._stats_lock:
+                self._events_dropped += len(batch)
+            return 0
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            self._flushes += 1
+            self._events_written += written
+            self._events_dropped += len(batch) - written
+            self._total_flush_ms += elapsed_ms
+            self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+            self._last_flush_ms = elapsed_ms
+        logger.debug(f"Wrote {written} governance audit events in {elapsed_ms:.1f}ms")
+        return written
+
+    def _write_individually(self, batch: list[tuple[Any, ...]]) -> int:
+        conn = self._store._get_connection()
+        written = 0
+        for row in batch:
+            try:
+                conn.execute(_INSERT_SQL, row)
+                written += 1
+            except sqlite3.IntegrityError:
+                logger.debug("Skipped governance audit event for session %s", row[0])
+        conn.commit()
+        if written < len(batch):
+            logger.warning(
+                "Skipped %d/%d governance audit events due to FK violations",
+                len(batch) - written,
+                len(batch),
+            )
+        return written
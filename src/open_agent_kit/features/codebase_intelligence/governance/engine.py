@@ -10,6 +10,7 @@ from __future__ import annotations
 import fnmatch
 import json
 import logging
+import os
 import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -29,6 +30,7 @@ from open_agent_kit.features.codebase_intelligence.constants import (
     GOVERNANCE_TOOL_CATEGORY_NETWORK,
     GOVERNANCE_TOOL_CATEGORY_OTHER,
     GOVERNANCE_TOOL_CATEGORY_SHELL,
+    GOVERNANCE_TOOL_RULES_CACHE_SIZE,
 )
 
 if TYPE_CHECKING:
@@ -65,22 +67,34 @@ class GovernanceDecision:
 
 @dataclass
 class _CompiledRule:
-    """Internal representation of a governance rule with pre-compiled regex."""
+    """Internal representation of a governance rule with pre-compiled regexes."""
 
     rule: GovernanceRule
     compiled_pattern: re.Pattern[str] | None = None
+    compiled_path: re.Pattern[str] | None = None
+    # Position in the policy; buckets are merged back in this order
+    order: int = 0
 
 
 class GovernanceEngine:
     """Evaluates tool calls against governance policy rules.
 
-    Pre-compiles regex patterns at construction time for efficient matching.
-    Thread-safe for concurrent evaluation (read-only after init).
+    Pre-compiles the policy at construction time: regex and path patterns
+    are compiled, and rules are bucketed by exact tool name versus tool
+    glob so a tool call only looks at rules that can match its tool.
+    Thread-safe for concurrent evaluation (the per-tool rule cache only
+    ever stores complete lists).
     """
 
     def __init__(self, config: GovernanceConfig) -> None:
         self._config = config
         self._compiled_rules: list[_CompiledRule] = []
+        # Rules for one exact (case-normalized) tool name
+        self._exact_rules: dict[str, list[_CompiledRule]] = {}
+        # Rules whose tool is a glob (None matches every tool)
+        self._wildcard_rules: list[tuple[re.Pattern[str] | None, _CompiledRule]] = []
+        # Tool name -> rules that apply to it, in policy order
+        self._tool_rules: dict[str, tuple[_CompiledRule, ...]] = {}
 
         for rule in config.rules:
             if not rule.enabled:
@@ -97,7 +111,54 @@ class GovernanceEngine:
                         e,
                     )
                     continue
-            self._compiled_rules.append(_CompiledRule(rule=rule, compiled_pattern=compiled))
+            compiled_path = (
+                re.compile(fnmatch.translate(os.path.normcase(rule.path_pattern)))
+                if rule.path_pattern
+                else None
+            )
+            compiled_rule = _CompiledRule(
+                rule=rule,
+                compiled_pattern=compiled,
+                compiled_path=compiled_path,
+                order=len(self._compiled_rules),
+            )
+            self._compiled_rules.append(compiled_rule)
+
+            if rule.tool == "*":
+                self._wildcard_rules.append((None, compiled_rule))
+            elif _is_glob(rule.tool):
+                tool_regex = re.compile(fnmatch.translate(os.path.normcase(rule.tool)))
+                self._wildcard_rules.append((tool_regex, compiled_rule))
+            else:
+                self._exact_rules.setdefault(os.path.normcase(rule.tool), []).append(compiled_rule)
+
+    def _rules_for_tool(self, tool_name: str) -> tuple[_CompiledRule, ...]:
+        """Get the rules whose tool condition matches a tool, in policy order.
+
+        Args:
+            tool_name: Tool name being called.
+
+        Returns:
+            Candidate rules; their pattern and path conditions still apply.
+        """
+        cached = self._tool_rules.get(tool_name)
+        if cached is not None:
+            return cached
+
+        normalized = os.path.normcase(tool_name)
+        candidates = list(self._exact_rules.get(normalized, ()))
+        candidates.extend(
+            compiled
+            for tool_regex, compiled in self._wildcard_rules
+            if tool_regex is None or tool_regex.match(normalized)
+        )
+        candidates.sort(key=lambda compiled: compiled.order)
+        rules = tuple(candidates)
+
+        if len(self._tool_rules) >= GOVERNANCE_TOOL_RULES_CACHE_SIZE:
+            self._tool_rules.clear()
+        self._tool_rules[tool_name] = rules
+        return rules
 
     def evaluate(self, tool_name: str, tool_input: dict[str, object] | str) -> GovernanceDecision:
         """Evaluate a tool call against all enabled governance rules.
@@ -113,19 +174,11 @@ class GovernanceEngine:
             GovernanceDecision with the evaluation result.
         """
         category = self.categorize_tool(tool_name)
+        call = _ToolCall(tool_input)
 
-        # Serialize tool_input to string for regex matching
-        if isinstance(tool_input, dict):
-            try:
-                input_str = json.dumps(tool_input, default=str)
-            except (TypeError, ValueError):
-                input_str = str(tool_input)
-        else:
-            input_str = str(tool_input)
-
-        for compiled in self._compiled_rules:
+        for compiled in self._rules_for_tool(tool_name):
             rule = compiled.rule
-            if not _rule_matches(rule, compiled.compiled_pattern, tool_name, input_str):
+            if not _rule_matches(compiled, call):
                 continue
 
             action = rule.action
@@ -190,72 +243,101 @@ class GovernanceEngine:
         return GOVERNANCE_TOOL_CATEGORY_OTHER
 
 
-def _rule_matches(
-    rule: GovernanceRule,
-    compiled_pattern: re.Pattern[str] | None,
-    tool_name: str,
-    input_str: str,
-) -> bool:
-    """Check if a rule matches a tool call (AND semantics).
+class _ToolCall:
+    """Tool input of one call, serialized and parsed at most once.
+
+    Both forms are produced lazily, only when a candidate rule needs them.
+    """
+
+    _UNSET = object()
+
+    def __init__(self, tool_input: dict[str, object] | str) -> None:
+        self._input = tool_input
+        self._input_str: str | None = None
+        self._file_path: object = self._UNSET
+
+    @property
+    def input_str(self) -> str:
+        """Tool input serialized for regex matching."""
+        if self._input_str is None:
+            if isinstance(self._input, dict):
+                try:
+                    self._input_str = json.dumps(self._input, default=str)
+                except (TypeError, ValueError):
+                    self._input_str = str(self._input)
+            else:
+                self._input_str = str(self._input)
+        return self._input_str
+
+    @property
+    def file_path(self) -> str | None:
+        """File path from the tool input, or None if it has none."""
+        if self._file_path is self._UNSET:
+            self._file_path = _extract_file_path(self._input)
+        return self._file_path  # type: ignore[return-value]
+
 
-    All present conditions must match:
-    - tool: fnmatch against tool_name
+def _is_glob(pattern: str) -> bool:
+    """Check whether a tool pattern uses fnmatch wildcards."""
+    return any(char in pattern for char in "*?[")
+
+
+def _rule_matches(compiled: _CompiledRule, call: _ToolCall) -> bool:
+    """Check if a candidate rule matches a tool call (AND semantics).
+
+    The tool condition is already satisfied (see _rules_for_tool). All
+    other present conditions must match:
     - pattern: regex search against serialized tool_input
     - path_pattern: fnmatch against file_path extracted from tool_input
 
     Args:
-        rule: The governance rule to check.
-        compiled_pattern: Pre-compiled regex for rule.pattern (or None).
-        tool_name: Tool name being called.
-        input_str: Serialized tool input string.
+        compiled: The compiled governance rule to check.
+        call: The tool call's input.
 
     Returns:
         True if all present conditions match.
     """
-    # Tool match (fnmatch allows "*" wildcard)
-    if rule.tool != "*" and not fnmatch.fnmatch(tool_name, rule.tool):
-        return False
-
     # Pattern match (regex on serialized input)
-    if compiled_pattern is not None:
-        if not compiled_pattern.search(input_str):
+    if compiled.compiled_pattern is not None:
+        if not compiled.compiled_pattern.search(call.input_str):
             return False
 
     # Path pattern match (fnmatch on file_path from input)
-    if rule.path_pattern:
-        # Try to extract file_path from input JSON
-        file_path = _extract_file_path(input_str)
+    if compiled.compiled_path is not None:
+        file_path = call.file_path
         if file_path is None:
             return False
-        if not fnmatch.fnmatch(file_path, rule.path_pattern):
+        if not compiled.compiled_path.match(os.path.normcase(file_path)):
             return False
 
     return True
 
 
-def _extract_file_path(input_str: str) -> str | None:
-    """Extract file_path from serialized tool input.
+def _extract_file_path(tool_input: dict[str, object] | str) -> str | None:
+    """Extract file_path from tool input.
 
-    Looks for common field names: file_path, path, command (for Bash).
+    Looks for common field names: file_path, path, filename.
 
     Args:
-        input_str: Serialized tool input JSON.
+        tool_input: Tool input as dict or JSON string.
 
     Returns:
         Extracted file path, or None if not found.
     """
-    try:
-        data = json.loads(input_str)
-        if not isinstance(data, dict):
+    data: object = tool_input
+    if isinstance(tool_input, str):
+        try:
+            data = json.loads(tool_input)
+        except (json.JSONDecodeError, TypeError):
             return None
-        # Try common field names
-        for key in ("file_path", "path", "filename"):
-            val = data.get(key)
-            if isinstance(val, str) and val:
-                return val
-        return None
-    except (json.JSONDecodeError, TypeError):
+    if not isinstance(data, dict):
         return None
+    # Try common field names
+    for key in ("file_path", "path", "filename"):
+        val = data.get(key)
+        if isinstance(val, str) and val:
+            return val
+    return None
 
 
 def _describe_match(rule: GovernanceRule, tool_name: str) -> str:
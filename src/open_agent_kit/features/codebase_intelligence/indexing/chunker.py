@@ -4,12 +4,16 @@ Provides both line-based chunking (fallback) and AST-aware chunking
 for supported languages (Python, JavaScript/TypeScript).
 """
 
+import importlib
 import importlib.util
 import logging
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from open_agent_kit.features.codebase_intelligence.constants import AST_TREE_CACHE_SIZE
 from open_agent_kit.features.codebase_intelligence.memory.store import CodeChunk
 
 logger = logging.getLogger(__name__)
@@ -185,6 +189,14 @@ class CodeChunker:
         self.config = config or ChunkerConfig()
         self._has_tree_sitter = importlib.util.find_spec("tree_sitter") is not None
         self._available_languages = self._check_language_support()
+        # tree-sitter Language objects, built once per language and shared by
+        # threads; Parsers are not thread-safe, so each thread gets its own.
+        self._languages: dict[str, Any] = {}
+        self._languages_lock = threading.Lock()
+        self._thread_parsers = threading.local()
+        # filepath -> (source bytes, tree) for incremental reparsing
+        self._trees: OrderedDict[str, tuple[bytes, Any]] = OrderedDict()
+        self._trees_lock = threading.Lock()
         # Statistics tracking for AST usage
         self._stats: dict[str, Any] = {
             "ast_success": 0,
@@ -257,6 +269,19 @@ class CodeChunker:
         """
         return self._stats.copy()
 
+    def merge_stats(self, stats: dict[str, Any]) -> None:
+        """Add statistics collected by another chunker (e.g. a worker process).
+
+        Args:
+            stats: Statistics as returned by ``get_stats()``.
+        """
+        for key in ("ast_success", "ast_fallback", "line_based"):
+            self._stats[key] += stats.get(key, 0)
+        for language, counts in stats.get("by_language", {}).items():
+            merged = self._stats["by_language"].setdefault(language, {"ast": 0, "lines": 0})
+            merged["ast"] += counts.get("ast", 0)
+            merged["lines"] += counts.get("lines", 0)
+
     def reset_stats(self) -> None:
         """Reset chunking statistics."""
         self._stats = {
@@ -312,6 +337,7 @@ class CodeChunker:
         lines = chunk.content.split("\n")
         chunks = []
         part_num = 0
+        base_symbol = chunk.symbol or chunk.name or chunk.chunk_type
 
         current_lines: list[str] = []
         current_chars = 0
@@ -324,9 +350,10 @@ class CodeChunker:
             if current_chars + line_chars > self.config.max_chunk_chars and current_lines:
                 # Create chunk from accumulated lines
                 chunk_content = "\n".join(current_lines)
+                part_symbol = f"{base_symbol}_part{part_num}"
                 chunks.append(
                     CodeChunk(
-                        id=CodeChunk.generate_id(chunk.filepath, current_start_line, chunk_content),
+                        id=CodeChunk.generate_id(chunk.filepath, part_symbol, chunk_content),
                         content=chunk_content,
                         filepath=chunk.filepath,
                         language=chunk.language,
@@ -337,6 +364,7 @@ class CodeChunker:
                         parent_id=chunk.parent_id,
                         docstring=chunk.docstring if part_num == 0 else None,
                         signature=chunk.signature if part_num == 0 else None,
+                        symbol=part_symbol,
                     )
                 )
                 part_num += 1
@@ -353,9 +381,10 @@ class CodeChunker:
         # Add remaining lines as final chunk
         if current_lines:
             chunk_content = "\n".join(current_lines)
+            part_symbol = f"{base_symbol}_part{part_num}"
             chunks.append(
                 CodeChunk(
-                    id=CodeChunk.generate_id(chunk.filepath, current_start_line, chunk_content),
+                    id=CodeChunk.generate_id(chunk.filepath, part_symbol, chunk_content),
                     content=chunk_content,
                     filepath=chunk.filepath,
                     language=chunk.language,
@@ -364,6 +393,7 @@ class CodeChunker:
                     start_line=current_start_line,
                     end_line=chunk.end_line,
                     parent_id=chunk.parent_id,
+                    symbol=part_symbol,
                 )
             )
 
@@ -387,6 +417,7 @@ class CodeChunker:
         filepath: Path,
         content: str | None = None,
         display_path: str | None = None,
+        reuse_tree: bool = False,
     ) -> list[CodeChunk]:
         """Chunk a file into semantic units.
 
@@ -394,6 +425,9 @@ class CodeChunker:
             filepath: Path to the file.
             content: Optional pre-loaded content.
             display_path: Optional relative path for logging (defaults to filepath.name).
+            reuse_tree: Keep the file's syntax tree and reparse incrementally
+                from the previous one, if any. Meant for files that are
+                chunked repeatedly, like watcher updates.
 
         Returns:
             List of code chunks.
@@ -419,7 +453,7 @@ class CodeChunker:
         # Try AST-based chunking for supported languages
         if self.config.use_ast and language in LANGUAGE_AST_CONFIG:
             attempted_ast = True
-            chunks = self._chunk_with_ast(filepath_str, content, language)
+            chunks = self._chunk_with_ast(filepath_str, content, language, reuse_tree)
 
             # Check if AST actually produced semantic chunks (not just module chunks from fallback)
             if chunks:
@@ -461,6 +495,7 @@ class CodeChunker:
         for chunk in chunks:
             result.extend(self._split_oversized_chunk(chunk))
 
+        _disambiguate_ids(result)
         return result
 
     def _chunk_by_lines(
@@ -484,16 +519,18 @@ class CodeChunker:
 
         if len(lines) <= self.config.chunk_size:
             # File fits in one chunk
+            name = Path(filepath).stem
             chunks.append(
                 CodeChunk(
-                    id=CodeChunk.generate_id(filepath, 1, content),
+                    id=CodeChunk.generate_id(filepath, name, content),
                     content=content,
                     filepath=filepath,
                     language=language,
                     chunk_type="module",
-                    name=Path(filepath).stem,
+                    name=name,
                     start_line=1,
                     end_line=len(lines),
+                    symbol=name,
                 )
             )
             return chunks
@@ -506,17 +543,19 @@ class CodeChunker:
             end = min(start + self.config.chunk_size, len(lines))
             chunk_lines = lines[start:end]
             chunk_content = "\n".join(chunk_lines)
+            name = f"{Path(filepath).stem}_part{chunk_num}"
 
             chunks.append(
                 CodeChunk(
-                    id=CodeChunk.generate_id(filepath, start + 1, chunk_content),
+                    id=CodeChunk.generate_id(filepath, name, chunk_content),
                     content=chunk_content,
                     filepath=filepath,
                     language=language,
                     chunk_type="module",
-                    name=f"{Path(filepath).stem}_part{chunk_num}",
+                    name=name,
                     start_line=start + 1,
                     end_line=end,
+                    symbol=name,
                 )
             )
 
@@ -525,11 +564,73 @@ class CodeChunker:
 
         return chunks
 
+    def _get_parser(self, language: str) -> Any:
+        """Get this thread's tree-sitter parser for a language.
+
+        The language package is imported and its Language built once per
+        chunker; each thread builds its own Parser on first use.
+
+        Args:
+            language: Language identifier (a key of LANGUAGE_AST_CONFIG).
+
+        Returns:
+            A tree_sitter.Parser for the language.
+        """
+        parsers: dict[str, Any] | None = getattr(self._thread_parsers, "parsers", None)
+        if parsers is None:
+            parsers = {}
+            self._thread_parsers.parsers = parsers
+        parser = parsers.get(language)
+        if parser is not None:
+            return parser
+
+        from tree_sitter import Language, Parser  # type: ignore[import-not-found]
+
+        with self._languages_lock:
+            ts_language = self._languages.get(language)
+            if ts_language is None:
+                lang_module = importlib.import_module(LANGUAGE_AST_CONFIG[language]["package"])
+                ts_language = Language(lang_module.language())
+                self._languages[language] = ts_language
+        parser = Parser(ts_language)
+        parsers[language] = parser
+        return parser
+
+    def _parse(self, parser: Any, filepath: str, source: bytes, reuse_tree: bool) -> Any:
+        """Parse source, reusing the file's previous tree when asked to.
+
+        Args:
+            parser: Parser for the file's language.
+            filepath: File path string (tree cache key).
+            source: UTF-8 encoded file content.
+            reuse_tree: Whether to reparse incrementally and keep the tree.
+
+        Returns:
+            The parsed tree.
+        """
+        if not reuse_tree:
+            return parser.parse(source)
+
+        with self._trees_lock:
+            previous = self._trees.pop(filepath, None)
+        if previous is None:
+            tree = parser.parse(source)
+        else:
+            old_source, old_tree = previous
+            _apply_edit(old_tree, old_source, source)
+            tree = parser.parse(source, old_tree)
+        with self._trees_lock:
+            self._trees[filepath] = (source, tree)
+            while len(self._trees) > AST_TREE_CACHE_SIZE:
+                self._trees.popitem(last=False)
+        return tree
+
     def _chunk_with_ast(
         self,
         filepath: str,
         content: str,
         language: str,
+        reuse_tree: bool = False,
     ) -> list[CodeChunk]:
         """Generic AST chunker using declarative language configuration.
 
@@ -541,6 +642,7 @@ class CodeChunker:
             filepath: File path string.
             content: File content.
             language: Language identifier (e.g., 'python', 'javascript').
+            reuse_tree: Reparse incrementally from the file's cached tree.
 
         Returns:
             List of code chunks, or falls back to line-based chunking.
@@ -550,16 +652,11 @@ class CodeChunker:
             return self._chunk_by_lines(filepath, content, language)
 
         try:
-            # Dynamic import of the language package
-            lang_module = importlib.import_module(lang_config["package"])
-            from tree_sitter import Language, Parser  # type: ignore[import-not-found]
-
-            ts_language = Language(lang_module.language())
-            parser = Parser(ts_language)
-            tree = parser.parse(bytes(content, "utf8"))
+            parser = self._get_parser(language)
+            source = content.encode("utf8")
+            tree = self._parse(parser, filepath, source, reuse_tree)
 
             chunks: list[CodeChunk] = []
-            lines = content.split("\n")
 
             # Extract config options
             node_map: dict[str, str] = lang_config["node_map"]
@@ -607,12 +704,14 @@ class CodeChunker:
                             return f"{name_node.text.decode('utf8')}{child.text.decode('utf8')}"
                 return None
 
-            def process_node(node: Any, parent_id: str | None = None) -> None:
+            def process_node(
+                node: Any, parent_id: str | None = None, parent_symbol: str | None = None
+            ) -> None:
                 """Recursively process AST nodes."""
                 # Handle traverse-only nodes (like C# namespaces)
                 if node.type in traverse_only:
                     for child in node.children:
-                        process_node(child, parent_id)
+                        process_node(child, parent_id, parent_symbol)
                     return
 
                 chunk_type = node_map.get(node.type)
@@ -620,14 +719,21 @@ class CodeChunker:
                     name = get_name(node)
                     start_line = node.start_point[0] + 1
                     end_line = node.end_point[0] + 1
-                    chunk_content = "\n".join(lines[start_line - 1 : end_line])
+                    # Whole lines spanned by the node, sliced from the source
+                    line_start = node.start_byte - node.start_point[1]
+                    line_end = source.find(b"\n", node.end_byte)
+                    if line_end == -1:
+                        line_end = len(source)
+                    chunk_content = source[line_start:line_end].decode("utf8")
 
                     # Extract optional metadata
                     docstring = get_docstring(node) if chunk_type in ("function", "class") else None
                     signature = get_signature(node) if chunk_type == "function" else None
+                    label = name or chunk_type
+                    symbol = f"{parent_symbol}.{label}" if parent_symbol else label
 
                     chunk = CodeChunk(
-                        id=CodeChunk.generate_id(filepath, start_line, chunk_content),
+                        id=CodeChunk.generate_id(filepath, symbol, chunk_content),
                         content=chunk_content,
                         filepath=filepath,
                         language=language,
@@ -638,17 +744,18 @@ class CodeChunker:
                         parent_id=parent_id,
                         docstring=docstring,
                         signature=signature,
+                        symbol=symbol,
                     )
                     chunks.append(chunk)
 
                     # Process children for container types (classes, impl blocks, etc.)
                     if node.type in container_types:
                         for child in node.children:
-                            process_node(child, chunk.id)
+                            process_node(child, chunk.id, symbol)
                 else:
                     # Continue traversing
                     for child in node.children:
-                        process_node(child, parent_id)
+                        process_node(child, parent_id, parent_symbol)
 
             process_node(tree.root_node)
 
@@ -663,6 +770,60 @@ class CodeChunker:
             return self._chunk_by_lines(filepath, content, language)
 
 
+def _point_at(source: bytes, offset: int) -> tuple[int, int]:
+    """Get the tree-sitter (row, byte column) of a byte offset."""
+    row = source.count(b"\n", 0, offset)
+    return row, offset - (source.rfind(b"\n", 0, offset) + 1)
+
+
+def _common_prefix_len(a: bytes, b: bytes) -> int:
+    """Length of the common prefix of two byte strings (binary search on slices)."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _apply_edit(tree: Any, old_source: bytes, new_source: bytes) -> None:
+    """Describe the change from old to new source to a tree as one edit.
+
+    The edited span is everything between the common prefix and common
+    suffix, which lets tree-sitter reuse the untouched parts of the tree.
+    """
+    prefix = _common_prefix_len(old_source, new_source)
+    limit = min(len(old_source), len(new_source)) - prefix
+    suffix = _common_prefix_len(old_source[::-1][:limit], new_source[::-1][:limit])
+    old_end = len(old_source) - suffix
+    new_end = len(new_source) - suffix
+    tree.edit(
+        start_byte=prefix,
+        old_end_byte=old_end,
+        new_end_byte=new_end,
+        start_point=_point_at(old_source, prefix),
+        old_end_point=_point_at(old_source, old_end),
+        new_end_point=_point_at(new_source, new_end),
+    )
+
+
+def _disambiguate_ids(chunks: list[CodeChunk]) -> None:
+    """Suffix repeated chunk IDs within one file with ``#n``, in file order.
+
+    Two chunks only share an ID when they have the same symbol path and the
+    same content (e.g. a function defined twice). Without a suffix the store
+    would keep just one of them.
+    """
+    seen: dict[str, int] = {}
+    for chunk in chunks:
+        count = seen.get(chunk.id, 0) + 1
+        seen[chunk.id] = count
+        if count > 1:
+            chunk.id = f"{chunk.id}#{count}"
+
+
 def chunk_file(filepath: Path, config: ChunkerConfig | None = None) -> list[CodeChunk]:
     """Convenience function to chunk a single file.
 
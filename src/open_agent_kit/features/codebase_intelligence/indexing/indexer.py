@@ -3,18 +3,36 @@
 import fnmatch
 import logging
 import os
+import sys
 import time
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from open_agent_kit.features.codebase_intelligence.config import DEFAULT_EXCLUDE_PATTERNS
+from open_agent_kit.features.codebase_intelligence.constants import (
+    DEFAULT_INDEX_WORKERS,
+    PARALLEL_INDEX_MIN_FILES,
+)
 from open_agent_kit.features.codebase_intelligence.indexing.chunker import (
     ChunkerConfig,
     CodeChunker,
 )
-from open_agent_kit.features.codebase_intelligence.memory.store import VectorStore
+from open_agent_kit.features.codebase_intelligence.indexing.ignore import (
+    NEGATION_PREFIX,
+    IgnoreMatcher,
+    cached_matcher,
+)
+from open_agent_kit.features.codebase_intelligence.indexing.manifest import (
+    IndexManifest,
+    ManifestEntry,
+    hash_file,
+)
+from open_agent_kit.features.codebase_intelligence.indexing.parallel import ParallelChunker
+from open_agent_kit.features.codebase_intelligence.memory.store import CodeChunk, VectorStore
 
 logger = logging.getLogger(__name__)
 
@@ -123,6 +141,14 @@ class IndexStats:
     ast_success: int = 0
     ast_fallback: int = 0
     line_based: int = 0
+    # Incremental (manifest) statistics
+    files_reused: int = 0
+    files_reembedded: int = 0
+    files_removed: int = 0
+    # Chunk-level diff statistics (watcher updates)
+    embeds_avoided: int = 0
+    chunks_moved: int = 0
+    chunks_removed: int = 0
 
 
 @dataclass
@@ -132,6 +158,8 @@ class IndexerConfig:
     ignore_patterns: list[str] = field(default_factory=lambda: DEFAULT_EXCLUDE_PATTERNS.copy())
     max_file_size_kb: int = 500  # Skip files larger than this
     batch_size: int = 50  # Index files in batches
+    manifest_path: Path | None = None  # Per-file manifest for incremental builds
+    workers: int = DEFAULT_INDEX_WORKERS  # Chunking processes for large builds
 
 
 class CodebaseIndexer:
@@ -162,8 +190,11 @@ class CodebaseIndexer:
 
         # Note: .gitignore patterns are loaded fresh at index time in discover_files()
         # This ensures gitignore changes are picked up without daemon restart
+        self._ignore_matcher: IgnoreMatcher | None = None
+        self._ignore_matcher_key: tuple | None = None
 
         self.chunker = CodeChunker(chunker_config)
+        self.manifest = IndexManifest(self.config.manifest_path)
         self._stats = IndexStats()
 
     def _load_gitignore(self) -> list[str]:
@@ -180,9 +211,14 @@ class CodebaseIndexer:
                     if not line or line.startswith("#"):
                         continue
 
-                    # Skip negations for now (complexity)
-                    if line.startswith("!"):
-                        continue
+                    # Negations re-include paths; convert the rest of the line
+                    # the same way and keep the prefix on each glob
+                    prefix = ""
+                    if line.startswith(NEGATION_PREFIX):
+                        prefix = NEGATION_PREFIX
+                        line = line[len(NEGATION_PREFIX) :]
+                        if not line:
+                            continue
 
                     # Handle directories (ending with /)
                     if line.endswith("/"):
@@ -190,20 +226,20 @@ class CodebaseIndexer:
                         clean_dir = line.rstrip("/")
                         if clean_dir.startswith("/"):
                             # Rooted: '/build/' -> 'build/**'
-                            patterns.append(f"{clean_dir.lstrip('/')}/**")
+                            patterns.append(f"{prefix}{clean_dir.lstrip('/')}/**")
                         else:
                             # Anywhere: 'build/' -> 'build/**', '**/build/**'
-                            patterns.append(f"{clean_dir}/**")
-                            patterns.append(f"**/{clean_dir}/**")
+                            patterns.append(f"{prefix}{clean_dir}/**")
+                            patterns.append(f"{prefix}**/{clean_dir}/**")
                     else:
                         # Handle files
                         if line.startswith("/"):
                             # Rooted file: '/todo.txt' -> 'todo.txt'
-                            patterns.append(line.lstrip("/"))
+                            patterns.append(f"{prefix}{line.lstrip('/')}")
                         else:
                             # Anywhere: 'start.sh' -> 'start.sh', '**/start.sh'
-                            patterns.append(line)
-                            patterns.append(f"**/{line}")
+                            patterns.append(f"{prefix}{line}")
+                            patterns.append(f"{prefix}**/{line}")
 
             logger.info(f"Loaded {len(patterns)} patterns from .gitignore")
             return patterns
@@ -254,60 +290,65 @@ class CodebaseIndexer:
             logger.warning(f"Path validation failed for {filepath}: {e}")
             return False
 
+    def _build_ignore_matcher(self) -> IgnoreMatcher:
+        """Compile config patterns merged with freshly loaded .gitignore patterns.
+
+        The matcher is kept for ``_should_ignore`` so the watcher applies
+        the same rules as the last discovery run.
+
+        Returns:
+            Compiled matcher for this discovery run.
+        """
+        # Merge config patterns with gitignore for this discovery run
+        # This ensures gitignore is always respected, even if config patterns change
+        all_patterns = list(self.config.ignore_patterns)
+        seen = set(all_patterns)
+        for pattern in self._load_gitignore():
+            if pattern not in seen:
+                seen.add(pattern)
+                all_patterns.append(pattern)
+
+        self._ignore_matcher = IgnoreMatcher(all_patterns)
+        self._ignore_matcher_key = tuple(self.config.ignore_patterns)
+        return self._ignore_matcher
+
+    def invalidate_ignore_matcher(self) -> None:
+        """Drop the compiled matcher so the next check reloads .gitignore.
+
+        Called by the watcher when .gitignore changes; discovery always
+        rebuilds the matcher itself.
+        """
+        self._ignore_matcher = None
+
+    def _get_ignore_matcher(self) -> IgnoreMatcher:
+        """Get the compiled matcher, rebuilding it if the config patterns changed."""
+        matcher = self._ignore_matcher
+        if matcher is None or self._ignore_matcher_key != tuple(self.config.ignore_patterns):
+            return self._build_ignore_matcher()
+        return matcher
+
     def _get_ignore_pattern(self, path: Path, patterns: list[str] | None = None) -> str | None:
         """Get the pattern that causes a path to be ignored.
 
         Args:
             path: Path to check (relative to project root).
             patterns: Optional list of patterns to check against.
-                     If None, uses self.config.ignore_patterns.
+                     If None, uses config patterns merged with .gitignore.
 
         Returns:
             The matching pattern, or None if not ignored.
         """
-        path_str = str(path)
-        path_parts = path.parts
-
-        check_patterns = patterns if patterns is not None else self.config.ignore_patterns
-        for pattern in check_patterns:
-            # Check full path match (e.g., "docs/**" matches "docs/file.py")
-            if fnmatch.fnmatch(path_str, pattern):
-                return pattern
-
-            # Check just the filename (e.g., "*.log" matches "app.log")
-            if fnmatch.fnmatch(path.name, pattern):
-                return pattern
-
-            # Check if any path component matches the pattern exactly
-            # This handles simple directory names like "docs" or "vendor"
-            # which should exclude files like "docs/file.py" or "vendor/lib/code.py"
-            if pattern in path_parts:
-                return pattern
-
-            # Check glob pattern against each path component
-            # This handles patterns like "node_*" matching "node_modules"
-            for part in path_parts:
-                if fnmatch.fnmatch(part, pattern):
-                    return pattern
-
-            # Check if pattern is a path prefix (handles patterns like ".claude/commands")
-            # This matches files like ".claude/commands/foo.md"
-            if "/" in pattern or "\\" in pattern:
-                # Normalize pattern to use forward slashes for comparison
-                normalized_pattern = pattern.replace("\\", "/")
-                normalized_path = path_str.replace("\\", "/")
-                # Check if path starts with pattern (as a directory prefix)
-                if normalized_path.startswith(normalized_pattern + "/"):
-                    return pattern
-                # Also check exact match for the directory itself
-                if normalized_path == normalized_pattern:
-                    return pattern
-
-        return None
+        if patterns is not None:
+            matcher = cached_matcher(tuple(patterns))
+        else:
+            matcher = self._get_ignore_matcher()
+        return matcher.match(path)
 
     def _should_ignore(self, path: Path) -> bool:
         """Check if a path should be ignored.
 
+        Uses the same compiled config and .gitignore patterns as discovery.
+
         Args:
             path: Path to check (relative to project root).
 
@@ -351,14 +392,7 @@ class CodebaseIndexer:
             List of file paths to index.
         """
         # Load gitignore patterns fresh each time (picks up changes without restart)
-        gitignore_patterns = self._load_gitignore()
-
-        # Merge config patterns with gitignore for this discovery run
-        # This ensures gitignore is always respected, even if config patterns change
-        all_patterns = list(self.config.ignore_patterns)
-        for pattern in gitignore_patterns:
-            if pattern not in all_patterns:
-                all_patterns.append(pattern)
+        matcher = self._build_ignore_matcher()
 
         files = []
 
@@ -372,16 +406,14 @@ class CodebaseIndexer:
                 continue
 
             # Prune ignored directories in-place (prevents descent)
-            dirs[:] = [
-                d for d in dirs if not self._get_ignore_pattern(relative_root / d, all_patterns)
-            ]
+            dirs[:] = [d for d in dirs if not matcher.match(relative_root / d)]
 
             for filename in filenames:
                 filepath = root_path / filename
                 relative = relative_root / filename
 
                 # Check ignore patterns FIRST - skip early without logging warnings
-                ignored_by = self._get_ignore_pattern(relative, all_patterns)
+                ignored_by = matcher.match(relative)
                 if ignored_by:
                     if filepath.suffix.lower() in INDEXABLE_EXTENSIONS:
                         logger.debug(f"Excluded {relative} (pattern: {ignored_by})")
@@ -425,8 +457,11 @@ class CodebaseIndexer:
             relative_path = filepath
 
         try:
+            fingerprint = self._file_fingerprint(filepath) if self.manifest.enabled else None
             chunks = self.chunker.chunk_file(filepath, display_path=str(relative_path))
             if not chunks:
+                if fingerprint is not None:
+                    self.manifest.put(str(relative_path), fingerprint)
                 return 0
 
             # Update filepath to be relative
@@ -434,6 +469,9 @@ class CodebaseIndexer:
                 chunk.filepath = str(relative_path)
 
             self.vector_store.add_code_chunks(chunks)
+            if fingerprint is not None:
+                fingerprint.chunk_ids = self._unique_chunk_ids(chunks)
+                self.manifest.put(str(relative_path), fingerprint)
             return len(chunks)
 
         except (OSError, ValueError, TypeError) as e:
@@ -449,11 +487,18 @@ class CodebaseIndexer:
     ) -> IndexStats:
         """Build or rebuild the index.
 
+        When a manifest is configured, incremental builds only chunk and embed
+        files that are new or whose content changed since they were last
+        indexed, and delete the chunks of files that no longer exist. If the
+        manifest is missing or disagrees with the code collection, the build
+        falls back to a full rebuild.
+
         Args:
             full_rebuild: If True, clear existing index first.
             progress_callback: Optional callback(current, total) for progress.
-            use_batched_embedding: If True, accumulate chunks and embed in batches.
-                This is more memory-efficient for large codebases.
+            use_batched_embedding: If True, stream chunks into batched embedding
+                requests. Memory use is bounded by the batch size rather than
+                the size of the codebase.
 
         Returns:
             IndexStats with results.
@@ -464,53 +509,25 @@ class CodebaseIndexer:
         # Reset chunker stats for this indexing run
         self.chunker.reset_stats()
 
+        if not full_rebuild and self.manifest.enabled and not self._manifest_in_sync():
+            logger.info("Index manifest is missing or out of sync with the code index")
+            full_rebuild = True
+
         if full_rebuild:
             logger.info("Starting full index rebuild (memories preserved)")
             self.vector_store.clear_code_index()
+            if self.manifest.enabled:
+                self.manifest.clear(self.vector_store.embedding_provider.dimensions)
         else:
             logger.info("Starting incremental index update")
 
         files = self.discover_files()
+        if self.manifest.enabled and not full_rebuild:
+            files = self._select_changed_files(files)
         total_files = len(files)
 
         if use_batched_embedding:
-            # Accumulate all chunks first, then embed in batches
-            # This is more efficient for embedding APIs that support batching
-            all_chunks = []
-
-            for i, filepath in enumerate(files):
-                try:
-                    chunks = self._chunk_file(filepath)
-                    if chunks:
-                        all_chunks.extend(chunks)
-                        self._stats.files_processed += 1
-                    else:
-                        self._stats.files_skipped += 1
-                except (OSError, ValueError, TypeError) as e:
-                    logger.error(f"Error chunking {filepath}: {e}")
-                    self._stats.errors += 1
-                    self._stats.files_skipped += 1
-
-                # Report file processing progress (first half)
-                if progress_callback:
-                    progress_callback(i + 1, total_files * 2)
-
-            # Now embed and store all chunks in batches
-            if all_chunks:
-                logger.info(f"Embedding {len(all_chunks)} chunks in batches...")
-
-                def embedding_progress(current: int, total: int) -> None:
-                    if progress_callback:
-                        # Second half of progress
-                        progress_callback(
-                            total_files + (current * total_files // total), total_files * 2
-                        )
-
-                self._stats.chunks_indexed = self.vector_store.add_code_chunks_batched(
-                    all_chunks,
-                    batch_size=self.config.batch_size,
-                    progress_callback=embedding_progress,
-                )
+            self._index_files_streaming(files, self._stats, progress_callback)
         else:
             # Original per-file indexing approach
             for i, filepath in enumerate(files):
@@ -531,6 +548,9 @@ class CodebaseIndexer:
                 if progress_callback:
                     progress_callback(i + 1, total_files)
 
+        self._stats.files_reembedded = self._stats.files_processed
+        self.manifest.save()
+
         self._stats.duration_seconds = time.time() - start_time
         self._stats.last_indexed = datetime.now()
 
@@ -544,17 +564,303 @@ class CodebaseIndexer:
             f"Indexing complete: {self._stats.files_processed} files, "
             f"{self._stats.chunks_indexed} chunks in {self._stats.duration_seconds:.1f}s"
         )
+        if self.manifest.enabled and not full_rebuild:
+            logger.info(
+                f"Incremental update: {self._stats.files_reused} files reused, "
+                f"{self._stats.files_reembedded} re-embedded, "
+                f"{self._stats.files_removed} removed"
+            )
 
         # Log AST usage statistics
         self.chunker.log_stats_summary()
 
         return self._stats
 
-    def _chunk_file(self, filepath: Path) -> list:
+    def _index_files_streaming(
+        self,
+        files: list[Path],
+        stats: IndexStats,
+        progress_callback: Callable[[int, int], None] | None,
+        stored: dict[str, dict[str, dict[str, Any]]] | None = None,
+    ) -> None:
+        """Chunk, embed and store files as one streaming pipeline.
+
+        Files are chunked lazily as the vector store pulls chunks into
+        embedding batches, so only the batches in flight and the chunks of
+        the current file are held in memory. A file counts as done (for
+        progress and the manifest) once its last chunk has been stored.
+
+        Args:
+            files: Files to index.
+            stats: Receives the counts for this run.
+            progress_callback: Optional callback(files_done, total_files).
+            stored: Chunk metadata already in the store, per manifest key and
+                chunk ID. When given, each file is diffed against it: only
+                new chunks are embedded, moved chunks get a metadata update
+                and chunks that disappeared are deleted.
+        """
+        total_files = len(files)
+        # (chunks yielded once this file is fully consumed, manifest key, entry)
+        # for files whose chunks are not all stored yet, in yield order
+        pending: deque[tuple[int, str, ManifestEntry | None]] = deque()
+        files_done = 0
+        chunks_stored = 0
+        moved: list[CodeChunk] = []
+        stale_ids: list[str] = []
+
+        def complete_through(stored: int) -> None:
+            nonlocal files_done, chunks_stored
+            chunks_stored = stored
+            completed = 0
+            while pending and pending[0][0] <= chunks_stored:
+                _, relative_key, entry = pending.popleft()
+                if entry is not None:
+                    # Manifest entries are committed only after their chunks are stored
+                    self.manifest.put(relative_key, entry)
+                completed += 1
+            if completed:
+                files_done += completed
+                if progress_callback:
+                    progress_callback(files_done, total_files)
+
+        def stream_chunks() -> Iterator[CodeChunk]:
+            chunks_yielded = 0
+            # Diffed files are re-chunked on every edit: keep their syntax trees
+            chunked = self._iter_chunked_files(files, stats, reuse_trees=stored is not None)
+            for filepath, chunks, entry in chunked:
+                if chunks:
+                    stats.files_processed += 1
+                else:
+                    stats.files_skipped += 1
+                if entry is not None:
+                    entry.chunk_ids = self._unique_chunk_ids(chunks)
+
+                relative_key = self._relative_key(filepath)
+                if stored is not None:
+                    chunks = self._diff_chunks(
+                        chunks, stored.pop(relative_key, {}), moved, stale_ids, stats
+                    )
+
+                chunks_yielded += len(chunks)
+                pending.append((chunks_yielded, relative_key, entry))
+                if not chunks:
+                    # Done already, unless earlier files are still in flight
+                    complete_through(chunks_stored)
+                yield from chunks
+                # Drop this file's chunks before chunking the next one
+                del chunks
+
+        stats.chunks_indexed += self.vector_store.add_code_chunks_batched(
+            stream_chunks(),
+            batch_size=self.config.batch_size,
+            progress_callback=lambda done, _total: complete_through(done),
+        )
+        if moved:
+            self.vector_store.update_code_metadata(moved)
+        if stale_ids:
+            stats.chunks_removed += self.vector_store.delete_code_by_ids(stale_ids)
+        # Everything yielded has been stored once the call returns
+        complete_through(sys.maxsize)
+
+    def _diff_chunks(
+        self,
+        chunks: list[CodeChunk],
+        previous: dict[str, dict[str, Any]],
+        moved: list[CodeChunk],
+        stale_ids: list[str],
+        stats: IndexStats,
+    ) -> list[CodeChunk]:
+        """Diff a file's fresh chunks against the chunks stored for it.
+
+        Chunk IDs depend on symbol path and content, not line numbers, so a
+        chunk whose ID is already stored has an up-to-date embedding.
+
+        Args:
+            chunks: Chunks just produced for the file.
+            previous: Stored metadata of the file's chunks, by chunk ID.
+            moved: Receives stored chunks whose metadata changed.
+            stale_ids: Receives IDs of stored chunks that no longer exist.
+            stats: Receives the diff counts.
+
+        Returns:
+            Chunks that are new or changed and need embedding.
+        """
+        to_embed: list[CodeChunk] = []
+        current: set[str] = set()
+        for chunk in chunks:
+            if chunk.id in current:
+                continue
+            current.add(chunk.id)
+            metadata = previous.get(chunk.id)
+            if metadata is None:
+                to_embed.append(chunk)
+                continue
+            stats.embeds_avoided += 1
+            if metadata != chunk.to_metadata():
+                moved.append(chunk)
+                stats.chunks_moved += 1
+        stale_ids.extend(chunk_id for chunk_id in previous if chunk_id not in current)
+        return to_embed
+
+    def _iter_chunked_files(
+        self, files: list[Path], stats: IndexStats, reuse_trees: bool = False
+    ) -> Iterator[tuple[Path, list[CodeChunk], ManifestEntry | None]]:
+        """Chunk and fingerprint files, in order.
+
+        Large builds are chunked on a process pool when ``config.workers``
+        is above 1; smaller ones stay in-process, where starting workers
+        would cost more than it saves.
+
+        Args:
+            files: Files to chunk.
+            stats: Receives chunking errors.
+            reuse_trees: Reparse in-process files incrementally from their
+                cached syntax trees (see CodeChunker.chunk_file).
+
+        Yields:
+            (filepath, chunks, manifest entry without chunk IDs) per file.
+            The entry is None when the manifest is disabled or chunking failed.
+        """
+        fingerprint = self.manifest.enabled
+        if self.config.workers > 1 and len(files) >= PARALLEL_INDEX_MIN_FILES:
+            logger.info(f"Chunking {len(files)} files with {self.config.workers} workers")
+            with ParallelChunker(
+                self.project_root, self.chunker.config, self.config.workers
+            ) as pool:
+                for result in pool.chunk_files(files, fingerprint, stats_sink=self.chunker):
+                    if result.error is not None:
+                        logger.warning(f"Failed to chunk {result.filepath}: {result.error}")
+                        stats.errors += 1
+                    yield result.filepath, result.chunks(), result.entry
+            return
+
+        for filepath in files:
+            entry: ManifestEntry | None = None
+            chunks: list[CodeChunk] = []
+            errors_before = stats.errors
+            try:
+                entry = self._file_fingerprint(filepath) if fingerprint else None
+                chunks = self._chunk_file(filepath, stats, reuse_tree=reuse_trees)
+            except (OSError, ValueError, TypeError) as e:
+                logger.error(f"Error chunking {filepath}: {e}")
+                stats.errors += 1
+            if stats.errors != errors_before:
+                entry = None
+            yield filepath, chunks, entry
+
+    def _relative_key(self, filepath: Path) -> str:
+        """Get the manifest key (project-relative path) for a file."""
+        try:
+            return str(filepath.relative_to(self.project_root))
+        except ValueError:
+            return str(filepath)
+
+    @staticmethod
+    def _unique_chunk_ids(chunks: list) -> list[str]:
+        """Get chunk IDs in order, without the duplicates the store drops."""
+        return list(dict.fromkeys(chunk.id for chunk in chunks))
+
+    def _file_fingerprint(
+        self, filepath: Path, previous: ManifestEntry | None = None
+    ) -> ManifestEntry:
+        """Fingerprint a file for the manifest.
+
+        The content hash is only recomputed when mtime or size differ from
+        the previous entry, so unchanged files cost a single stat().
+
+        Args:
+            filepath: Path to the file.
+            previous: Existing manifest entry for the file, if any.
+
+        Returns:
+            Entry without chunk IDs, or ``previous`` itself if mtime and size match.
+        """
+        stat = filepath.stat()
+        if (
+            previous is not None
+            and previous.mtime_ns == stat.st_mtime_ns
+            and previous.size == stat.st_size
+        ):
+            return previous
+        return ManifestEntry(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            content_hash=hash_file(filepath),
+        )
+
+    def _manifest_in_sync(self) -> bool:
+        """Check that the manifest describes the current code collection.
+
+        The collection can be cleared or recreated without the indexer
+        knowing (devtools reset, dimension change, hard reset), in which case
+        reusing manifest entries would leave files unindexed.
+        """
+        if self.manifest.embedding_dimensions != self.vector_store.embedding_provider.dimensions:
+            return False
+        return self.manifest.total_chunks() == self.vector_store.count_code_chunks()
+
+    def _select_changed_files(self, files: list[Path]) -> list[Path]:
+        """Filter discovered files down to those that need (re-)embedding.
+
+        Unchanged files are skipped, chunks of changed files are deleted so
+        they can be replaced, and files that vanished since the last build are
+        removed from both the code index and the manifest.
+
+        Args:
+            files: Files returned by discover_files().
+
+        Returns:
+            Files that are new or whose content changed.
+        """
+        changed: list[Path] = []
+        stale_ids: list[str] = []
+        seen: set[str] = set()
+
+        for filepath in files:
+            relative_key = self._relative_key(filepath)
+            seen.add(relative_key)
+            previous = self.manifest.get(relative_key)
+            if previous is None:
+                changed.append(filepath)
+                continue
+
+            try:
+                fingerprint = self._file_fingerprint(filepath, previous)
+            except OSError as e:
+                logger.debug(f"Could not fingerprint {relative_key}: {e}")
+                fingerprint = None
+
+            if fingerprint is not None and fingerprint.content_hash == previous.content_hash:
+                if fingerprint is not previous:
+                    # Touched but not modified (e.g. git checkout): refresh stat fields
+                    fingerprint.chunk_ids = previous.chunk_ids
+                    self.manifest.put(relative_key, fingerprint)
+                self._stats.files_reused += 1
+                continue
+
+            stale_ids.extend(previous.chunk_ids)
+            self.manifest.remove(relative_key)
+            changed.append(filepath)
+
+        for relative_key in self.manifest.filepaths() - seen:
+            entry = self.manifest.remove(relative_key)
+            if entry is not None:
+                stale_ids.extend(entry.chunk_ids)
+                self._stats.files_removed += 1
+
+        if stale_ids:
+            self.vector_store.delete_code_by_ids(stale_ids)
+            logger.debug(f"Deleted {len(stale_ids)} stale chunks")
+
+        return changed
+
+    def _chunk_file(self, filepath: Path, stats: IndexStats, reuse_tree: bool = False) -> list:
         """Chunk a file without embedding.
 
         Args:
             filepath: Path to the file.
+            stats: Receives chunking errors.
+            reuse_tree: Reparse incrementally from the file's cached syntax tree.
 
         Returns:
             List of CodeChunk objects, or empty list if chunking failed.
@@ -565,7 +871,9 @@ class CodebaseIndexer:
             relative_path = filepath
 
         try:
-            chunks = self.chunker.chunk_file(filepath, display_path=str(relative_path))
+            chunks = self.chunker.chunk_file(
+                filepath, display_path=str(relative_path), reuse_tree=reuse_tree
+            )
             if not chunks:
                 return []
 
@@ -577,23 +885,29 @@ class CodebaseIndexer:
 
         except (OSError, ValueError, TypeError) as e:
             logger.warning(f"Failed to chunk {relative_path}: {e}")
-            self._stats.errors += 1
+            stats.errors += 1
             return []
 
     def get_stats(self) -> IndexStats:
         """Get current index statistics."""
         return self._stats
 
+    def save_manifest(self) -> None:
+        """Persist manifest changes made by single-file updates."""
+        self.manifest.save()
+
     def index_single_file(self, filepath: Path) -> int:
         """Index or re-index a single file.
 
-        Use this for incremental updates when a file changes.
+        Use this for incremental updates when a file changes. The file is
+        diffed against its stored chunks like in apply_file_changes, so only
+        added or changed chunks are embedded.
 
         Args:
             filepath: Path to the file.
 
         Returns:
-            Number of chunks indexed.
+            Number of chunks embedded.
         """
         # Security: Validate path safety
         if not self._validate_path_safety(filepath):
@@ -604,18 +918,104 @@ class CodebaseIndexer:
         if self._is_sensitive_file(filepath):
             return 0
 
-        try:
-            relative_path = filepath.relative_to(self.project_root)
-        except ValueError:
-            relative_path = filepath
+        if not filepath.exists():
+            self.apply_file_changes([], [filepath])
+            return 0
+        return self.apply_file_changes([filepath], []).chunks_indexed
 
-        # Remove existing chunks for this file
-        deleted_count = self.vector_store.delete_code_by_filepath(str(relative_path))
-        if deleted_count > 0:
-            logger.debug(f"Deleted {deleted_count} existing chunks for {relative_path}")
+    def apply_file_changes(self, modified: Iterable[Path], deleted: Iterable[Path]) -> IndexStats:
+        """Apply a batch of file changes to the index.
+
+        Chunks of deleted files are removed with one bulk delete. Modified
+        files go through the same batched, pipelined embedding path as
+        build_index, but are diffed chunk by chunk against what is stored:
+        only added or changed chunks are embedded, chunks that merely moved
+        get a metadata-only update, and chunks that disappeared are deleted.
+        Use this for debounced change sets instead of calling
+        index_single_file per file.
+
+        Args:
+            modified: Created or modified files. Files that no longer exist,
+                or that fail the security checks, are skipped.
+            deleted: Deleted files.
 
-        # Re-index
-        return self.index_file(filepath)
+        Returns:
+            IndexStats for this batch, including its duration.
+        """
+        start_time = time.time()
+        # Local stats: a concurrent build_index owns self._stats
+        stats = IndexStats()
+        files: list[Path] = []
+        for filepath in modified:
+            if not filepath.exists():
+                # File was deleted after being queued
+                continue
+            # Security: Validate path safety and block sensitive files
+            if not self._validate_path_safety(filepath):
+                logger.warning(f"Blocked unsafe path from indexing: {filepath}")
+                continue
+            if self._is_sensitive_file(filepath):
+                continue
+            files.append(filepath)
+
+        removed = [self._relative_key(filepath) for filepath in deleted]
+        for relative_key in removed:
+            self.manifest.remove(relative_key)
+        if removed:
+            deleted_count = self.vector_store.delete_code_by_filepaths(removed)
+            logger.debug(f"Deleted {deleted_count} chunks for {len(removed)} removed files")
+
+        if files:
+            for filepath in files:
+                self.manifest.remove(self._relative_key(filepath))
+            try:
+                self._index_files_streaming(files, stats, None, self._stored_chunks(files))
+            except (OSError, ValueError, TypeError) as e:
+                if len(files) == 1:
+                    logger.warning(f"Failed to index {files[0]}: {e}")
+                    stats = IndexStats(errors=1)
+                else:
+                    # Redo the set file by file so one bad file does not fail the
+                    # rest. Chunks stored before the failure are diffed as unchanged.
+                    logger.warning(f"Batched update failed, retrying file by file: {e}")
+                    stats = self._index_files_isolated(files)
+        stats.files_removed = len(removed)
+        self.manifest.save()
+
+        stats.duration_seconds = time.time() - start_time
+        stats.last_indexed = datetime.now()
+        return stats
+
+    def _index_files_isolated(self, files: list[Path]) -> IndexStats:
+        """Index files one at a time, counting a failing file as an error.
+
+        Args:
+            files: Files to index.
+
+        Returns:
+            IndexStats for the files that were indexed.
+        """
+        stats = IndexStats()
+        for filepath in files:
+            before = replace(stats)
+            try:
+                self._index_files_streaming(
+                    [filepath], stats, None, self._stored_chunks([filepath])
+                )
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning(f"Failed to index {filepath}: {e}")
+                # Drop the counts of the failed file
+                stats = before
+                stats.errors += 1
+        return stats
+
+    def _stored_chunks(self, files: list[Path]) -> dict[str, dict[str, dict[str, Any]]]:
+        """Get the stored chunk metadata of files, by manifest key and chunk ID."""
+        keys = [self._relative_key(filepath) for filepath in files]
+        stored: dict[str, dict[str, dict[str, Any]]] = {key: {} for key in keys}
+        for chunk_id, metadata in self.vector_store.get_code_metadata_by_filepaths(keys).items():
+            stored.setdefault(str(metadata.get("filepath", "")), {})[chunk_id] = metadata
+        return stored
 
     def remove_file(self, filepath: Path) -> int:
         """Remove a file from the index.
@@ -631,4 +1031,5 @@ class CodebaseIndexer:
         except ValueError:
             relative_path = filepath
 
+        self.manifest.remove(str(relative_path))
         return self.vector_store.delete_code_by_filepath(str(relative_path))
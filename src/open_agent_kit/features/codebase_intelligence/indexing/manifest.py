@@ -0,0 +1,211 @@
+"""Persistent per-file manifest for incremental indexing.
+
+Records, for every indexed file, the fingerprint it had when it was embedded
+(mtime, size, content hash) and the chunk IDs it produced. Incremental builds
+compare the current tree against the manifest so that only new or changed
+files are chunked and embedded, and chunks of vanished files are deleted.
+
+The manifest is a JSON file stored next to the ChromaDB directory. It is only
+trusted while it agrees with the code collection it describes; callers should
+discard it (see ``IndexManifest.clear``) when the collection was cleared or
+rebuilt behind its back.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes; older manifests are discarded.
+MANIFEST_VERSION = 1
+
+# Read size when hashing file content.
+_HASH_READ_SIZE = 1024 * 1024
+
+
+@dataclass
+class ManifestEntry:
+    """Fingerprint and chunk IDs for one indexed file."""
+
+    mtime_ns: int
+    size: int
+    content_hash: str
+    chunk_ids: list[str] = field(default_factory=list)
+
+
+def hash_file(filepath: Path) -> str:
+    """Compute the SHA-256 hex digest of a file's content.
+
+    Args:
+        filepath: Path to the file.
+
+    Returns:
+        Hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        while block := f.read(_HASH_READ_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class IndexManifest:
+    """Thread-safe manifest of indexed files.
+
+    The indexer and the file watcher both update the manifest, so every
+    access goes through a lock. Changes are kept in memory until ``save()``
+    is called.
+    """
+
+    def __init__(self, path: Path | None):
+        """Initialize manifest.
+
+        Args:
+            path: Location of the manifest file. If None, the manifest is
+                disabled and every query reports a miss.
+        """
+        self.path = path
+        self._embedding_dimensions: int | None = None
+        self._entries: dict[str, ManifestEntry] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the manifest is backed by a file."""
+        return self.path is not None
+
+    @property
+    def embedding_dimensions(self) -> int | None:
+        """Dimensions of the embeddings the manifest's chunks were stored with."""
+        self._ensure_loaded()
+        return self._embedding_dimensions
+
+    def load(self) -> None:
+        """Load the manifest from disk, replacing in-memory state.
+
+        Missing, unreadable or outdated manifests load as empty.
+        """
+        with self._lock:
+            self._entries = {}
+            self._embedding_dimensions = None
+            self._loaded = True
+            self._dirty = False
+
+            if self.path is None or not self.path.exists():
+                return
+
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to read index manifest, ignoring it: {e}")
+                return
+
+            if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+                logger.info("Index manifest has an unsupported version, ignoring it")
+                return
+
+            self._embedding_dimensions = data.get("embedding_dimensions")
+            for filepath, raw in data.get("files", {}).items():
+                try:
+                    self._entries[filepath] = ManifestEntry(
+                        mtime_ns=int(raw["mtime_ns"]),
+                        size=int(raw["size"]),
+                        content_hash=str(raw["content_hash"]),
+                        chunk_ids=list(raw.get("chunk_ids", [])),
+                    )
+                except (KeyError, TypeError, ValueError):
+                    logger.debug(f"Skipping malformed manifest entry: {filepath}")
+
+            logger.debug(f"Loaded index manifest with {len(self._entries)} files")
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def save(self) -> None:
+        """Write the manifest to disk if it has unsaved changes.
+
+        The file is written to a temporary path and renamed into place so a
+        crash never leaves a truncated manifest behind.
+        """
+        if self.path is None:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": MANIFEST_VERSION,
+                "embedding_dimensions": self._embedding_dimensions,
+                "files": {path: asdict(entry) for path, entry in self._entries.items()},
+            }
+            self._dirty = False
+
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save index manifest: {e}")
+            with self._lock:
+                self._dirty = True
+
+    def clear(self, embedding_dimensions: int | None = None) -> None:
+        """Forget all entries (e.g. before a full rebuild).
+
+        Args:
+            embedding_dimensions: Dimensions of the embeddings the rebuilt
+                index will hold.
+        """
+        with self._lock:
+            self._entries = {}
+            self._embedding_dimensions = embedding_dimensions
+            self._loaded = True
+            self._dirty = True
+
+    def get(self, filepath: str) -> ManifestEntry | None:
+        """Get the entry for a file (relative path), if any."""
+        self._ensure_loaded()
+        with self._lock:
+            return self._entries.get(filepath)
+
+    def put(self, filepath: str, entry: ManifestEntry) -> None:
+        """Record the entry for a file (relative path)."""
+        self._ensure_loaded()
+        with self._lock:
+            self._entries[filepath] = entry
+            self._dirty = True
+
+    def remove(self, filepath: str) -> ManifestEntry | None:
+        """Drop a file from the manifest, returning its previous entry."""
+        self._ensure_loaded()
+        with self._lock:
+            entry = self._entries.pop(filepath, None)
+            if entry is not None:
+                self._dirty = True
+            return entry
+
+    def filepaths(self) -> set[str]:
+        """Get all file paths recorded in the manifest."""
+        self._ensure_loaded()
+        with self._lock:
+            return set(self._entries)
+
+    def total_chunks(self) -> int:
+        """Count chunk IDs across all entries."""
+        self._ensure_loaded()
+        with self._lock:
+            return sum(len(entry.chunk_ids) for entry in self._entries.values())
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,198 @@
+"""Parallel file chunking across a process pool.
+
+Tree-sitter parsing is CPU-bound and holds the GIL, so a full rebuild in
+the daemon process uses a single core. ``ParallelChunker`` shards files
+across worker processes. Each worker keeps its own ``CodeChunker`` (and the
+tree-sitter languages it loads) for its whole lifetime and sends back
+compact chunk records, which the parent turns back into ``CodeChunk``
+objects in the original file order.
+
+Workers are started with the ``spawn`` method: the daemon runs many
+threads, and forking a threaded process is unsafe.
+"""
+
+import logging
+import multiprocessing
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import astuple, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from open_agent_kit.features.codebase_intelligence.constants import PARALLEL_CHUNK_SHARD_SIZE
+from open_agent_kit.features.codebase_intelligence.indexing.chunker import (
+    ChunkerConfig,
+    CodeChunker,
+)
+from open_agent_kit.features.codebase_intelligence.indexing.manifest import (
+    ManifestEntry,
+    hash_file,
+)
+from open_agent_kit.features.codebase_intelligence.memory.store import CodeChunk
+
+logger = logging.getLogger(__name__)
+
+# Shards queued per worker ahead of the consumer (bounds parent memory)
+_SHARDS_AHEAD_PER_WORKER = 2
+
+# Per-process chunker, created by _init_worker
+_worker_chunker: CodeChunker | None = None
+
+
+@dataclass
+class ChunkedFile:
+    """Chunking result for one file, as sent back by a worker.
+
+    Attributes:
+        filepath: Absolute path of the file.
+        chunk_records: ``CodeChunk`` field tuples (see ``chunks()``).
+        entry: Manifest fingerprint (without chunk IDs), if requested.
+        error: Description of the failure if the file could not be chunked.
+    """
+
+    filepath: Path
+    chunk_records: list[tuple[Any, ...]] = field(default_factory=list)
+    entry: ManifestEntry | None = None
+    error: str | None = None
+
+    def chunks(self) -> list[CodeChunk]:
+        """Rebuild the chunks from their compact records."""
+        return [CodeChunk(*record) for record in self.chunk_records]
+
+
+@dataclass
+class _ShardResult:
+    files: list[ChunkedFile]
+    stats: dict[str, Any]
+
+
+def _init_worker(chunker_config: ChunkerConfig) -> None:
+    """Create the worker's chunker once per process."""
+    global _worker_chunker
+    _worker_chunker = CodeChunker(chunker_config)
+
+
+def _chunk_shard(project_root: Path, filepaths: list[Path], fingerprint: bool) -> _ShardResult:
+    """Chunk a shard of files in a worker process.
+
+    Args:
+        project_root: Project root; chunk file paths are made relative to it.
+        filepaths: Files to chunk.
+        fingerprint: Whether to compute manifest fingerprints.
+
+    Returns:
+        Per-file results and the chunker statistics for this shard.
+    """
+    chunker = _worker_chunker
+    if chunker is None:
+        raise RuntimeError("Chunking worker was not initialized")
+    chunker.reset_stats()
+
+    results: list[ChunkedFile] = []
+    for filepath in filepaths:
+        result = ChunkedFile(filepath=filepath)
+        try:
+            relative_path = filepath.relative_to(project_root)
+        except ValueError:
+            relative_path = filepath
+
+        try:
+            if fingerprint:
+                stat = filepath.stat()
+                result.entry = ManifestEntry(
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                    content_hash=hash_file(filepath),
+                )
+            chunks = chunker.chunk_file(filepath, display_path=str(relative_path))
+            for chunk in chunks:
+                chunk.filepath = str(relative_path)
+            result.chunk_records = [astuple(chunk) for chunk in chunks]
+        except (OSError, ValueError, TypeError) as e:
+            result.error = str(e)
+            result.entry = None
+            result.chunk_records = []
+        results.append(result)
+
+    return _ShardResult(files=results, stats=chunker.get_stats())
+
+
+class ParallelChunker:
+    """Chunks files on a pool of worker processes.
+
+    Use as a context manager so worker processes are shut down afterwards.
+    """
+
+    def __init__(self, project_root: Path, chunker_config: ChunkerConfig, workers: int):
+        """Initialize the pool.
+
+        Args:
+            project_root: Project root directory.
+            chunker_config: Configuration for each worker's chunker.
+            workers: Number of worker processes.
+        """
+        self.project_root = project_root
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(chunker_config,),
+        )
+
+    def chunk_files(
+        self,
+        files: list[Path],
+        fingerprint: bool,
+        stats_sink: CodeChunker,
+    ) -> Iterator[ChunkedFile]:
+        """Chunk files in parallel, yielding results in input order.
+
+        Only a bounded number of shards is queued ahead of the consumer, so
+        a slow consumer (e.g. the embedding pipeline) throttles chunking.
+
+        Args:
+            files: Files to chunk.
+            fingerprint: Whether to compute manifest fingerprints.
+            stats_sink: Chunker whose statistics absorb the workers' stats.
+
+        Yields:
+            One ChunkedFile per input file.
+        """
+        shards = (
+            files[start : start + PARALLEL_CHUNK_SHARD_SIZE]
+            for start in range(0, len(files), PARALLEL_CHUNK_SHARD_SIZE)
+        )
+        max_ahead = self.workers * _SHARDS_AHEAD_PER_WORKER
+        in_flight: deque[Future[_ShardResult]] = deque()
+
+        try:
+            for shard in shards:
+                in_flight.append(
+                    self._executor.submit(_chunk_shard, self.project_root, shard, fingerprint)
+                )
+                if len(in_flight) >= max_ahead:
+                    yield from self._collect(in_flight.popleft(), stats_sink)
+
+            while in_flight:
+                yield from self._collect(in_flight.popleft(), stats_sink)
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    @staticmethod
+    def _collect(future: Future[_ShardResult], stats_sink: CodeChunker) -> list[ChunkedFile]:
+        result = future.result()
+        stats_sink.merge_stats(result.stats)
+        return result.files
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "ParallelChunker":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
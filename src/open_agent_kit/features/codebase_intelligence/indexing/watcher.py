@@ -73,6 +73,11 @@ class FileWatcher:
         Returns:
             True if file changes should trigger indexing.
         """
+        # A .gitignore edit changes what the indexer ignores
+        if filepath == self.project_root / ".gitignore":
+            self.indexer.invalidate_ignore_matcher()
+            return False
+
         # Check extension
         if filepath.suffix.lower() not in INDEXABLE_EXTENSIONS:
             return False
@@ -129,28 +134,8 @@ class FileWatcher:
             if self.on_index_start:
                 self.on_index_start()
 
-            total_chunks = 0
-
-            # Handle deleted files
-            for filepath in deleted:
-                try:
-                    removed = self.indexer.remove_file(filepath)
-                    logger.debug(f"Removed {removed} chunks for deleted file: {filepath}")
-                except (ValueError, TypeError, KeyError) as e:
-                    logger.warning(f"Failed to remove {filepath} from index: {e}")
-
-            # Handle modified/created files
-            for filepath in pending:
-                if not filepath.exists():
-                    # File was deleted after being queued
-                    continue
-
-                try:
-                    chunks = self.indexer.index_single_file(filepath)
-                    total_chunks += chunks
-                    logger.debug(f"Re-indexed {filepath}: {chunks} chunks")
-                except (OSError, ValueError, TypeError) as e:
-                    logger.warning(f"Failed to re-index {filepath}: {e}")
+            stats = self.indexer.apply_file_changes(pending, deleted)
+            total_chunks = stats.chunks_indexed
 
             if self.on_index_complete:
                 self.on_index_complete(total_chunks)
@@ -160,8 +145,14 @@ class FileWatcher:
             if state.vector_store:
                 state.index_status.file_count = state.vector_store.count_unique_files()
 
-            logger.info(f"Incremental indexing complete: {total_chunks} chunks updated")
-        except (OSError, ValueError, RuntimeError):
+            logger.info(
+                f"Incremental indexing complete: {total_chunks} chunks embedded, "
+                f"{stats.embeds_avoided} embeds avoided ({stats.chunks_moved} moved), "
+                f"{stats.chunks_removed} removed "
+                f"({stats.files_processed} files re-indexed, {stats.files_removed} removed) "
+                f"in {stats.duration_seconds:.2f}s"
+            )
+        except (OSError, ValueError, TypeError, KeyError, RuntimeError):
             logger.error("Watcher reindex failed unexpectedly", exc_info=True)
 
     def _on_file_created(self, filepath: Path) -> None:
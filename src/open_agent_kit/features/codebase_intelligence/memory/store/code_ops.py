@@ -6,16 +6,21 @@ Functions for adding and removing code chunks from ChromaDB.
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
-from typing import TYPE_CHECKING
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sized
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from open_agent_kit.features.codebase_intelligence.constants import (
     DEFAULT_EMBEDDING_BATCH_SIZE,
+    VECTOR_DELETE_BATCH_SIZE,
 )
 from open_agent_kit.features.codebase_intelligence.memory.store.constants import CODE_COLLECTION
 from open_agent_kit.features.codebase_intelligence.memory.store.models import CodeChunk
 
 if TYPE_CHECKING:
+    from open_agent_kit.features.codebase_intelligence.embeddings.base import EmbeddingResult
     from open_agent_kit.features.codebase_intelligence.memory.store.core import VectorStore
 
 logger = logging.getLogger(__name__)
@@ -55,7 +60,7 @@ def add_code_chunks(store: VectorStore, chunks: list[CodeChunk]) -> int:
     # But store original content for display/retrieval
     embedding_texts = [chunk.get_embedding_text() for chunk in chunks]
     original_contents = [chunk.content for chunk in chunks]
-    result = store.embedding_provider.embed(embedding_texts)
+    result = store._embed_texts(embedding_texts)
 
     # Get actual dimensions from embeddings
     actual_dims = result.dimensions
@@ -100,101 +105,205 @@ def add_code_chunks(store: VectorStore, chunks: list[CodeChunk]) -> int:
 
 def add_code_chunks_batched(
     store: VectorStore,
-    chunks: list[CodeChunk],
+    chunks: Iterable[CodeChunk],
     batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
     progress_callback: Callable[[int, int], None] | None = None,
 ) -> int:
     """Add code chunks to the index in batches.
 
-    This method processes chunks in smaller batches to prevent memory
-    issues when indexing large codebases with thousands of files.
+    Chunks may be a list or any iterable, such as a generator that chunks
+    files on demand. Batches are assembled as chunks are consumed, so only
+    a few batches are ever held in memory.
+
+    With ``store.embedding_concurrency`` above 1, embedding and upserting
+    run as a pipeline: up to that many batches are embedded concurrently
+    while finished batches are upserted in order on the calling thread.
+    At most one extra batch is queued ahead, which bounds memory use.
 
     Args:
         store: The VectorStore instance.
-        chunks: List of code chunks to add.
+        chunks: Code chunks to add.
         batch_size: Number of chunks to process per batch.
         progress_callback: Optional callback(processed, total) for progress.
+            ``processed`` counts chunks consumed from ``chunks`` (including
+            dropped duplicates) that have been stored. ``total`` is
+            ``len(chunks)``, or 0 if ``chunks`` has no length.
 
     Returns:
         Number of chunks added.
     """
     store._ensure_initialized()
 
-    if not chunks:
-        return 0
+    total_chunks = len(chunks) if isinstance(chunks, Sized) else 0
+    total_added = 0
+    processed = 0
+    batches = _unique_batches(chunks, batch_size)
+
+    concurrency = max(1, store.embedding_concurrency)
+    embedded: Iterable[tuple[_ChunkBatch, EmbeddingResult]]
+    if concurrency > 1:
+        embedded = _embed_batches_pipelined(store, batches, concurrency)
+    else:
+        embedded = ((batch, _embed_chunks(store, batch.chunks)) for batch in batches)
+
+    for batch_number, (batch, result) in enumerate(embedded, start=1):
+        # Handle dimension mismatch (only check on first batch)
+        total_added += _upsert_code_batch(
+            store, batch.chunks, result, check_dimensions=batch_number == 1
+        )
+        processed += batch.consumed
+
+        # Report progress
+        if progress_callback:
+            progress_callback(processed, total_chunks)
+
+        logger.debug(f"Processed batch {batch_number}: {len(batch.chunks)} chunks")
+
+    if total_added:
+        logger.info(
+            f"Added {total_added} code chunks to index in batches of {batch_size} "
+            f"(concurrency {concurrency})"
+        )
+    return total_added
 
-    # Deduplicate chunks by ID
+
+@dataclass
+class _ChunkBatch:
+    """Deduplicated chunks plus how many input chunks they account for."""
+
+    chunks: list[CodeChunk]
+    consumed: int
+
+
+def _unique_batches(chunks: Iterable[CodeChunk], batch_size: int) -> Iterator[_ChunkBatch]:
+    """Group chunks into batches, dropping chunks whose ID was already seen.
+
+    Only IDs are remembered across batches, not the chunks themselves.
+    """
     seen_ids: set[str] = set()
-    unique_chunks: list[CodeChunk] = []
+    batch: list[CodeChunk] = []
+    consumed = 0
+    duplicates = 0
     for chunk in chunks:
-        if chunk.id not in seen_ids:
-            seen_ids.add(chunk.id)
-            unique_chunks.append(chunk)
+        consumed += 1
+        if chunk.id in seen_ids:
+            duplicates += 1
+            continue
+        seen_ids.add(chunk.id)
+        batch.append(chunk)
+        if len(batch) >= batch_size:
+            yield _ChunkBatch(batch, consumed)
+            batch = []
+            consumed = 0
+
+    if batch:
+        yield _ChunkBatch(batch, consumed)
+    if duplicates:
+        logger.info(f"Skipped {duplicates} duplicate chunk IDs")
+
+
+def _embed_chunks(store: VectorStore, batch: list[CodeChunk]) -> EmbeddingResult:
+    """Embed a batch of chunks using their document envelope.
+
+    The envelope includes metadata for better search; the original content
+    is what gets stored for display/retrieval.
+    """
+    return store._embed_texts([chunk.get_embedding_text() for chunk in batch])
 
-    if len(unique_chunks) < len(chunks):
-        logger.info(f"Deduplicated {len(chunks)} chunks to {len(unique_chunks)} unique")
 
-    total_chunks = len(unique_chunks)
-    total_added = 0
+def _embed_batches_pipelined(
+    store: VectorStore,
+    batches: Iterable[_ChunkBatch],
+    concurrency: int,
+) -> Iterator[tuple[_ChunkBatch, EmbeddingResult]]:
+    """Embed batches concurrently, yielding results in submission order.
 
-    # Process in batches
-    for batch_start in range(0, total_chunks, batch_size):
-        batch_end = min(batch_start + batch_size, total_chunks)
-        batch = unique_chunks[batch_start:batch_end]
+    Keeps ``concurrency`` batches embedding while the consumer upserts the
+    oldest finished one. Submission stops until the consumer catches up, so
+    no more than ``concurrency + 1`` batches are held in memory.
 
-        # Generate embeddings using document envelope (includes metadata for better search)
-        # But store original content for display/retrieval
-        embedding_texts = [chunk.get_embedding_text() for chunk in batch]
-        original_contents = [chunk.content for chunk in batch]
-        result = store.embedding_provider.embed(embedding_texts)
+    Args:
+        store: The VectorStore instance.
+        batches: Chunk batches to embed. Consumed lazily, so producing a
+            batch (e.g. chunking files) overlaps with embedding earlier ones.
+        concurrency: Number of embedding requests in flight.
 
-        # Get actual dimensions
-        actual_dims = result.dimensions
-        if result.embeddings is not None and len(result.embeddings) > 0:
-            actual_dims = len(result.embeddings[0])
+    Yields:
+        Tuples of (batch, embedding result).
+    """
+    in_flight: deque[tuple[_ChunkBatch, Future[EmbeddingResult]]] = deque()
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="oak-ci-embed")
+    try:
+        for batch in batches:
+            in_flight.append((batch, executor.submit(_embed_chunks, store, batch.chunks)))
+            if len(in_flight) > concurrency:
+                oldest, future = in_flight.popleft()
+                yield oldest, future.result()
+
+        while in_flight:
+            oldest, future = in_flight.popleft()
+            yield oldest, future.result()
+    finally:
+        # On error, drop queued batches instead of embedding them for nothing
+        for _, future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _upsert_code_batch(
+    store: VectorStore,
+    batch: list[CodeChunk],
+    result: EmbeddingResult,
+    check_dimensions: bool,
+) -> int:
+    """Upsert an embedded batch, recovering from dimension mismatches.
 
-        # Handle dimension mismatch (only check on first batch)
-        if batch_start == 0:
-            store._handle_dimension_mismatch(CODE_COLLECTION, actual_dims)
-
-        # Prepare data for ChromaDB
-        # Store original content as documents (for display), embeddings from enriched text
-        ids = [chunk.id for chunk in batch]
-        documents = original_contents
-        embeddings = result.embeddings
-        metadatas = [chunk.to_metadata() for chunk in batch]
-
-        # Upsert batch with dimension mismatch recovery
-        try:
+    Args:
+        store: The VectorStore instance.
+        batch: Chunks in the batch.
+        result: Embeddings for the batch, aligned with the chunks.
+        check_dimensions: Whether to compare against the collection's
+            dimensions before inserting.
+
+    Returns:
+        Number of chunks upserted.
+    """
+    # Get actual dimensions
+    actual_dims = result.dimensions
+    if result.embeddings is not None and len(result.embeddings) > 0:
+        actual_dims = len(result.embeddings[0])
+
+    if check_dimensions:
+        store._handle_dimension_mismatch(CODE_COLLECTION, actual_dims)
+
+    # Prepare data for ChromaDB
+    # Store original content as documents (for display), embeddings from enriched text
+    ids = [chunk.id for chunk in batch]
+    documents = [chunk.content for chunk in batch]
+    embeddings = result.embeddings
+    metadatas = [chunk.to_metadata() for chunk in batch]
+
+    # Upsert batch with dimension mismatch recovery
+    try:
+        store._code_collection.upsert(
+            ids=ids,
+            documents=documents,
+            embeddings=embeddings,
+            metadatas=metadatas,
+        )
+    except (RuntimeError, ValueError, TypeError) as e:
+        if "dimension" in str(e).lower():
+            logger.warning(f"Dimension mismatch on batch insert, recreating collection: {e}")
+            store._recreate_collection(CODE_COLLECTION, actual_dims)
             store._code_collection.upsert(
                 ids=ids,
                 documents=documents,
                 embeddings=embeddings,
                 metadatas=metadatas,
             )
-            total_added += len(batch)
-        except (RuntimeError, ValueError, TypeError) as e:
-            if "dimension" in str(e).lower():
-                logger.warning(f"Dimension mismatch on batch insert, recreating collection: {e}")
-                store._recreate_collection(CODE_COLLECTION, actual_dims)
-                store._code_collection.upsert(
-                    ids=ids,
-                    documents=documents,
-                    embeddings=embeddings,
-                    metadatas=metadatas,
-                )
-                total_added += len(batch)
-            else:
-                raise
-
-        # Report progress
-        if progress_callback:
-            progress_callback(batch_end, total_chunks)
-
-        logger.debug(f"Processed batch {batch_start // batch_size + 1}: {len(batch)} chunks")
-
-    logger.info(f"Added {total_added} code chunks to index in batches of {batch_size}")
-    return total_added
+        else:
+            raise
+    return len(batch)
 
 
 def delete_code_by_filepath(store: VectorStore, filepath: str) -> int:
@@ -220,3 +329,107 @@ def delete_code_by_filepath(store: VectorStore, filepath: str) -> int:
 
     store._code_collection.delete(ids=results["ids"])
     return len(results["ids"])
+
+
+def delete_code_by_filepaths(store: VectorStore, filepaths: Iterable[str]) -> int:
+    """Delete all code chunks for several files.
+
+    Looks up chunk IDs with one ``$in`` query per batch of paths instead of
+    one query per file, so large change sets (e.g. a branch switch) cost a
+    handful of round-trips.
+
+    Args:
+        store: The VectorStore instance.
+        filepaths: File paths to delete chunks for.
+
+    Returns:
+        Number of chunks deleted.
+    """
+    store._ensure_initialized()
+
+    paths = list(dict.fromkeys(filepaths))
+    chunk_ids: list[str] = []
+    for start in range(0, len(paths), VECTOR_DELETE_BATCH_SIZE):
+        batch = paths[start : start + VECTOR_DELETE_BATCH_SIZE]
+        where = {"filepath": batch[0]} if len(batch) == 1 else {"filepath": {"$in": batch}}
+        results = store._code_collection.get(where=where, include=[])
+        chunk_ids.extend(results["ids"])
+
+    return delete_code_by_ids(store, chunk_ids)
+
+
+def get_code_metadata_by_filepaths(
+    store: VectorStore, filepaths: Iterable[str]
+) -> dict[str, dict[str, Any]]:
+    """Get the stored metadata of every code chunk for several files.
+
+    Incremental indexing diffs a file's new chunks against these to decide
+    which chunks need embedding, which only moved, and which are gone.
+
+    Args:
+        store: The VectorStore instance.
+        filepaths: File paths to look up.
+
+    Returns:
+        Mapping of chunk ID to its metadata.
+    """
+    store._ensure_initialized()
+
+    paths = list(dict.fromkeys(filepaths))
+    existing: dict[str, dict[str, Any]] = {}
+    for start in range(0, len(paths), VECTOR_DELETE_BATCH_SIZE):
+        batch = paths[start : start + VECTOR_DELETE_BATCH_SIZE]
+        where = {"filepath": batch[0]} if len(batch) == 1 else {"filepath": {"$in": batch}}
+        results = store._code_collection.get(where=where, include=["metadatas"])
+        for chunk_id, metadata in zip(results["ids"], results["metadatas"] or [], strict=False):
+            existing[chunk_id] = dict(metadata or {})
+    return existing
+
+
+def update_code_metadata(store: VectorStore, chunks: list[CodeChunk]) -> int:
+    """Rewrite the metadata of already-embedded code chunks.
+
+    Used for chunks whose content is unchanged but whose line range or parent
+    moved. Documents and embeddings are left untouched, so nothing is
+    re-embedded.
+
+    Args:
+        store: The VectorStore instance.
+        chunks: Chunks whose IDs are already in the collection.
+
+    Returns:
+        Number of chunks updated.
+    """
+    store._ensure_initialized()
+
+    for start in range(0, len(chunks), VECTOR_DELETE_BATCH_SIZE):
+        batch = chunks[start : start + VECTOR_DELETE_BATCH_SIZE]
+        store._code_collection.update(
+            ids=[chunk.id for chunk in batch],
+            metadatas=[chunk.to_metadata() for chunk in batch],
+        )
+    return len(chunks)
+
+
+def delete_code_by_ids(store: VectorStore, chunk_ids: list[str]) -> int:
+    """Delete code chunks by ID.
+
+    Used by incremental indexing, which already knows the chunk IDs of
+    changed and vanished files and can skip the per-file metadata lookup.
+
+    Args:
+        store: The VectorStore instance.
+        chunk_ids: Chunk IDs to delete. Unknown IDs are ignored.
+
+    Returns:
+        Number of IDs submitted for deletion.
+    """
+    store._ensure_initialized()
+
+    if not chunk_ids:
+        return 0
+
+    for start in range(0, len(chunk_ids), VECTOR_DELETE_BATCH_SIZE):
+        store._code_collection.delete(ids=chunk_ids[start : start + VECTOR_DELETE_BATCH_SIZE])
+
+    return len(chunk_ids)
@@ -10,6 +10,10 @@ CODE_COLLECTION = "oak_code"
 MEMORY_COLLECTION = "oak_memory"
 SESSION_SUMMARIES_COLLECTION = "oak_session_summaries"
 
+# Collection metadata key recording the embedding dimensions a collection was
+# created for, so inserts don't have to read an embedding back to learn them
+COLLECTION_DIMENSIONS_KEY: Final[str] = "oak:dimensions"
+
 # HNSW index configuration for ChromaDB collections
 HNSW_SPACE: Final[str] = "cosine"
 HNSW_CONSTRUCTION_EF: Final[int] = 200
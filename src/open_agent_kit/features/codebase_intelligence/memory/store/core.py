@@ -4,15 +4,26 @@ Contains the main VectorStore class with ChromaDB initialization and delegation
 to operation modules.
 """
 
+import itertools
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
 from open_agent_kit.features.codebase_intelligence.constants import (
     DEFAULT_EMBEDDING_BATCH_SIZE,
 )
-from open_agent_kit.features.codebase_intelligence.embeddings.base import EmbeddingProvider
+from open_agent_kit.features.codebase_intelligence.embeddings.base import (
+    EmbeddingProvider,
+    EmbeddingResult,
+)
+from open_agent_kit.features.codebase_intelligence.embeddings.cache import (
+    EmbeddingCache,
+    QueryEmbeddingCache,
+)
+from open_agent_kit.features.codebase_intelligence.embeddings.provider_chain import (
+    EmbeddingProviderChain,
+)
 from open_agent_kit.features.codebase_intelligence.memory.store import (
     code_ops,
     management,
@@ -22,6 +33,7 @@ from open_agent_kit.features.codebase_intelligence.memory.store import (
 )
 from open_agent_kit.features.codebase_intelligence.memory.store.constants import (
     CODE_COLLECTION,
+    COLLECTION_DIMENSIONS_KEY,
     MEMORY_COLLECTION,
     SESSION_SUMMARIES_COLLECTION,
     default_hnsw_config,
@@ -34,6 +46,9 @@ from open_agent_kit.features.codebase_intelligence.memory.store.models import (
 
 logger = logging.getLogger(__name__)
 
+# Process-wide, so a replacement VectorStore never reuses a generation
+_memory_generations = itertools.count(1)
+
 
 class VectorStore:
     """ChromaDB-based vector store for code and memory.
@@ -47,20 +62,44 @@ class VectorStore:
         self,
         persist_directory: Path,
         embedding_provider: EmbeddingProvider,
+        embedding_cache: EmbeddingCache | None = None,
+        embedding_concurrency: int = 1,
     ):
         """Initialize vector store.
 
         Args:
             persist_directory: Directory for ChromaDB persistence.
             embedding_provider: Provider for generating embeddings.
+            embedding_cache: Optional persistent cache consulted before
+                embedding code chunks.
+            embedding_concurrency: Number of code chunk batches embedded
+                concurrently by ``add_code_chunks_batched``.
         """
         self.persist_directory = persist_directory
         self.embedding_provider = embedding_provider
+        self.embedding_cache = embedding_cache
+        self.embedding_concurrency = embedding_concurrency
+        self.query_embedding_cache = QueryEmbeddingCache()
         # Lazily initialized - chromadb is an optional dependency
         self._client: Any = None
         self._code_collection: Any = None
         self._memory_collection: Any = None
         self._session_summaries_collection: Any = None
+        # Embedding dimensions per collection name; None while a collection
+        # has no known dimensions (empty, or created before they were recorded)
+        self._collection_dims: dict[str, int | None] = {}
+        self._memory_generation = next(_memory_generations)
+
+    @property
+    def memory_generation(self) -> int:
+        """Counter that changes whenever the memory collection may have changed.
+
+        Callers caching memory search results compare it before reuse.
+        """
+        return self._memory_generation
+
+    def _bump_memory_generation(self) -> None:
+        self._memory_generation = next(_memory_generations)
 
     def _ensure_initialized(self) -> None:
         """Ensure ChromaDB is initialized."""
@@ -83,6 +122,7 @@ class VectorStore:
 
             # Get embedding dimensions from provider
             embedding_dims = self.embedding_provider.dimensions
+            self._collection_dims = {}
 
             # Create or get collections with HNSW configuration
             hnsw_config = default_hnsw_config()
@@ -127,36 +167,76 @@ class VectorStore:
         try:
             # Try to get existing collection
             collection = self._client.get_collection(name=name)
+        except Exception:  # broad catch intentional: ChromaDB exception types vary by version
+            # Collection doesn't exist (NotFoundError) or other ChromaDB error, create it
+            return self._create_collection(name, hnsw_config, expected_dims)
 
-            # Check if we can detect dimension mismatch
-            # ChromaDB doesn't store dims in metadata, so we try a test query
-            # If collection is empty, just use it
-            if collection.count() == 0:
-                return collection
-
-            # Try to detect dimension mismatch by checking existing embeddings
-            # This is a heuristic - if first item has different dims, recreate
-            try:
-                sample = collection.peek(limit=1)
-                # Use explicit len() checks to avoid numpy array truthiness ambiguity
-                embeddings = sample.get("embeddings") if sample else None
-                if embeddings is not None and len(embeddings) > 0:
-                    existing_dims = len(embeddings[0])
-                    if existing_dims != expected_dims:
-                        logger.warning(
-                            f"Collection '{name}' has embeddings with {existing_dims} dims, "
-                            f"but current provider uses {expected_dims} dims. Recreating..."
-                        )
-                        self._client.delete_collection(name)
-                        return self._client.create_collection(name=name, metadata=hnsw_config)
-            except (AttributeError, KeyError, TypeError, ValueError):
-                pass  # Can't check, just use existing
-
+        # If collection is empty, just use it
+        if collection.count() == 0:
+            self._collection_dims[name] = self._recorded_dims(collection)
             return collection
 
-        except Exception:  # broad catch intentional: ChromaDB exception types vary by version
-            # Collection doesn't exist (NotFoundError) or other ChromaDB error, create it
-            return self._client.create_collection(name=name, metadata=hnsw_config)
+        existing_dims = self._load_collection_dims(collection)
+        if existing_dims is not None and existing_dims != expected_dims:
+            logger.warning(
+                f"Collection '{name}' has embeddings with {existing_dims} dims, "
+                f"but current provider uses {expected_dims} dims. Recreating..."
+            )
+            self._client.delete_collection(name)
+            return self._create_collection(name, hnsw_config, expected_dims)
+
+        self._collection_dims[name] = existing_dims
+        return collection
+
+    def _create_collection(self, name: str, hnsw_config: dict, dims: int | None) -> Any:
+        """Create a collection, recording its embedding dimensions.
+
+        Args:
+            name: Collection name.
+            hnsw_config: HNSW configuration for the collection.
+            dims: Embedding dimensions the collection is created for.
+
+        Returns:
+            ChromaDB collection.
+        """
+        metadata = dict(hnsw_config)
+        if dims:
+            metadata[COLLECTION_DIMENSIONS_KEY] = dims
+        collection = self._client.create_collection(name=name, metadata=metadata)
+        self._collection_dims[name] = dims or None
+        return collection
+
+    @staticmethod
+    def _recorded_dims(collection: Any) -> int | None:
+        """Get the dimensions recorded in a collection's metadata, if any."""
+        metadata = getattr(collection, "metadata", None)
+        dims = metadata.get(COLLECTION_DIMENSIONS_KEY) if isinstance(metadata, dict) else None
+        return dims if isinstance(dims, int) else None
+
+    def _load_collection_dims(self, collection: Any) -> int | None:
+        """Get a collection's embedding dimensions from metadata, or from its data.
+
+        Collections created before dimensions were recorded fall back to
+        reading one embedding back.
+
+        Args:
+            collection: ChromaDB collection.
+
+        Returns:
+            Dimensions, or None if the collection is empty or can't be read.
+        """
+        dims = self._recorded_dims(collection)
+        if dims is not None:
+            return dims
+        try:
+            sample = collection.peek(limit=1)
+            # Use explicit len() checks to avoid numpy array truthiness ambiguity
+            embeddings = sample.get("embeddings") if sample else None
+            if embeddings is not None and len(embeddings) > 0:
+                return len(embeddings[0])
+        except (AttributeError, KeyError, TypeError, ValueError):
+            pass  # Can't check; the upsert's dimension recovery still applies
+        return None
 
     def _handle_dimension_mismatch(self, collection_name: str, actual_dims: int) -> None:
         """Check and handle dimension mismatch for a collection.
@@ -166,35 +246,35 @@ class VectorStore:
         embedding provider falls back to a different provider after collection
         creation.
 
+        Dimensions are cached per collection, so this only reads the
+        collection the first time after initialization or a provider change.
+
         Args:
             collection_name: Name of the collection to check.
             actual_dims: Actual dimensions of the embeddings being added.
         """
-        if collection_name == CODE_COLLECTION:
-            collection = self._code_collection
-        elif collection_name == SESSION_SUMMARIES_COLLECTION:
-            collection = self._session_summaries_collection
-        else:
-            collection = self._memory_collection
+        if collection_name not in self._collection_dims:
+            self._collection_dims[collection_name] = self._load_collection_dims(
+                self._collection_for(collection_name)
+            )
 
-        # Try to detect current collection dimensions
-        try:
-            sample = collection.peek(limit=1)
-            # Use explicit len() checks to avoid numpy array truthiness ambiguity
-            embeddings = sample.get("embeddings") if sample else None
-            if embeddings is not None and len(embeddings) > 0:
-                existing_dims = len(embeddings[0])
-                if existing_dims != actual_dims:
-                    logger.warning(
-                        f"Dimension mismatch in '{collection_name}': "
-                        f"collection has {existing_dims}, got {actual_dims}. Recreating..."
-                    )
-                    self._recreate_collection(collection_name, actual_dims)
-        except (AttributeError, KeyError, TypeError, ValueError):
-            # Empty collection or error - check if we need to recreate anyway
-            # ChromaDB doesn't store dims in metadata, so we can't check directly
-            # Just proceed and let the upsert fail if there's a mismatch
-            pass
+        existing_dims = self._collection_dims[collection_name]
+        if existing_dims is None:
+            # Empty collection: the first insert fixes its dimensions
+            self._collection_dims[collection_name] = actual_dims
+        elif existing_dims != actual_dims:
+            logger.warning(
+                f"Dimension mismatch in '{collection_name}': "
+                f"collection has {existing_dims}, got {actual_dims}. Recreating..."
+            )
+            self._recreate_collection(collection_name, actual_dims)
+
+    def _collection_for(self, collection_name: str) -> Any:
+        if collection_name == CODE_COLLECTION:
+            return self._code_collection
+        if collection_name == SESSION_SUMMARIES_COLLECTION:
+            return self._session_summaries_collection
+        return self._memory_collection
 
     def _recreate_collection(self, collection_name: str, dims: int) -> None:
         """Recreate a collection with new dimensions.
@@ -203,10 +283,8 @@ class VectorStore:
             collection_name: Name of the collection to recreate.
             dims: Expected embedding dimensions.
         """
-        hnsw_config = default_hnsw_config()
-
         self._client.delete_collection(collection_name)
-        new_collection = self._client.create_collection(name=collection_name, metadata=hnsw_config)
+        new_collection = self._create_collection(collection_name, default_hnsw_config(), dims)
 
         if collection_name == CODE_COLLECTION:
             self._code_collection = new_collection
@@ -217,6 +295,90 @@ class VectorStore:
 
         logger.info(f"Recreated collection '{collection_name}' for {dims}-dim embeddings")
 
+    def _embedding_cache_name(self) -> str:
+        """Provider name the embedding cache is keyed by.
+
+        A provider chain reports "chain:none" until its first embed call, so
+        the cache uses the provider the chain resolves to instead.
+        """
+        provider = self.embedding_provider
+        if isinstance(provider, EmbeddingProviderChain):
+            return provider.resolved_name
+        return provider.name
+
+    def _embed_texts(self, texts: list[str]) -> EmbeddingResult:
+        """Embed texts, serving previously embedded texts from the cache.
+
+        Only cache misses are sent to the embedding provider. Without a
+        cache this is a plain ``embed()`` call.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            EmbeddingResult with one vector per text, in order.
+        """
+        cache = self.embedding_cache
+        provider = self.embedding_provider
+        if cache is None or not texts:
+            return provider.embed(texts)
+
+        embeddings = cache.get_many(self._embedding_cache_name(), provider.dimensions, texts)
+        missing = [i for i, vector in enumerate(embeddings) if vector is None]
+        if not missing:
+            return EmbeddingResult(
+                embeddings=[vector for vector in embeddings if vector is not None],
+                model=provider.name,
+                provider=provider.name,
+                dimensions=provider.dimensions,
+            )
+
+        result = provider.embed([texts[i] for i in missing])
+        if len(result.embeddings) != len(missing):
+            # Provider dropped inputs (e.g. blank text), so vectors can't be
+            # matched back to texts; embed everything uncached instead.
+            return provider.embed(texts)
+
+        actual_dims = len(result.embeddings[0]) if result.embeddings else result.dimensions
+        cache.put_many(
+            self._embedding_cache_name(),
+            actual_dims,
+            [texts[i] for i in missing],
+            result.embeddings,
+        )
+        for i, vector in zip(missing, result.embeddings, strict=True):
+            embeddings[i] = vector
+
+        return EmbeddingResult(
+            embeddings=[vector for vector in embeddings if vector is not None],
+            model=result.model,
+            provider=result.provider,
+            dimensions=result.dimensions,
+        )
+
+    def embed_query(self, query: str) -> list[float]:
+        """Embed a search query, reusing recent embeddings of the same query.
+
+        Search functions accept the returned vector so that one search
+        across several collections embeds the query only once.
+
+        Args:
+            query: Search query text.
+
+        Returns:
+            Query embedding vector.
+        """
+        provider = self.embedding_provider
+        cached = self.query_embedding_cache.get(provider.name, provider.dimensions, query)
+        if cached is not None:
+            return cached
+
+        embedding = provider.embed_query(query)
+        # Read the name after embedding: a provider chain reports the
+        # provider that actually served the request
+        self.query_embedding_cache.put(provider.name, provider.dimensions, query, embedding)
+        return embedding
+
     def update_embedding_provider(self, new_provider: EmbeddingProvider) -> None:
         """Update the embedding provider and reinitialize if dimensions changed.
 
@@ -230,6 +392,8 @@ class VectorStore:
         new_dims = new_provider.dimensions
 
         self.embedding_provider = new_provider
+        # Re-validate collection dimensions on the next insert
+        self._collection_dims.clear()
 
         # If dimensions changed and we're already initialized, reinitialize collections
         if self._client is not None and old_dims != new_dims:
@@ -242,6 +406,7 @@ class VectorStore:
             self._code_collection = None
             self._memory_collection = None
             self._session_summaries_collection = None
+            self._bump_memory_generation()
             # Reinitialize with new dimensions
             self._ensure_initialized()
             logger.info(f"ChromaDB reinitialized with {new_dims} dimensions")
@@ -256,7 +421,7 @@ class VectorStore:
 
     def add_code_chunks_batched(
         self,
-        chunks: list[CodeChunk],
+        chunks: Iterable[CodeChunk],
         batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
         progress_callback: Callable[[int, int], None] | None = None,
     ) -> int:
@@ -267,29 +432,66 @@ class VectorStore:
         """Delete all code chunks for a file."""
         return code_ops.delete_code_by_filepath(self, filepath)
 
+    def delete_code_by_filepaths(self, filepaths: Iterable[str]) -> int:
+        """Delete all code chunks for several files in bulk."""
+        return code_ops.delete_code_by_filepaths(self, filepaths)
+
+    def delete_code_by_ids(self, chunk_ids: list[str]) -> int:
+        """Delete code chunks by ID."""
+        return code_ops.delete_code_by_ids(self, chunk_ids)
+
+    def get_code_metadata_by_filepaths(self, filepaths: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Get stored chunk metadata for several files, keyed by chunk ID."""
+        return code_ops.get_code_metadata_by_filepaths(self, filepaths)
+
+    def update_code_metadata(self, chunks: list[CodeChunk]) -> int:
+        """Rewrite metadata of already-embedded code chunks without re-embedding."""
+        return code_ops.update_code_metadata(self, chunks)
+
     # ==========================================================================
     # Memory operations - delegate to memory_ops module
     # ==========================================================================
 
     def add_memory(self, observation: MemoryObservation) -> str:
         """Add a memory observation."""
-        return memory_ops.add_memory(self, observation)
+        try:
+            return memory_ops.add_memory(self, observation)
+        finally:
+            self._bump_memory_generation()
+
+    def add_memories(self, observations: list[MemoryObservation]) -> list[str]:
+        """Add many memory observations with one embed call and one upsert."""
+        try:
+            return memory_ops.add_memories(self, observations)
+        finally:
+            self._bump_memory_generation()
 
     def add_plan(self, plan: PlanObservation) -> str:
         """Add a plan to the memory collection for semantic search."""
-        return memory_ops.add_plan(self, plan)
+        try:
+            return memory_ops.add_plan(self, plan)
+        finally:
+            self._bump_memory_generation()
 
     def delete_memories(self, observation_ids: list[str]) -> int:
         """Delete memories from ChromaDB by their observation IDs."""
-        return memory_ops.delete_memories(self, observation_ids)
+        try:
+            return memory_ops.delete_memories(self, observation_ids)
+        finally:
+            self._bump_memory_generation()
 
     # ==========================================================================
     # Search operations - delegate to search module
     # ==========================================================================
 
-    def search_code(self, query: str, limit: int = 20) -> list[dict]:
+    def search_code(
+        self,
+        query: str,
+        limit: int = 20,
+        query_embedding: list[float] | None = None,
+    ) -> list[dict]:
         """Search code chunks."""
-        return search.search_code(self, query, limit)
+        return search.search_code(self, query, limit, query_embedding)
 
     def search_memory(
         self,
@@ -297,9 +499,12 @@ class VectorStore:
         limit: int = 10,
         memory_types: list[str] | None = None,
         metadata_filters: dict | None = None,
+        query_embedding: list[float] | None = None,
     ) -> list[dict]:
         """Search memory observations."""
-        return search.search_memory(self, query, limit, memory_types, metadata_filters)
+        return search.search_memory(
+            self, query, limit, memory_types, metadata_filters, query_embedding
+        )
 
     def get_by_ids(self, ids: list[str], collection: str = "code") -> list[dict]:
         """Fetch full content by IDs."""
@@ -316,11 +521,17 @@ class VectorStore:
         session_origin_type: str | None = None,
     ) -> bool:
         """Update memory status in ChromaDB metadata."""
-        return management.update_memory_status(self, memory_id, status, session_origin_type)
+        try:
+            return management.update_memory_status(self, memory_id, status, session_origin_type)
+        finally:
+            self._bump_memory_generation()
 
     def archive_memory(self, memory_id: str, archived: bool = True) -> bool:
         """Archive or unarchive a memory."""
-        return management.archive_memory(self, memory_id, archived)
+        try:
+            return management.archive_memory(self, memory_id, archived)
+        finally:
+            self._bump_memory_generation()
 
     def list_memories(
         self,
@@ -352,7 +563,10 @@ class VectorStore:
 
     def bulk_archive_memories(self, memory_ids: list[str], archived: bool = True) -> int:
         """Archive or unarchive multiple memories."""
-        return management.bulk_archive_memories(self, memory_ids, archived)
+        try:
+            return management.bulk_archive_memories(self, memory_ids, archived)
+        finally:
+            self._bump_memory_generation()
 
     def add_tag_to_memories(self, memory_ids: list[str], tag: str) -> int:
         """Add a tag to multiple memories."""
@@ -362,6 +576,10 @@ class VectorStore:
         """Remove a tag from multiple memories."""
         return management.remove_tag_from_memories(self, memory_ids, tag)
 
+    def count_code_chunks(self) -> int:
+        """Count chunks in the code index."""
+        return management.count_code_chunks(self)
+
     def count_unique_files(self) -> int:
         """Count unique files in the code index."""
         return management.count_unique_files(self)
@@ -388,11 +606,17 @@ class VectorStore:
 
     def clear_memory_collection(self) -> int:
         """Clear only memory collection, preserving code index."""
-        return management.clear_memory_collection(self)
+        try:
+            return management.clear_memory_collection(self)
+        finally:
+            self._bump_memory_generation()
 
     def clear_all(self) -> None:
         """Clear all data from both collections."""
-        management.clear_all(self)
+        try:
+            management.clear_all(self)
+        finally:
+            self._bump_memory_generation()
 
     def hard_reset(self) -> int:
         """Delete ChromaDB directory to reclaim disk space.
@@ -404,7 +628,10 @@ class VectorStore:
         Returns:
             Approximate bytes freed.
         """
-        return management.hard_reset(self)
+        try:
+            return management.hard_reset(self)
+        finally:
+            self._bump_memory_generation()
 
     # ==========================================================================
     # Session summary operations - for similarity-based session linking
@@ -442,9 +669,14 @@ class VectorStore:
             max_age_days,
         )
 
-    def search_session_summaries(self, query: str, limit: int = 10) -> list[dict]:
+    def search_session_summaries(
+        self,
+        query: str,
+        limit: int = 10,
+        query_embedding: list[float] | None = None,
+    ) -> list[dict]:
         """Search session summaries using vector similarity."""
-        return session_ops.search_session_summaries(self, query, limit)
+        return session_ops.search_session_summaries(self, query, limit, query_embedding)
 
     def delete_session_summary(self, session_id: str) -> bool:
         """Delete a session summary from the vector store."""
@@ -324,6 +324,23 @@ def remove_tag_from_memories(store: VectorStore, memory_ids: list[str], tag: str
     return count
 
 
+def count_code_chunks(store: VectorStore) -> int:
+    """Count chunks in the code index.
+
+    Args:
+        store: The VectorStore instance.
+
+    Returns:
+        Number of code chunks, or 0 if the collection is unavailable.
+    """
+    store._ensure_initialized()
+
+    try:
+        return int(store._code_collection.count()) if store._code_collection else 0
+    except (ValueError, RuntimeError, OSError, AttributeError):
+        return 0
+
+
 def count_unique_files(store: VectorStore) -> int:
     """Count unique files in the code index.
 
@@ -388,6 +405,10 @@ def get_stats(store: VectorStore) -> dict:
         "memory_count": memory_count,
         "memory_observations": memory_count,
         "persist_directory": str(store.persist_directory),
+        "embedding_cache": (
+            store.embedding_cache.get_stats() if store.embedding_cache is not None else None
+        ),
+        "query_embedding_cache": store.query_embedding_cache.get_stats(),
     }
 
 
@@ -471,9 +492,8 @@ def clear_memory_collection(store: VectorStore) -> int:
     # Delete and recreate only the memory collection
     store._client.delete_collection(MEMORY_COLLECTION)
 
-    store._memory_collection = store._client.create_collection(
-        name=MEMORY_COLLECTION,
-        metadata=default_hnsw_config(),
+    store._memory_collection = store._create_collection(
+        MEMORY_COLLECTION, default_hnsw_config(), store.embedding_provider.dimensions
     )
 
     logger.info(f"Cleared memory collection ({count} items, code index preserved)")
@@ -494,9 +514,8 @@ def clear_code_index(store: VectorStore) -> None:
     # Delete and recreate only the code collection
     store._client.delete_collection(CODE_COLLECTION)
 
-    store._code_collection = store._client.create_collection(
-        name=CODE_COLLECTION,
-        metadata=default_hnsw_config(),
+    store._code_collection = store._create_collection(
+        CODE_COLLECTION, default_hnsw_config(), store.embedding_provider.dimensions
     )
 
     logger.info("Cleared code index (memories preserved)")
@@ -526,6 +545,7 @@ def _close_chromadb_client(store: VectorStore) -> None:
     store._code_collection = None
     store._memory_collection = None
     store._session_summaries_collection = None
+    store._collection_dims.clear()
     store._client = None
 
     # Force garbage collection to release file handles
@@ -582,14 +602,10 @@ def clear_all(store: VectorStore) -> None:
     store._client.delete_collection(MEMORY_COLLECTION)
 
     # Recreate
-    store._code_collection = store._client.create_collection(
-        name=CODE_COLLECTION,
-        metadata=default_hnsw_config(),
-    )
-
-    store._memory_collection = store._client.create_collection(
-        name=MEMORY_COLLECTION,
-        metadata=default_hnsw_config(),
+    dims = store.embedding_provider.dimensions
+    store._code_collection = store._create_collection(CODE_COLLECTION, default_hnsw_config(), dims)
+    store._memory_collection = store._create_collection(
+        MEMORY_COLLECTION, default_hnsw_config(), dims
     )
 
     logger.info("Cleared all vector store data (including memories)")
@@ -70,6 +70,76 @@ def add_memory(store: VectorStore, observation: MemoryObservation) -> str:
     return observation.id
 
 
+def add_memories(store: VectorStore, observations: list[MemoryObservation]) -> list[str]:
+    """Add many memory observations with one embed call and one upsert.
+
+    Used by bulk re-embedding (rebuilds, restores, model changes), where
+    adding memories one at a time pays for an embedding request, a
+    dimension check and an upsert per row. Here the dimension check runs
+    once for the whole batch, and the embedding provider splits the texts
+    into request-sized batches itself.
+
+    Args:
+        store: The VectorStore instance.
+        observations: Observations to store. Later duplicates of an ID win.
+
+    Returns:
+        IDs of the stored observations, in input order.
+
+    Raises:
+        ValueError: If the provider returns fewer embeddings than texts.
+    """
+    store._ensure_initialized()
+
+    # Chroma rejects duplicate IDs within one upsert
+    unique = list({observation.id: observation for observation in observations}.values())
+    if not unique:
+        return []
+
+    result = store._embed_texts([observation.get_embedding_text() for observation in unique])
+    if len(result.embeddings) != len(unique):
+        raise ValueError(
+            f"Embedding provider returned {len(result.embeddings)} embeddings "
+            f"for {len(unique)} memories"
+        )
+
+    # Get actual dimensions
+    actual_dims = result.dimensions
+    if len(result.embeddings) > 0:
+        actual_dims = len(result.embeddings[0])
+
+    # Check for dimension mismatch once for the whole batch
+    store._handle_dimension_mismatch(MEMORY_COLLECTION, actual_dims)
+
+    ids = [observation.id for observation in unique]
+    documents = [observation.observation for observation in unique]
+    metadatas = [observation.to_metadata() for observation in unique]
+
+    # Upsert with dimension mismatch recovery
+    try:
+        store._memory_collection.upsert(
+            ids=ids,
+            documents=documents,
+            embeddings=result.embeddings,
+            metadatas=metadatas,
+        )
+    except (RuntimeError, ValueError, TypeError) as e:
+        if "dimension" in str(e).lower():
+            logger.warning(f"Dimension mismatch on memory batch insert, recreating: {e}")
+            store._recreate_collection(MEMORY_COLLECTION, actual_dims)
+            store._memory_collection.upsert(
+                ids=ids,
+                documents=documents,
+                embeddings=result.embeddings,
+                metadatas=metadatas,
+            )
+        else:
+            raise
+
+    logger.info(f"Added {len(ids)} memory observations")
+    return ids
+
+
 def add_plan(store: VectorStore, plan: PlanObservation) -> str:
     """Add a plan to the memory collection for semantic search.
 
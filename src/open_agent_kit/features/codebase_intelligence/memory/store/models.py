@@ -38,6 +38,8 @@ class CodeChunk:
     parent_id: str | None = None
     docstring: str | None = None
     signature: str | None = None
+    # Dotted symbol path the ID is derived from (e.g. "Indexer.build"); not stored
+    symbol: str | None = None
 
     @property
     def token_estimate(self) -> int:
@@ -116,10 +118,20 @@ class CodeChunk:
         }
 
     @staticmethod
-    def generate_id(filepath: str, start_line: int, content: str) -> str:
-        """Generate stable ID from content."""
+    def generate_id(filepath: str, symbol: str, content: str) -> str:
+        """Generate a line-independent ID from symbol path and content.
+
+        Line numbers are deliberately left out: editing code above a chunk
+        shifts its lines but keeps its ID, so incremental indexing only has
+        to update its metadata instead of re-embedding it.
+
+        Args:
+            filepath: File the chunk belongs to.
+            symbol: Dotted symbol path within the file (e.g. "Class.method").
+            content: Chunk content.
+        """
         content_hash = hashlib.sha256(content.encode()).hexdigest()[:12]
-        return f"{filepath}:{start_line}:{content_hash}"
+        return f"{filepath}:{symbol}:{content_hash}"
 
 
 @dataclass
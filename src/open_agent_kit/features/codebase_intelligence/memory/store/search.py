@@ -15,6 +15,7 @@ def search_code(
     store: VectorStore,
     query: str,
     limit: int = 20,
+    query_embedding: list[float] | None = None,
 ) -> list[dict]:
     """Search code chunks.
 
@@ -22,13 +23,15 @@ def search_code(
         store: The VectorStore instance.
         query: Search query.
         limit: Maximum results to return.
+        query_embedding: Precomputed embedding of ``query`` (embedded if None).
 
     Returns:
         List of search results with metadata.
     """
     store._ensure_initialized()
 
-    query_embedding = store.embedding_provider.embed_query(query)
+    if query_embedding is None:
+        query_embedding = store.embed_query(query)
 
     results = store._code_collection.query(
         query_embeddings=[query_embedding],
@@ -62,6 +65,7 @@ def search_memory(
     limit: int = 10,
     memory_types: list[str] | None = None,
     metadata_filters: dict | None = None,
+    query_embedding: list[float] | None = None,
 ) -> list[dict]:
     """Search memory observations.
 
@@ -71,13 +75,15 @@ def search_memory(
         limit: Maximum results to return.
         memory_types: Filter by memory types.
         metadata_filters: Additional ChromaDB where-clause filters.
+        query_embedding: Precomputed embedding of ``query`` (embedded if None).
 
     Returns:
         List of search results.
     """
     store._ensure_initialized()
 
-    query_embedding = store.embedding_provider.embed_query(query)
+    if query_embedding is None:
+        query_embedding = store.embed_query(query)
 
     # Build where filter
     where_clauses: list[dict] = []
@@ -178,6 +178,7 @@ def search_session_summaries(
     store: VectorStore,
     query: str,
     limit: int = 10,
+    query_embedding: list[float] | None = None,
 ) -> list[dict]:
     """Search session summaries using vector similarity.
 
@@ -185,6 +186,7 @@ def search_session_summaries(
         store: The VectorStore instance.
         query: Search query text.
         limit: Maximum number of results.
+        query_embedding: Precomputed embedding of ``query`` (embedded if None).
 
     Returns:
         List of matching session summaries with metadata and relevance scores.
@@ -195,14 +197,14 @@ def search_session_summaries(
         return []
 
     # Generate query embedding
-    try:
-        result = store.embedding_provider.embed([query])
-        if not result.embeddings or len(result.embeddings) == 0:
+    if query_embedding is None:
+        try:
+            query_embedding = store.embed_query(query)
+        except (OSError, ValueError, RuntimeError) as e:
+            logger.error(f"Failed to embed query for session search: {e}")
+            return []
+        if not query_embedding:
             return []
-        query_embedding = result.embeddings[0]
-    except (OSError, ValueError, RuntimeError) as e:
-        logger.error(f"Failed to embed query for session search: {e}")
-        return []
 
     # Query the collection
     try:
@@ -453,10 +453,17 @@ class RetrievalEngine:
 
         result = SearchResult(query=query)
 
+        # Embed once and share the vector across collections. Session-only
+        # searches let the store embed, since it tolerates embedding failures.
+        query_embedding = None
+        if search_type != SEARCH_TYPE_SESSIONS:
+            query_embedding = self.store.embed_query(query)
+
         if search_type in (SEARCH_TYPE_ALL, SEARCH_TYPE_CODE):
             code_results = self.store.search_code(
                 query=query,
                 limit=limit,
+                query_embedding=query_embedding,
             )
 
             # Apply doc_type weighting to scores (if enabled)
@@ -492,6 +499,7 @@ class RetrievalEngine:
                 query=query,
                 limit=limit,
                 metadata_filters=memory_filters,
+                query_embedding=query_embedding,
             )
             # Filter out plans from memory results (they go in the plans category)
             memory_results = [r for r in memory_results if r.get("memory_type") != MEMORY_TYPE_PLAN]
@@ -522,6 +530,7 @@ class RetrievalEngine:
                 query=query,
                 limit=limit,
                 memory_types=[MEMORY_TYPE_PLAN],  # Filter to plans only
+                query_embedding=query_embedding,
             )
 
             # Calculate confidence for plan results
@@ -556,6 +565,7 @@ class RetrievalEngine:
             session_results = self.store.search_session_summaries(
                 query=query,
                 limit=limit,
+                query_embedding=query_embedding,
             )
 
             # Calculate confidence for session results
@@ -748,10 +758,13 @@ class RetrievalEngine:
             file_names = [f.split("/")[-1] for f in current_files]
             search_query = f"{task} {' '.join(file_names)}"
 
+        query_embedding = self.store.embed_query(search_query)
+
         # Search for relevant code
         code_results = self.store.search_code(
             query=search_query,
             limit=DEFAULT_CONTEXT_LIMIT,
+            query_embedding=query_embedding,
         )
 
         # Apply doc_type weighting if enabled
@@ -777,6 +790,7 @@ class RetrievalEngine:
             query=search_query,
             limit=DEFAULT_CONTEXT_MEMORY_LIMIT,
             metadata_filters={"status": "active"},
+            query_embedding=query_embedding,
         )
 
         for r in memory_results:
@@ -1007,3 +1021,77 @@ class RetrievalEngine:
             status=status,
             include_resolved=include_resolved,
         )
+
+    def list_memories_page(
+        self,
+        limit: int = DEFAULT_MEMORY_LIST_LIMIT,
+        cursor: str | None = None,
+        offset: int = 0,
+        memory_types: list[str] | None = None,
+        exclude_types: list[str] | None = None,
+        tag: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        include_archived: bool = False,
+        status: str | None = "active",
+        include_resolved: bool = False,
+    ) -> tuple[list[dict[str, Any]], int, str | None]:
+        """List one page of stored memories using keyset pagination.
+
+        Same filters as list_memories. The ChromaDB fallback only supports
+        offset pagination and never returns a next cursor.
+
+        Args:
+            limit: Maximum memories to return.
+            cursor: next_cursor from the previous page. Takes precedence over offset.
+            offset: Pagination offset when no cursor is given (deprecated).
+            memory_types: Filter to specific types.
+            exclude_types: Types to exclude.
+            tag: Filter to memories containing this tag.
+            start_date: Filter to memories created on or after this date (ISO format).
+            end_date: Filter to memories created on or before this date (ISO format).
+            include_archived: If True, include archived memories. Default False.
+            status: Filter to this observation status. Default "active".
+            include_resolved: If True, include all statuses. Default False.
+
+        Returns:
+            Tuple of (memories list, total count, cursor for the next page or None).
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid, or given without an
+                activity store.
+        """
+        if self.activity_store:
+            return self.activity_store.list_observations_page(
+                limit=limit,
+                cursor=cursor,
+                offset=offset,
+                memory_types=memory_types,
+                exclude_types=exclude_types,
+                tag=tag,
+                start_date=start_date,
+                end_date=end_date,
+                include_archived=include_archived,
+                status=status,
+                include_resolved=include_resolved,
+            )
+
+        if cursor:
+            from open_agent_kit.features.codebase_intelligence.activity.store.pagination import (
+                InvalidCursorError,
+            )
+
+            raise InvalidCursorError("Cursor pagination requires the activity store")
+        memories, total = self.list_memories(
+            limit=limit,
+            offset=offset,
+            memory_types=memory_types,
+            exclude_types=exclude_types,
+            tag=tag,
+            start_date=start_date,
+            end_date=end_date,
+            include_archived=include_archived,
+            status=status,
+            include_resolved=include_resolved,
+        )
+        return memories, total, None
@@ -49,7 +49,7 @@ def extract_tables(schema_sql: str) -> dict[str, dict]:
     # Captures the full CREATE statement including closing );
     regular_pattern = re.compile(
         r"(-- [^\n]*\n)*"  # Optional comment lines before
-        r"CREATE TABLE IF NOT EXISTS (\w+)\s*\((.*?)\);",
+        r"CREATE TABLE IF NOT EXISTS (\w+)\s*\((.*?)\)(\s+WITHOUT ROWID)?;",
         re.DOTALL,
     )
     virtual_pattern = re.compile(
@@ -66,6 +66,7 @@ def extract_tables(schema_sql: str) -> dict[str, dict]:
         tables[name] = {
             "type": "table",
             "body": body.strip(),
+            "options": (match.group(4) or "").strip(),
             "comments": comments.strip(),
             "full_match": match.group(0),
         }
@@ -137,6 +138,9 @@ def get_table_description(name: str) -> str:
         "session_link_events": "Analytics for user-driven session linking.",
         "session_relationships": "Many-to-many semantic relationships between sessions.",
         "resolution_events": "Cross-machine resolution propagation. Each resolution action (resolve, supersede, reactivate) is recorded as a first-class, machine-owned entity that flows through the backup pipeline.",
+        "session_rollups": "Per-session activity counts maintained by triggers on activities. Read by the sessions list and session stats instead of aggregating activities.",
+        "session_tool_rollups": "Per-session activity count by tool name, maintained by triggers on activities.",
+        "session_file_rollups": "Per-session reference count of touched file paths, maintained by triggers on activities. Backs session_rollups.files_touched.",
         "activities_fts": "Full-text search index over activities (FTS5).",
         "memories_fts": "Full-text search index over memory observations (FTS5).",
     }
@@ -168,7 +172,7 @@ def generate_schema_md(tables: dict, indexes: dict) -> str:
         lines.append("```sql")
         lines.append(f"CREATE TABLE IF NOT EXISTS {name} (")
         lines.append(f"    {info['body']}")
-        lines.append(");")
+        lines.append(f") {info['options']};" if info["options"] else ");")
         lines.append("```")
         lines.append("")
         if name in indexes:
@@ -254,6 +258,9 @@ def generate_core_tables_section(tables: dict) -> str:
         "session_link_events": "`session_id`, `event_type`, `old_parent_id`, `new_parent_id`",
         "session_relationships": "`session_a_id`, `session_b_id`, `relationship_type`, `similarity_score`",
         "resolution_events": "`observation_id`, `action`, `source_machine_id`, `applied`, `content_hash`",
+        "session_rollups": "`session_id`, `last_activity_epoch`, `activity_count`, `error_count`, `files_touched`",
+        "session_tool_rollups": "`session_id`, `tool_name`, `count`",
+        "session_file_rollups": "`session_id`, `file_path`, `count`",
     }
 
     # Build table descriptions
@@ -267,6 +274,9 @@ def generate_core_tables_section(tables: dict) -> str:
         "session_link_events": "Session linking analytics",
         "session_relationships": "Semantic session relationships",
         "resolution_events": "Cross-machine resolution propagation",
+        "session_rollups": "Per-session activity totals (trigger-maintained)",
+        "session_tool_rollups": "Per-session counts by tool",
+        "session_file_rollups": "Per-session touched files",
     }
 
     lines = []
@@ -0,0 +1,25 @@
+"""Console entry point for ``oak``.
+
+Dispatches ``oak ci hook`` to the standard-library-only ``ci_hook`` module
+so agent hooks, which run on every tool call, skip importing the full CLI.
+Every other command goes to ``open_agent_kit.cli``.
+"""
+
+import sys
+
+HOOK_COMMAND = ["ci", "hook"]
+HELP_FLAGS = frozenset({"--help", "-h"})
+
+
+def main() -> None:
+    """Run the ``oak`` command."""
+    args = sys.argv[1:]
+    if args[:2] == HOOK_COMMAND and not HELP_FLAGS.intersection(args):
+        from open_agent_kit.ci_hook import main as hook_main
+
+        hook_main(args[2:])
+        return
+
+    from open_agent_kit.cli import cli_main
+
+    cli_main()
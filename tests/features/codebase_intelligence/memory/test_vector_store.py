@@ -28,6 +28,9 @@ from open_agent_kit.features.codebase_intelligence.memory.store import (
     MemoryObservation,
     VectorStore,
 )
+from open_agent_kit.features.codebase_intelligence.memory.store.constants import (
+    COLLECTION_DIMENSIONS_KEY,
+)
 
 
 @pytest.fixture
@@ -193,6 +196,96 @@ class TestVectorStoreDimensionMismatch:
         store._client.delete_collection.assert_not_called()
 
 
+class TestVectorStoreDimensionCache:
+    """Test that collection dimensions are cached instead of read per insert."""
+
+    @staticmethod
+    def _store_with_collection(
+        temp_vector_store_dir: Path,
+        mock_embedding_provider: MagicMock,
+        dims: int,
+    ) -> tuple[VectorStore, MagicMock]:
+        store = VectorStore(
+            persist_directory=temp_vector_store_dir,
+            embedding_provider=mock_embedding_provider,
+        )
+        collection = MagicMock()
+        collection.count.return_value = 10
+        collection.metadata = {}
+        collection.peek.return_value = {"embeddings": [[0.1] * dims]}
+        store._client = MagicMock()
+        store._memory_collection = collection
+        return store, collection
+
+    def test_dimensions_read_once(
+        self,
+        temp_vector_store_dir: Path,
+        mock_embedding_provider: MagicMock,
+    ):
+        """Test that repeated inserts don't read an embedding back each time."""
+        store, collection = self._store_with_collection(
+            temp_vector_store_dir, mock_embedding_provider, 384
+        )
+
+        for i in range(50):
+            store.add_memory(
+                MemoryObservation(id=f"mem{i}", observation=f"Note {i}", memory_type="gotcha")
+            )
+
+        assert collection.peek.call_count == 1
+        assert collection.upsert.call_count == 50
+        store._client.delete_collection.assert_not_called()
+
+    def test_recorded_dimensions_skip_peek(
+        self,
+        temp_vector_store_dir: Path,
+        mock_embedding_provider: MagicMock,
+    ):
+        """Test that dimensions recorded in collection metadata are trusted."""
+        store, collection = self._store_with_collection(
+            temp_vector_store_dir, mock_embedding_provider, 384
+        )
+        collection.metadata = {COLLECTION_DIMENSIONS_KEY: 384}
+
+        store._handle_dimension_mismatch(MEMORY_COLLECTION, 384)
+
+        collection.peek.assert_not_called()
+        store._client.delete_collection.assert_not_called()
+
+    def test_mismatch_recreates_with_recorded_dimensions(
+        self,
+        temp_vector_store_dir: Path,
+        mock_embedding_provider: MagicMock,
+    ):
+        """Test that a recreated collection records the new dimensions."""
+        store, _ = self._store_with_collection(temp_vector_store_dir, mock_embedding_provider, 768)
+
+        store._handle_dimension_mismatch(MEMORY_COLLECTION, 384)
+        store._handle_dimension_mismatch(MEMORY_COLLECTION, 384)
+
+        store._client.delete_collection.assert_called_once_with(MEMORY_COLLECTION)
+        metadata = store._client.create_collection.call_args.kwargs["metadata"]
+        assert metadata[COLLECTION_DIMENSIONS_KEY] == 384
+
+    def test_provider_change_revalidates(
+        self,
+        temp_vector_store_dir: Path,
+        mock_embedding_provider: MagicMock,
+    ):
+        """Test that switching providers drops the cached dimensions."""
+        store, collection = self._store_with_collection(
+            temp_vector_store_dir, mock_embedding_provider, 384
+        )
+        store._handle_dimension_mismatch(MEMORY_COLLECTION, 384)
+
+        new_provider = MagicMock(spec=EmbeddingProvider)
+        new_provider.dimensions = 384
+        store.update_embedding_provider(new_provider)
+        store._handle_dimension_mismatch(MEMORY_COLLECTION, 384)
+
+        assert collection.peek.call_count == 2
+
+
 class TestVectorStoreBatchEmbedding:
     """Test batch embedding with progress tracking."""
 
@@ -344,6 +437,54 @@ class TestVectorStoreBatchEmbedding:
         assert result == 2
 
 
+class TestVectorStoreCodeMetadata:
+    """Test metadata lookup and metadata-only updates for code chunks."""
+
+    @staticmethod
+    def _chunk(filepath: str, name: str, start_line: int) -> CodeChunk:
+        content = f"def {name}():\n    pass"
+        return CodeChunk(
+            id=CodeChunk.generate_id(filepath, name, content),
+            content=content,
+            filepath=filepath,
+            language="python",
+            chunk_type="function",
+            name=name,
+            start_line=start_line,
+            end_line=start_line + 1,
+        )
+
+    def test_get_metadata_by_filepaths(self, vector_store: VectorStore):
+        """Test that only chunks of the requested files are returned."""
+        chunks = [
+            self._chunk("a.py", "one", 1),
+            self._chunk("b.py", "two", 1),
+            self._chunk("c.py", "three", 1),
+        ]
+        vector_store.add_code_chunks(chunks)
+
+        stored = vector_store.get_code_metadata_by_filepaths(["a.py", "b.py"])
+
+        assert set(stored) == {chunks[0].id, chunks[1].id}
+        assert stored[chunks[0].id]["start_line"] == 1
+
+    def test_update_metadata_does_not_reembed(
+        self, vector_store: VectorStore, mock_embedding_provider: MagicMock
+    ):
+        """Test that moving a chunk rewrites its metadata without embedding it."""
+        chunk = self._chunk("a.py", "one", 1)
+        vector_store.add_code_chunks([chunk])
+        embed_calls = mock_embedding_provider.embed.call_count
+
+        moved = self._chunk("a.py", "one", 10)
+        vector_store.update_code_metadata([moved])
+
+        stored = vector_store.get_code_metadata_by_filepaths(["a.py"])
+        assert stored[chunk.id]["start_line"] == 10
+        assert stored[chunk.id]["end_line"] == 11
+        assert mock_embedding_provider.embed.call_count == embed_calls
+
+
 class TestVectorStoreSearchRelevance:
     """Test search relevance scoring."""
 
@@ -0,0 +1,208 @@
+"""Tests for keyset (cursor) pagination of the activity store list queries.
+
+Covers:
+- Walking sessions, activities, memories and agent runs page by page with
+  next_cursor yields the same rows as one unpaginated query, including ties
+- Offset pagination still working alongside cursors
+- Malformed cursors and cursors from another sort order rejected
+- Cursor pages of memories planned on the (created_at_epoch, id) index
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.activity.store.core import (
+    ActivityStore,
+)
+from open_agent_kit.features.codebase_intelligence.activity.store.models import (
+    Activity,
+    StoredObservation,
+)
+from open_agent_kit.features.codebase_intelligence.activity.store.pagination import (
+    InvalidCursorError,
+)
+from open_agent_kit.features.codebase_intelligence.activity.store.sessions import (
+    create_session,
+)
+
+TEST_MACHINE_ID = "test-machine-pagination"
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+PAGE_SIZE = 4
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> ActivityStore:
+    """Create an ActivityStore with a real temp SQLite database."""
+    db_path = tmp_path / "ci" / "activities.db"
+    activity_store = ActivityStore(db_path, machine_id=TEST_MACHINE_ID)
+    yield activity_store
+    activity_store.close()
+
+
+def _walk(fetch_page: Callable[[str | None], tuple[Any, ...]]) -> list[Any]:
+    """Follow next_cursor until the last page, collecting every item."""
+    items: list[Any] = []
+    cursor = None
+    while True:
+        page = fetch_page(cursor)
+        assert len(page[0]) <= PAGE_SIZE
+        items.extend(page[0])
+        cursor = page[-1]
+        if cursor is None:
+            return items
+
+
+def _seed_sessions(store: ActivityStore) -> None:
+    # created_at_epoch collides within the same second, so the id tiebreaker matters
+    for i in range(11):
+        create_session(store, session_id=f"s{i:02d}", agent="claude", project_root="/p")
+    store.end_session("s03")
+    for i, minutes in [(2, 5), (7, 1), (2, 9)]:
+        store.add_activity(
+            Activity(
+                session_id=f"s{i:02d}",
+                tool_name="Read",
+                timestamp=BASE_TIME + timedelta(minutes=minutes),
+            )
+        )
+
+
+class TestKeysetWalk:
+    """Test that following cursors returns every row exactly once, in order."""
+
+    @pytest.mark.parametrize("sort", ["last_activity", "status", "created"])
+    def test_sessions(self, store: ActivityStore, sort: str):
+        _seed_sessions(store)
+
+        expected = [s.id for s in store.get_recent_sessions(limit=100, sort=sort)]
+        walked = _walk(lambda c: store.get_sessions_page(limit=PAGE_SIZE, cursor=c, sort=sort))
+
+        assert [s.id for s in walked] == expected
+        assert len(expected) == 11
+
+    def test_activities(self, store: ActivityStore):
+        create_session(store, session_id="s", agent="claude", project_root="/p")
+        for i in range(10):
+            store.add_activity(
+                Activity(
+                    session_id="s",
+                    tool_name="Read",
+                    timestamp=BASE_TIME + timedelta(minutes=i // 3),
+                )
+            )
+
+        walked = _walk(lambda c: store.get_session_activities_page("s", limit=PAGE_SIZE, cursor=c))
+
+        ids = [a.id for a in walked]
+        assert ids == sorted(ids)
+        assert len(ids) == 10
+
+    def test_memories(self, store: ActivityStore):
+        create_session(store, session_id="s", agent="claude", project_root="/p")
+        for i in range(9):
+            store.store_observation(
+                StoredObservation(
+                    id=f"obs-{i}",
+                    session_id="s",
+                    observation=f"observation {i}",
+                    memory_type="discovery",
+                    created_at=BASE_TIME + timedelta(minutes=i % 3),
+                )
+            )
+
+        expected, total = store.list_observations(limit=100)
+        walked = _walk(lambda c: store.list_observations_page(limit=PAGE_SIZE, cursor=c))
+
+        assert [m["id"] for m in walked] == [m["id"] for m in expected]
+        assert total == 9
+
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    def test_agent_runs(self, store: ActivityStore, sort_order: str):
+        for i in range(9):
+            store.create_agent_run(run_id=f"run-{i}", agent_name="docs", task="t")
+
+        expected, _total = store.list_agent_runs(limit=100, sort_order=sort_order)
+        walked = _walk(
+            lambda c: store.list_agent_runs_page(limit=PAGE_SIZE, cursor=c, sort_order=sort_order)
+        )
+
+        assert [r["id"] for r in walked] == [r["id"] for r in expected]
+        assert not any(key.startswith("_k") for key in walked[0])
+
+
+class TestOffsetCompatibility:
+    """Test that deprecated offsets keep working."""
+
+    def test_offset_pages_match_cursor_pages(self, store: ActivityStore):
+        _seed_sessions(store)
+
+        by_offset = [
+            s.id
+            for offset in range(0, 12, PAGE_SIZE)
+            for s in store.get_recent_sessions(limit=PAGE_SIZE, offset=offset)
+        ]
+        by_cursor = _walk(lambda c: store.get_sessions_page(limit=PAGE_SIZE, cursor=c))
+
+        assert by_offset == [s.id for s in by_cursor]
+
+    def test_cursor_takes_precedence_over_offset(self, store: ActivityStore):
+        _seed_sessions(store)
+        first, cursor = store.get_sessions_page(limit=PAGE_SIZE)
+
+        second, _ = store.get_sessions_page(limit=PAGE_SIZE, cursor=cursor, offset=100)
+
+        assert len(second) == PAGE_SIZE
+        assert not {s.id for s in first} & {s.id for s in second}
+
+
+class TestInvalidCursor:
+    """Test cursor validation."""
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "WyJ4Il0"])
+    def test_malformed_cursor_rejected(self, store: ActivityStore, cursor: str):
+        with pytest.raises(InvalidCursorError):
+            store.get_sessions_page(limit=PAGE_SIZE, cursor=cursor)
+
+    def test_cursor_from_other_sort_rejected(self, store: ActivityStore):
+        _seed_sessions(store)
+        _, cursor = store.get_sessions_page(limit=PAGE_SIZE, sort="created")
+
+        with pytest.raises(InvalidCursorError):
+            store.get_sessions_page(limit=PAGE_SIZE, cursor=cursor, sort="last_activity")
+
+
+class TestDeepPageQueryPlan:
+    """Test that deep memory pages seek by cursor instead of scanning."""
+
+    def test_cursor_query_uses_created_id_index(self, store: ActivityStore):
+        """Test that the cursor page query is planned on the keyset index."""
+        create_session(store, session_id="s", agent="claude", project_root="/p")
+        for i in range(3):
+            store.store_observation(
+                StoredObservation(
+                    id=f"obs-{i}",
+                    session_id="s",
+                    observation=f"observation {i}",
+                    memory_type="discovery",
+                    created_at=BASE_TIME,
+                )
+            )
+        _, _, cursor = store.list_observations_page(limit=1)
+
+        conn = store._get_connection()
+        statements: list[str] = []
+        conn.set_trace_callback(statements.append)
+        try:
+            store.list_observations_page(limit=PAGE_SIZE, cursor=cursor)
+        finally:
+            conn.set_trace_callback(None)
+        page_sql = next(sql for sql in statements if sql.lstrip().startswith("SELECT *"))
+
+        plan = " ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {page_sql}"))
+        assert "idx_memory_observations_created_id" in plan
@@ -0,0 +1,225 @@
+"""Tests for the materialized per-session rollups.
+
+Covers:
+- Insert/update/delete triggers keeping rollups equal to a full backfill
+- get_recent_sessions() sorting by last activity from the rollups
+- Session deletion removing rollup rows
+- v8 -> v9 migration backfilling existing activities
+- Adding the update trigger to databases already past v9
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.activity.store.core import (
+    ActivityStore,
+)
+from open_agent_kit.features.codebase_intelligence.activity.store.migrations import (
+    apply_migrations,
+    backfill_session_rollups,
+)
+from open_agent_kit.features.codebase_intelligence.activity.store.models import (
+    Activity,
+)
+from open_agent_kit.features.codebase_intelligence.activity.store.sessions import (
+    create_session,
+    get_recent_sessions,
+)
+
+TEST_MACHINE_ID = "test-machine-rollups"
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> ActivityStore:
+    """Create an ActivityStore with a real temp SQLite database."""
+    db_path = tmp_path / "ci" / "activities.db"
+    activity_store = ActivityStore(db_path, machine_id=TEST_MACHINE_ID)
+    yield activity_store
+    activity_store.close()
+
+
+def _add_activity(
+    store: ActivityStore,
+    session_id: str,
+    minutes: int,
+    tool_name: str = "Read",
+    file_path: str | None = "/a.py",
+    success: bool = True,
+) -> int:
+    return store.add_activity(
+        Activity(
+            session_id=session_id,
+            tool_name=tool_name,
+            file_path=file_path,
+            success=success,
+            timestamp=BASE_TIME + timedelta(minutes=minutes),
+        )
+    )
+
+
+def _snapshot(store: ActivityStore) -> tuple[list[tuple], list[tuple], list[tuple]]:
+    conn = store._get_connection()
+    return (
+        [tuple(r) for r in conn.execute("SELECT * FROM session_rollups ORDER BY session_id")],
+        [
+            tuple(r)
+            for r in conn.execute(
+                "SELECT * FROM session_tool_rollups ORDER BY session_id, tool_name"
+            )
+        ],
+        [
+            tuple(r)
+            for r in conn.execute(
+                "SELECT * FROM session_file_rollups ORDER BY session_id, file_path"
+            )
+        ],
+    )
+
+
+def _rebuilt(store: ActivityStore) -> tuple[list[tuple], list[tuple], list[tuple]]:
+    conn = store._get_connection()
+    backfill_session_rollups(conn)
+    conn.commit()
+    return _snapshot(store)
+
+
+class TestRollupTriggers:
+    """Test that incremental maintenance matches a full rebuild."""
+
+    def test_inserts_and_deletes_match_backfill(self, store: ActivityStore):
+        create_session(store, session_id="s1", agent="claude", project_root="/p")
+        create_session(store, session_id="s2", agent="claude", project_root="/p")
+        ids = [
+            _add_activity(store, "s1", 1, "Read", "/a.py"),
+            _add_activity(store, "s1", 5, "Edit", "/a.py"),
+            _add_activity(store, "s1", 3, "Write", "/b.py"),
+            _add_activity(store, "s1", 4, "Bash", None, success=False),
+            _add_activity(store, "s2", 2, "Read", "/a.py"),
+        ]
+        # Drop the latest activity and one of two /a.py touches
+        store.delete_activity(ids[1])
+
+        incremental = _snapshot(store)
+        assert incremental == _rebuilt(store)
+
+        rollup = (
+            store._get_connection()
+            .execute("SELECT * FROM session_rollups WHERE session_id = 's1'")
+            .fetchone()
+        )
+        assert rollup["activity_count"] == 3
+        assert rollup["files_touched"] == 2
+        assert rollup["edit_count"] == 0
+        assert rollup["error_count"] == 1
+        assert rollup["last_activity_epoch"] == int((BASE_TIME + timedelta(minutes=4)).timestamp())
+
+    def test_updates_match_backfill(self, store: ActivityStore):
+        create_session(store, session_id="s1", agent="claude", project_root="/p")
+        create_session(store, session_id="s2", agent="claude", project_root="/p")
+        ids = [
+            _add_activity(store, "s1", 1, "Read", "/a.py"),
+            _add_activity(store, "s1", 5, "Edit", "/a.py"),
+            _add_activity(store, "s1", 3, "Write", "/b.py"),
+            _add_activity(store, "s2", 2, "Read", "/a.py"),
+        ]
+        conn = store._get_connection()
+        # Move the latest activity back in time, retype and re-point others
+        conn.execute(
+            "UPDATE activities SET timestamp_epoch = ? WHERE id = ?",
+            (int(BASE_TIME.timestamp()), ids[1]),
+        )
+        conn.execute(
+            "UPDATE activities SET tool_name = 'Bash', file_path = NULL, success = FALSE "
+            "WHERE id = ?",
+            (ids[2],),
+        )
+        conn.execute("UPDATE activities SET session_id = 's2' WHERE id = ?", (ids[0],))
+        conn.commit()
+
+        incremental = _snapshot(store)
+        assert incremental == _rebuilt(store)
+
+        rollup = conn.execute("SELECT * FROM session_rollups WHERE session_id = 's1'").fetchone()
+        assert rollup["activity_count"] == 2
+        assert rollup["files_touched"] == 1
+        assert rollup["write_count"] == 0
+        assert rollup["error_count"] == 1
+        assert rollup["last_activity_epoch"] == int((BASE_TIME + timedelta(minutes=3)).timestamp())
+
+    def test_session_delete_removes_rollups(self, store: ActivityStore):
+        create_session(store, session_id="gone", agent="claude", project_root="/p")
+        _add_activity(store, "gone", 1)
+
+        store.delete_session("gone")
+
+        assert _snapshot(store) == ([], [], [])
+
+
+class TestRecentSessionsSort:
+    """Test that the sessions list sorts by rollup last activity."""
+
+    def test_resumed_session_sorts_first(self, store: ActivityStore):
+        for session_id in ("old", "new", "idle"):
+            create_session(store, session_id=session_id, agent="claude", project_root="/p")
+        _add_activity(store, "new", 1)
+        _add_activity(store, "old", 10)
+
+        sessions = get_recent_sessions(store, limit=10, sort="last_activity")
+
+        ordered = [s.id for s in sessions]
+        assert ordered.index("old") < ordered.index("new")
+        assert set(ordered) == {"old", "new", "idle"}
+
+
+class TestRollupMigration:
+    """Test the v8 -> v9 backfill of existing activities."""
+
+    def test_migration_backfills_existing_activities(self, store: ActivityStore):
+        create_session(store, session_id="s1", agent="claude", project_root="/p")
+        _add_activity(store, "s1", 1, "Read", "/a.py")
+        _add_activity(store, "s1", 2, "Edit", "/a.py")
+        expected = _snapshot(store)
+
+        # Simulate a v8 database: no rollup tables or triggers
+        conn = store._get_connection()
+        for trigger in (
+            "session_rollups_ai",
+            "session_rollups_au",
+            "session_rollups_ad",
+            "session_rollups_session_ad",
+        ):
+            conn.execute(f"DROP TRIGGER {trigger}")
+        for table in ("session_rollups", "session_tool_rollups", "session_file_rollups"):
+            conn.execute(f"DROP TABLE {table}")
+        conn.commit()
+
+        apply_migrations(conn, from_version=8)
+        conn.commit()
+
+        assert _snapshot(store) == expected
+        _add_activity(store, "s1", 3, "Write", "/b.py")
+        assert _snapshot(store) == _rebuilt(store)
+
+    def test_missing_update_trigger_added_and_rollups_rebuilt(self, store: ActivityStore):
+        create_session(store, session_id="s1", agent="claude", project_root="/p")
+        activity_id = _add_activity(store, "s1", 1, "Read", "/a.py")
+
+        # Simulate a database that reached v9 before the update trigger existed
+        conn = store._get_connection()
+        conn.execute("DROP TRIGGER session_rollups_au")
+        conn.execute("UPDATE activities SET tool_name = 'Edit' WHERE id = ?", (activity_id,))
+        conn.commit()
+        assert _snapshot(store)[1] == [("s1", "Read", 1)]
+
+        apply_migrations(conn, from_version=11)
+        conn.commit()
+
+        assert _snapshot(store)[1] == [("s1", "Edit", 1)]
+        conn.execute("UPDATE activities SET tool_name = 'Write' WHERE id = ?", (activity_id,))
+        conn.commit()
+        assert _snapshot(store) == _rebuilt(store)
@@ -0,0 +1,206 @@
+"""Tests for the write-behind activity queue.
+
+Covers:
+- Time-based and size-based draining by the writer thread
+- flush() and close() committing everything queued
+- Bulk insert IDs and session/batch counters
+- Queue depth and write latency stats
+- Concurrent submitters and FK-violating rows
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.activity.store.batches import (
+    create_prompt_batch,
+)
+from open_agent_kit.features.codebase_intelligence.activity.store.core import (
+    ActivityStore,
+)
+from open_agent_kit.features.codebase_intelligence.activity.store.models import (
+    Activity,
+)
+from open_agent_kit.features.codebase_intelligence.activity.store.sessions import (
+    create_session,
+)
+from open_agent_kit.features.codebase_intelligence.activity.store.writer import (
+    ActivityWriter,
+)
+from open_agent_kit.features.codebase_intelligence.constants import (
+    ACTIVITY_WRITER_THREAD_NAME,
+)
+
+TEST_MACHINE_ID = "test-machine-writer"
+SESSION_ID = "writer-session"
+# Long enough that only an explicit flush or a full batch triggers a write
+NEVER_MS = 60_000
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> ActivityStore:
+    """Create an ActivityStore with one session, closed after the test."""
+    db_path = tmp_path / "ci" / "activities.db"
+    activity_store = ActivityStore(db_path, machine_id=TEST_MACHINE_ID)
+    create_session(activity_store, session_id=SESSION_ID, agent="claude", project_root="/p")
+    yield activity_store
+    activity_store.close()
+
+
+def _activity(i: int, session_id: str = SESSION_ID, batch_id: int | None = None) -> Activity:
+    return Activity(
+        session_id=session_id,
+        prompt_batch_id=batch_id,
+        tool_name="Read",
+        file_path=f"/file_{i}.py",
+        tool_output_summary=f"Read file {i}",
+    )
+
+
+def _count(store: ActivityStore) -> int:
+    conn = store._get_connection()
+    return int(conn.execute("SELECT COUNT(*) FROM activities").fetchone()[0])
+
+
+def _wait_for_count(store: ActivityStore, expected: int, timeout: float = 5.0) -> int:
+    deadline = time.monotonic() + timeout
+    count = _count(store)
+    while count < expected and time.monotonic() < deadline:
+        time.sleep(0.01)
+        count = _count(store)
+    return count
+
+
+class TestActivityWriter:
+    """Test draining, flushing and stats of the activity writer."""
+
+    def test_drains_after_interval(self, store: ActivityStore):
+        """Test that a queued activity is written once the interval elapses."""
+        store._activity_writer = ActivityWriter(store, batch_size=100, flush_interval_ms=20)
+
+        assert store.add_activity_buffered(_activity(0)) is None
+
+        assert _wait_for_count(store, 1) == 1
+
+    def test_drains_when_batch_is_full(self, store: ActivityStore):
+        """Test that reaching the batch size triggers a write without waiting."""
+        store._activity_writer = ActivityWriter(store, batch_size=3, flush_interval_ms=NEVER_MS)
+
+        for i in range(3):
+            store.add_activity_buffered(_activity(i))
+
+        assert _wait_for_count(store, 3) == 3
+        assert store.get_activity_writer_stats()["writes"] == 1
+
+    def test_writes_on_writer_thread(self, store: ActivityStore):
+        """Test that inserts happen on the writer thread, not the caller's."""
+        store._activity_writer = ActivityWriter(store, batch_size=100, flush_interval_ms=NEVER_MS)
+        store.add_activity_buffered(_activity(0))
+
+        names = {t.name for t in threading.enumerate()}
+
+        assert ACTIVITY_WRITER_THREAD_NAME in names
+        assert _count(store) == 0
+
+    def test_flush_commits_queued_activities(self, store: ActivityStore):
+        """Test that flush returns the IDs of everything queued so far."""
+        store._activity_writer = ActivityWriter(store, batch_size=100, flush_interval_ms=NEVER_MS)
+        for i in range(5):
+            store.add_activity_buffered(_activity(i))
+
+        ids = store.flush_activity_buffer()
+
+        assert len(ids) == 5
+        conn = store._get_connection()
+        stored = [row[0] for row in conn.execute("SELECT id FROM activities ORDER BY id")]
+        assert stored == ids
+
+    def test_force_flush_returns_id(self, store: ActivityStore):
+        """Test that force_flush writes immediately and returns the row ID."""
+        activity_id = store.add_activity_buffered(_activity(0), force_flush=True)
+
+        assert activity_id is not None
+        assert _count(store) == 1
+
+    def test_close_writes_queued_activities(self, tmp_path: Path):
+        """Test that closing the store does not lose queued activities."""
+        db_path = tmp_path / "ci" / "activities.db"
+        store = ActivityStore(db_path, machine_id=TEST_MACHINE_ID)
+        create_session(store, session_id=SESSION_ID, agent="claude", project_root="/p")
+        store._activity_writer = ActivityWriter(store, batch_size=100, flush_interval_ms=NEVER_MS)
+        for i in range(4):
+            store.add_activity_buffered(_activity(i))
+
+        store.close()
+
+        assert _count(ActivityStore(db_path, machine_id=TEST_MACHINE_ID)) == 4
+
+    def test_updates_session_and_batch_counts(self, store: ActivityStore):
+        """Test that a bulk write updates tool and activity counters."""
+        batch = create_prompt_batch(store, SESSION_ID, "do things")
+        for i in range(3):
+            store.add_activity_buffered(_activity(i, batch_id=batch.id))
+
+        store.flush_activity_buffer()
+
+        conn = store._get_connection()
+        tool_count = conn.execute(
+            "SELECT tool_count FROM sessions WHERE id = ?", (SESSION_ID,)
+        ).fetchone()[0]
+        activity_count = conn.execute(
+            "SELECT activity_count FROM prompt_batches WHERE id = ?", (batch.id,)
+        ).fetchone()[0]
+        assert tool_count == 3
+        assert activity_count == 3
+
+    def test_concurrent_submitters(self, store: ActivityStore):
+        """Test that activities from many threads all land."""
+        store._activity_writer = ActivityWriter(store, batch_size=7, flush_interval_ms=5)
+
+        def _submit(offset: int) -> None:
+            for i in range(25):
+                store.add_activity_buffered(_activity(offset + i))
+
+        threads = [threading.Thread(target=_submit, args=(n * 100,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        store.flush_activity_buffer()
+
+        assert _count(store) == 100
+
+    def test_fk_violation_skips_only_bad_rows(self, store: ActivityStore):
+        """Test that a row for an unknown session does not block the batch."""
+        store.add_activity_buffered(_activity(0))
+        store.add_activity_buffered(_activity(1, session_id="missing-session"))
+        store.add_activity_buffered(_activity(2))
+
+        ids = store.flush_activity_buffer()
+
+        assert len(ids) == 2
+        assert store.get_activity_writer_stats()["rows_dropped"] == 1
+
+    def test_stats(self, store: ActivityStore):
+        """Test that stats report queue depth and write latency."""
+        store._activity_writer = ActivityWriter(store, batch_size=100, flush_interval_ms=NEVER_MS)
+        for i in range(3):
+            store.add_activity_buffered(_activity(i))
+
+        assert store.get_activity_writer_stats()["queue_depth"] == 3
+
+        store.flush_activity_buffer()
+        stats = store.get_activity_writer_stats()
+
+        assert stats["queue_depth"] == 0
+        assert stats["writes"] == 1
+        assert stats["rows_written"] == 3
+        assert stats["last_write_ms"] > 0
+
+    def test_flush_without_writer_thread(self, store: ActivityStore):
+        """Test that flushing a store that never queued anything is a no-op."""
+        assert store.flush_activity_buffer() == []
@@ -0,0 +1,125 @@
+"""Tests for rebuilding the ChromaDB memory index from SQLite.
+
+Tests cover:
+- One bulk add and one embedded-flag update per batch
+- Session summaries skipped but marked embedded
+- Falling back to single inserts when a batch fails
+- Stopping when no observation in a batch can be embedded
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.activity.processor.indexing import (
+    embed_pending_observations,
+    rebuild_chromadb_from_sqlite,
+)
+from open_agent_kit.features.codebase_intelligence.activity.store.core import ActivityStore
+from open_agent_kit.features.codebase_intelligence.activity.store.models import (
+    StoredObservation,
+)
+from open_agent_kit.features.codebase_intelligence.activity.store.sessions import (
+    create_session,
+)
+
+SESSION_ID = "rebuild-session"
+TEST_MACHINE_ID = "test-machine-rebuild"
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> ActivityStore:
+    """Create an ActivityStore with one session, closed after the test."""
+    activity_store = ActivityStore(tmp_path / "ci" / "activities.db", machine_id=TEST_MACHINE_ID)
+    create_session(activity_store, session_id=SESSION_ID, agent="claude", project_root="/p")
+    yield activity_store
+    activity_store.close()
+
+
+@pytest.fixture()
+def vector_store() -> MagicMock:
+    """Vector store whose bulk add stores every memory."""
+    mock = MagicMock()
+    mock.add_memories.side_effect = lambda memories: [memory.id for memory in memories]
+    return mock
+
+
+def _add_observations(store: ActivityStore, count: int, memory_type: str = "gotcha") -> None:
+    for i in range(count):
+        store.store_observation(
+            StoredObservation(
+                id=f"{memory_type}-{i}",
+                session_id=SESSION_ID,
+                observation=f"Observation {i}",
+                memory_type=memory_type,
+            )
+        )
+
+
+class TestRebuildChromadbFromSqlite:
+    """Test batched re-embedding of observations."""
+
+    def test_embeds_in_batches(self, store: ActivityStore, vector_store: MagicMock):
+        """Test that each batch is added with one call and marked embedded."""
+        _add_observations(store, 5)
+
+        with patch.object(
+            store, "mark_observations_embedded", wraps=store.mark_observations_embedded
+        ) as mark:
+            stats = embed_pending_observations(store, vector_store, batch_size=2)
+
+        assert stats["embedded"] == 5
+        assert stats["failed"] == 0
+        assert [len(c.args[0]) for c in vector_store.add_memories.call_args_list] == [2, 2, 1]
+        assert mark.call_count == 3
+        vector_store.add_memory.assert_not_called()
+        assert store.count_embedded_observations() == 5
+
+    def test_session_summaries_skipped(self, store: ActivityStore, vector_store: MagicMock):
+        """Test that session summaries are marked embedded but not added."""
+        _add_observations(store, 2)
+        _add_observations(store, 1, memory_type="session_summary")
+
+        stats = embed_pending_observations(store, vector_store)
+
+        assert stats["embedded"] == 2
+        assert stats["skipped"] == 1
+        added = [memory.id for memory in vector_store.add_memories.call_args.args[0]]
+        assert "session_summary-0" not in added
+        assert store.count_embedded_observations() == 3
+
+    def test_batch_failure_falls_back_to_single_adds(
+        self, store: ActivityStore, vector_store: MagicMock
+    ):
+        """Test that one bad observation only fails itself."""
+        _add_observations(store, 3)
+        vector_store.add_memories.side_effect = ValueError("bad batch")
+
+        def _add_memory(memory):
+            if memory.id == "gotcha-1":
+                raise ValueError("bad memory")
+            return memory.id
+
+        vector_store.add_memory.side_effect = _add_memory
+
+        stats = embed_pending_observations(store, vector_store, batch_size=3)
+
+        assert stats["embedded"] == 2
+        # The failed row is fetched once more on its own before the rebuild stops
+        assert stats["failed"] == 2
+        assert store.count_embedded_observations() == 2
+
+    def test_stops_when_nothing_can_be_embedded(
+        self, store: ActivityStore, vector_store: MagicMock
+    ):
+        """Test that a batch of failures ends the rebuild instead of looping."""
+        _add_observations(store, 2)
+        vector_store.add_memories.side_effect = ValueError("provider down")
+        vector_store.add_memory.side_effect = ValueError("provider down")
+
+        stats = rebuild_chromadb_from_sqlite(store, vector_store, batch_size=2)
+
+        assert stats["embedded"] == 0
+        assert stats["failed"] == 2
+        assert store.count_embedded_observations() == 0
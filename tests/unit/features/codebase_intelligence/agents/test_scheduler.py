@@ -0,0 +1,211 @@
+"""Tests for the agent scheduler's next-run queue and concurrent dispatch.
+
+Covers:
+- Due schedules running concurrently up to scheduler_max_concurrent_runs
+- Per-task mutual exclusion
+- Sleeping until the earliest due time instead of polling
+- Failed runs retried after the resync interval instead of immediately
+- queue_wait_ms recorded on agent_runs, including the v10 -> v11 migration
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.activity.store.core import (
+    ActivityStore,
+)
+from open_agent_kit.features.codebase_intelligence.activity.store.migrations import (
+    apply_migrations,
+)
+from open_agent_kit.features.codebase_intelligence.agents.models import (
+    AgentRun,
+    AgentRunStatus,
+)
+from open_agent_kit.features.codebase_intelligence.agents.scheduler import AgentScheduler
+from open_agent_kit.features.codebase_intelligence.config import AgentConfig
+
+TEST_MACHINE_ID = "test-machine-scheduler"
+RUN_SECONDS = 0.05
+
+
+class FakeRegistry:
+    """Registry where every task exists unless listed as missing."""
+
+    def __init__(self, missing: set[str] | None = None):
+        self.missing = missing or set()
+
+    def get_task(self, name: str) -> Any:
+        if name in self.missing:
+            return None
+        return SimpleNamespace(name=name, agent_type="docs", default_task=f"do {name}")
+
+    def get_template(self, name: str) -> Any:
+        return SimpleNamespace(name=name)
+
+    def list_tasks(self) -> list[Any]:
+        return []
+
+
+class FakeExecutor:
+    """Executor that persists runs and sleeps instead of calling an agent."""
+
+    def __init__(self, store: ActivityStore):
+        self.store = store
+        self.active = 0
+        self.max_active = 0
+        self.started: list[str] = []
+
+    def create_run(
+        self, agent: Any, task: str, agent_task: Any, queue_wait_ms: int | None = None
+    ) -> AgentRun:
+        run = AgentRun(
+            id=f"run-{agent_task.name}-{len(self.started)}",
+            agent_name=agent_task.name,
+            task=task,
+            queue_wait_ms=queue_wait_ms,
+        )
+        self.store.create_agent_run(
+            run_id=run.id, agent_name=run.agent_name, task=task, queue_wait_ms=queue_wait_ms
+        )
+        return run
+
+    async def execute(self, agent: Any, task: str, run: AgentRun, agent_task: Any) -> AgentRun:
+        self.started.append(agent_task.name)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(RUN_SECONDS)
+        finally:
+            self.active -= 1
+        run.status = AgentRunStatus.COMPLETED
+        return run
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> ActivityStore:
+    """Create an ActivityStore with a real temp SQLite database."""
+    db_path = tmp_path / "ci" / "activities.db"
+    activity_store = ActivityStore(db_path, machine_id=TEST_MACHINE_ID)
+    yield activity_store
+    activity_store.close()
+
+
+def _scheduler(
+    store: ActivityStore,
+    max_concurrent_runs: int = 2,
+    missing: set[str] | None = None,
+) -> tuple[AgentScheduler, FakeExecutor]:
+    executor = FakeExecutor(store)
+    config = AgentConfig(scheduler_max_concurrent_runs=max_concurrent_runs)
+    scheduler = AgentScheduler(store, FakeRegistry(missing), executor, config)
+    return scheduler, executor
+
+
+def _add_schedule(store: ActivityStore, task_name: str, due_in_seconds: float) -> None:
+    store.create_schedule(
+        task_name=task_name,
+        cron_expression="0 * * * *",
+        next_run_at=datetime.now() + timedelta(seconds=due_in_seconds),
+    )
+
+
+class TestConcurrentDispatch:
+    """Test that due schedules share a bounded number of run slots."""
+
+    def test_runs_concurrently_up_to_limit(self, store: ActivityStore):
+        for i in range(4):
+            _add_schedule(store, f"task-{i}", -60)
+        scheduler, executor = _scheduler(store, max_concurrent_runs=2)
+
+        results = asyncio.run(scheduler.check_and_run())
+
+        assert sorted(r["task_name"] for r in results) == [f"task-{i}" for i in range(4)]
+        assert all(r["status"] == "completed" for r in results)
+        # Two at a time, never more and never one by one
+        assert executor.max_active == 2
+        assert not scheduler.get_due_schedules()
+
+    def test_same_task_never_runs_twice_at_once(self, store: ActivityStore):
+        _add_schedule(store, "docs", -60)
+        scheduler, executor = _scheduler(store)
+        schedule = store.get_schedule("docs")
+
+        async def run_twice() -> list[dict[str, Any]]:
+            return await asyncio.gather(
+                scheduler.run_scheduled_agent(schedule),
+                scheduler.run_scheduled_agent(schedule),
+            )
+
+        first, second = asyncio.run(run_twice())
+
+        assert first["status"] == "completed"
+        assert second["skipped"] is True
+        assert executor.started == ["docs"]
+
+
+class TestNextRunQueue:
+    """Test the in-memory next-run heap."""
+
+    def test_sleeps_until_earliest_due_time(self, store: ActivityStore):
+        _add_schedule(store, "later", 120)
+        _add_schedule(store, "sooner", 30)
+        scheduler, _ = _scheduler(store)
+
+        scheduler._rebuild_queue()
+
+        assert [entry[1] for entry in sorted(scheduler._queue)] == ["sooner", "later"]
+        assert 25 < scheduler._seconds_until_wake() <= 30
+
+    def test_idle_sleeps_until_resync(self, store: ActivityStore):
+        scheduler, _ = _scheduler(store)
+
+        scheduler._rebuild_queue()
+
+        assert scheduler._seconds_until_wake() > scheduler.scheduler_interval_seconds - 5
+
+    def test_failed_run_retried_after_interval(self, store: ActivityStore):
+        _add_schedule(store, "gone", -60)
+        scheduler, executor = _scheduler(store, missing={"gone"})
+
+        results = asyncio.run(scheduler.check_and_run())
+        scheduler._rebuild_queue()
+
+        assert "not found" in results[0]["error"]
+        assert executor.started == []
+        # Still due in the table, but not re-dispatched until the retry time
+        assert scheduler.get_due_schedules()
+        assert scheduler._seconds_until_wake() > scheduler.scheduler_interval_seconds - 5
+
+
+class TestQueueWait:
+    """Test that queue wait is recorded per run."""
+
+    def test_queue_wait_recorded(self, store: ActivityStore):
+        _add_schedule(store, "a", -10)
+        _add_schedule(store, "b", -10)
+        scheduler, _ = _scheduler(store, max_concurrent_runs=1)
+
+        results = asyncio.run(scheduler.check_and_run())
+
+        waits = sorted(store.get_agent_run(r["run_id"])["queue_wait_ms"] for r in results)
+        assert waits[0] >= 9000
+        # The second run waited for the first to finish
+        assert waits[1] >= waits[0] + RUN_SECONDS * 1000 * 0.8
+
+    def test_migration_adds_queue_wait_column(self, store: ActivityStore):
+        conn = store._get_connection()
+        conn.execute("ALTER TABLE agent_runs DROP COLUMN queue_wait_ms")
+        conn.commit()
+
+        apply_migrations(conn, from_version=10)
+        conn.commit()
+
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(agent_runs)")}
+        assert "queue_wait_ms" in columns
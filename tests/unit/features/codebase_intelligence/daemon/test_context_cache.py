@@ -0,0 +1,75 @@
+"""Tests for the post-tool-use file memory context cache.
+
+Tests cover:
+- Hits, misses and saved search time
+- Invalidation by memory generation
+- Caching of "no memories" results
+- LRU eviction
+"""
+
+from open_agent_kit.features.codebase_intelligence.daemon.context_cache import FileContextCache
+
+
+class TestFileContextCache:
+    """Test FileContextCache lookups and stats."""
+
+    def test_hit_returns_context_and_credits_saved_time(self):
+        """Test that a hit returns the stored context and counts the saved search."""
+        cache = FileContextCache()
+        cache.put("src/main.py", 1, "**Memories about src/main.py:**", 40.0)
+
+        entry = cache.get("src/main.py", 1)
+
+        assert entry is not None
+        assert entry.context == "**Memories about src/main.py:**"
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 0
+        assert stats["hit_rate"] == 1.0
+        assert stats["saved_ms"] == 40.0
+
+    def test_missing_path_is_a_miss(self):
+        """Test that an unknown file misses."""
+        cache = FileContextCache()
+
+        assert cache.get("src/other.py", 1) is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_new_generation_invalidates_entry(self):
+        """Test that a memory change makes older entries miss and drops them."""
+        cache = FileContextCache()
+        cache.put("src/main.py", 1, "old", 10.0)
+
+        assert cache.get("src/main.py", 2) is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_no_memories_result_is_cached(self):
+        """Test that a search with nothing to inject is still a hit next time."""
+        cache = FileContextCache()
+        cache.put("src/main.py", 1, None, 25.0)
+
+        entry = cache.get("src/main.py", 1)
+
+        assert entry is not None
+        assert entry.context is None
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched file is evicted when full."""
+        cache = FileContextCache(max_entries=2)
+        cache.put("a.py", 1, "a", 1.0)
+        cache.put("b.py", 1, "b", 1.0)
+        cache.get("a.py", 1)
+        cache.put("c.py", 1, "c", 1.0)
+
+        assert cache.get("b.py", 1) is None
+        assert cache.get("a.py", 1) is not None
+        assert cache.get("c.py", 1) is not None
+
+    def test_clear(self):
+        """Test that clear drops all entries."""
+        cache = FileContextCache()
+        cache.put("a.py", 1, "a", 1.0)
+
+        cache.clear()
+
+        assert cache.get_stats()["entries"] == 0
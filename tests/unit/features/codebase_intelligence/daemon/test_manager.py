@@ -11,6 +11,7 @@ Tests cover:
 """
 
 import builtins
+import socket
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -21,6 +22,7 @@ from open_agent_kit.features.codebase_intelligence.constants import (
     CI_LOG_FILE,
     CI_NULL_DEVICE_POSIX,
     CI_NULL_DEVICE_WINDOWS,
+    CI_SOCKET_FILE,
     CI_TOKEN_FILE,
     CI_TOKEN_FILE_PERMISSIONS,
 )
@@ -31,6 +33,7 @@ from open_agent_kit.features.codebase_intelligence.daemon.manager import (
     DaemonManager,
     derive_port_from_path,
     get_project_port,
+    get_socket_path,
     read_project_port,
 )
 
@@ -1247,6 +1250,45 @@ class TestDaemonManagerCleanup:
 
         assert not manager.token_file.exists()
 
+    def test_cleanup_files_removes_stale_socket(self, tmp_path: Path):
+        """Test that _cleanup_files removes a socket left by a killed daemon."""
+        manager = DaemonManager(tmp_path, ci_data_dir=tmp_path / ".oak" / "ci")
+        manager._ensure_data_dir()
+        if manager.socket_file is None:
+            pytest.skip("Unix sockets unavailable for this path")
+        manager.socket_file.write_text("")
+
+        manager._cleanup_files()
+
+        assert not manager.socket_file.exists()
+
+
+# =============================================================================
+# Unix Socket Path Tests
+# =============================================================================
+
+
+class TestGetSocketPath:
+    """Test Unix domain socket path resolution."""
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires AF_UNIX")
+    def test_socket_in_ci_data_dir(self):
+        """Test that the socket lives in the CI data directory."""
+        ci_data_dir = Path("/tmp/project/.oak/ci")
+        with patch("open_agent_kit.features.codebase_intelligence.daemon.manager.os.name", "posix"):
+            assert get_socket_path(ci_data_dir) == ci_data_dir / CI_SOCKET_FILE
+
+    def test_no_socket_on_windows(self, tmp_path: Path):
+        """Test that Windows daemons listen on TCP only."""
+        with patch("open_agent_kit.features.codebase_intelligence.daemon.manager.os.name", "nt"):
+            assert get_socket_path(tmp_path) is None
+
+    def test_no_socket_for_long_paths(self, tmp_path: Path):
+        """Test that paths over the AF_UNIX limit fall back to TCP."""
+        deep_dir = tmp_path / ("d" * 120)
+
+        assert get_socket_path(deep_dir) is None
+
 
 # =============================================================================
 # Token Lifecycle Tests
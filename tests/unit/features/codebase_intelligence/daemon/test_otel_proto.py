@@ -0,0 +1,166 @@
+"""Tests for the OTLP logs protobuf codec.
+
+Tests cover:
+- Decoding ExportLogsServiceRequest into the OTLP/JSON shape
+- AnyValue variants and negative int64 values
+- Skipping unknown fields
+- Malformed payloads
+- Encoding ExportLogsServiceResponse
+"""
+
+import struct
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.daemon.routes.otel_proto import (
+    OtlpDecodeError,
+    decode_export_logs_request,
+    encode_export_logs_response,
+)
+
+
+def _varint(value: int) -> bytes:
+    value &= (1 << 64) - 1
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _len_field(field: int, payload: bytes) -> bytes:
+    return _varint(field << 3 | 2) + _varint(len(payload)) + payload
+
+
+def _varint_field(field: int, value: int) -> bytes:
+    return _varint(field << 3) + _varint(value)
+
+
+def _string_kv(key: str, value: str) -> bytes:
+    return _len_field(1, key.encode()) + _len_field(2, _len_field(1, value.encode()))
+
+
+def _export(records: list[bytes], resource: bytes = b"") -> bytes:
+    scope_logs = _len_field(1, _len_field(1, b"codex")) + b"".join(
+        _len_field(2, record) for record in records
+    )
+    resource_logs = _len_field(1, resource) + _len_field(2, scope_logs)
+    return _len_field(1, resource_logs)
+
+
+class TestDecodeExportLogsRequest:
+    """Test decoding of protobuf log exports."""
+
+    def test_decodes_records_and_attributes(self):
+        """Test that records, attributes and resource attributes round-trip."""
+        record = (
+            b"\x09"
+            + struct.pack("<Q", 1_700_000_000_000_000_000)
+            + _varint_field(2, 9)
+            + _len_field(3, b"INFO")
+            + _len_field(5, _len_field(1, b"hello"))
+            + _len_field(6, _string_kv("event.name", "codex.tool_result"))
+            + _len_field(6, _string_kv("tool_name", "shell"))
+        )
+        data = _export([record], resource=_len_field(1, _string_kv("service.name", "codex")))
+
+        decoded = decode_export_logs_request(data)
+
+        resource_logs = decoded["resourceLogs"][0]
+        assert resource_logs["resource"]["attributes"] == [
+            {"key": "service.name", "value": {"stringValue": "codex"}}
+        ]
+        scope_logs = resource_logs["scopeLogs"][0]
+        assert scope_logs["scope"] == {"name": "codex"}
+        log_record = scope_logs["logRecords"][0]
+        assert log_record["timeUnixNano"] == "1700000000000000000"
+        assert log_record["severityNumber"] == 9
+        assert log_record["severityText"] == "INFO"
+        assert log_record["body"] == {"stringValue": "hello"}
+        assert log_record["attributes"] == [
+            {"key": "event.name", "value": {"stringValue": "codex.tool_result"}},
+            {"key": "tool_name", "value": {"stringValue": "shell"}},
+        ]
+
+    def test_decodes_any_value_variants(self):
+        """Test bool, negative int, double, array, kvlist and bytes values."""
+        values = [
+            ("flag", _varint_field(2, 1)),
+            ("neg", _varint_field(3, -5)),
+            ("ratio", b"\x21" + struct.pack("<d", 0.5)),
+            ("list", _len_field(5, _len_field(1, _varint_field(3, 7)))),
+            ("map", _len_field(6, _len_field(1, _string_kv("inner", "x")))),
+            ("raw", _len_field(7, b"\x00\xff")),
+        ]
+        record = b"".join(
+            _len_field(6, _len_field(1, key.encode()) + _len_field(2, value))
+            for key, value in values
+        )
+
+        decoded = decode_export_logs_request(_export([record]))
+
+        attributes = {
+            attr["key"]: attr["value"]
+            for attr in decoded["resourceLogs"][0]["scopeLogs"][0]["logRecords"][0]["attributes"]
+        }
+        assert attributes["flag"] == {"boolValue": True}
+        assert attributes["neg"] == {"intValue": -5}
+        assert attributes["ratio"] == {"doubleValue": 0.5}
+        assert attributes["list"] == {"arrayValue": {"values": [{"intValue": 7}]}}
+        assert attributes["map"] == {
+            "kvlistValue": {"values": [{"key": "inner", "value": {"stringValue": "x"}}]}
+        }
+        assert attributes["raw"] == {"bytesValue": "AP8="}
+
+    def test_decodes_event_name_field(self):
+        """Test that the LogRecord event_name field is exposed as eventName."""
+        decoded = decode_export_logs_request(_export([_len_field(12, b"codex.user_prompt")]))
+
+        log_record = decoded["resourceLogs"][0]["scopeLogs"][0]["logRecords"][0]
+        assert log_record["eventName"] == "codex.user_prompt"
+
+    def test_skips_unknown_fields(self):
+        """Test that fields the receiver doesn't read are skipped by wire type."""
+        record = _varint_field(99, 1) + b"\xa5\x06" + b"\x00" * 4 + _len_field(3, b"WARN")
+
+        decoded = decode_export_logs_request(_export([record]))
+
+        assert decoded["resourceLogs"][0]["scopeLogs"][0]["logRecords"][0]["severityText"] == (
+            "WARN"
+        )
+
+    def test_empty_payload(self):
+        """Test that an empty export decodes to no resource logs."""
+        assert decode_export_logs_request(b"") == {"resourceLogs": []}
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"\x0a\x05abc",  # length past the end
+            b"\x08",  # truncated varint
+            b"\x0b",  # start-group wire type
+            b'{"resourceLogs": []}',  # JSON sent with the protobuf content type
+        ],
+    )
+    def test_malformed_payload_raises(self, data: bytes):
+        """Test that malformed payloads raise OtlpDecodeError."""
+        with pytest.raises(OtlpDecodeError):
+            decode_export_logs_request(data)
+
+
+class TestEncodeExportLogsResponse:
+    """Test encoding of protobuf export responses."""
+
+    def test_full_success_is_empty(self):
+        """Test that a fully accepted export encodes to an empty message."""
+        assert encode_export_logs_response(0) == b""
+
+    def test_partial_success(self):
+        """Test that rejected records and the message are encoded in partial_success."""
+        encoded = encode_export_logs_response(300, "bad")
+
+        assert encoded == b"\x0a\x08\x08\xac\x02\x12\x03bad"
@@ -15,6 +15,9 @@ from unittest.mock import MagicMock
 import pytest
 from fastapi.testclient import TestClient
 
+from open_agent_kit.features.codebase_intelligence.activity.store.pagination import (
+    InvalidCursorError,
+)
 from open_agent_kit.features.codebase_intelligence.constants import (
     PROMPT_SOURCE_PLAN,
     PROMPT_SOURCE_USER,
@@ -73,6 +76,7 @@ def mock_activity_store():
     session2.parent_session_reason = None
 
     mock.get_recent_sessions.return_value = [session1, session2]
+    mock.get_sessions_page.return_value = ([session1, session2], None)
     mock.get_session.return_value = session1
     mock.get_child_session_count.return_value = 0
     mock.get_latest_session_summary.return_value = None  # No summary observation by default
@@ -141,6 +145,7 @@ def mock_activity_store():
     activity2.timestamp = now - timedelta(hours=1, minutes=20)
 
     mock.get_session_activities.return_value = [activity1, activity2]
+    mock.get_session_activities_page.return_value = ([activity1, activity2], None)
     mock.search_activities.return_value = [activity1]
 
     # Prompt batches
@@ -230,14 +235,36 @@ class TestListSessions:
         )
 
         assert response.status_code == 200
-        setup_state_with_activity_store.activity_store.get_recent_sessions.assert_called_with(
+        setup_state_with_activity_store.activity_store.get_sessions_page.assert_called_with(
             limit=20,
+            cursor=None,
             offset=0,
             status=None,
             agent="codex",
             sort="last_activity",
         )
 
+    def test_list_sessions_with_cursor(self, client, setup_state_with_activity_store):
+        """Test that the cursor is forwarded and next_cursor returned."""
+        store = setup_state_with_activity_store.activity_store
+        sessions, _ = store.get_sessions_page.return_value
+        store.get_sessions_page.return_value = (sessions, "next-page")
+
+        response = client.get("/api/activity/sessions", params={"cursor": "this-page"})
+
+        assert response.status_code == 200
+        assert response.json()["next_cursor"] == "next-page"
+        assert store.get_sessions_page.call_args.kwargs["cursor"] == "this-page"
+
+    def test_list_sessions_invalid_cursor(self, client, setup_state_with_activity_store):
+        """Test that a malformed cursor is a client error."""
+        store = setup_state_with_activity_store.activity_store
+        store.get_sessions_page.side_effect = InvalidCursorError("bad")
+
+        response = client.get("/api/activity/sessions", params={"cursor": "bad"})
+
+        assert response.status_code == 400
+
 
 class TestSessionAgents:
     """Test GET /api/activity/session-agents endpoint."""
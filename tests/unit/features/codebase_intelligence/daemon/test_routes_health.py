@@ -335,6 +335,18 @@ class TestGetStatus:
         assert "running" in file_watcher
         assert "pending_changes" in file_watcher
 
+    def test_get_status_includes_runtime(self, client, setup_state_fully_initialized):
+        """Test that status includes loop lag, hook stage timings and cache stats."""
+        response = client.get("/api/status")
+
+        assert response.status_code == 200
+        runtime = response.json()["runtime"]
+        assert "event_loop_lag" in runtime
+        assert "workers" in runtime["hook_stages"]
+        assert "stages" in runtime["hook_stages"]
+        assert runtime["file_context_cache"]["hits"] == 0
+        assert "saved_ms" in runtime["file_context_cache"]
+
     def test_get_status_indexing_in_progress(self, client, setup_state_fully_initialized):
         """Test status when indexing is in progress."""
         setup_state_fully_initialized.index_status.set_indexing()
@@ -10,6 +10,7 @@ Tests cover:
 """
 
 import json
+from pathlib import Path
 from unittest.mock import MagicMock
 from uuid import uuid4
 
@@ -679,6 +680,56 @@ class TestPostToolUseHook:
         if "injected_context" in data:
             assert "gotcha" in data["injected_context"] or "Memories" in data["injected_context"]
 
+    def test_post_tool_use_caches_file_memories(self, client, setup_state_with_mocks):
+        """Test that repeated touches of a file reuse the cached memory search."""
+        state = setup_state_with_mocks
+        state.project_root = Path("/tmp/test_project")
+        state.vector_store.memory_generation = 1
+        state.activity_store.get_active_prompt_batch.return_value = MagicMock(
+            id=1, user_prompt="fix error handling"
+        )
+        payload = {
+            "session_id": "session-123",
+            "tool_name": "Read",
+            "tool_input": {"file_path": "/tmp/test_project/src/main.py"},
+            "tool_output": "file contents",
+        }
+
+        first = client.post(
+            "/api/oak/ci/post-tool-use", json={**payload, "tool_use_id": "tool-1"}
+        ).json()
+        second = client.post(
+            "/api/oak/ci/post-tool-use", json={**payload, "tool_use_id": "tool-2"}
+        ).json()
+
+        assert state.vector_store.search_memory.call_count == 1
+        assert "Important gotcha" in first["injected_context"]
+        assert second["injected_context"] == first["injected_context"]
+        stats = state.file_context_cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_post_tool_use_memory_change_invalidates_cache(self, client, setup_state_with_mocks):
+        """Test that a new memory generation forces a fresh search."""
+        state = setup_state_with_mocks
+        state.project_root = Path("/tmp/test_project")
+        state.vector_store.memory_generation = 1
+        state.activity_store.get_active_prompt_batch.return_value = MagicMock(
+            id=1, user_prompt="fix error handling"
+        )
+        payload = {
+            "session_id": "session-123",
+            "tool_name": "Read",
+            "tool_input": {"file_path": "/tmp/test_project/src/main.py"},
+            "tool_output": "file contents",
+        }
+
+        client.post("/api/oak/ci/post-tool-use", json={**payload, "tool_use_id": "tool-1"})
+        state.vector_store.memory_generation = 2
+        client.post("/api/oak/ci/post-tool-use", json={**payload, "tool_use_id": "tool-2"})
+
+        assert state.vector_store.search_memory.call_count == 2
+
     def test_post_tool_use_oak_ci_hint_after_search_tools(self, client, setup_state_with_mocks):
         """Test oak ci hint injection after multiple search tool uses."""
         session_id = str(uuid4())
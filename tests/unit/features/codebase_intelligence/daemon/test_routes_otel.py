@@ -0,0 +1,287 @@
+"""Tests for the OTLP logs receiver routes.
+
+Tests cover:
+- JSON and binary protobuf exports
+- gzip-compressed bodies and size limits
+- Unsupported content types and encodings
+- Batched processing: one session lookup and one insert per export
+"""
+
+import gzip
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from open_agent_kit.features.codebase_intelligence.activity.store.core import ActivityStore
+from open_agent_kit.features.codebase_intelligence.constants import (
+    OTEL_ATTR_CONVERSATION_ID,
+    OTEL_ATTR_PROMPT,
+    OTEL_ATTR_TOOL_NAME,
+    OTEL_ATTR_TOOL_OUTPUT,
+    OTEL_EVENT_CODEX_TOOL_RESULT,
+    OTEL_EVENT_CODEX_USER_PROMPT,
+    OTLP_CONTENT_TYPE_JSON,
+    OTLP_CONTENT_TYPE_PROTOBUF,
+    OTLP_LOGS_ENDPOINT,
+)
+from open_agent_kit.features.codebase_intelligence.daemon.routes import otel as otel_routes
+from open_agent_kit.features.codebase_intelligence.daemon.server import create_app
+from open_agent_kit.features.codebase_intelligence.daemon.state import get_state, reset_state
+
+SESSION_ID = "otel-session"
+TEST_MACHINE_ID = "test-machine-otel"
+
+
+@pytest.fixture(autouse=True)
+def reset_daemon_state():
+    """Reset daemon state before and after each test."""
+    reset_state()
+    yield
+    reset_state()
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ActivityStore:
+    """Real activity store wired into daemon state."""
+    activity_store = ActivityStore(tmp_path / "ci" / "activities.db", machine_id=TEST_MACHINE_ID)
+    state = get_state()
+    state.activity_store = activity_store
+    state.project_root = tmp_path
+    yield activity_store
+    activity_store.close()
+
+
+@pytest.fixture
+def client(store: ActivityStore) -> TestClient:
+    """FastAPI test client."""
+    return TestClient(create_app())
+
+
+def _attrs(**values: str) -> list[dict]:
+    return [{"key": key, "value": {"stringValue": value}} for key, value in values.items()]
+
+
+def _record(event_name: str, **attributes: str) -> dict:
+    attrs = {"event.name": event_name, OTEL_ATTR_CONVERSATION_ID: SESSION_ID, **attributes}
+    return {"attributes": _attrs(**attrs)}
+
+
+def _json_export(records: list[dict]) -> bytes:
+    return json.dumps(
+        {"resourceLogs": [{"resource": {"attributes": []}, "scopeLogs": [{"logRecords": records}]}]}
+    ).encode()
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _len_field(field: int, payload: bytes) -> bytes:
+    return _varint(field << 3 | 2) + _varint(len(payload)) + payload
+
+
+def _proto_export(records: list[dict]) -> bytes:
+    """Encode the string attributes of JSON-shaped records as protobuf."""
+    encoded = b""
+    for record in records:
+        log_record = b"".join(
+            _len_field(
+                6,
+                _len_field(1, attr["key"].encode())
+                + _len_field(2, _len_field(1, attr["value"]["stringValue"].encode())),
+            )
+            for attr in record["attributes"]
+        )
+        encoded += _len_field(2, log_record)
+    return _len_field(1, _len_field(2, encoded))
+
+
+def _tool_results(count: int) -> list[dict]:
+    return [
+        _record(
+            OTEL_EVENT_CODEX_TOOL_RESULT,
+            **{OTEL_ATTR_TOOL_NAME: "shell", OTEL_ATTR_TOOL_OUTPUT: f"out {i}"},
+        )
+        for i in range(count)
+    ]
+
+
+def _activity_count(store: ActivityStore) -> int:
+    conn = store._get_connection()
+    return int(conn.execute("SELECT COUNT(*) FROM activities").fetchone()[0])
+
+
+class TestOtlpLogsReceiver:
+    """Test decoding and batch processing of OTLP log exports."""
+
+    def test_json_export(self, client: TestClient, store: ActivityStore):
+        """Test that a JSON export creates the session and its activities."""
+        records = [_record(OTEL_EVENT_CODEX_USER_PROMPT, **{OTEL_ATTR_PROMPT: "fix it"})]
+        records += _tool_results(2)
+
+        response = client.post(
+            OTLP_LOGS_ENDPOINT,
+            content=_json_export(records),
+            headers={"Content-Type": OTLP_CONTENT_TYPE_JSON},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {}
+        assert store.get_session(SESSION_ID) is not None
+        batch = store.get_active_prompt_batch(SESSION_ID)
+        assert batch is not None
+        assert batch.user_prompt == "fix it"
+        assert _activity_count(store) == 2
+
+    def test_protobuf_export(self, client: TestClient, store: ActivityStore):
+        """Test that a binary protobuf export is decoded and answered in protobuf."""
+        response = client.post(
+            OTLP_LOGS_ENDPOINT,
+            content=_proto_export(_tool_results(3)),
+            headers={"Content-Type": OTLP_CONTENT_TYPE_PROTOBUF},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == OTLP_CONTENT_TYPE_PROTOBUF
+        assert response.content == b""
+        assert _activity_count(store) == 3
+
+    def test_gzip_protobuf_export(self, client: TestClient, store: ActivityStore):
+        """Test that gzip-compressed protobuf bodies are accepted."""
+        response = client.post(
+            OTLP_LOGS_ENDPOINT,
+            content=gzip.compress(_proto_export(_tool_results(2))),
+            headers={"Content-Type": OTLP_CONTENT_TYPE_PROTOBUF, "Content-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert _activity_count(store) == 2
+
+    def test_gzip_json_export(self, client: TestClient, store: ActivityStore):
+        """Test that gzip-compressed JSON bodies are accepted."""
+        response = client.post(
+            OTLP_LOGS_ENDPOINT,
+            content=gzip.compress(_json_export(_tool_results(1))),
+            headers={"Content-Type": OTLP_CONTENT_TYPE_JSON, "Content-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert _activity_count(store) == 1
+
+    def test_export_is_processed_as_one_batch(self, client: TestClient, store: ActivityStore):
+        """Test that session setup runs once and activities insert in one call."""
+        with (
+            patch.object(
+                store, "get_or_create_session", wraps=store.get_or_create_session
+            ) as get_or_create,
+            patch.object(
+                store, "get_active_prompt_batch", wraps=store.get_active_prompt_batch
+            ) as get_active,
+            patch.object(store, "add_activities", wraps=store.add_activities) as add_activities,
+        ):
+            response = client.post(
+                OTLP_LOGS_ENDPOINT,
+                content=_json_export(_tool_results(5)),
+                headers={"Content-Type": OTLP_CONTENT_TYPE_JSON},
+            )
+
+        assert response.status_code == 200
+        assert get_or_create.call_count == 1
+        assert get_active.call_count == 1
+        assert add_activities.call_count == 1
+        assert _activity_count(store) == 5
+
+    def test_tool_results_before_new_prompt_keep_their_batch(
+        self, client: TestClient, store: ActivityStore
+    ):
+        """Test that results queued before a new prompt land in the earlier batch."""
+        records = [_record(OTEL_EVENT_CODEX_USER_PROMPT, **{OTEL_ATTR_PROMPT: "first"})]
+        records += _tool_results(2)
+        records.append(_record(OTEL_EVENT_CODEX_USER_PROMPT, **{OTEL_ATTR_PROMPT: "second"}))
+        records += _tool_results(1)
+
+        client.post(
+            OTLP_LOGS_ENDPOINT,
+            content=_json_export(records),
+            headers={"Content-Type": OTLP_CONTENT_TYPE_JSON},
+        )
+
+        conn = store._get_connection()
+        rows = conn.execute(
+            "SELECT pb.user_prompt, COUNT(a.id) FROM activities a "
+            "JOIN prompt_batches pb ON pb.id = a.prompt_batch_id "
+            "GROUP BY pb.id ORDER BY pb.id"
+        ).fetchall()
+        assert [tuple(row) for row in rows] == [("first", 2), ("second", 1)]
+
+    def test_unmapped_records_are_rejected(self, client: TestClient):
+        """Test that unmapped events are counted in partialSuccess."""
+        response = client.post(
+            OTLP_LOGS_ENDPOINT,
+            content=_json_export([_record("codex.sse_event")]),
+            headers={"Content-Type": OTLP_CONTENT_TYPE_JSON},
+        )
+
+        assert response.json() == {"partialSuccess": {"rejectedLogRecords": 1}}
+
+    def test_malformed_protobuf_returns_partial_success(self, client: TestClient):
+        """Test that an undecodable body is reported, not raised."""
+        response = client.post(
+            OTLP_LOGS_ENDPOINT,
+            content=b"\x0a\x05abc",
+            headers={"Content-Type": OTLP_CONTENT_TYPE_PROTOBUF},
+        )
+
+        assert response.status_code == 200
+        assert response.content == b"\x0a\x02\x08\x01"
+
+    def test_unsupported_content_type(self, client: TestClient):
+        """Test that non-OTLP content types are rejected with 415."""
+        response = client.post(
+            OTLP_LOGS_ENDPOINT, content=b"hello", headers={"Content-Type": "text/plain"}
+        )
+
+        assert response.status_code == 415
+
+    def test_unsupported_content_encoding(self, client: TestClient):
+        """Test that compression other than gzip is rejected with 415."""
+        response = client.post(
+            OTLP_LOGS_ENDPOINT,
+            content=b"{}",
+            headers={"Content-Type": OTLP_CONTENT_TYPE_JSON, "Content-Encoding": "br"},
+        )
+
+        assert response.status_code == 415
+
+    def test_oversized_gzip_body(self, client: TestClient):
+        """Test that a body inflating past the limit is rejected with 413."""
+        with patch.object(otel_routes, "OTLP_MAX_BODY_BYTES", 1024):
+            response = client.post(
+                OTLP_LOGS_ENDPOINT,
+                content=gzip.compress(b" " * 4096),
+                headers={"Content-Type": OTLP_CONTENT_TYPE_JSON, "Content-Encoding": "gzip"},
+            )
+
+        assert response.status_code == 413
+
+    def test_root_path_accepts_protobuf(self, client: TestClient, store: ActivityStore):
+        """Test that the root fallback delegates protobuf exports."""
+        response = client.post(
+            "/",
+            content=_proto_export(_tool_results(1)),
+            headers={"Content-Type": OTLP_CONTENT_TYPE_PROTOBUF},
+        )
+
+        assert response.status_code == 200
+        assert _activity_count(store) == 1
@@ -0,0 +1,195 @@
+"""Tests for the daemon's Unix domain socket transport.
+
+Tests cover:
+- Socket listener lifecycle (bind, permissions, cleanup)
+- Hook client preferring the socket and falling back to TCP
+"""
+
+import asyncio
+import socket
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+import pytest
+import uvicorn
+from fastapi import FastAPI
+
+from open_agent_kit import ci_hook
+from open_agent_kit.features.codebase_intelligence.constants import CI_SOCKET_FILE_PERMISSIONS
+from open_agent_kit.features.codebase_intelligence.daemon.manager import get_socket_path
+from open_agent_kit.features.codebase_intelligence.daemon.unix_socket import UnixSocketListener
+
+
+class _Daemon:
+    """A minimal app served over both transports from a background loop."""
+
+    def __init__(self, ci_data_dir: Path, socket_path: Path) -> None:
+        self.ci_data_dir = ci_data_dir
+        self.socket_path = socket_path
+        self.transports: list[str] = []
+
+        app = FastAPI()
+
+        @app.get("/api/health")
+        def health() -> dict[str, Any]:
+            return {"status": "healthy"}
+
+        self.app = app
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.listener = UnixSocketListener(app, socket_path)
+
+        tcp_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        tcp_sock.bind(("127.0.0.1", 0))
+        self.port: int = tcp_sock.getsockname()[1]
+        self._tcp_sock = tcp_sock
+        self._tcp_server = uvicorn.Server(
+            uvicorn.Config(app, lifespan="off", log_config=None, access_log=False)
+        )
+        self._tcp_future: Future[None] | None = None
+
+    def _run(self, coro: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout=10)
+
+    def start(self) -> None:
+        self._thread.start()
+        assert self._run(self.listener.start())
+        self._tcp_future = asyncio.run_coroutine_threadsafe(
+            self._tcp_server.serve(sockets=[self._tcp_sock]), self.loop
+        )
+        deadline = time.monotonic() + 10
+        while not self._tcp_server.started and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert self._tcp_server.started
+
+    def stop(self) -> None:
+        self._tcp_server.should_exit = True
+        if self._tcp_future is not None:
+            self._tcp_future.result(timeout=10)
+        self._run(self.listener.stop())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=10)
+        self.loop.close()
+
+
+@pytest.fixture
+def daemon() -> Iterator[_Daemon]:
+    """Serve a minimal app on a Unix socket and on TCP."""
+    # Short base dir: pytest's tmp_path can exceed the AF_UNIX path limit.
+    with tempfile.TemporaryDirectory(prefix="oak-", dir="/tmp") as tmp:
+        ci_data_dir = Path(tmp)
+        socket_path = get_socket_path(ci_data_dir)
+        if socket_path is None:
+            pytest.skip("Unix sockets unavailable on this platform")
+        served = _Daemon(ci_data_dir, socket_path)
+        served.start()
+        try:
+            yield served
+        finally:
+            served.stop()
+
+
+def _request_over_socket(daemon: _Daemon) -> bytes:
+    conn = ci_hook.UnixHTTPConnection(daemon.socket_path, timeout=5.0)
+    try:
+        conn.request("GET", "/api/health")
+        return conn.getresponse().read()
+    finally:
+        conn.close()
+
+
+def _request_over_tcp(daemon: _Daemon) -> bytes:
+    conn = ci_hook.http.client.HTTPConnection("127.0.0.1", daemon.port, timeout=5.0)
+    try:
+        conn.request("GET", "/api/health")
+        return conn.getresponse().read()
+    finally:
+        conn.close()
+
+
+class TestUnixSocketListener:
+    """Test the daemon-side socket listener."""
+
+    def test_socket_is_owner_only(self, daemon: _Daemon):
+        """Test that the socket file is created with owner-only permissions."""
+        assert daemon.socket_path.is_socket()
+        assert daemon.socket_path.stat().st_mode & 0o777 == CI_SOCKET_FILE_PERMISSIONS
+
+    def test_serves_same_app(self, daemon: _Daemon):
+        """Test that both transports serve the same routes."""
+        assert _request_over_socket(daemon) == _request_over_tcp(daemon)
+
+    def test_stop_removes_socket(self, daemon: _Daemon):
+        """Test that stopping the listener removes the socket file."""
+        asyncio.run_coroutine_threadsafe(daemon.listener.stop(), daemon.loop).result(timeout=10)
+
+        assert not daemon.socket_path.exists()
+
+    def test_replaces_stale_socket_file(self):
+        """Test that a socket file left by a killed daemon does not block startup."""
+        with tempfile.TemporaryDirectory(prefix="oak-", dir="/tmp") as tmp:
+            socket_path = get_socket_path(Path(tmp))
+            if socket_path is None:
+                pytest.skip("Unix sockets unavailable on this platform")
+            socket_path.write_text("")
+            served = _Daemon(Path(tmp), socket_path)
+            served.start()
+            try:
+                assert socket_path.is_socket()
+            finally:
+                served.stop()
+
+
+class TestHookClientTransport:
+    """Test that the hook client prefers the socket and falls back to TCP."""
+
+    def test_prefers_socket(self, daemon: _Daemon, monkeypatch: pytest.MonkeyPatch):
+        """Test that requests go over the socket when it is available."""
+        monkeypatch.setattr(
+            ci_hook.http.client,
+            "HTTPConnection",
+            _fail_if_used(ci_hook.http.client.HTTPConnection),
+        )
+
+        body = ci_hook.daemon_request(daemon.ci_data_dir, daemon.port, "GET", "/api/health")
+
+        assert b"healthy" in body
+
+    def test_falls_back_to_tcp_without_socket(self, daemon: _Daemon):
+        """Test that a missing socket falls back to TCP."""
+        asyncio.run_coroutine_threadsafe(daemon.listener.stop(), daemon.loop).result(timeout=10)
+
+        body = ci_hook.daemon_request(daemon.ci_data_dir, daemon.port, "GET", "/api/health")
+
+        assert b"healthy" in body
+
+    def test_falls_back_to_tcp_on_stale_socket(self, daemon: _Daemon):
+        """Test that a socket file nobody listens on falls back to TCP."""
+        asyncio.run_coroutine_threadsafe(daemon.listener.stop(), daemon.loop).result(timeout=10)
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(daemon.socket_path))
+        stale.close()
+
+        body = ci_hook.daemon_request(daemon.ci_data_dir, daemon.port, "GET", "/api/health")
+
+        assert b"healthy" in body
+
+    def test_http_errors_raise(self, daemon: _Daemon):
+        """Test that non-2xx responses raise instead of returning a body."""
+        with pytest.raises(ci_hook.http.client.HTTPException):
+            ci_hook.daemon_request(daemon.ci_data_dir, daemon.port, "GET", "/api/missing")
+
+
+def _fail_if_used(cls: type) -> type:
+    """Subclass whose TCP connections fail the test (Unix connections still work)."""
+
+    class _NoTCP(cls):  # type: ignore[misc, valid-type]
+        def connect(self) -> None:
+            raise AssertionError("request fell back to TCP")
+
+    return _NoTCP
@@ -0,0 +1,165 @@
+"""Tests for off-loop hook execution and event-loop lag sampling.
+
+Tests cover:
+- Hook worker pool results, errors and per-stage timings
+- Bounded concurrency and the event loop staying responsive
+- Event-loop lag snapshot and detection of a blocked loop
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.constants import HOOK_WORKER_THREAD_PREFIX
+from open_agent_kit.features.codebase_intelligence.daemon.workers import (
+    EventLoopLagMonitor,
+    HookWorkerPool,
+    get_hook_pool,
+)
+
+
+@pytest.fixture
+def pool():
+    """A small hook worker pool, shut down after the test."""
+    worker_pool = HookWorkerPool(max_workers=2)
+    yield worker_pool
+    worker_pool.shutdown()
+
+
+class TestHookWorkerPool:
+    """Test running blocking hook stages off the event loop."""
+
+    def test_returns_result_and_records_stage(self, pool: HookWorkerPool):
+        """Test that a stage's result is returned and its timing recorded."""
+        result = asyncio.run(pool.run("test.store", lambda a, b=0: a + b, 1, b=2))
+
+        assert result == 3
+        stage = pool.stats()["stages"]["test.store"]
+        assert stage["count"] == 1
+        assert stage["errors"] == 0
+
+    def test_runs_on_worker_thread(self, pool: HookWorkerPool):
+        """Test that stages run on a named pool thread, not the loop thread."""
+        name = asyncio.run(pool.run("test.thread", lambda: threading.current_thread().name))
+
+        assert name.startswith(HOOK_WORKER_THREAD_PREFIX)
+
+    def test_exceptions_propagate_and_count(self, pool: HookWorkerPool):
+        """Test that a failing stage raises to the caller and counts as an error."""
+
+        def _fail() -> None:
+            raise OSError("disk full")
+
+        with pytest.raises(OSError, match="disk full"):
+            asyncio.run(pool.run("test.fail", _fail))
+
+        assert pool.stats()["stages"]["test.fail"]["errors"] == 1
+
+    def test_concurrency_is_bounded(self, pool: HookWorkerPool):
+        """Test that no more than max_workers stages run at once."""
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def _work() -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        async def _main() -> None:
+            await asyncio.gather(*(pool.run("test.bounded", _work) for _ in range(6)))
+
+        asyncio.run(_main())
+
+        assert peak == pool.max_workers
+        stage = pool.stats()["stages"]["test.bounded"]
+        assert stage["count"] == 6
+        # Later calls queue behind the first two.
+        assert stage["avg_wait_ms"] > 0
+
+    def test_event_loop_stays_responsive(self, pool: HookWorkerPool):
+        """Test that the loop keeps serving other work during a slow stage."""
+        ticks = 0
+
+        async def _ticker(stop: asyncio.Event) -> None:
+            nonlocal ticks
+            while not stop.is_set():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        async def _main() -> None:
+            stop = asyncio.Event()
+            ticker = asyncio.create_task(_ticker(stop))
+            await pool.run("test.slow", time.sleep, 0.3)
+            stop.set()
+            await ticker
+
+        asyncio.run(_main())
+
+        # ~30 ticks if never blocked; 1 if the sleep ran on the loop.
+        assert ticks >= 10
+
+    def test_runs_inline_after_shutdown(self, pool: HookWorkerPool):
+        """Test that a shut-down pool runs late calls inline without new threads."""
+        asyncio.run(pool.run("test.before", lambda: None))
+        pool.shutdown()
+
+        name = asyncio.run(pool.run("test.after", lambda: threading.current_thread().name))
+
+        assert name == threading.current_thread().name
+        assert pool._executor is None
+        assert pool.stats()["stages"]["test.after"]["count"] == 1
+
+    def test_get_hook_pool_replaces_shut_down_pool(self):
+        """Test that the shared pool is recreated after a daemon shutdown."""
+        shared = get_hook_pool()
+        assert get_hook_pool() is shared
+
+        shared.shutdown()
+
+        assert get_hook_pool() is not shared
+
+
+class TestEventLoopLagMonitor:
+    """Test event-loop lag sampling."""
+
+    def test_snapshot_without_samples(self):
+        """Test that an idle monitor reports no samples."""
+        assert EventLoopLagMonitor().snapshot() == {"samples": 0}
+
+    def test_snapshot_percentiles(self):
+        """Test that the snapshot summarizes the recorded window."""
+        monitor = EventLoopLagMonitor(window=100)
+        for lag_ms in range(1, 101):
+            monitor.record(float(lag_ms))
+
+        snapshot = monitor.snapshot()
+
+        assert snapshot["samples"] == 100
+        assert snapshot["last_ms"] == 100.0
+        assert snapshot["p50_ms"] == 50.5
+        assert snapshot["p99_ms"] == 100.0
+        assert snapshot["max_ms"] == 100.0
+
+    def test_detects_blocked_loop(self):
+        """Test that blocking the loop shows up as lag."""
+        monitor = EventLoopLagMonitor(interval=0.01)
+
+        async def _main() -> None:
+            task = asyncio.create_task(monitor.run())
+            await asyncio.sleep(0.05)
+            time.sleep(0.2)  # block the loop
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(_main())
+
+        assert monitor.snapshot()["max_ms"] >= 150
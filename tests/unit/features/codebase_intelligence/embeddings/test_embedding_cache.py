@@ -0,0 +1,179 @@
+"""Tests for the persistent embedding cache."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.embeddings.base import (
+    EmbeddingProvider,
+    EmbeddingResult,
+)
+from open_agent_kit.features.codebase_intelligence.embeddings.cache import (
+    EmbeddingCache,
+    QueryEmbeddingCache,
+)
+from open_agent_kit.features.codebase_intelligence.embeddings.provider_chain import (
+    EmbeddingProviderChain,
+)
+from open_agent_kit.features.codebase_intelligence.memory.store import VectorStore
+
+DIMS = 4
+PROVIDER = "ollama:test-model"
+
+
+def _vector(seed: float) -> list[float]:
+    return [seed, seed + 0.5, seed + 1.0, seed + 1.5]
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> EmbeddingCache:
+    return EmbeddingCache(tmp_path / "embedding_cache.db", max_size_mb=1)
+
+
+@pytest.fixture
+def mock_provider() -> MagicMock:
+    """Provider that returns a distinct vector per text."""
+    provider = MagicMock(spec=EmbeddingProvider)
+    provider.name = PROVIDER
+    provider.dimensions = DIMS
+    provider.embed.side_effect = lambda texts: EmbeddingResult(
+        embeddings=[_vector(float(len(text))) for text in texts],
+        model="test-model",
+        provider=PROVIDER,
+        dimensions=DIMS,
+    )
+    return provider
+
+
+class TestEmbeddingCache:
+    """Test cache storage, lookup and eviction."""
+
+    def test_miss_then_hit(self, cache: EmbeddingCache) -> None:
+        assert cache.get_many(PROVIDER, DIMS, ["a"]) == [None]
+
+        cache.put_many(PROVIDER, DIMS, ["a"], [_vector(1.0)])
+
+        assert cache.get_many(PROVIDER, DIMS, ["a"]) == [_vector(1.0)]
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_keyed_by_provider_and_dimensions(self, cache: EmbeddingCache) -> None:
+        cache.put_many(PROVIDER, DIMS, ["a"], [_vector(1.0)])
+
+        assert cache.get_many("ollama:other-model", DIMS, ["a"]) == [None]
+        assert cache.get_many(PROVIDER, DIMS * 2, ["a"]) == [None]
+
+    def test_persists_across_instances(self, cache: EmbeddingCache) -> None:
+        cache.put_many(PROVIDER, DIMS, ["a", "b"], [_vector(1.0), _vector(2.0)])
+
+        reopened = EmbeddingCache(cache.db_path, max_size_mb=1)
+
+        assert reopened.get_many(PROVIDER, DIMS, ["b", "a"]) == [_vector(2.0), _vector(1.0)]
+        assert reopened.get_stats()["entries"] == 2
+
+    def test_evicts_least_recently_used(self, cache: EmbeddingCache) -> None:
+        cache.max_bytes = 3 * DIMS * 4  # room for three float32 vectors
+        cache.put_many(PROVIDER, DIMS, ["a", "b"], [_vector(1.0), _vector(2.0)])
+        cache.get_many(PROVIDER, DIMS, ["a"])  # "a" is now more recent than "b"
+        cache.put_many(PROVIDER, DIMS, ["c", "d"], [_vector(3.0), _vector(4.0)])
+
+        results = cache.get_many(PROVIDER, DIMS, ["a", "b", "c", "d"])
+
+        assert results[1] is None
+        assert cache.get_stats()["size_bytes"] <= cache.max_bytes
+        assert cache.get_stats()["evictions"] >= 1
+
+
+class TestVectorStoreEmbeddingCache:
+    """Test that VectorStore only embeds cache misses."""
+
+    def test_only_misses_are_embedded(
+        self, tmp_path: Path, cache: EmbeddingCache, mock_provider: MagicMock
+    ) -> None:
+        store = VectorStore(tmp_path / "chroma", mock_provider, embedding_cache=cache)
+
+        first = store._embed_texts(["one", "three"])
+        mock_provider.embed.reset_mock()
+        second = store._embed_texts(["three", "four!", "one"])
+
+        mock_provider.embed.assert_called_once_with(["four!"])
+        assert second.embeddings == [first.embeddings[1], _vector(5.0), first.embeddings[0]]
+
+    def test_fully_cached_batch_skips_provider(
+        self, tmp_path: Path, cache: EmbeddingCache, mock_provider: MagicMock
+    ) -> None:
+        store = VectorStore(tmp_path / "chroma", mock_provider, embedding_cache=cache)
+        store._embed_texts(["one"])
+        mock_provider.embed.reset_mock()
+
+        result = store._embed_texts(["one"])
+
+        mock_provider.embed.assert_not_called()
+        assert result.dimensions == DIMS
+
+    def test_unresolved_chain_hits_warm_cache(
+        self, tmp_path: Path, cache: EmbeddingCache, mock_provider: MagicMock
+    ) -> None:
+        VectorStore(tmp_path / "warm", mock_provider, embedding_cache=cache)._embed_texts(["one"])
+        mock_provider.embed.reset_mock()
+        chain = EmbeddingProviderChain(providers=[mock_provider])
+        store = VectorStore(tmp_path / "chroma", chain, embedding_cache=cache)
+
+        store._embed_texts(["one"])
+
+        assert chain.name == "chain:none"
+        mock_provider.embed.assert_not_called()
+
+    def test_without_cache_calls_provider(self, tmp_path: Path, mock_provider: MagicMock) -> None:
+        store = VectorStore(tmp_path / "chroma", mock_provider)
+
+        store._embed_texts(["one"])
+        store._embed_texts(["one"])
+
+        assert mock_provider.embed.call_count == 2
+
+
+class TestQueryEmbeddingCache:
+    """Test the in-process query embedding cache."""
+
+    def test_lru_eviction(self) -> None:
+        cache = QueryEmbeddingCache(max_entries=2)
+        cache.put(PROVIDER, DIMS, "a", _vector(1.0))
+        cache.put(PROVIDER, DIMS, "b", _vector(2.0))
+        cache.get(PROVIDER, DIMS, "a")  # "b" is now least recently used
+        cache.put(PROVIDER, DIMS, "c", _vector(3.0))
+
+        assert cache.get(PROVIDER, DIMS, "b") is None
+        assert cache.get(PROVIDER, DIMS, "a") == _vector(1.0)
+
+    def test_entries_expire(self) -> None:
+        cache = QueryEmbeddingCache(ttl_seconds=10)
+        with patch("time.monotonic", return_value=100.0):
+            cache.put(PROVIDER, DIMS, "a", _vector(1.0))
+        with patch("time.monotonic", return_value=105.0):
+            assert cache.get(PROVIDER, DIMS, "a") == _vector(1.0)
+        with patch("time.monotonic", return_value=111.0):
+            assert cache.get(PROVIDER, DIMS, "a") is None
+
+        assert cache.get_stats()["entries"] == 0
+
+    def test_keyed_by_provider(self) -> None:
+        cache = QueryEmbeddingCache()
+        cache.put(PROVIDER, DIMS, "a", _vector(1.0))
+
+        assert cache.get("ollama:other-model", DIMS, "a") is None
+
+    def test_vector_store_reuses_query_embedding(
+        self, tmp_path: Path, mock_provider: MagicMock
+    ) -> None:
+        mock_provider.embed_query.return_value = _vector(1.0)
+        store = VectorStore(tmp_path / "chroma", mock_provider)
+
+        assert store.embed_query("where is auth?") == _vector(1.0)
+        assert store.embed_query("where is auth?") == _vector(1.0)
+
+        mock_provider.embed_query.assert_called_once_with("where is auth?")
+        assert store.query_embedding_cache.get_stats()["hits"] == 1
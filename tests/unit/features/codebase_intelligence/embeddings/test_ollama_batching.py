@@ -0,0 +1,180 @@
+"""Tests for batched embedding in OllamaProvider.
+
+Runs the provider against a local stub Ollama server so request counts,
+batch splitting and legacy-endpoint fallback are exercised over real HTTP.
+"""
+
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.embeddings.base import EmbeddingError
+from open_agent_kit.features.codebase_intelligence.embeddings.ollama import OllamaProvider
+
+DIMS = 4
+MODEL = "stub-embed"
+
+
+def _vector(text: str) -> list[float]:
+    return [float(len(text))] * DIMS
+
+
+class StubOllama:
+    """Minimal Ollama server: /api/tags, /api/embed and /api/embeddings."""
+
+    def __init__(self, supports_batch: bool = True) -> None:
+        self.supports_batch = supports_batch
+        self.model_missing = False
+        self.requests: list[tuple[str, dict]] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+            def _reply(self, status: int, body: str, content_type: str) -> None:
+                payload = body.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self) -> None:
+                self._reply(
+                    200, json.dumps({"models": [{"name": f"{MODEL}:latest"}]}), "application/json"
+                )
+
+            def do_POST(self) -> None:
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stub.requests.append((self.path, body))
+
+                if stub.model_missing:
+                    # Current servers report an unknown model as a JSON 404
+                    error = {"error": f'model "{body["model"]}" not found'}
+                    self._reply(404, json.dumps(error), "application/json")
+                elif self.path == "/api/embed" and stub.supports_batch:
+                    embeddings = [_vector(text) for text in body["input"]]
+                    self._reply(200, json.dumps({"embeddings": embeddings}), "application/json")
+                elif self.path == "/api/embeddings":
+                    self._reply(
+                        200, json.dumps({"embedding": _vector(body["prompt"])}), "application/json"
+                    )
+                else:
+                    self._reply(404, "404 page not found", "text/plain")
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def paths(self) -> list[str]:
+        return [path for path, _ in self.requests]
+
+    def __enter__(self) -> "StubOllama":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stub() -> Iterator[StubOllama]:
+    with StubOllama() as server:
+        yield server
+
+
+@pytest.fixture
+def legacy_stub() -> Iterator[StubOllama]:
+    with StubOllama(supports_batch=False) as server:
+        yield server
+
+
+def _provider(url: str, **kwargs: int) -> OllamaProvider:
+    return OllamaProvider(model=MODEL, base_url=url, dimensions=DIMS, **kwargs)
+
+
+class TestBatchedEmbed:
+    """Test /api/embed batching."""
+
+    def test_one_request_per_batch(self, stub: StubOllama) -> None:
+        provider = _provider(stub.url, max_batch_size=10)
+        texts = [f"text {i}" for i in range(25)]
+
+        result = provider.embed(texts)
+
+        assert stub.paths() == ["/api/embed"] * 3
+        assert [len(body["input"]) for _, body in stub.requests] == [10, 10, 5]
+        assert result.embeddings == [_vector(text) for text in texts]
+
+    def test_token_budget_splits_batches(self, stub: StubOllama) -> None:
+        # Budget of 10 tokens ~= 40 chars, so only two 16-char texts fit per request
+        provider = _provider(stub.url, max_batch_size=100, max_batch_tokens=10)
+
+        provider.embed(["x" * 16] * 5)
+
+        assert [len(body["input"]) for _, body in stub.requests] == [2, 2, 1]
+
+    def test_oversized_text_gets_own_batch(self, stub: StubOllama) -> None:
+        provider = _provider(stub.url, max_batch_tokens=10)
+
+        provider.embed(["small", "x" * 100, "small"])
+
+        assert [body["input"] for _, body in stub.requests] == [
+            ["small"],
+            ["x" * 100],
+            ["small"],
+        ]
+
+    def test_empty_texts_are_skipped(self, stub: StubOllama) -> None:
+        provider = _provider(stub.url)
+
+        result = provider.embed(["a", "  ", "b"])
+
+        assert stub.requests[0][1]["input"] == ["a", "b"]
+        assert len(result.embeddings) == 2
+
+    def test_model_error_is_not_mistaken_for_old_server(self, stub: StubOllama) -> None:
+        provider = _provider(stub.url)
+        stub.model_missing = True
+
+        with pytest.raises(EmbeddingError, match="404"):
+            provider.embed(["a"])
+        assert provider._legacy_endpoint is False
+
+
+class TestLegacyFallback:
+    """Test fallback to /api/embeddings on servers without /api/embed."""
+
+    def test_falls_back_once(self, legacy_stub: StubOllama) -> None:
+        provider = _provider(legacy_stub.url, max_batch_size=2)
+
+        first = provider.embed(["a", "bb", "ccc"])
+        second = provider.embed(["dddd"])
+
+        assert legacy_stub.paths() == ["/api/embed"] + ["/api/embeddings"] * 4
+        assert first.embeddings == [_vector("a"), _vector("bb"), _vector("ccc")]
+        assert second.embeddings == [_vector("dddd")]
+
+
+class TestRequestCounts:
+    """Compare HTTP requests per embed call between batched and legacy endpoints."""
+
+    def test_batched_sends_one_request_per_batch(self) -> None:
+        texts = [f"def function_{i}(): return {i}" for i in range(200)]
+        requests: dict[str, int] = {}
+
+        for mode, supports_batch in (("batched", True), ("legacy", False)):
+            with StubOllama(supports_batch=supports_batch) as srv:
+                provider = _provider(srv.url, max_batch_size=50)
+                provider.embed(texts[:1])  # Settle endpoint detection
+                srv.requests.clear()
+                result = provider.embed(texts)
+                assert result.embeddings == [_vector(text) for text in texts]
+                requests[mode] = len(srv.requests)
+
+        assert requests == {"batched": 4, "legacy": 200}
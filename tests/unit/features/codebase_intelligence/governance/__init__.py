@@ -0,0 +1 @@
+"""Unit tests for Codebase Intelligence governance module."""
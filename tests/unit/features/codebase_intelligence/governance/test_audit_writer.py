@@ -0,0 +1,154 @@
+"""Tests for the buffered governance audit writer.
+
+Covers:
+- Size-based and time-based flushing by the writer thread
+- flush() and stop() committing everything buffered
+- Ring buffer overflow dropping the oldest events
+- FK-violating events skipped without losing the rest of the batch
+- Flush latency and dropped-event stats
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.activity.store.core import (
+    ActivityStore,
+)
+from open_agent_kit.features.codebase_intelligence.activity.store.sessions import (
+    create_session,
+)
+from open_agent_kit.features.codebase_intelligence.constants import (
+    GOVERNANCE_ACTION_ALLOW,
+    GOVERNANCE_MODE_OBSERVE,
+)
+from open_agent_kit.features.codebase_intelligence.governance import (
+    GovernanceAuditWriter,
+    GovernanceDecision,
+)
+
+TEST_MACHINE_ID = "test-machine-audit"
+SESSION_ID = "audit-session"
+# Long enough that only an explicit flush or a full batch triggers a write
+NEVER_MS = 60_000
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> ActivityStore:
+    """Create an ActivityStore with one session, closed after the test."""
+    db_path = tmp_path / "ci" / "activities.db"
+    activity_store = ActivityStore(db_path, machine_id=TEST_MACHINE_ID)
+    create_session(activity_store, session_id=SESSION_ID, agent="claude", project_root="/p")
+    yield activity_store
+    activity_store.close()
+
+
+def _record(writer: GovernanceAuditWriter, i: int, session_id: str = SESSION_ID) -> None:
+    writer.record(
+        session_id=session_id,
+        agent="claude",
+        tool_name="Read",
+        tool_use_id=f"tool-{i}",
+        decision=GovernanceDecision(action=GOVERNANCE_ACTION_ALLOW),
+        enforcement_mode=GOVERNANCE_MODE_OBSERVE,
+        evaluation_ms=0,
+    )
+
+
+def _tool_use_ids(store: ActivityStore) -> list[str]:
+    conn = store._get_connection()
+    rows = conn.execute("SELECT tool_use_id FROM governance_audit_events ORDER BY id").fetchall()
+    return [row[0] for row in rows]
+
+
+def _wait_for_count(store: ActivityStore, expected: int, timeout: float = 5.0) -> int:
+    deadline = time.monotonic() + timeout
+    count = len(_tool_use_ids(store))
+    while count < expected and time.monotonic() < deadline:
+        time.sleep(0.01)
+        count = len(_tool_use_ids(store))
+    return count
+
+
+class TestFlushing:
+    """Test when buffered events reach the database."""
+
+    def test_record_is_buffered(self, store: ActivityStore):
+        writer = GovernanceAuditWriter(store, flush_interval_ms=NEVER_MS)
+        _record(writer, 0)
+
+        assert _tool_use_ids(store) == []
+        assert writer.get_stats()["buffered"] == 1
+        writer.stop()
+
+    def test_flush_writes_in_order(self, store: ActivityStore):
+        writer = GovernanceAuditWriter(store, flush_interval_ms=NEVER_MS)
+        for i in range(5):
+            _record(writer, i)
+
+        assert writer.flush() == 5
+        assert _tool_use_ids(store) == [f"tool-{i}" for i in range(5)]
+        writer.stop()
+
+    def test_full_batch_flushes(self, store: ActivityStore):
+        writer = GovernanceAuditWriter(store, batch_size=10, flush_interval_ms=NEVER_MS)
+        for i in range(10):
+            _record(writer, i)
+
+        assert _wait_for_count(store, 10) == 10
+        writer.stop()
+
+    def test_interval_flushes(self, store: ActivityStore):
+        writer = GovernanceAuditWriter(store, flush_interval_ms=20)
+        _record(writer, 0)
+
+        assert _wait_for_count(store, 1) == 1
+        writer.stop()
+
+    def test_stop_writes_remaining(self, store: ActivityStore):
+        writer = GovernanceAuditWriter(store, flush_interval_ms=NEVER_MS)
+        for i in range(3):
+            _record(writer, i)
+
+        writer.stop()
+
+        assert len(_tool_use_ids(store)) == 3
+        stats = writer.get_stats()
+        assert stats["buffered"] == 0
+        assert stats["events_written"] == 3
+
+
+class TestDrops:
+    """Test dropped-event accounting."""
+
+    def test_full_ring_buffer_drops_oldest(self, store: ActivityStore):
+        writer = GovernanceAuditWriter(
+            store, batch_size=100, flush_interval_ms=NEVER_MS, max_buffer=3
+        )
+        for i in range(5):
+            _record(writer, i)
+
+        writer.flush()
+
+        assert _tool_use_ids(store) == ["tool-2", "tool-3", "tool-4"]
+        assert writer.get_stats()["events_dropped"] == 2
+        writer.stop()
+
+    def test_fk_violation_skips_only_bad_event(self, store: ActivityStore):
+        writer = GovernanceAuditWriter(store, flush_interval_ms=NEVER_MS)
+        _record(writer, 0)
+        _record(writer, 1, session_id="no-such-session")
+        _record(writer, 2)
+
+        assert writer.flush() == 2
+
+        assert _tool_use_ids(store) == ["tool-0", "tool-2"]
+        stats = writer.get_stats()
+        assert stats["events_written"] == 2
+        assert stats["events_dropped"] == 1
+        assert stats["flushes"] == 1
+        assert stats["max_flush_ms"] >= stats["last_flush_ms"] >= 0
+        writer.stop()
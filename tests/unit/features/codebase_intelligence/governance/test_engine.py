@@ -0,0 +1,152 @@
+"""Tests for governance rule evaluation.
+
+Tests cover:
+- Rules bucketed by exact tool name and tool glob, first match in policy order
+- Pattern and path_pattern conditions on dict and JSON string input
+- Observe-mode downgrade
+- First-match selection in a large synthetic policy
+"""
+
+import json
+
+from open_agent_kit.features.codebase_intelligence.config import (
+    GovernanceConfig,
+    GovernanceRule,
+)
+from open_agent_kit.features.codebase_intelligence.constants import (
+    GOVERNANCE_ACTION_ALLOW,
+    GOVERNANCE_ACTION_DENY,
+    GOVERNANCE_ACTION_OBSERVE,
+    GOVERNANCE_ACTION_WARN,
+    GOVERNANCE_MODE_ENFORCE,
+    GOVERNANCE_MODE_OBSERVE,
+)
+from open_agent_kit.features.codebase_intelligence.governance import GovernanceEngine
+
+LARGE_POLICY_RULES = 300
+
+
+def _engine(*rules: GovernanceRule, mode: str = GOVERNANCE_MODE_ENFORCE) -> GovernanceEngine:
+    return GovernanceEngine(GovernanceConfig(enforcement_mode=mode, rules=list(rules)))
+
+
+class TestRuleOrder:
+    """Test that bucketing keeps first-match-wins policy order."""
+
+    def test_wildcard_before_exact_wins(self):
+        engine = _engine(
+            GovernanceRule(id="any-rm", tool="*", pattern=r"rm -rf", action="deny"),
+            GovernanceRule(id="bash-rm", tool="Bash", pattern=r"rm", action="warn"),
+        )
+
+        decision = engine.evaluate("Bash", {"command": "rm -rf /"})
+
+        assert decision.rule_id == "any-rm"
+        assert decision.action == GOVERNANCE_ACTION_DENY
+
+    def test_exact_before_glob_wins(self):
+        engine = _engine(
+            GovernanceRule(id="bash", tool="Bash", pattern=r"curl", action="warn"),
+            GovernanceRule(id="glob", tool="B*", action="deny"),
+        )
+
+        assert engine.evaluate("Bash", {"command": "curl x"}).rule_id == "bash"
+        assert engine.evaluate("Bash", {"command": "ls"}).rule_id == "glob"
+
+    def test_tool_glob_matches_whole_name(self):
+        engine = _engine(GovernanceRule(id="mcp", tool="mcp__*", action="deny"))
+
+        assert engine.evaluate("mcp__github__create_issue", {}).rule_id == "mcp"
+        assert engine.evaluate("Read", {}).action == GOVERNANCE_ACTION_ALLOW
+        assert engine.evaluate("xmcp__tool", {}).action == GOVERNANCE_ACTION_ALLOW
+
+    def test_disabled_and_invalid_rules_skipped(self):
+        engine = _engine(
+            GovernanceRule(id="off", tool="Bash", action="deny", enabled=False),
+            GovernanceRule(id="on", tool="Bash", action="warn"),
+        )
+
+        assert engine.evaluate("Bash", {"command": "ls"}).rule_id == "on"
+
+
+class TestConditions:
+    """Test pattern and path_pattern conditions."""
+
+    def test_path_pattern_on_dict_input(self):
+        engine = _engine(
+            GovernanceRule(id="no-env", tool="Write", path_pattern="*.env", action="deny")
+        )
+
+        assert engine.evaluate("Write", {"file_path": "/repo/.env"}).rule_id == "no-env"
+        assert engine.evaluate("Write", {"file_path": "/repo/app.py"}).rule_id == ""
+        assert engine.evaluate("Write", {"content": "x"}).rule_id == ""
+
+    def test_path_pattern_on_json_string_input(self):
+        engine = _engine(
+            GovernanceRule(id="no-env", tool="Edit", path_pattern="*.env", action="deny")
+        )
+
+        decision = engine.evaluate("Edit", json.dumps({"path": "config/.env"}))
+
+        assert decision.rule_id == "no-env"
+        assert engine.evaluate("Edit", "not json").rule_id == ""
+
+    def test_pattern_and_path_both_required(self):
+        engine = _engine(
+            GovernanceRule(
+                id="secret-in-config",
+                tool="Write",
+                pattern=r"API_KEY",
+                path_pattern="config/*",
+                action="warn",
+            )
+        )
+
+        hit = {"file_path": "config/app.yaml", "content": "API_KEY=1"}
+        assert engine.evaluate("Write", hit).action == GOVERNANCE_ACTION_WARN
+        assert engine.evaluate("Write", {**hit, "content": "x"}).rule_id == ""
+        assert engine.evaluate("Write", {**hit, "file_path": "src/app.py"}).rule_id == ""
+
+    def test_observe_mode_downgrades(self):
+        engine = _engine(
+            GovernanceRule(id="deny-bash", tool="Bash", action="deny"),
+            mode=GOVERNANCE_MODE_OBSERVE,
+        )
+
+        decision = engine.evaluate("Bash", {"command": "ls"})
+
+        assert decision.action == GOVERNANCE_ACTION_OBSERVE
+        assert decision.rule_id == "deny-bash"
+
+
+class TestLargePolicy:
+    """Test evaluation against a large synthetic policy."""
+
+    def test_picks_first_matching_rule(self):
+        """Test that a 300-rule policy picks the right rules."""
+        tools = ["Bash", "Read", "Write", "Edit", "Grep", "WebFetch", "Task"]
+        rules = []
+        for i in range(LARGE_POLICY_RULES):
+            tool = tools[i % len(tools)] if i % 10 else "mcp__*"
+            if i % 3 == 0:
+                rules.append(
+                    GovernanceRule(id=f"r{i}", tool=tool, pattern=rf"token_{i}\b", action="warn")
+                )
+            else:
+                rules.append(
+                    GovernanceRule(
+                        id=f"r{i}", tool=tool, path_pattern=f"*/secret_{i}/*", action="deny"
+                    )
+                )
+        engine = _engine(*rules)
+        calls = [
+            ("Bash", {"command": "git status"}),
+            ("Read", {"file_path": "/repo/src/app.py"}),
+            ("Write", {"file_path": "/repo/secret_2/key.pem", "content": "x"}),
+            ("mcp__github__list", {"query": "token_30"}),
+        ]
+
+        assert engine.evaluate(*calls[0]).action == GOVERNANCE_ACTION_ALLOW
+        assert engine.evaluate(*calls[1]).action == GOVERNANCE_ACTION_ALLOW
+        assert engine.evaluate(*calls[2]).rule_id == "r2"
+        assert engine.evaluate(*calls[3]).rule_id == "r30"
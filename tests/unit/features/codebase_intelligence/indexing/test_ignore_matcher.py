@@ -0,0 +1,208 @@
+"""Tests for the compiled ignore-pattern matcher.
+
+IgnoreMatcher must report exactly the pattern the per-pattern fnmatch check
+reports, honour ``!`` negations, and be what discovery and the watcher use.
+"""
+
+import fnmatch
+import ntpath
+import random
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.config import DEFAULT_EXCLUDE_PATTERNS
+from open_agent_kit.features.codebase_intelligence.indexing import ignore as ignore_module
+from open_agent_kit.features.codebase_intelligence.indexing.ignore import (
+    IgnoreMatcher,
+    cached_matcher,
+)
+from open_agent_kit.features.codebase_intelligence.indexing.indexer import (
+    CodebaseIndexer,
+    IndexerConfig,
+)
+from open_agent_kit.features.codebase_intelligence.indexing.watcher import FileWatcher
+from open_agent_kit.features.codebase_intelligence.memory.store import VectorStore
+
+EXTRA_PATTERNS = [
+    "*.log",
+    "docs/**",
+    "build/**",
+    "**/build/**",
+    ".claude/commands",
+    "src/generated",
+    "[ab]",
+    "src/*.py",
+    "te?t_*",
+    "*/config.py",
+]
+
+COMPONENTS = [
+    "src",
+    "docs",
+    "node_modules",
+    "build",
+    "generated",
+    ".claude",
+    "commands",
+    "a",
+    "[ab]",
+    "main.py",
+    "config.py",
+    "test_app.py",
+    "app.log",
+    "README.md",
+]
+
+
+def reference_match(path: Path, patterns: list[str]) -> str | None:
+    """Uncompiled first-match check, one fnmatch per pattern and component."""
+    path_str = str(path)
+    for pattern in patterns:
+        if fnmatch.fnmatch(path_str, pattern) or fnmatch.fnmatch(path.name, pattern):
+            return pattern
+        if pattern in path.parts or any(fnmatch.fnmatch(p, pattern) for p in path.parts):
+            return pattern
+        if "/" in pattern and (path_str == pattern or path_str.startswith(pattern + "/")):
+            return pattern
+    return None
+
+
+def _random_paths(count: int, seed: int = 7) -> list[Path]:
+    rng = random.Random(seed)
+    return [Path(*rng.choices(COMPONENTS, k=rng.randint(1, 5))) for _ in range(count)]
+
+
+class TestIgnoreMatcher:
+    """Test matching results against the per-pattern reference."""
+
+    def test_matches_reference_on_random_paths(self) -> None:
+        patterns = list(DEFAULT_EXCLUDE_PATTERNS) + EXTRA_PATTERNS
+        rng = random.Random(3)
+        matchers = [(patterns, IgnoreMatcher(patterns))]
+        for _ in range(5):
+            subset = rng.sample(patterns, k=len(patterns) // 3)
+            matchers.append((subset, IgnoreMatcher(subset)))
+
+        for path in _random_paths(2000):
+            for subset, matcher in matchers:
+                assert matcher.match(path) == reference_match(path, subset), path
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("logs/app.log", "*.log"),
+            ("docs/guide/intro.md", "docs/**"),
+            ("src/generated/api.py", "src/generated"),
+            ("pkg/node_modules/x/index.js", "node_modules"),
+            ("src/app/main.py", None),
+        ],
+    )
+    def test_reports_matching_pattern(self, path: str, expected: str | None) -> None:
+        matcher = IgnoreMatcher(["*.log", "docs/**", "src/generated", "node_modules"])
+
+        assert matcher.match(Path(path)) == expected
+
+    def test_negation_reincludes(self) -> None:
+        matcher = IgnoreMatcher(["*.log", "!keep.log"])
+
+        assert matcher.match(Path("logs/app.log")) == "*.log"
+        assert matcher.match(Path("logs/keep.log")) is None
+
+    def test_later_pattern_overrides_negation(self) -> None:
+        matcher = IgnoreMatcher(["*.log", "!keep.log", "logs/**"])
+
+        assert matcher.match(Path("keep.log")) is None
+        # The first matching pattern is still reported for diagnostics
+        assert matcher.match(Path("logs/keep.log")) == "*.log"
+
+    def test_negation_before_pattern_has_no_effect(self) -> None:
+        matcher = IgnoreMatcher(["!keep.log", "*.log"])
+
+        assert matcher.match(Path("keep.log")) == "*.log"
+
+
+@pytest.fixture
+def indexer(tmp_path: Path) -> CodebaseIndexer:
+    project = tmp_path / "project"
+    (project / "src").mkdir(parents=True)
+    (project / "logs").mkdir()
+    (project / "src" / "app.py").write_text("def app():\n    return 1\n")
+    (project / "src" / "generated.py").write_text("GENERATED = True\n")
+    (project / "src" / "keep_generated.py").write_text("KEEP = True\n")
+    (project / ".gitignore").write_text("*generated.py\n!keep_generated.py\n")
+    store = MagicMock(spec=VectorStore)
+    return CodebaseIndexer(project, store, config=IndexerConfig(ignore_patterns=[]))
+
+
+class TestIgnoreIntegration:
+    """Test discovery and the watcher share the compiled gitignore rules."""
+
+    def test_discovery_honours_gitignore_negation(self, indexer: CodebaseIndexer) -> None:
+        files = {p.relative_to(indexer.project_root).as_posix() for p in indexer.discover_files()}
+
+        assert files == {"src/app.py", "src/keep_generated.py"}
+
+    def test_watcher_applies_gitignore(self, indexer: CodebaseIndexer) -> None:
+        watcher = FileWatcher(project_root=indexer.project_root, indexer=indexer)
+        src = indexer.project_root / "src"
+
+        assert watcher._should_watch_file(src / "app.py")
+        assert watcher._should_watch_file(src / "keep_generated.py")
+        assert not watcher._should_watch_file(src / "generated.py")
+
+    def test_watcher_reloads_gitignore_on_change(self, indexer: CodebaseIndexer) -> None:
+        watcher = FileWatcher(project_root=indexer.project_root, indexer=indexer)
+        gitignore = indexer.project_root / ".gitignore"
+        app = indexer.project_root / "src" / "app.py"
+        assert watcher._should_watch_file(app)
+
+        gitignore.write_text("app.py\n")
+        assert not watcher._should_watch_file(gitignore)
+
+        assert not watcher._should_watch_file(app)
+
+    def test_watcher_picks_up_config_changes(self, indexer: CodebaseIndexer) -> None:
+        path = Path("src/app.py")
+        assert not indexer._should_ignore(path)
+
+        indexer.config.ignore_patterns = ["src/**"]
+
+        assert indexer._should_ignore(path)
+
+
+class TestPatternCompilation:
+    """Test how a large gitignore-style pattern list is compiled."""
+
+    def test_gitignore_shapes_avoid_the_regex(self) -> None:
+        patterns = list(EXTRA_PATTERNS)
+        # Gitignore-style additions: each line yields a rooted and an anywhere glob
+        for i in range(150):
+            patterns += [f"cache_{i}/**", f"**/cache_{i}/**", f"*.tmp{i}"]
+
+        matcher = IgnoreMatcher(patterns)
+
+        # Only the irregular globs from EXTRA_PATTERNS share the alternation regex
+        regex_patterns = {patterns[i] for i in matcher._positive._glob_indexes}
+        assert regex_patterns == {"[ab]", "src/*.py", "te?t_*", "*/config.py"}
+        for path in _random_paths(2000):
+            assert matcher.match(path) == reference_match(path, patterns), path
+
+    def test_case_insensitive_where_normcase_folds(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(ignore_module, "_normcase", ntpath.normcase)
+
+        matcher = IgnoreMatcher(["*.LOG", "Vendor", "Docs/**"])
+
+        assert matcher.match(Path("logs/App.log")) == "*.LOG"
+        assert matcher.match(Path("vendor/lib.py")) == "Vendor"
+        assert matcher.match(Path("docs/guide.md")) == "Docs/**"
+        assert matcher.match(Path("src/app.py")) is None
+
+    def test_explicit_patterns_compiled_once(self, indexer: CodebaseIndexer) -> None:
+        cached_matcher.cache_clear()
+
+        for name in ("a.log", "b.log", "c.py"):
+            indexer._get_ignore_pattern(Path(name), ["*.log"])
+
+        assert cached_matcher.cache_info().misses == 1
@@ -0,0 +1,334 @@
+"""Tests for manifest-driven incremental indexing.
+
+The manifest records a fingerprint and chunk IDs per indexed file so that
+incremental builds only embed new or changed files and delete chunks of
+files that vanished.
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.indexing.indexer import (
+    CodebaseIndexer,
+    IndexerConfig,
+)
+from open_agent_kit.features.codebase_intelligence.indexing.manifest import (
+    IndexManifest,
+    ManifestEntry,
+)
+from open_agent_kit.features.codebase_intelligence.memory.store import VectorStore
+
+EMBEDDING_DIMS = 8
+
+
+class FakeCodeIndex:
+    """Tracks chunk IDs the indexer stores, standing in for the code collection."""
+
+    def __init__(self) -> None:
+        self.ids: set[str] = set()
+        self.metadata: dict[str, dict] = {}
+        self.embedded_files: list[str] = []
+        self.embedded_ids: list[str] = []
+        self.updated_ids: list[str] = []
+
+    def add_batched(self, chunks, batch_size=50, progress_callback=None) -> int:
+        added = 0
+        for chunk in chunks:
+            self.ids.add(chunk.id)
+            self.metadata[chunk.id] = chunk.to_metadata()
+            self.embedded_ids.append(chunk.id)
+            added += 1
+            if chunk.filepath not in self.embedded_files:
+                self.embedded_files.append(chunk.filepath)
+        return added
+
+    def delete_ids(self, chunk_ids: list[str]) -> int:
+        self.ids.difference_update(chunk_ids)
+        return len(chunk_ids)
+
+    def delete_filepaths(self, filepaths) -> int:
+        paths = set(filepaths)
+        stale = [i for i in self.ids if self.metadata[i]["filepath"] in paths]
+        return self.delete_ids(stale)
+
+    def get_metadata(self, filepaths) -> dict[str, dict]:
+        paths = set(filepaths)
+        return {
+            i: dict(self.metadata[i]) for i in self.ids if self.metadata[i]["filepath"] in paths
+        }
+
+    def update_metadata(self, chunks) -> int:
+        for chunk in chunks:
+            self.metadata[chunk.id] = chunk.to_metadata()
+            self.updated_ids.append(chunk.id)
+        return len(chunks)
+
+
+@pytest.fixture
+def code_index() -> FakeCodeIndex:
+    return FakeCodeIndex()
+
+
+@pytest.fixture
+def mock_vector_store(code_index: FakeCodeIndex) -> MagicMock:
+    """Vector store mock backed by FakeCodeIndex."""
+    mock = MagicMock(spec=VectorStore)
+    mock.embedding_provider = MagicMock(dimensions=EMBEDDING_DIMS)
+    mock.add_code_chunks_batched.side_effect = code_index.add_batched
+    mock.delete_code_by_ids.side_effect = code_index.delete_ids
+    mock.delete_code_by_filepaths.side_effect = code_index.delete_filepaths
+    mock.get_code_metadata_by_filepaths.side_effect = code_index.get_metadata
+    mock.update_code_metadata.side_effect = code_index.update_metadata
+    mock.count_code_chunks.side_effect = lambda: len(code_index.ids)
+    mock.clear_code_index.side_effect = code_index.ids.clear
+    return mock
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    root = tmp_path / "project"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "alpha.py").write_text("def alpha():\n    return 1\n")
+    (root / "src" / "beta.py").write_text("def beta():\n    return 2\n")
+    return root
+
+
+@pytest.fixture
+def indexer(project: Path, tmp_path: Path, mock_vector_store: MagicMock) -> CodebaseIndexer:
+    config = IndexerConfig(ignore_patterns=[], manifest_path=tmp_path / "index_manifest.json")
+    return CodebaseIndexer(project, mock_vector_store, config=config)
+
+
+def _new_indexer(indexer: CodebaseIndexer) -> CodebaseIndexer:
+    """Simulate a daemon restart: fresh indexer, same manifest file."""
+    return CodebaseIndexer(indexer.project_root, indexer.vector_store, config=indexer.config)
+
+
+class TestIndexManifest:
+    """Test manifest persistence."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "manifest.json"
+        manifest = IndexManifest(path)
+        manifest.clear(embedding_dimensions=EMBEDDING_DIMS)
+        manifest.put("a.py", ManifestEntry(1, 2, "abc", ["id1", "id2"]))
+        manifest.save()
+
+        reloaded = IndexManifest(path)
+        assert reloaded.get("a.py") == ManifestEntry(1, 2, "abc", ["id1", "id2"])
+        assert reloaded.embedding_dimensions == EMBEDDING_DIMS
+        assert reloaded.total_chunks() == 2
+
+    def test_corrupt_file_loads_empty(self, tmp_path: Path) -> None:
+        path = tmp_path / "manifest.json"
+        path.write_text("{not json")
+
+        manifest = IndexManifest(path)
+        assert len(manifest) == 0
+
+    def test_disabled_manifest_does_not_write(self, tmp_path: Path) -> None:
+        manifest = IndexManifest(None)
+        manifest.put("a.py", ManifestEntry(1, 2, "abc"))
+        manifest.save()
+
+        assert not manifest.enabled
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestIncrementalBuild:
+    """Test build_index reuse, re-embed and removal accounting."""
+
+    def test_first_incremental_build_falls_back_to_full(
+        self, indexer: CodebaseIndexer, mock_vector_store: MagicMock
+    ) -> None:
+        stats = indexer.build_index(full_rebuild=False)
+
+        mock_vector_store.clear_code_index.assert_called_once()
+        assert stats.files_reembedded == 2
+        assert indexer.config.manifest_path is not None
+        assert indexer.config.manifest_path.exists()
+
+    def test_unchanged_files_are_reused(
+        self, indexer: CodebaseIndexer, code_index: FakeCodeIndex
+    ) -> None:
+        indexer.build_index(full_rebuild=True)
+        code_index.embedded_files.clear()
+
+        stats = _new_indexer(indexer).build_index(full_rebuild=False)
+
+        assert stats.files_reused == 2
+        assert stats.files_reembedded == 0
+        assert code_index.embedded_files == []
+
+    def test_changed_file_is_reembedded(
+        self, indexer: CodebaseIndexer, project: Path, code_index: FakeCodeIndex
+    ) -> None:
+        indexer.build_index(full_rebuild=True)
+        old_ids = set(code_index.ids)
+        code_index.embedded_files.clear()
+        (project / "src" / "beta.py").write_text("def beta():\n    return 3\n")
+
+        stats = _new_indexer(indexer).build_index(full_rebuild=False)
+
+        assert stats.files_reused == 1
+        assert stats.files_reembedded == 1
+        assert code_index.embedded_files == ["src/beta.py"]
+        # Old beta chunks were replaced rather than left behind
+        assert len(code_index.ids) == len(old_ids)
+        assert code_index.ids != old_ids
+
+    def test_touched_but_identical_file_is_reused(
+        self, indexer: CodebaseIndexer, project: Path, code_index: FakeCodeIndex
+    ) -> None:
+        indexer.build_index(full_rebuild=True)
+        code_index.embedded_files.clear()
+        alpha = project / "src" / "alpha.py"
+        stat = alpha.stat()
+        os.utime(alpha, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        stats = _new_indexer(indexer).build_index(full_rebuild=False)
+
+        assert stats.files_reused == 2
+        assert code_index.embedded_files == []
+
+    def test_vanished_file_chunks_are_removed(
+        self, indexer: CodebaseIndexer, project: Path, code_index: FakeCodeIndex
+    ) -> None:
+        indexer.build_index(full_rebuild=True)
+        (project / "src" / "beta.py").unlink()
+
+        rebuilt = _new_indexer(indexer)
+        stats = rebuilt.build_index(full_rebuild=False)
+
+        assert stats.files_removed == 1
+        assert rebuilt.manifest.filepaths() == {"src/alpha.py"}
+        assert len(code_index.ids) == rebuilt.manifest.total_chunks()
+
+    def test_cleared_collection_invalidates_manifest(
+        self,
+        indexer: CodebaseIndexer,
+        code_index: FakeCodeIndex,
+        mock_vector_store: MagicMock,
+    ) -> None:
+        indexer.build_index(full_rebuild=True)
+        code_index.ids.clear()  # e.g. devtools reset behind the indexer's back
+        mock_vector_store.clear_code_index.reset_mock()
+
+        stats = _new_indexer(indexer).build_index(full_rebuild=False)
+
+        mock_vector_store.clear_code_index.assert_called_once()
+        assert stats.files_reused == 0
+        assert stats.files_reembedded == 2
+
+    def test_remove_file_updates_manifest(self, indexer: CodebaseIndexer, project: Path) -> None:
+        indexer.build_index(full_rebuild=True)
+
+        indexer.remove_file(project / "src" / "alpha.py")
+
+        assert indexer.manifest.get("src/alpha.py") is None
+
+    def test_apply_file_changes_batches_deletes(
+        self,
+        indexer: CodebaseIndexer,
+        project: Path,
+        mock_vector_store: MagicMock,
+        code_index: FakeCodeIndex,
+    ) -> None:
+        indexer.build_index(full_rebuild=True)
+        build_stats = indexer.get_stats()
+        code_index.embedded_files.clear()
+        mock_vector_store.add_code_chunks_batched.reset_mock()
+        (project / "src" / "alpha.py").write_text("def alpha():\n    return 10\n")
+        (project / "src" / "beta.py").unlink()
+        (project / "src" / "gamma.py").write_text("def gamma():\n    return 3\n")
+
+        stats = indexer.apply_file_changes(
+            [project / "src" / "alpha.py", project / "src" / "gamma.py"],
+            [project / "src" / "beta.py"],
+        )
+
+        mock_vector_store.delete_code_by_filepaths.assert_called_once_with(["src/beta.py"])
+        mock_vector_store.add_code_chunks_batched.assert_called_once()
+        assert code_index.embedded_files == ["src/alpha.py", "src/gamma.py"]
+        assert stats.files_processed == 2
+        assert stats.files_removed == 1
+        # The old alpha chunk was replaced rather than left behind
+        assert stats.chunks_removed == 1
+        assert len(code_index.ids) == indexer.manifest.total_chunks()
+        assert indexer.get_stats() is build_stats
+        assert indexer.manifest.get("src/beta.py") is None
+        assert indexer.manifest.get("src/gamma.py") is not None
+
+    def test_apply_file_changes_isolates_failing_file(
+        self,
+        indexer: CodebaseIndexer,
+        project: Path,
+        mock_vector_store: MagicMock,
+        code_index: FakeCodeIndex,
+    ) -> None:
+        indexer.build_index(full_rebuild=True)
+        build_stats = indexer.get_stats()
+        code_index.embedded_files.clear()
+        alpha = project / "src" / "alpha.py"
+        beta = project / "src" / "beta.py"
+        alpha.write_text("def alpha():\n    return 10\n")
+        beta.write_text("def beta():\n    return 20\n")
+
+        def add_batched(chunks, batch_size=50, progress_callback=None) -> int:
+            chunks = list(chunks)
+            if any(chunk.filepath == "src/beta.py" for chunk in chunks):
+                raise ValueError("embedding rejected")
+            return code_index.add_batched(chunks, batch_size, progress_callback)
+
+        mock_vector_store.add_code_chunks_batched.side_effect = add_batched
+
+        stats = indexer.apply_file_changes([beta, alpha], [])
+
+        assert code_index.embedded_files == ["src/alpha.py"]
+        assert stats.files_processed == 1
+        assert stats.errors == 1
+        # The failed file is left out of the manifest so the next build retries it
+        assert indexer.manifest.get("src/alpha.py") is not None
+        assert indexer.manifest.get("src/beta.py") is None
+        assert indexer.get_stats() is build_stats
+        assert build_stats.errors == 0
+
+    def test_apply_file_changes_embeds_only_changed_chunks(
+        self, indexer: CodebaseIndexer, project: Path, code_index: FakeCodeIndex
+    ) -> None:
+        alpha = project / "src" / "alpha.py"
+        alpha.write_text("def one():\n    return 1\n\n\ndef two():\n    return 2\n")
+        indexer.build_index(full_rebuild=True)
+        code_index.embedded_ids.clear()
+        alpha.write_text("def one():\n    return 1\n\n\ndef two():\n    return 22\n")
+
+        stats = indexer.apply_file_changes([alpha], [])
+
+        assert [chunk_id.split(":")[-2] for chunk_id in code_index.embedded_ids] == ["two"]
+        assert stats.chunks_indexed == 1
+        assert stats.embeds_avoided == 1
+        assert stats.chunks_moved == 0
+        assert stats.chunks_removed == 1
+        assert len(code_index.ids) == indexer.manifest.total_chunks() == 3
+
+    def test_apply_file_changes_updates_metadata_of_moved_chunks(
+        self, indexer: CodebaseIndexer, project: Path, code_index: FakeCodeIndex
+    ) -> None:
+        alpha = project / "src" / "alpha.py"
+        alpha.write_text("def one():\n    return 1\n\n\ndef two():\n    return 2\n")
+        indexer.build_index(full_rebuild=True)
+        ids_before = set(code_index.ids)
+        code_index.embedded_ids.clear()
+        alpha.write_text("import os\n\n\ndef one():\n    return 1\n\n\ndef two():\n    return 2\n")
+
+        stats = indexer.apply_file_changes([alpha], [])
+
+        assert code_index.embedded_ids == []
+        assert code_index.ids == ids_before
+        assert stats.embeds_avoided == 2
+        assert stats.chunks_moved == 2
+        two_id = next(i for i in code_index.updated_ids if i.split(":")[-2] == "two")
+        assert code_index.metadata[two_id]["start_line"] == 8
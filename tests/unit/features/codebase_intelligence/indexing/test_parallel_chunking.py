@@ -0,0 +1,167 @@
+"""Tests for parallel chunking during index builds.
+
+Files are sharded across worker processes; results must match in-process
+chunking exactly (chunk IDs, order, manifest entries and chunker stats).
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.constants import PARALLEL_CHUNK_SHARD_SIZE
+from open_agent_kit.features.codebase_intelligence.indexing import indexer as indexer_module
+from open_agent_kit.features.codebase_intelligence.indexing import parallel as parallel_module
+from open_agent_kit.features.codebase_intelligence.indexing.chunker import (
+    ChunkerConfig,
+    CodeChunker,
+)
+from open_agent_kit.features.codebase_intelligence.indexing.indexer import (
+    CodebaseIndexer,
+    IndexerConfig,
+)
+from open_agent_kit.features.codebase_intelligence.indexing.parallel import ParallelChunker
+from open_agent_kit.features.codebase_intelligence.memory.store import CodeChunk, VectorStore
+
+FILE_COUNT = 40
+WORKERS = 2
+
+
+def _module_source(i: int) -> str:
+    return (
+        f"class Service{i}:\n"
+        f"    def handle(self, value):\n"
+        f"        return value + {i}\n\n\n"
+        f"def helper_{i}(items):\n"
+        f"    return [item * {i} for item in items]\n"
+    )
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    root = tmp_path / "project"
+    root.mkdir()
+    for i in range(FILE_COUNT):
+        (root / f"module_{i:02d}.py").write_text(_module_source(i))
+    (root / "notes.md").write_text("# Notes\n\nSome prose.\n")
+    (root / "empty.py").write_text("")
+    return root
+
+
+def _build(project: Path, tmp_path: Path, workers: int) -> tuple[CodebaseIndexer, list[CodeChunk]]:
+    stored: list[CodeChunk] = []
+
+    def add_batched(chunks: Iterable[CodeChunk], batch_size=50, progress_callback=None) -> int:
+        stored.extend(chunks)
+        return len(stored)
+
+    store = MagicMock(spec=VectorStore)
+    store.embedding_provider = MagicMock(dimensions=8)
+    store.add_code_chunks_batched.side_effect = add_batched
+    config = IndexerConfig(
+        ignore_patterns=[],
+        manifest_path=tmp_path / f"manifest_{workers}.json",
+        workers=workers,
+    )
+    indexer = CodebaseIndexer(project, store, config=config)
+    indexer.build_index(full_rebuild=True)
+    return indexer, stored
+
+
+class TestParallelChunker:
+    """Test the process pool chunker directly."""
+
+    def test_matches_in_process_chunking(self, project: Path) -> None:
+        files = sorted(project.iterdir())
+        files.append(project / "missing.py")
+        serial = CodeChunker(ChunkerConfig())
+        sink = CodeChunker(ChunkerConfig())
+
+        with ParallelChunker(project, ChunkerConfig(), workers=WORKERS) as pool:
+            results = list(pool.chunk_files(files, fingerprint=True, stats_sink=sink))
+
+        assert [result.filepath for result in results] == files
+        for result in results[:-1]:
+            expected = serial.chunk_file(result.filepath, display_path=result.filepath.name)
+            for chunk in expected:
+                chunk.filepath = result.filepath.name
+            assert result.chunks() == expected
+            assert result.entry is not None
+        assert results[-1].error is not None
+        assert results[-1].entry is None
+        assert sink.get_stats()["ast_success"] == serial.get_stats()["ast_success"]
+
+
+class TestParallelBuild:
+    """Test build_index with chunking workers."""
+
+    @pytest.fixture(autouse=True)
+    def low_parallel_threshold(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(indexer_module, "PARALLEL_INDEX_MIN_FILES", 1)
+
+    def test_parallel_build_matches_serial(self, project: Path, tmp_path: Path) -> None:
+        serial_indexer, serial_chunks = _build(project, tmp_path, workers=1)
+        parallel_indexer, parallel_chunks = _build(project, tmp_path, workers=WORKERS)
+
+        assert [c.id for c in parallel_chunks] == [c.id for c in serial_chunks]
+        assert parallel_chunks == serial_chunks
+
+        serial_stats = serial_indexer._stats
+        parallel_stats = parallel_indexer._stats
+        assert parallel_stats.files_processed == serial_stats.files_processed
+        assert parallel_stats.files_skipped == serial_stats.files_skipped
+        assert parallel_stats.ast_success == serial_stats.ast_success > 0
+        assert parallel_stats.ast_fallback == serial_stats.ast_fallback
+        assert parallel_stats.line_based == serial_stats.line_based
+
+        serial_manifest = serial_indexer.manifest
+        parallel_manifest = parallel_indexer.manifest
+        assert parallel_manifest.filepaths() == serial_manifest.filepaths()
+        for filepath in serial_manifest.filepaths():
+            assert parallel_manifest.get(filepath) == serial_manifest.get(filepath)
+
+    def test_small_builds_stay_in_process(
+        self, project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(indexer_module, "PARALLEL_INDEX_MIN_FILES", FILE_COUNT * 10)
+        pool_factory = MagicMock(side_effect=AssertionError("pool should not start"))
+        monkeypatch.setattr(indexer_module, "ParallelChunker", pool_factory)
+
+        _, chunks = _build(project, tmp_path, workers=WORKERS)
+
+        assert chunks
+        pool_factory.assert_not_called()
+
+
+class TestParallelChunkerSharding:
+    """Test how files are split into shards and queued to workers."""
+
+    def test_shards_bounded_ahead_of_consumer(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        root = tmp_path / "shards"
+        root.mkdir()
+        files = []
+        for i in range(PARALLEL_CHUNK_SHARD_SIZE * 5 + 3):
+            path = root / f"module_{i:03d}.py"
+            path.write_text(_module_source(i))
+            files.append(path)
+        shard_sizes: list[int] = []
+
+        with ParallelChunker(root, ChunkerConfig(), workers=WORKERS) as pool:
+            submit = pool._executor.submit
+
+            def recording_submit(fn, project_root, shard, fingerprint):
+                shard_sizes.append(len(shard))
+                return submit(fn, project_root, shard, fingerprint)
+
+            monkeypatch.setattr(pool._executor, "submit", recording_submit)
+            results = pool.chunk_files(files, fingerprint=False, stats_sink=CodeChunker())
+            first = next(results)
+            queued_before_first = len(shard_sizes)
+            rest = list(results)
+
+        assert [first.filepath, *(r.filepath for r in rest)] == files
+        assert shard_sizes == [PARALLEL_CHUNK_SHARD_SIZE] * 5 + [3]
+        assert queued_before_first == WORKERS * parallel_module._SHARDS_AHEAD_PER_WORKER
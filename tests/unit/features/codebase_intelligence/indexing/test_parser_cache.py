@@ -0,0 +1,174 @@
+"""Tests for tree-sitter parser reuse in the chunker.
+
+Tests cover:
+- Languages and parsers built once per chunker (and per thread)
+- Incremental reparsing from cached trees matching a fresh parse
+- Chunking many files per language without rebuilding languages or parsers
+"""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.indexing.chunker import (
+    LANGUAGE_AST_CONFIG,
+    CodeChunker,
+)
+
+# One small module per language in LANGUAGE_AST_CONFIG
+SAMPLES: dict[str, tuple[str, str]] = {
+    "python": (
+        ".py",
+        'class Greeter:\n    def greet(self, name):\n        """Say hi."""\n'
+        '        return f"hi {name}"\n\n\ndef main():\n    return Greeter().greet("x")\n',
+    ),
+    "javascript": (
+        ".js",
+        "class Greeter {\n  greet(name) {\n    return `hi ${name}`;\n  }\n}\n\n"
+        "function main() {\n  return new Greeter().greet('x');\n}\n",
+    ),
+    "typescript": (
+        ".ts",
+        "class Greeter {\n  greet(name) {\n    return 'hi ' + name;\n  }\n}\n\n"
+        "function main() {\n  return new Greeter().greet('x');\n}\n",
+    ),
+    "go": (
+        ".go",
+        "package main\n\ntype Greeter struct{}\n\nfunc (g Greeter) Greet(name string) string {\n"
+        '\treturn "hi " + name\n}\n\nfunc main() {\n\tGreeter{}.Greet("x")\n}\n',
+    ),
+    "rust": (
+        ".rs",
+        "struct Greeter;\n\nimpl Greeter {\n    fn greet(&self, name: &str) -> String {\n"
+        '        format!("hi {}", name)\n    }\n}\n\nfn main() {\n    Greeter.greet("x");\n}\n',
+    ),
+    "csharp": (
+        ".cs",
+        "namespace Demo {\n    class Greeter {\n        public string Greet(string name) {\n"
+        '            return "hi " + name;\n        }\n    }\n}\n',
+    ),
+    "java": (
+        ".java",
+        "class Greeter {\n    String greet(String name) {\n"
+        '        return "hi " + name;\n    }\n}\n',
+    ),
+}
+
+FILES_PER_LANGUAGE = 5
+
+
+def _supported(chunker: CodeChunker) -> list[str]:
+    return [language for language in LANGUAGE_AST_CONFIG if chunker.has_ast_support(language)]
+
+
+@pytest.fixture
+def chunker() -> CodeChunker:
+    chunker = CodeChunker()
+    if not chunker.has_ast_support("python"):
+        pytest.skip("tree-sitter-python not installed")
+    return chunker
+
+
+def test_samples_cover_every_ast_language():
+    assert set(SAMPLES) == set(LANGUAGE_AST_CONFIG)
+
+
+class TestParserRegistry:
+    """Test that parsers are built once and reused."""
+
+    def test_parser_reused_across_files(self, chunker: CodeChunker):
+        first = chunker._get_parser("python")
+        assert chunker._get_parser("python") is first
+        assert set(chunker._languages) == {"python"}
+
+    def test_each_thread_gets_own_parser_sharing_language(self, chunker: CodeChunker):
+        main_parser = chunker._get_parser("python")
+        language = chunker._languages["python"]
+        other: list[object] = []
+        thread = threading.Thread(target=lambda: other.append(chunker._get_parser("python")))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not main_parser
+        assert chunker._languages["python"] is language
+
+    def test_cached_parser_chunks_like_before(self, chunker: CodeChunker, tmp_path: Path):
+        path = tmp_path / "greeter.py"
+        path.write_text(SAMPLES["python"][1])
+
+        first = chunker.chunk_file(path)
+        again = chunker.chunk_file(path)
+
+        assert [c.id for c in again] == [c.id for c in first]
+        assert [c.name for c in first] == ["Greeter", "greet", "main"]
+        assert first[1].content.startswith("    def greet(self, name):")
+        assert first[2].content == 'def main():\n    return Greeter().greet("x")'
+
+
+class TestIncrementalReparse:
+    """Test that reparsing from a cached tree matches a fresh parse."""
+
+    @pytest.mark.parametrize(
+        "edit",
+        [
+            lambda src: "import os\n\n" + src,
+            lambda src: src.replace('f"hi {name}"', 'f"hello, {name}!"'),
+            lambda src: src.replace("def main():\n", "def main(argv=None):\n"),
+            lambda src: src + "\n\ndef extra():\n    return 1\n",
+            lambda src: src[: src.index("\n\ndef main")] + "\n",
+        ],
+    )
+    def test_matches_fresh_parse(self, chunker: CodeChunker, tmp_path: Path, edit):
+        path = tmp_path / "greeter.py"
+        original = SAMPLES["python"][1]
+        path.write_text(original)
+        chunker.chunk_file(path, reuse_tree=True)
+
+        path.write_text(edit(original))
+        incremental = chunker.chunk_file(path, reuse_tree=True)
+        fresh = CodeChunker().chunk_file(path)
+
+        assert [(c.id, c.start_line, c.end_line) for c in incremental] == [
+            (c.id, c.start_line, c.end_line) for c in fresh
+        ]
+
+    def test_tree_cache_only_used_when_requested(self, chunker: CodeChunker, tmp_path: Path):
+        path = tmp_path / "greeter.py"
+        path.write_text(SAMPLES["python"][1])
+
+        chunker.chunk_file(path)
+        assert not chunker._trees
+
+        chunker.chunk_file(path, reuse_tree=True)
+        assert list(chunker._trees) == [str(path)]
+
+
+class TestConstructionCounts:
+    """Test that chunking many files builds each Language and Parser once."""
+
+    def test_language_and_parser_built_once_per_language(
+        self, chunker: CodeChunker, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        import tree_sitter
+
+        built: dict[str, list[object]] = {"Language": [], "Parser": []}
+        for name in built:
+            real = getattr(tree_sitter, name)
+
+            def counting(*args, _real=real, _name=name):
+                built[_name].append(args[0])
+                return _real(*args)
+
+            monkeypatch.setattr(tree_sitter, name, counting)
+
+        languages = _supported(chunker)
+        for language in languages:
+            suffix, source = SAMPLES[language]
+            for i in range(FILES_PER_LANGUAGE):
+                path = tmp_path / f"module_{language}_{i}{suffix}"
+                path.write_text(source)
+                assert chunker.chunk_file(path)
+
+        assert len(built["Language"]) == len(languages)
+        assert built["Parser"] == [chunker._languages[language] for language in languages]
@@ -0,0 +1,102 @@
+"""Tests for streaming build_index.
+
+Chunks are produced lazily while the vector store consumes them, so only
+the batches in flight are held in memory and progress tracks stored files.
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from open_agent_kit.features.codebase_intelligence.indexing.indexer import (
+    CodebaseIndexer,
+    IndexerConfig,
+)
+from open_agent_kit.features.codebase_intelligence.memory.store import CodeChunk, VectorStore
+
+FILE_COUNT = 12
+BATCH_SIZE = 4
+
+
+class StreamingStore:
+    """Consumes chunks in batches, recording how far chunking ran ahead."""
+
+    def __init__(self, indexer_ref: list[CodebaseIndexer]) -> None:
+        self.indexer_ref = indexer_ref
+        self.stored: list[str] = []  # filepath of each stored chunk
+        self.max_files_ahead = 0
+
+    def add_batched(self, chunks: Iterable[CodeChunk], batch_size=50, progress_callback=None):
+        assert not isinstance(chunks, list), "build_index should stream chunks"
+        batch: list[CodeChunk] = []
+        for chunk in chunks:
+            batch.append(chunk)
+            if len(batch) == batch_size:
+                self._store(batch, progress_callback)
+                batch = []
+        if batch:
+            self._store(batch, progress_callback)
+        return len(self.stored)
+
+    def _store(self, batch: list[CodeChunk], progress_callback) -> None:
+        stats = self.indexer_ref[0]._stats
+        self.stored.extend(chunk.filepath for chunk in batch)
+        files_chunked = stats.files_processed + stats.files_skipped
+        self.max_files_ahead = max(self.max_files_ahead, files_chunked - len(set(self.stored)))
+        if progress_callback:
+            progress_callback(len(self.stored), 0)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    root = tmp_path / "project"
+    root.mkdir()
+    for i in range(FILE_COUNT):
+        (root / f"module_{i:02d}.py").write_text(f"def function_{i}():\n    return {i}\n")
+    (root / "empty.py").write_text("")
+    return root
+
+
+@pytest.fixture
+def indexer_and_store(project: Path) -> tuple[CodebaseIndexer, StreamingStore]:
+    indexer_ref: list[CodebaseIndexer] = []
+    store = StreamingStore(indexer_ref)
+    mock = MagicMock(spec=VectorStore)
+    mock.add_code_chunks_batched.side_effect = store.add_batched
+    indexer = CodebaseIndexer(
+        project, mock, config=IndexerConfig(ignore_patterns=[], batch_size=BATCH_SIZE)
+    )
+    indexer_ref.append(indexer)
+    return indexer, store
+
+
+class TestStreamingBuild:
+    """Test the generator-based build_index pipeline."""
+
+    def test_chunking_stays_close_to_storage(
+        self, indexer_and_store: tuple[CodebaseIndexer, StreamingStore]
+    ) -> None:
+        indexer, store = indexer_and_store
+
+        stats = indexer.build_index(full_rebuild=True)
+
+        assert stats.chunks_indexed == FILE_COUNT
+        # Only the current batch (plus the file being chunked) is ahead of storage
+        assert store.max_files_ahead <= BATCH_SIZE + 1
+
+    def test_progress_counts_stored_files(
+        self, indexer_and_store: tuple[CodebaseIndexer, StreamingStore]
+    ) -> None:
+        indexer, _ = indexer_and_store
+        calls: list[tuple[int, int]] = []
+
+        indexer.build_index(full_rebuild=True, progress_callback=lambda c, t: calls.append((c, t)))
+
+        total = FILE_COUNT + 1  # includes the empty file
+        assert all(t == total for _, t in calls)
+        assert [c for c, _ in calls] == sorted(c for c, _ in calls)
+        assert calls[-1] == (total, total)
+        # Progress advances per stored batch, not all at the end
+        assert len(calls) > 2
@@ -14,6 +14,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from open_agent_kit.features.codebase_intelligence.indexing.indexer import IndexStats
 from open_agent_kit.features.codebase_intelligence.indexing.watcher import FileWatcher
 
 # Module path for patching
@@ -25,8 +26,7 @@ def mock_indexer():
     """Create a mock CodebaseIndexer."""
     indexer = MagicMock()
     indexer._should_ignore.return_value = False
-    indexer.remove_file.return_value = 0
-    indexer.index_single_file.return_value = 1
+    indexer.apply_file_changes.return_value = IndexStats(files_processed=1, chunks_indexed=1)
     return indexer
 
 
@@ -42,11 +42,11 @@ def watcher(mock_indexer, tmp_path: Path) -> FileWatcher:
 class TestDoReindexResilience:
     """Test that _do_reindex() survives unexpected exceptions."""
 
-    def test_survives_remove_file_runtime_error(
+    def test_survives_remove_runtime_error(
         self, watcher: FileWatcher, mock_indexer, tmp_path: Path
     ) -> None:
-        """_do_reindex() does not raise when remove_file throws RuntimeError."""
-        mock_indexer.remove_file.side_effect = RuntimeError("readonly database")
+        """_do_reindex() does not raise when removing a file throws RuntimeError."""
+        mock_indexer.apply_file_changes.side_effect = RuntimeError("readonly database")
 
         gone_file = tmp_path / "gone.py"
         watcher._deleted_files.add(gone_file)
@@ -56,11 +56,11 @@ class TestDoReindexResilience:
             mock_get_state.return_value.vector_store = None
             watcher._do_reindex()  # Should NOT raise
 
-    def test_survives_index_single_file_exception(
+    def test_survives_reindex_exception(
         self, watcher: FileWatcher, mock_indexer, tmp_path: Path
     ) -> None:
-        """_do_reindex() does not raise when index_single_file throws Exception."""
-        mock_indexer.index_single_file.side_effect = RuntimeError("ChromaDB lock")
+        """_do_reindex() does not raise when re-indexing throws Exception."""
+        mock_indexer.apply_file_changes.side_effect = RuntimeError("ChromaDB lock")
 
         test_file = tmp_path / "test.py"
         test_file.write_text("x = 1")
@@ -75,7 +75,7 @@ class TestDoReindexResilience:
         self, watcher: FileWatcher, mock_indexer, tmp_path: Path, caplog
     ) -> None:
         """_do_reindex() logs the error when an unexpected exception occurs."""
-        mock_indexer.remove_file.side_effect = RuntimeError("database is locked")
+        mock_indexer.apply_file_changes.side_effect = RuntimeError("database is locked")
 
         gone_file = tmp_path / "gone.py"
         watcher._deleted_files.add(gone_file)
@@ -106,6 +106,24 @@ class TestDoReindexResilience:
             mock_get_state.return_value.vector_store = mock_vs
             watcher._do_reindex()  # Should NOT raise
 
+    def test_change_set_applied_in_one_batch(
+        self, watcher: FileWatcher, mock_indexer, tmp_path: Path
+    ) -> None:
+        """_do_reindex() hands the whole debounced change set to the indexer at once."""
+        changed = [tmp_path / f"file_{i}.py" for i in range(3)]
+        gone_file = tmp_path / "gone.py"
+        watcher._pending_files.update(changed)
+        watcher._deleted_files.add(gone_file)
+        watcher._last_reindex_time = 0.0
+
+        with patch(f"{_WATCHER_MODULE}.get_state") as mock_get_state:
+            mock_get_state.return_value.vector_store = None
+            watcher._do_reindex()
+
+        mock_indexer.apply_file_changes.assert_called_once_with(set(changed), {gone_file})
+        mock_indexer.index_single_file.assert_not_called()
+        mock_indexer.remove_file.assert_not_called()
+
     def test_empty_queues_return_early(self, watcher: FileWatcher) -> None:
         """_do_reindex() returns immediately when there are no pending changes."""
         # No files queued — should return without error
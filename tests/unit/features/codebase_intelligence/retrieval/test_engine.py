@@ -334,6 +334,24 @@ class TestSearch:
         # search_memory is called twice: once for memories, once for plans
         assert mock_vector_store.search_memory.call_count == 2
 
+    def test_search_all_embeds_query_once(
+        self, engine: RetrievalEngine, mock_vector_store: MagicMock
+    ) -> None:
+        """Test that one search shares a single query embedding across collections."""
+        mock_vector_store.embed_query.return_value = [0.1, 0.2]
+
+        engine.search(query="test query", search_type=SEARCH_TYPE_ALL)
+
+        mock_vector_store.embed_query.assert_called_once_with("test query")
+        searches = [
+            mock_vector_store.search_code,
+            mock_vector_store.search_memory,
+            mock_vector_store.search_session_summaries,
+        ]
+        for search in searches:
+            for call in search.call_args_list:
+                assert call.kwargs["query_embedding"] == [0.1, 0.2]
+
     def test_search_code_only(self, engine: RetrievalEngine, mock_vector_store: MagicMock) -> None:
         """Test that search with 'code' type only returns code results."""
         result = engine.search(query="test query", search_type=SEARCH_TYPE_CODE)
@@ -2582,6 +2582,140 @@ INSERT INTO sessions (id, agent, project_root, started_at, status, prompt_count,
 
         target_store.close()
 
+    def test_backup_rows_stream_across_read_chunks(self, temp_db: Path):
+        """Test that statements split across read chunks parse like whole ones."""
+        from open_agent_kit.features.codebase_intelligence.activity.store.backup import (
+            _iter_backup_rows,
+        )
+
+        backup_content = """-- OAK Codebase Intelligence History Backup
+-- Schema version: 12
+
+-- memory_observations (2 records)
+INSERT INTO memory_observations (id, observation, context, importance) VALUES ('obs-1', 'it''s done;
+INSERT INTO x (a) VALUES (1);', NULL, 1.5e-07);
+INSERT INTO memory_observations (id, observation, context, importance) VALUES ('obs-2', '-- not a comment', 'ctx', -3);
+-- trailing comment"""
+        backup_path = temp_db.parent / "chunked_backup.sql"
+        backup_path.write_text(backup_content)
+
+        expected = [
+            (
+                "memory_observations",
+                {
+                    "id": "obs-1",
+                    "observation": "it's done;\nINSERT INTO x (a) VALUES (1);",
+                    "context": None,
+                    "importance": 1.5e-07,
+                },
+            ),
+            (
+                "memory_observations",
+                {
+                    "id": "obs-2",
+                    "observation": "-- not a comment",
+                    "context": "ctx",
+                    "importance": -3,
+                },
+            ),
+        ]
+        for chunk_chars in (1, 7, 4096):
+            assert list(_iter_backup_rows(backup_path, chunk_chars)) == expected
+
+    def test_backup_rows_escaped_quotes_across_read_chunks(self, temp_db: Path):
+        """Test that a run of '' escapes cut by a read chunk parses in linear time."""
+        from open_agent_kit.features.codebase_intelligence.activity.store.backup import (
+            _iter_backup_rows,
+        )
+
+        quotes = "''" * 40
+        backup_path = temp_db.parent / "quotes_backup.sql"
+        backup_path.write_text(
+            f"INSERT INTO sessions (id, title) VALUES ('s1', '{quotes}');\n"
+            "INSERT INTO sessions (id, title) VALUES ('s2', 'plain');\n"
+        )
+
+        # Every chunk size cuts the escapes somewhere; the old ambiguous
+        # pattern backtracked exponentially on the unterminated string
+        for chunk_chars in (50, 61, 64, 97):
+            rows = list(_iter_backup_rows(backup_path, chunk_chars))
+            assert rows == [
+                ("sessions", {"id": "s1", "title": "'" * 40}),
+                ("sessions", {"id": "s2", "title": "plain"}),
+            ]
+
+    def test_import_rolls_back_on_failure(self, temp_db: Path):
+        """Test that a failed import leaves no rows behind, even across batches."""
+        from open_agent_kit.features.codebase_intelligence.activity.store import backup
+        from open_agent_kit.features.codebase_intelligence.constants import (
+            CI_BACKUP_IMPORT_BATCH_SIZE,
+        )
+
+        source_store = ActivityStore(temp_db, machine_id=TEST_MACHINE_ID)
+        for i in range(CI_BACKUP_IMPORT_BATCH_SIZE * 2):
+            source_store.create_session(
+                session_id=f"bulk-{i}",
+                agent="claude",
+                project_root="/test/project",
+            )
+        backup_path = temp_db.parent / "bulk_backup.sql"
+        backup.export_to_sql(source_store, backup_path)
+        source_store.close()
+
+        real_iter = backup._iter_backup_rows
+
+        def failing_iter(path: Path):
+            rows = real_iter(path)
+            # More than one batch has been flushed when the read fails
+            for _ in range(CI_BACKUP_IMPORT_BATCH_SIZE * 2 - 1):
+                yield next(rows)
+            raise OSError("disk read failed")
+
+        target_store = ActivityStore(temp_db.parent / "bulk_target.db", machine_id=TEST_MACHINE_ID)
+        with patch.object(backup, "_iter_backup_rows", failing_iter):
+            with pytest.raises(OSError):
+                backup.import_from_sql_with_dedup(target_store, backup_path)
+
+        assert target_store.get_all_session_ids() == set()
+        assert not target_store._get_connection().in_transaction
+
+        result = backup.import_from_sql_with_dedup(target_store, backup_path)
+        assert result.sessions_imported == CI_BACKUP_IMPORT_BATCH_SIZE * 2
+        assert not target_store._get_connection().in_transaction
+        target_store.close()
+
+    def test_import_reports_throughput(self, temp_db: Path):
+        """Test that import batches many rows and reports rows per second."""
+        from open_agent_kit.features.codebase_intelligence.activity.store.backup import (
+            export_to_sql,
+            import_from_sql_with_dedup,
+        )
+
+        source_store = ActivityStore(temp_db, machine_id=TEST_MACHINE_ID)
+        for i in range(1200):
+            source_store.create_session(
+                session_id=f"bulk-{i}",
+                agent="claude",
+                project_root="/test/project",
+            )
+        backup_path = temp_db.parent / "bulk_backup.sql"
+        export_to_sql(source_store, backup_path)
+        source_store.close()
+
+        target_store = ActivityStore(temp_db.parent / "bulk_target.db", machine_id=TEST_MACHINE_ID)
+        result = import_from_sql_with_dedup(target_store, backup_path)
+
+        assert result.sessions_imported == 1200
+        assert result.rows_read == 1200
+        assert result.rows_per_second > 0
+        assert len(target_store.get_all_session_ids()) == 1200
+
+        # Re-importing skips every row as a duplicate
+        again = import_from_sql_with_dedup(target_store, backup_path)
+        assert again.sessions_imported == 0
+        assert again.sessions_skipped == 1200
+        target_store.close()
+
     def test_export_only_includes_records_from_current_machine(self, temp_db: Path):
         """Test that export only includes records that originated on this machine.
 
@@ -0,0 +1,174 @@
+"""Tests for the standard-library-only ``oak ci hook`` fast path.
+
+Hooks run on every agent tool call, so the hook entry point must not pull in
+the full CLI (typer, rich, pydantic, ...). These tests guard that import
+surface and that the constants it mirrors stay in sync.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from open_agent_kit import ci_hook, launcher
+
+# Third-party packages the full CLI imports that the hook path must avoid.
+HEAVY_MODULES = ("typer", "rich", "dotenv", "pydantic", "yaml", "httpx", "chromadb")
+
+# First-party modules the hook path is allowed to import at startup.
+ALLOWED_OAK_MODULES = {
+    "open_agent_kit",
+    "open_agent_kit._version",
+    "open_agent_kit.ci_hook",
+    "open_agent_kit.config",
+    "open_agent_kit.config.messages",
+    "open_agent_kit.config.paths",
+}
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+
+
+class TestImportSurface:
+    """The hook path must only import what it needs to start."""
+
+    def test_no_heavy_dependencies_loaded(self) -> None:
+        result = _run_python(
+            "import json, sys\n"
+            "import open_agent_kit.ci_hook\n"
+            "print(json.dumps(sorted(sys.modules)))\n"
+        )
+        loaded = set(json.loads(result.stdout))
+
+        heavy = sorted(m for m in loaded if m.split(".")[0] in HEAVY_MODULES)
+        assert heavy == []
+        oak_modules = {m for m in loaded if m.split(".")[0] == "open_agent_kit"}
+        assert oak_modules <= ALLOWED_OAK_MODULES
+
+
+class TestMirroredConstants:
+    """Constants duplicated to avoid heavy imports must match their sources."""
+
+    def test_matches_ci_constants(self) -> None:
+        from open_agent_kit.features.codebase_intelligence import constants
+
+        for name in (
+            "AGENT_CLAUDE",
+            "AGENTS_REQUIRE_HOOK_SPECIFIC_OUTPUT",
+            "CI_AUTH_SCHEME_BEARER",
+            "CI_CLI_VERSION_FILE",
+            "CI_DATA_DIR",
+            "CI_PORT_FILE",
+            "CI_SHARED_PORT_DIR",
+            "CI_SHARED_PORT_FILE",
+            "CI_SOCKET_FILE",
+            "CI_SOCKET_PATH_MAX_LENGTH",
+            "CI_TOKEN_FILE",
+            "DAEMON_HEALTH_POLL_INTERVAL",
+            "DAEMON_START_TIMEOUT_SECONDS",
+            "HOOK_STDIN_TIMEOUT_SECONDS",
+            "HTTP_TIMEOUT_HEALTH_CHECK",
+            "HTTP_TIMEOUT_LONG",
+        ):
+            assert getattr(ci_hook, name) == getattr(constants, name), name
+
+    def test_matches_daemon_port_range(self) -> None:
+        from open_agent_kit.features.codebase_intelligence.daemon import manager
+
+        assert ci_hook.PORT_RANGE_START == manager.PORT_RANGE_START
+        assert ci_hook.PORT_RANGE_SIZE == manager.PORT_RANGE_SIZE
+
+
+class TestResolvePort:
+    """Port resolution reads port files without importing the daemon manager."""
+
+    def _layout(self, tmp_path: Path) -> Path:
+        ci_data_dir = tmp_path / ".oak" / ci_hook.CI_DATA_DIR
+        ci_data_dir.mkdir(parents=True)
+        shared_dir = tmp_path / ci_hook.CI_SHARED_PORT_DIR
+        shared_dir.mkdir()
+        (shared_dir / ci_hook.CI_SHARED_PORT_FILE).write_text("37811\n")
+        return ci_data_dir
+
+    def test_local_override_wins(self, tmp_path: Path) -> None:
+        ci_data_dir = self._layout(tmp_path)
+        (ci_data_dir / ci_hook.CI_PORT_FILE).write_text("37900")
+
+        assert ci_hook.resolve_port(tmp_path, ci_data_dir) == 37900
+
+    def test_shared_port_used_without_override(self, tmp_path: Path) -> None:
+        ci_data_dir = self._layout(tmp_path)
+
+        assert ci_hook.resolve_port(tmp_path, ci_data_dir) == 37811
+
+    def test_out_of_range_override_ignored(self, tmp_path: Path) -> None:
+        ci_data_dir = self._layout(tmp_path)
+        (ci_data_dir / ci_hook.CI_PORT_FILE).write_text("80")
+
+        assert ci_hook.resolve_port(tmp_path, ci_data_dir) == 37811
+
+
+class TestEntryPoints:
+    """Argument handling for the launcher and the hook main."""
+
+    def test_launcher_routes_hook_to_fast_path(self) -> None:
+        argv = ["oak", "ci", "hook", "PostToolUse", "--agent", "cursor"]
+        with (
+            patch.object(sys, "argv", argv),
+            patch("open_agent_kit.ci_hook.main") as hook_main,
+            patch("open_agent_kit.cli.cli_main") as cli_main,
+        ):
+            launcher.main()
+
+        hook_main.assert_called_once_with(["PostToolUse", "--agent", "cursor"])
+        cli_main.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "argv",
+        [["oak", "ci", "status"], ["oak", "ci", "hook", "--help"], ["oak"]],
+    )
+    def test_launcher_routes_other_commands_to_cli(self, argv: list[str]) -> None:
+        with (
+            patch.object(sys, "argv", argv),
+            patch("open_agent_kit.ci_hook.main") as hook_main,
+            patch("open_agent_kit.cli.cli_main") as cli_main,
+        ):
+            launcher.main()
+
+        cli_main.assert_called_once_with()
+        hook_main.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            (["SessionStart"], ("SessionStart", "claude")),
+            (["PostToolUse", "--agent", "cursor"], ("PostToolUse", "cursor")),
+            (["--agent=gemini", "Stop"], ("Stop", "gemini")),
+            (["Stop", "-a", "codex"], ("Stop", "codex")),
+        ],
+    )
+    def test_hook_main_parses_arguments(
+        self, argv: list[str], expected: tuple[str, str], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        with patch.object(ci_hook, "run_hook", return_value={"continue": True}) as run_hook:
+            ci_hook.main(argv)
+
+        run_hook.assert_called_once_with(*expected)
+        assert json.loads(capsys.readouterr().out) == {"continue": True}
+
+    @pytest.mark.parametrize("argv", [[], ["--agent", "cursor"], ["A", "B"], ["A", "--bogus"]])
+    def test_hook_main_rejects_bad_arguments(self, argv: list[str]) -> None:
+        with pytest.raises(SystemExit) as exc_info:
+            ci_hook.main(argv)
+
+        assert exc_info.value.code == 2
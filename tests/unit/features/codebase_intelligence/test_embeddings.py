@@ -387,6 +387,8 @@ class TestCreateProviderFromConfig:
         config.base_url = "http://localhost:11434"
         config.get_max_chunk_chars.return_value = 8000
         config.dimensions = 768
+        config.max_batch_size = 32
+        config.max_batch_tokens = 4096
 
         with patch(
             "open_agent_kit.features.codebase_intelligence.embeddings.provider_chain.OllamaProvider"
@@ -398,6 +400,8 @@ class TestCreateProviderFromConfig:
                 base_url="http://localhost:11434",
                 max_chars=8000,
                 dimensions=768,
+                max_batch_size=32,
+                max_batch_tokens=4096,
             )
 
     def test_creates_openai_provider(self):
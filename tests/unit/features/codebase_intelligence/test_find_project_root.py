@@ -1,4 +1,4 @@
-"""Tests for _find_project_root() in ci/hooks.py.
+"""Tests for find_project_root() in ci_hook.py.
 
 Verifies that the hook handler correctly resolves the project root even
 when the working directory has been changed by the AI agent (e.g.,
@@ -7,7 +7,7 @@ when the working directory has been changed by the AI agent (e.g.,
 
 from pathlib import Path
 
-from open_agent_kit.commands.ci.hooks import _find_project_root
+from open_agent_kit.ci_hook import find_project_root as _find_project_root
 from open_agent_kit.config.paths import GIT_DIR, OAK_DIR
 
 
@@ -5,12 +5,15 @@ Tests cover:
 - Code chunk indexing (add_code_chunks, add_code_chunks_batched)
 - Code search functionality
 - Memory observation storage
+- Memory generation counter
 - Memory search and listing
 - Collection management (clear, delete)
 - Edge cases and error handling
 - Dimension mismatch handling
 """
 
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -299,25 +302,30 @@ class TestCodeChunk:
         assert metadata["has_docstring"] is False
 
     def test_generate_chunk_id(self):
-        """Test stable ID generation from content."""
+        """Test stable ID generation from symbol path and content."""
         filepath = "test.py"
-        start_line = 10
         content = "def my_function(): pass"
 
-        id1 = CodeChunk.generate_id(filepath, start_line, content)
-        id2 = CodeChunk.generate_id(filepath, start_line, content)
+        id1 = CodeChunk.generate_id(filepath, "Module.my_function", content)
+        id2 = CodeChunk.generate_id(filepath, "Module.my_function", content)
 
         assert id1 == id2
         assert filepath in id1
-        assert str(start_line) in id1
+        assert "Module.my_function" in id1
 
     def test_generate_chunk_id_different_content(self):
         """Test that different content produces different IDs."""
         filepath = "test.py"
-        start_line = 10
 
-        id1 = CodeChunk.generate_id(filepath, start_line, "content1")
-        id2 = CodeChunk.generate_id(filepath, start_line, "content2")
+        id1 = CodeChunk.generate_id(filepath, "my_function", "content1")
+        id2 = CodeChunk.generate_id(filepath, "my_function", "content2")
+
+        assert id1 != id2
+
+    def test_generate_chunk_id_different_symbol(self):
+        """Test that identical content under different symbols gets different IDs."""
+        id1 = CodeChunk.generate_id("test.py", "A.run", "pass")
+        id2 = CodeChunk.generate_id("test.py", "B.run", "pass")
 
         assert id1 != id2
 
@@ -562,6 +570,118 @@ class TestAddCodeChunksBatched:
         assert added == 0
 
 
+class TestAddCodeChunksPipelined:
+    """Test concurrent embedding in add_code_chunks_batched."""
+
+    EMBED_LATENCY_SECONDS = 0.02
+
+    @staticmethod
+    def _chunks(count: int) -> list[CodeChunk]:
+        return [
+            CodeChunk(
+                id=f"test:{i}:hash",
+                content=f"def func{i}(): pass",
+                filepath="test.py",
+                language="python",
+                chunk_type="function",
+                name=f"func{i}",
+                start_line=i,
+                end_line=i + 1,
+            )
+            for i in range(count)
+        ]
+
+    @pytest.fixture
+    def slow_provider(self) -> MagicMock:
+        """Provider with fixed latency that records peak concurrent calls."""
+        provider = MagicMock(spec=EmbeddingProvider)
+        provider.dimensions = 3
+        provider.in_flight = 0
+        provider.peak_in_flight = 0
+        lock = threading.Lock()
+
+        def embed(texts: list[str]) -> EmbeddingResult:
+            with lock:
+                provider.in_flight += 1
+                provider.peak_in_flight = max(provider.peak_in_flight, provider.in_flight)
+            time.sleep(self.EMBED_LATENCY_SECONDS)
+            with lock:
+                provider.in_flight -= 1
+            return EmbeddingResult(
+                embeddings=[[float(len(text)), 0.0, 1.0] for text in texts],
+                model="mock-model",
+                provider="mock",
+                dimensions=3,
+            )
+
+        provider.embed.side_effect = embed
+        return provider
+
+    def _add(
+        self,
+        tmp_path: Path,
+        provider: MagicMock,
+        client: MagicMock,
+        concurrency: int,
+        chunks: list[CodeChunk],
+    ) -> VectorStore:
+        store = VectorStore(tmp_path / "chroma", provider, embedding_concurrency=concurrency)
+        with patch("chromadb.PersistentClient", return_value=client):
+            with patch("chromadb.config.Settings"):
+                store.add_code_chunks_batched(chunks, batch_size=2)
+                return store
+
+    def test_upserts_in_order(
+        self, tmp_path: Path, slow_provider: MagicMock, mock_chromadb_client: MagicMock
+    ):
+        """Test that batches are upserted in submission order."""
+        chunks = self._chunks(11)
+        progress: list[int] = []
+        store = VectorStore(tmp_path / "chroma", slow_provider, embedding_concurrency=4)
+
+        with patch("chromadb.PersistentClient", return_value=mock_chromadb_client):
+            with patch("chromadb.config.Settings"):
+                added = store.add_code_chunks_batched(
+                    chunks, batch_size=2, progress_callback=lambda done, _: progress.append(done)
+                )
+
+        upserted_ids = [
+            chunk_id
+            for call in store._code_collection.upsert.call_args_list
+            for chunk_id in call.kwargs["ids"]
+        ]
+        assert added == 11
+        assert upserted_ids == [chunk.id for chunk in chunks]
+        assert progress == [2, 4, 6, 8, 10, 11]
+
+    def test_in_flight_bounded_by_concurrency(
+        self, tmp_path: Path, slow_provider: MagicMock, mock_chromadb_client: MagicMock
+    ):
+        """Test that no more than the configured number of batches embed at once."""
+        self._add(tmp_path, slow_provider, mock_chromadb_client, 3, self._chunks(20))
+
+        assert slow_provider.peak_in_flight == 3
+
+    def test_embedding_error_propagates(
+        self, tmp_path: Path, slow_provider: MagicMock, mock_chromadb_client: MagicMock
+    ):
+        """Test that a failed batch aborts the pipeline."""
+        slow_provider.embed.side_effect = RuntimeError("embedding server down")
+
+        with pytest.raises(RuntimeError, match="embedding server down"):
+            self._add(tmp_path, slow_provider, mock_chromadb_client, 4, self._chunks(10))
+
+    def test_sequential_embeds_one_batch_at_a_time(
+        self, tmp_path: Path, slow_provider: MagicMock, mock_chromadb_client: MagicMock
+    ):
+        """Test that concurrency 1 embeds batch by batch at the batch size."""
+        self._add(tmp_path, slow_provider, mock_chromadb_client, 1, self._chunks(11))
+
+        assert slow_provider.peak_in_flight == 1
+        batch_sizes = [len(call.args[0]) for call in slow_provider.embed.call_args_list]
+        assert batch_sizes == [2, 2, 2, 2, 2, 1]
+
+
 # =============================================================================
 # Code Search Tests
 # =============================================================================
@@ -680,6 +800,156 @@ class TestAddMemory:
         assert mem_id == "mem:3"
 
 
+class TestAddMemories:
+    """Test bulk memory addition."""
+
+    @staticmethod
+    def _embed_each(texts: list[str]) -> EmbeddingResult:
+        return EmbeddingResult(
+            embeddings=[[0.1, 0.2, 0.3] * 128 for _ in texts],
+            model="mock-model",
+            provider="mock",
+            dimensions=384,
+        )
+
+    def test_one_embed_and_upsert_per_batch(
+        self,
+        vector_store: VectorStore,
+        mock_chromadb_client: MagicMock,
+        mock_embedding_provider: MagicMock,
+    ):
+        """Test that a batch is embedded and upserted with one call each."""
+        mock_embedding_provider.embed.side_effect = self._embed_each
+        observations = [
+            MemoryObservation(id=f"mem:{i}", observation=f"Gotcha {i}", memory_type="gotcha")
+            for i in range(5)
+        ]
+
+        with patch("chromadb.PersistentClient", return_value=mock_chromadb_client):
+            with patch("chromadb.config.Settings"):
+                ids = vector_store.add_memories(observations)
+
+        assert ids == [f"mem:{i}" for i in range(5)]
+        assert mock_embedding_provider.embed.call_count == 1
+        memory_collection = vector_store._memory_collection
+        assert memory_collection.upsert.call_count == 1
+        assert memory_collection.upsert.call_args.kwargs["ids"] == ids
+        # Dimensions were recorded when the store created the collection
+        assert memory_collection.peek.call_count == 0
+
+    def test_duplicate_ids_upserted_once(
+        self,
+        vector_store: VectorStore,
+        mock_chromadb_client: MagicMock,
+        mock_embedding_provider: MagicMock,
+    ):
+        """Test that repeated IDs collapse to the last observation."""
+        mock_embedding_provider.embed.side_effect = self._embed_each
+        observations = [
+            MemoryObservation(id="mem:dup", observation="old", memory_type="gotcha"),
+            MemoryObservation(id="mem:dup", observation="new", memory_type="gotcha"),
+        ]
+
+        with patch("chromadb.PersistentClient", return_value=mock_chromadb_client):
+            with patch("chromadb.config.Settings"):
+                ids = vector_store.add_memories(observations)
+
+        assert ids == ["mem:dup"]
+        upsert_kwargs = vector_store._memory_collection.upsert.call_args.kwargs
+        assert upsert_kwargs["documents"] == ["new"]
+
+    def test_short_embedding_result_raises(
+        self,
+        vector_store: VectorStore,
+        mock_chromadb_client: MagicMock,
+    ):
+        """Test that embeddings that can't be matched to memories are rejected."""
+        observations = [
+            MemoryObservation(id=f"mem:{i}", observation=f"Gotcha {i}", memory_type="gotcha")
+            for i in range(2)
+        ]
+
+        with patch("chromadb.PersistentClient", return_value=mock_chromadb_client):
+            with patch("chromadb.config.Settings"):
+                with pytest.raises(ValueError):
+                    vector_store.add_memories(observations)
+
+    def test_empty_list(self, vector_store: VectorStore, mock_chromadb_client: MagicMock):
+        """Test that an empty batch is a no-op."""
+        with patch("chromadb.PersistentClient", return_value=mock_chromadb_client):
+            with patch("chromadb.config.Settings"):
+                assert vector_store.add_memories([]) == []
+
+
+class TestMemoryGeneration:
+    """Test the memory generation counter used to invalidate search caches."""
+
+    def test_add_memory_bumps_generation(
+        self,
+        vector_store: VectorStore,
+        mock_chromadb_client: MagicMock,
+    ):
+        """Test that adding a memory changes the generation."""
+        before = vector_store.memory_generation
+        obs = MemoryObservation(id="mem:gen", observation="Gotcha", memory_type="gotcha")
+
+        with patch("chromadb.PersistentClient", return_value=mock_chromadb_client):
+            with patch("chromadb.config.Settings"):
+                vector_store.add_memory(obs)
+
+        assert vector_store.memory_generation != before
+
+    def test_status_and_archive_bump_generation(
+        self,
+        vector_store: VectorStore,
+        mock_chromadb_client: MagicMock,
+    ):
+        """Test that resolving and archiving memories change the generation."""
+        with patch("chromadb.PersistentClient", return_value=mock_chromadb_client):
+            with patch("chromadb.config.Settings"):
+                before = vector_store.memory_generation
+                vector_store.update_memory_status("mem:1", "resolved")
+                resolved = vector_store.memory_generation
+                vector_store.archive_memory("mem:1")
+
+        assert resolved != before
+        assert vector_store.memory_generation != resolved
+
+    def test_reads_and_code_writes_keep_generation(
+        self,
+        vector_store: VectorStore,
+        mock_chromadb_client: MagicMock,
+    ):
+        """Test that searches and code indexing leave the generation alone."""
+        chunk = CodeChunk(
+            id="src/a.py:1:hash",
+            filepath="src/a.py",
+            language="python",
+            chunk_type="function",
+            name="a",
+            start_line=1,
+            end_line=2,
+            content="def a(): pass",
+        )
+
+        with patch("chromadb.PersistentClient", return_value=mock_chromadb_client):
+            with patch("chromadb.config.Settings"):
+                before = vector_store.memory_generation
+                vector_store.search_memory("gotcha")
+                vector_store.add_code_chunks([chunk])
+
+        assert vector_store.memory_generation == before
+
+    def test_stores_never_share_generation(
+        self, temp_vector_store_dir: Path, mock_embedding_provider: MagicMock
+    ):
+        """Test that a replacement store starts at a fresh generation."""
+        first = VectorStore(temp_vector_store_dir, mock_embedding_provider)
+        second = VectorStore(temp_vector_store_dir, mock_embedding_provider)
+
+        assert first.memory_generation != second.memory_generation
+
+
 class TestSearchMemory:
     """Test memory search functionality."""
 
@@ -890,6 +1160,51 @@ class TestDeleteCodeByFilepath:
         assert deleted == 0
 
 
+class TestDeleteCodeByFilepaths:
+    """Test bulk-deleting code chunks for several files."""
+
+    def test_single_lookup_and_delete(
+        self,
+        vector_store: VectorStore,
+        mock_chromadb_client: MagicMock,
+    ):
+        """Test that several files cost one $in lookup and one delete."""
+        mock_code_coll = MagicMock()
+        mock_code_coll.get.return_value = {"ids": ["a1", "a2", "b1"]}
+        mock_chromadb_client.get_collection.side_effect = lambda name: (
+            mock_code_coll if name == CODE_COLLECTION else MagicMock()
+        )
+
+        with patch("chromadb.PersistentClient", return_value=mock_chromadb_client):
+            with patch("chromadb.config.Settings"):
+                deleted = vector_store.delete_code_by_filepaths(["a.py", "b.py", "a.py"])
+
+        assert deleted == 3
+        mock_code_coll.get.assert_called_once_with(
+            where={"filepath": {"$in": ["a.py", "b.py"]}}, include=[]
+        )
+        mock_code_coll.delete.assert_called_once_with(ids=["a1", "a2", "b1"])
+
+    def test_no_matching_chunks(
+        self,
+        vector_store: VectorStore,
+        mock_chromadb_client: MagicMock,
+    ):
+        """Test that nothing is deleted when no chunks match."""
+        mock_code_coll = MagicMock()
+        mock_code_coll.get.return_value = {"ids": []}
+        mock_chromadb_client.get_collection.side_effect = lambda name: (
+            mock_code_coll if name == CODE_COLLECTION else MagicMock()
+        )
+
+        with patch("chromadb.PersistentClient", return_value=mock_chromadb_client):
+            with patch("chromadb.config.Settings"):
+                deleted = vector_store.delete_code_by_filepaths(["gone.py"])
+
+        assert deleted == 0
+        mock_code_coll.delete.assert_not_called()
+
+
 # =============================================================================
 # Statistics and Clearing Tests
 # =============================================================================